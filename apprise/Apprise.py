@@ -29,9 +29,13 @@ from itertools import chain
 from . import common
 from .conversion import convert_between
 from .utils import is_exclusive_match
+from .utils import tag_logic
 from .utils import parse_list
 from .utils import parse_urls
-from .utils import cwe312_url
+from .utils import CWE312URL
+from .dedup import dedup_check
+from .circuit import circuit_check
+from . import resolver
 from .logger import logger
 from .AppriseAsset import AppriseAsset
 from .AppriseConfig import AppriseConfig
@@ -193,14 +197,13 @@ class Apprise(object):
             except Exception:
                 # CWE-312 (Secure Logging) Handling
                 loggable_url = url if not asset.secure_logging \
-                    else cwe312_url(url)
+                    else CWE312URL(url)
 
                 # the arguments are invalid or can not be used.
                 logger.error(
-                    'Could not load {} URL: {}'.format(
-                        common.
-                        NOTIFY_SCHEMA_MAP[results['schema']].service_name,
-                        loggable_url))
+                    'Could not load %s URL: %s',
+                    common.NOTIFY_SCHEMA_MAP[results['schema']].service_name,
+                    loggable_url)
                 return None
 
         else:
@@ -304,6 +307,30 @@ class Apprise(object):
         """
         self.servers[:] = []
 
+    def close(self):
+        """
+        Releases any resources (such as authenticated sessions or open
+        connections) our notification services held onto between calls.
+        Services remain loaded and will simply re-establish what they need
+        the next time they're notified.
+
+        """
+        for entry in self.servers:
+            entry.close()
+
+    def __enter__(self):
+        """
+        Allows the Apprise object to be used within a 'with' block; our
+        services are closed when the block is exited.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        """
+        Closes our services when the 'with' block has completed
+        """
+        self.close()
+
     def find(self, tag=common.MATCH_ALL_TAG, match_always=True):
         """
         Returns an list of all servers matching against the tag specified.
@@ -320,27 +347,30 @@ class Apprise(object):
         #     tag=[('tagA', 'tagC'), 'tagB']  = (tagA and tagC) or tagB
         #     tag=[('tagB', 'tagC')]          = tagB and tagC
 
-        # A match_always flag allows us to pick up on our 'any' keyword
-        # and notify these services under all circumstances
-        match_always = common.MATCH_ALWAYS_TAG if match_always else None
+        # Fetch all of the configuration we reference at the same time
+        self._prefetch()
+
+        # Our tag is applied to every service we have; parse it only once
+        tag = tag_logic(tag)
 
         # Iterate over our loaded plugins
         for entry in self.servers:
 
             if isinstance(entry, (ConfigBase, AppriseConfig)):
-                # load our servers
-                servers = entry.servers()
-
-            else:
-                servers = [entry, ]
-
-            for server in servers:
-                # Apply our tag matching based on our defined logic
-                if is_exclusive_match(
-                        logic=tag, data=server.tags,
-                        match_all=common.MATCH_ALL_TAG,
-                        match_always=match_always):
+                # load our servers; only those that match our tag are
+                # instantiated
+                for server in entry.find(tag, match_always=match_always):
                     yield server
+
+                continue
+
+            # Apply our tag matching based on our defined logic
+            if is_exclusive_match(
+                    logic=tag, data=entry.tags,
+                    match_all=common.MATCH_ALL_TAG,
+                    match_always=common.MATCH_ALWAYS_TAG
+                    if match_always else None):
+                yield entry
         return
 
     def notify(self, body, title='', notify_type=common.NotifyType.INFO,
@@ -442,19 +472,43 @@ class Apprise(object):
         sent successfully.
         """
 
-        try:
-            # Send notification
-            return server.notify(**kwargs)
+        dedup = dedup_check(server, **kwargs)
+        if dedup is True:
+            # We already sent this one recently
+            return True
 
-        except TypeError:
-            # These our our internally thrown notifications
-            return False
+        circuit = circuit_check(server)
+        if circuit is False:
+            # The upstream server is down; don't bother waiting on it
+            result = False
 
-        except Exception:
-            # A catch all so we don't have to abort early
-            # just because one of our plugins has a bug in it.
-            logger.exception("Unhandled Notification Exception")
-            return False
+        else:
+            if circuit:
+                # Track what becomes of our upstream server
+                kwargs['tracker'] = circuit
+
+            try:
+                # Send notification
+                result = server.notify(**kwargs)
+
+            except TypeError:
+                # These our our internally thrown notifications
+                result = False
+
+            except Exception:
+                # A catch all so we don't have to abort early
+                # just because one of our plugins has a bug in it.
+                logger.exception("Unhandled Notification Exception")
+                result = False
+
+            if circuit:
+                circuit.record(result)
+
+        if not result and dedup:
+            # Allow our notification to be retried
+            dedup()
+
+        return result
 
     @staticmethod
     def _notifyhandlerasync(server, **kwargs):
@@ -464,7 +518,33 @@ class Apprise(object):
         """
 
         if server.asset.async_mode:
-            return server.async_notify(**kwargs)
+            dedup = dedup_check(server, **kwargs)
+            if dedup is True:
+                # We already sent this one recently
+                return py3compat.asyncio.toasyncwrapvalue(True)
+
+            circuit = circuit_check(server)
+            if circuit is False:
+                # The upstream server is down; don't bother waiting on it
+                if dedup:
+                    dedup()
+
+                return py3compat.asyncio.toasyncwrapvalue(False)
+
+            if circuit:
+                # Track what becomes of our upstream server
+                kwargs['tracker'] = circuit
+
+            cor = server.async_notify(**kwargs)
+            if circuit:
+                # Track the health of the upstream server
+                cor = py3compat.asyncio.onresult(cor, circuit.record)
+
+            if dedup:
+                # Allow our notification to be retried if it fails
+                cor = py3compat.asyncio.onfailure(cor, dedup)
+
+            return cor
 
         else:
             # Send the notification immediately, and wrap the result in a
@@ -484,7 +564,7 @@ class Apprise(object):
         arguments are exactly as they would be passed to server.notify().
         """
 
-        if len(self) == 0:
+        if not self:
             # Nothing to notify
             msg = "There are no service(s) to notify"
             logger.error(msg)
@@ -520,6 +600,10 @@ class Apprise(object):
             logger.error(msg)
             raise TypeError(msg)
 
+        if self.asset.dns_cache_ttl and self.asset.dns_cache_ttl > 0:
+            # Cache our DNS lookups
+            resolver.install(ttl=self.asset.dns_cache_ttl)
+
         # Tracks conversions
         conversion_body_map = dict()
         conversion_title_map = dict()
@@ -780,22 +864,62 @@ class Apprise(object):
     def __bool__(self):
         """
         Allows the Apprise object to be wrapped in an Python 3.x based 'if
-        statement'.  True is returned if at least one service has been loaded.
+        statement'.  True is returned if at least one service can be loaded.
         """
-        return len(self) > 0
+        return self._has_servers()
 
     def __nonzero__(self):
         """
         Allows the Apprise object to be wrapped in an Python 2.x based 'if
-        statement'.  True is returned if at least one service has been loaded.
+        statement'.  True is returned if at least one service can be loaded.
         """
-        return len(self) > 0
+        return self._has_servers()
+
+    def _prefetch(self):
+        """
+        Fetches all of the configuration we reference (that has yet to be
+        loaded) at the same time instead of one after the other.
+        """
+        configs = []
+        for s in self.servers:
+            if isinstance(s, AppriseConfig):
+                configs.extend(s.configs)
+
+            elif isinstance(s, ConfigBase):
+                configs.append(s)
+
+        ConfigBase.prefetch(configs)
+
+    def _has_servers(self):
+        """
+        Returns True if at least one service can be loaded. Unlike len(),
+        the services defined in our configuration are only instantiated until
+        the first one that loads is found.
+        """
+        self._prefetch()
+
+        for s in self.servers:
+            if isinstance(s, ConfigBase):
+                configs = (s, )
+
+            elif isinstance(s, AppriseConfig):
+                configs = s.configs
+
+            else:
+                return True
+
+            if any(configs):
+                # Our configuration contains at least one service
+                return True
+
+        return False
 
     def __iter__(self):
         """
         Returns an iterator to each of our servers loaded. This includes those
         found inside configuration.
         """
+        self._prefetch()
         return chain(*[[s] if not isinstance(s, (ConfigBase, AppriseConfig))
                        else iter(s.servers()) for s in self.servers])
 
@@ -805,6 +929,7 @@ class Apprise(object):
         loaded configuration. This funtion nnever actually counts the
         Config entry themselves (if they exist), only what they contain.
         """
+        self._prefetch()
         return sum([1 if not isinstance(s, (ConfigBase, AppriseConfig))
                     else len(s.servers()) for s in self.servers])
 
@@ -30,8 +30,22 @@ from os.path import dirname
 from os.path import isfile
 from os.path import abspath
 from .common import NotifyType
+from .common import NOTIFY_TYPES
+from .common import NOTIFY_IMAGE_SIZES
 from .utils import module_detection
 
+# The tokens we substitute in our image url and path masks
+ASSET_TEMPLATE_RE = re.compile(
+    r'(\{(?P<token>THEME|TYPE|XY|EXTENSION)\})', re.IGNORECASE)
+
+# Resolved image paths keyed by the (path mask, theme, notify type, image size,
+# extension, must exist) they were generated from; the path is None if the
+# file did not exist.
+ASSET_IMAGE_PATH_CACHE = {}
+
+# The raw content of the images we've read keyed by their path
+ASSET_IMAGE_RAW_CACHE = {}
+
 
 class AppriseAsset(object):
     """
@@ -71,6 +85,17 @@ class AppriseAsset(object):
         NotifyType.WARNING: '[~]',
     }
 
+    # The order notifications are delivered in when more are being sent then
+    # there are workers to send them (asynchronously); the higher the
+    # priority the sooner the notification is sent.  This allows your
+    # failures to skip ahead of a backlog of informational messages.
+    notify_priority_map = {
+        NotifyType.FAILURE: 3,
+        NotifyType.WARNING: 2,
+        NotifyType.SUCCESS: 1,
+        NotifyType.INFO: 0,
+    }
+
     # The default color to return if a mapping isn't found in our table above
     default_html_color = '#888888'
 
@@ -137,6 +162,47 @@ class AppriseAsset(object):
     # that you leave this option as is otherwise.
     secure_logging = True
 
+    # Cache the location and content of the images we read from disk so that
+    # we don't need to stat and read them again each time a notification is
+    # sent.  Set this to False if you intend to change the image files on
+    # disk while your application is running.
+    image_cache = True
+
+    # Suppress a notification if the same one (the same body, title, type
+    # and attachments) was already sent to the same service within the last
+    # dedup_window seconds.  This is useful when whatever triggers your
+    # notifications fires repeatedly (such as a flapping monitor).  It is
+    # disabled (set to zero) by default.
+    dedup_window = 0
+
+    # The maximum number of (recently sent) notifications that are
+    # remembered for the purpose of deduplication
+    dedup_size = 4096
+
+    # The notifications recently sent are remembered in memory by default
+    # which only suppresses duplicates sent by the same process.  Set this to
+    # the path of an (SQLite) database to share them between processes (such
+    # as multiple calls to the apprise tool).
+    dedup_path = None
+
+    # Stop sending notifications to an upstream server (the same service,
+    # host, path and credentials) after it failed this many times in a row
+    # (connection errors, timeouts and server errors); they fail right away
+    # instead of waiting for the (dead) server to time out.  It is disabled
+    # (set to zero) by default.
+    circuit_threshold = 0
+
+    # The number of seconds we stop sending notifications to an upstream
+    # server for (see circuit_threshold) before trying it again
+    circuit_timeout = 60
+
+    # Cache the DNS lookups made while sending notifications for this many
+    # seconds, and connect to servers with both IPv6 and IPv4 addresses
+    # over both in parallel (so that a broken network doesn't have to time
+    # out first).  This affects the entire process (not just Apprise) which
+    # is why it's disabled (set to zero) by default.
+    dns_cache_ttl = 0
+
     # Optionally specify one or more path to attempt to scan for Python modules
     # By default, no paths are scanned.
     __plugin_paths = []
@@ -230,20 +296,8 @@ class AppriseAsset(object):
         if extension is None:
             extension = self.default_extension
 
-        re_map = {
-            '{THEME}': self.theme if self.theme else '',
-            '{TYPE}': notify_type,
-            '{XY}': image_size,
-            '{EXTENSION}': extension,
-        }
-
-        # Iterate over above list and store content accordingly
-        re_table = re.compile(
-            r'(' + '|'.join(re_map.keys()) + r')',
-            re.IGNORECASE,
-        )
-
-        return re_table.sub(lambda x: re_map[x.group()], url_mask)
+        return self._apply_template(
+            url_mask, notify_type, image_size, extension)
 
     def image_path(self, notify_type, image_size, must_exist=True,
                    extension=None):
@@ -259,23 +313,25 @@ class AppriseAsset(object):
         if extension is None:
             extension = self.default_extension
 
-        re_map = {
-            '{THEME}': self.theme if self.theme else '',
-            '{TYPE}': notify_type,
-            '{XY}': image_size,
-            '{EXTENSION}': extension,
-        }
+        key = (self.image_path_mask, self.theme, notify_type, image_size,
+               extension, must_exist)
+        try:
+            if self.image_cache:
+                # Use our cached path if we have it
+                return ASSET_IMAGE_PATH_CACHE[key]
 
-        # Iterate over above list and store content accordingly
-        re_table = re.compile(
-            r'(' + '|'.join(re_map.keys()) + r')',
-            re.IGNORECASE,
-        )
+        except KeyError:
+            # We haven't resolved this path yet
+            pass
 
         # Acquire our path
-        path = re_table.sub(lambda x: re_map[x.group()], self.image_path_mask)
+        path = self._apply_template(
+            self.image_path_mask, notify_type, image_size, extension)
         if must_exist and not isfile(path):
-            return None
+            path = None
+
+        if self.image_cache:
+            ASSET_IMAGE_PATH_CACHE[key] = path
 
         # Return what we parsed
         return path
@@ -291,16 +347,73 @@ class AppriseAsset(object):
             image_size=image_size,
             extension=extension,
         )
-        if path:
-            try:
-                with open(path, 'rb') as fd:
-                    return fd.read()
+        if not path:
+            return None
+
+        if self.image_cache and path in ASSET_IMAGE_RAW_CACHE:
+            # Use our cached content
+            return ASSET_IMAGE_RAW_CACHE[path]
+
+        try:
+            with open(path, 'rb') as fd:
+                content = fd.read()
+
+        except (OSError, IOError):
+            # We can't access the file
+            return None
+
+        if self.image_cache:
+            ASSET_IMAGE_RAW_CACHE[path] = content
+
+        return content
+
+    def preload_images(self, extension=None):
+        """
+        Reads all of the images associated with our theme into our cache
+        ahead of time so that none of our notifications pay the price of
+        reading them from disk.
+
+        The number of images loaded is returned.
+
+        """
+        if not self.image_cache:
+            # Nothing to preload into
+            return 0
+
+        loaded = 0
+        for notify_type in NOTIFY_TYPES:
+            for image_size in NOTIFY_IMAGE_SIZES:
+                if self.image_raw(
+                        notify_type, image_size, extension=extension):
+                    loaded += 1
+
+        return loaded
 
-            except (OSError, IOError):
-                # We can't access the file
-                return None
+    @staticmethod
+    def image_cache_reset():
+        """
+        Empties our image cache; new images are read from disk the next
+        time they're requested.
+
+        """
+        ASSET_IMAGE_PATH_CACHE.clear()
+        ASSET_IMAGE_RAW_CACHE.clear()
+
+    def _apply_template(self, mask, notify_type, image_size, extension):
+        """
+        Applies our theme, notify type, image size and extension to the
+        image url or path mask specified.
+
+        """
+        re_map = {
+            'THEME': self.theme if self.theme else '',
+            'TYPE': notify_type,
+            'XY': image_size,
+            'EXTENSION': extension,
+        }
 
-        return None
+        return ASSET_TEMPLATE_RE.sub(
+            lambda x: re_map[x.group('token').upper()], mask)
 
     def details(self):
         """
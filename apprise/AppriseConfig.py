@@ -34,6 +34,7 @@ from . import common
 from .utils import GET_SCHEMA_RE
 from .utils import parse_list
 from .utils import is_exclusive_match
+from .utils import tag_logic
 from .logger import logger
 
 
@@ -298,18 +299,42 @@ class AppriseConfig(object):
 
         response = list()
 
-        for entry in self.configs:
+        # Our tag is applied to every configuration we have; parse it only
+        # once
+        tag = tag_logic(tag)
+
+        # Acquire the configuration that matches our tag
+        configs = [
+            entry for entry in self.configs if is_exclusive_match(
+                logic=tag, data=entry.tags, match_all=common.MATCH_ALL_TAG,
+                match_always=match_always)]
 
-            # Apply our tag matching based on our defined logic
-            if is_exclusive_match(
-                    logic=tag, data=entry.tags, match_all=common.MATCH_ALL_TAG,
-                    match_always=match_always):
-                # Build ourselves a list of services dynamically and return the
-                # as a list
-                response.extend(entry.servers())
+        # Fetch all of it at the same time
+        ConfigBase.prefetch(configs)
+
+        for entry in configs:
+            # Build ourselves a list of services dynamically and return the
+            # as a list
+            response.extend(entry.servers())
 
         return response
 
+    def find(self, tag=common.MATCH_ALL_TAG, match_always=True):
+        """
+        Returns a generator of all of the services defined in our
+        configuration that match the tag specified.
+
+        Unlike servers(), the tag is applied to the notification services
+        and only those that match are instantiated.
+
+        """
+        # Fetch all of our configuration at the same time
+        ConfigBase.prefetch(self.configs)
+
+        for entry in self.configs:
+            for server in entry.find(tag, match_always=match_always):
+                yield server
+
     @staticmethod
     def instantiate(url, asset=None, tag=None, cache=None,
                     recursion=0, insecure_includes=False,
@@ -389,6 +414,15 @@ class AppriseConfig(object):
         """
         self.configs[:] = []
 
+    def close(self):
+        """
+        Releases the resources held by any of the services already loaded
+        from our configuration.
+
+        """
+        for entry in self.configs:
+            entry.close()
+
     def server_pop(self, index):
         """
         Removes an indexed Apprise Notification from the servers
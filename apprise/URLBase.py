@@ -25,6 +25,7 @@
 
 import re
 import six
+import threading
 from .logger import logger
 from time import sleep
 from datetime import datetime
@@ -47,6 +48,8 @@ from .utils import parse_url
 from .utils import parse_bool
 from .utils import parse_list
 from .utils import parse_phone_no
+from .circuit import circuit_failure
+from .circuit import circuit_response
 
 # Used to break a path list into parts
 PATHSPLIT_LIST_DELIM = re.compile(r'[ \t\r\n,\\/]+')
@@ -76,6 +79,9 @@ HTML_LOOKUP = {
     503: 'Servers are overloaded.',
 }
 
+# Guards the (lazy) creation of the throttle lock of each of our objects
+THROTTLE_LOCK_INIT = threading.Lock()
+
 
 class URLBase(object):
     """
@@ -118,6 +124,15 @@ class URLBase(object):
     # Logging to our global logger
     logger = logger
 
+    # Tracks the time any i/o was made to the remote server.  This value
+    # is automatically set and controlled through the throttle() call.
+    _last_io_datetime = None
+
+    # Our throttle is shared by anything sending on our behalf (such as
+    # split messages being delivered at the same time).  It's only created
+    # the first time it's needed.
+    _throttle_lock = None
+
     # Define a default set of template arguments used for dynamically building
     # details about our individual plugins for developers.
 
@@ -255,10 +270,6 @@ class URLBase(object):
             # it just falls back to whatever was already defined globally
             self.tags = set(parse_list(kwargs.get('tag'), self.tags))
 
-        # Tracks the time any i/o was made to the remote server.  This value
-        # is automatically set and controlled through the throttle() call.
-        self._last_io_datetime = None
-
     def throttle(self, last_io=None, wait=None):
         """
         A common throttle control
@@ -268,6 +279,22 @@ class URLBase(object):
         time.
         """
 
+        lock = self._throttle_lock
+        if lock is None:
+            with THROTTLE_LOCK_INIT:
+                if self._throttle_lock is None:
+                    self._throttle_lock = threading.Lock()
+
+                lock = self._throttle_lock
+
+        with lock:
+            self._throttle(last_io=last_io, wait=wait)
+
+    def _throttle(self, last_io=None, wait=None):
+        """
+        Performs the actual throttle; see throttle()
+        """
+
         if last_io is not None:
             # Assume specified last_io
             self._last_io_datetime = last_io
@@ -312,6 +339,15 @@ class URLBase(object):
         """
         raise NotImplementedError("url() is implimented by the child class.")
 
+    def close(self):
+        """
+        Releases any resources (such as authenticated sessions or open
+        connections) held onto between calls.  Plugins that hold onto such
+        resources should over-ride this function.
+
+        """
+        return
+
     def __contains__(self, tags):
         """
         Returns true if the tag specified is associated with this notification.
@@ -695,6 +731,10 @@ class URLBase(object):
             # Apply any/all header over-rides defined
             HTML_LOOKUP.update(response_mask)
 
+        # Our services look up the error codes their upstream server responds
+        # with; they tell us whether or not it's healthy
+        circuit_response(code)
+
         # Look up our response
         try:
             response = HTML_LOOKUP[code]
@@ -704,6 +744,16 @@ class URLBase(object):
 
         return response
 
+    @staticmethod
+    def upstream_failure(e=None):
+        """Tracks that the upstream server couldn't be reached (or timed
+        out); this counts against its circuit breaker (see circuit_check()).
+
+        If the exception that was raised is specified, it's only counted if
+        it's a connection error or a timeout.
+        """
+        circuit_failure(e)
+
     def schemas(self):
         """A simple function that returns a set of all schemas associated
         with this object based on the object.protocol and
@@ -24,7 +24,13 @@
 # THE SOFTWARE.
 
 import os
+import six
+import stat
+import mmap
 import time
+import base64
+import hashlib
+import threading
 import mimetypes
 from ..URLBase import URLBase
 from ..utils import parse_bool
@@ -144,6 +150,24 @@ class AttachBase(URLBase):
         # Absolute path to attachment
         self.download_path = None
 
+        # The os.stat() of our content; anything we cache about our content
+        # (below) is dropped if it changes
+        self._stat = None
+
+        # A (read-only) memory map of our content; see view()
+        self._mmap = None
+
+        # Protects our memory map; the same attachment is often sent by
+        # several services at the same time
+        self._mmap_lock = threading.Lock()
+
+        # Set once our content changed on us; content that is being written
+        # to is read into memory instead of being mapped (see view())
+        self._volatile = False
+
+        # Our cached digests (keyed by their algorithm); see digest()
+        self._digests = {}
+
         # Set our cache flag; it can be True, False, None, or a (positive)
         # integer... nothing else
         if cache is not None:
@@ -258,28 +282,159 @@ class AttachBase(URLBase):
         cache = self.template_args['cache']['default'] \
             if self.cache is None else self.cache
 
-        if self.download_path and os.path.isfile(self.download_path) \
-                and cache:
-
+        if self.download_path and cache:
             # We have enough reason to look further into our cached content
             # and verify it has not expired.
-            if cache is True:
-                # return our fixed content as is; we will always cache it
-                return True
-
-            # Verify our cache time to determine whether we will get our
-            # content again.
-            try:
-                age_in_sec = time.time() - os.stat(self.download_path).st_mtime
-                if age_in_sec <= cache:
+            st = self.refresh()
+            if st is not None:
+                if cache is True:
+                    # return our fixed content as is; we will always cache it
                     return True
 
-            except (OSError, IOError):
-                # The file is not present
-                pass
+                # Verify our cache time to determine whether we will get our
+                # content again.
+                try:
+                    if time.time() - st.st_mtime <= cache:
+                        return True
+
+                except (OSError, IOError):
+                    pass
 
         return self.download()
 
+    def refresh(self, path=None):
+        """
+        Performs a (single) os.stat() of our content (or the path specified)
+        and returns it; None is returned if it isn't a file.
+
+        If our content changed since we last looked at it, our memory map
+        and digests of it are dropped (and it's no longer mapped into memory
+        from here on).
+        """
+        try:
+            st = os.stat(path if path else self.download_path)
+
+        except (OSError, IOError, TypeError):
+            # The file is not present
+            return None
+
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        if self._stat is None or (
+                self._stat.st_size, self._stat.st_mtime, self._stat.st_ino,
+                self._stat.st_dev) != (
+                st.st_size, st.st_mtime, st.st_ino, st.st_dev):
+            # Our content changed
+            self.release()
+            self._digests = {}
+            self._volatile = self._stat is not None
+            self._stat = st
+
+        return st
+
+    def view(self):
+        """
+        Returns a read-only view (a memoryview) of our content that can be
+        handed to uploads, base64 encoders and the like directly.  It's
+        backed by a memory map of our content (that's shared between calls)
+        so nothing is copied into memory until it's accessed.
+
+        None is returned if our content isn't available.  OSError (or
+        IOError) is thrown if it can't be read.
+
+        Our content is looked at (see exists()) right before it's mapped;
+        content that changed on us since is read into memory instead.  Our
+        map is held onto until release() is called; notification services
+        release the attachments they sent once they're done with them.
+        """
+        if not self.exists():
+            return None
+
+        st = self._stat if self._stat is not None else self.refresh()
+        if st is None or not st.st_size:
+            # Empty files can't be memory mapped
+            return memoryview(b'')
+
+        if self._volatile:
+            # Truncating a file while it's mapped into memory is fatal to
+            # whoever reads it next
+            with open(self.download_path, 'rb') as f:
+                return memoryview(f.read())
+
+        with self._mmap_lock:
+            if self._mmap is None:
+                with open(self.download_path, 'rb') as f:
+                    self._mmap = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if six.PY2:  # pragma: no cover
+                # Python v2.7 can't create a memoryview of a memory map
+                return self._mmap[:]
+
+            return memoryview(self._mmap)
+
+    def base64(self, encoding='ascii', lines=False):
+        """
+        Returns our content base64 encoded (as a string unless the encoding
+        is set to None).  Our content is encoded straight from our view()
+        of it.
+
+        If lines is set to True, the encoded content is split into lines of
+        76 characters (as MIME requires).
+        """
+        view = self.view()
+        if view is None:
+            return None
+
+        if lines:
+            encoded = base64.encodebytes(view) \
+                if hasattr(base64, 'encodebytes') \
+                else base64.encodestring(view)
+
+        else:
+            encoded = base64.b64encode(view)
+
+        return encoded.decode(encoding) if encoding else encoded
+
+    def digest(self, algorithm='sha256'):
+        """
+        Returns the (hex) digest of our content using the hashlib algorithm
+        specified.  It's cached until our content changes.
+        """
+        if not self.exists():
+            return None
+
+        digest = self._digests.get(algorithm)
+        if digest is None:
+            mapped = self._mmap is not None
+            digest = hashlib.new(algorithm, self.view()).hexdigest()
+            self._digests[algorithm] = digest
+
+            if not mapped:
+                # We're not about to send our content; there is no reason
+                # to hold onto the map we just created
+                self.release()
+
+        return digest
+
+    def release(self):
+        """
+        Releases our memory map of our content; it's created again the next
+        time it's needed.
+        """
+        with self._mmap_lock:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+
+                except BufferError:
+                    # A view of it is still in use; it's closed once it's no
+                    # longer referenced
+                    pass
+
+                self._mmap = None
+
     def invalidate(self):
         """
         Release any temporary data that may be open by child classes.
@@ -294,6 +449,12 @@ class AttachBase(URLBase):
         self.detected_name = None
         self.download_path = None
         self.detected_mimetype = None
+
+        # Release what we cached about our content
+        self.release()
+        self._digests = {}
+        self._volatile = False
+        self._stat = None
         return
 
     def download(self):
@@ -363,7 +524,11 @@ class AttachBase(URLBase):
         Returns the filesize of the attachment.
 
         """
-        return os.path.getsize(self.path) if self.path else 0
+        if not self.exists():
+            return 0
+
+        st = self._stat if self._stat is not None else self.refresh()
+        return st.st_size if st is not None else 0
 
     def __bool__(self):
         """
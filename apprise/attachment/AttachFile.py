@@ -90,14 +90,18 @@ class AttachFile(AttachBase):
             # our content is inaccessible
             return False
 
-        # Ensure any existing content set has been invalidated
-        self.invalidate()
-
-        if not os.path.isfile(self.dirty_path):
+        if self.download_path != self.dirty_path:
+            # Ensure any existing content set has been invalidated; our
+            # content is otherwise kept (see refresh()) if it didn't change
+            self.invalidate()
+
+        st = self.refresh(self.dirty_path)
+        if st is None:
+            self.invalidate()
             return False
 
-        if self.max_file_size > 0 and \
-                os.path.getsize(self.dirty_path) > self.max_file_size:
+        if self.max_file_size > 0 and st.st_size > self.max_file_size:
+            self.invalidate()
 
             # The content to attach is to large
             self.logger.error(
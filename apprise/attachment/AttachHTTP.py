@@ -251,12 +251,13 @@ class AttachHTTP(AttachBase):
         """
         Close our temporary file
         """
+        # Release our (memory mapped) content before removing it
+        super(AttachHTTP, self).invalidate()
+
         if self._temp_file:
             self._temp_file.close()
             self._temp_file = None
 
-        super(AttachHTTP, self).invalidate()
-
     def url(self, privacy=False, *args, **kwargs):
         """
         Returns the URL built dynamically based on specified arguments.
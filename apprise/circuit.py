@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import six
+import time
+import socket
+import smtplib
+import hashlib
+import threading
+import requests
+
+from .logger import logger
+
+# Our circuit breakers keyed by the upstream (service, host, path and
+# credentials) they protect; they're shared between all of the Apprise
+# objects (and services) that reference the same upstream.
+CIRCUIT_BREAKERS = {}
+
+# Held while a circuit breaker is looked up (or created)
+CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+# The tracker (if any) of the notification being sent from the current
+# thread (see circuit_track())
+CIRCUIT_TRACKING = threading.local()
+
+
+class CircuitState(object):
+    """
+    The states our circuit breakers can be in
+    """
+    # Notifications are sent as usual
+    CLOSED = 'closed'
+
+    # Notifications fail right away (without contacting the upstream server)
+    OPEN = 'open'
+
+    # A single (trial) notification is allowed through to find out if the
+    # upstream server has recovered
+    HALF_OPEN = 'half-open'
+
+
+class CircuitTracker(object):
+    """
+    Tracks a single notification that was allowed through a circuit breaker
+    (see circuit_check()).  Our upstream server is only to blame for the
+    notification failing if it was found to be down (or struggling) while it
+    was being sent; a server that simply rejected what we sent it is not.
+
+    """
+
+    __slots__ = ('server', 'breaker', 'threshold', 'timeout', 'failed')
+
+    def __init__(self, server, breaker, threshold, timeout):
+        """
+        Initialize our tracker
+        """
+        self.server = server
+        self.breaker = breaker
+        self.threshold = threshold
+        self.timeout = timeout
+
+        # Set if our upstream server couldn't be reached, timed out or
+        # responded with a server (5xx) error
+        self.failed = False
+
+    def record(self, result):
+        """
+        Records the result of our notification with our circuit breaker
+        """
+        if result:
+            success = True
+
+        elif self.failed:
+            success = False
+
+        else:
+            # Our upstream server isn't to blame
+            success = None
+
+        if self.breaker.record(success, threshold=self.threshold):
+            logger.warning(
+                'The upstream %s server failed %d time(s) in a row; its '
+                'notifications will be skipped for the next %s second(s).',
+                self.server.service_name, self.breaker.failures,
+                self.timeout)
+
+
+class CircuitBreaker(object):
+    """
+    Tracks the consecutive failures of an upstream server.  Once threshold of
+    them have occurred the circuit is opened and the notifications that
+    would have been sent to it fail fast (instead of waiting on a server
+    that is down to time out).
+
+    After timeout seconds a single (half-open) trial notification is allowed
+    through again; the circuit is closed if it succeeds and opened again
+    (for another timeout seconds) if it doesn't.
+
+    Our breakers are shared by everyone referencing the same upstream server
+    so the threshold and timeout are provided by each caller.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize our (closed) circuit breaker
+        """
+        self.state = CircuitState.CLOSED
+
+        # Our consecutive failures
+        self.failures = 0
+
+        # The number of notifications that failed fast
+        self.rejected = 0
+
+        # When our circuit was opened (or our trial notification started)
+        self._since = 0.0
+
+        # Our state and counters only ever change while this is held
+        self._lock = threading.Lock()
+
+    def allow(self, timeout=60):
+        """
+        Returns True if a notification can be sent; if it is then its result
+        must be passed to record().  Our circuit stays open for timeout
+        seconds.
+        """
+        now = time.time()
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+
+            # Our trial notification is given the same amount of time to
+            # complete in case its result never gets recorded
+            if now - self._since >= timeout:
+                self.state = CircuitState.HALF_OPEN
+                self._since = now
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record(self, success, threshold=5):
+        """
+        Records the result of a notification that was allowed through.
+        Returns True if our circuit was opened because of it (once threshold
+        failures occurred in a row).
+
+        A success of None identifies a notification that failed for reasons
+        that had nothing to do with the health of the upstream server; it
+        isn't counted either way.
+        """
+        with self._lock:
+            if success is None:
+                if self.state == CircuitState.HALF_OPEN:
+                    # Our trial told us nothing; let the next one through
+                    self.state = CircuitState.OPEN
+                    self._since = 0.0
+
+                return False
+
+            if success:
+                self.failures = 0
+                self.state = CircuitState.CLOSED
+                return False
+
+            self.failures += 1
+            if self.state == CircuitState.HALF_OPEN \
+                    or self.failures >= threshold:
+                # (Re)open our circuit
+                self.state = CircuitState.OPEN
+                self._since = time.time()
+                return True
+
+        return False
+
+    def reset(self):
+        """
+        Closes our circuit and resets our counters
+        """
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self.rejected = 0
+            self._since = 0.0
+
+
+def circuit_key(server):
+    """
+    Returns the key identifying the upstream (the service, host, port, path
+    and credentials) of the server specified.
+
+    """
+    # An empty path and the root one are one in the same
+    fullpath = getattr(server, 'fullpath', None) or '/'
+
+    digest = hashlib.sha256()
+    for entry in (server.__class__.__name__, server.host, server.port,
+                  fullpath, server.user, server.password):
+        if entry is None:
+            entry = b''
+
+        elif not isinstance(entry, six.binary_type):
+            entry = six.text_type(entry).encode('utf-8')
+
+        digest.update(entry)
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def circuit_breaker(server):
+    """
+    Returns the (shared) circuit breaker of the server's upstream.
+
+    """
+    key = circuit_key(server)
+    with CIRCUIT_BREAKERS_LOCK:
+        breaker = CIRCUIT_BREAKERS.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            CIRCUIT_BREAKERS[key] = breaker
+
+    return breaker
+
+
+def circuit_reset():
+    """
+    Forgets all of our circuit breakers along with the failures they
+    counted; every upstream is notified again (starting out closed).
+    """
+    with CIRCUIT_BREAKERS_LOCK:
+        CIRCUIT_BREAKERS.clear()
+
+
+def circuit_track(tracker=None):
+    """
+    Tracks the requests made from the current thread with the tracker
+    specified and returns whatever was tracking them before.  Passing None
+    in stops tracking them.
+
+    """
+    previous = getattr(CIRCUIT_TRACKING, 'tracker', None)
+    CIRCUIT_TRACKING.tracker = tracker
+    return previous
+
+
+def circuit_tracker():
+    """
+    Returns the tracker of the requests made from the current thread (or
+    None if they aren't being tracked).
+
+    """
+    return getattr(CIRCUIT_TRACKING, 'tracker', None)
+
+
+def circuit_response(code):
+    """
+    Tracks the (HTTP) error code our upstream server responded with; server
+    (5xx) errors count against it.
+
+    """
+    tracker = getattr(CIRCUIT_TRACKING, 'tracker', None)
+    if tracker is None:
+        return
+
+    try:
+        if int(code) >= 500:
+            tracker.failed = True
+
+    except (TypeError, ValueError):
+        # Not a response we can make anything of
+        pass
+
+
+def circuit_failure(e=None):
+    """
+    Tracks that our upstream server couldn't be reached (or timed out).  If
+    the exception that was raised is specified, it only counts against our
+    upstream server if it's a connection error or a timeout.
+
+    """
+    tracker = getattr(CIRCUIT_TRACKING, 'tracker', None)
+    if tracker is None:
+        return
+
+    if e is None:
+        failed = True
+
+    elif isinstance(e, requests.RequestException):
+        # These are also IOErrors; only some of them mean our upstream
+        # server couldn't be reached
+        failed = isinstance(e, (requests.ConnectionError, requests.Timeout))
+
+    elif isinstance(e, smtplib.SMTPException):
+        failed = isinstance(
+            e, (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected))
+
+    else:
+        failed = isinstance(e, (socket.error, socket.timeout))
+
+    if failed:
+        tracker.failed = True
+
+
+def circuit_check(server):
+    """
+    Consults the circuit breaker of the server's upstream (if the server's
+    asset has them enabled) before a notification is sent to it.
+
+    Returns None if circuit breakers aren't enabled and False if the
+    notification should fail fast.  Otherwise a CircuitTracker is returned;
+    it must be passed to the server's notify() (which tracks the requests
+    made with it) and its record() called with the result.
+
+    Only notifications that fail because of the upstream server (connection
+    errors, timeouts and server (5xx) errors) count against it.
+
+    """
+    threshold = server.asset.circuit_threshold
+    timeout = server.asset.circuit_timeout
+    if not threshold or threshold <= 0:
+        return None
+
+    breaker = circuit_breaker(server)
+    if not breaker.allow(timeout=timeout):
+        logger.warning(
+            'Skipped a %s notification; the upstream server failed %d '
+            'time(s) in a row (%d notification(s) skipped so far).',
+            server.service_name, breaker.failures, breaker.rejected)
+        return False
+
+    return CircuitTracker(server, breaker, threshold, timeout)
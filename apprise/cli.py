@@ -24,13 +24,19 @@
 # THE SOFTWARE.
 
 import click
+import json
 import logging
 import platform
 import six
 import sys
 import os
 import re
+import signal
+import socket
+import subprocess
+import threading
 
+from os.path import isdir
 from os.path import isfile
 from os.path import exists
 from os.path import expanduser
@@ -43,6 +49,7 @@ from . import AppriseAsset
 from . import AppriseConfig
 
 from .utils import parse_list
+from .utils import parse_bool
 from .common import NOTIFY_TYPES
 from .common import NOTIFY_FORMATS
 from .common import ContentLocation
@@ -57,6 +64,25 @@ from . import __copywrite__
 # files.
 DEFAULT_RECURSION_DEPTH = 1
 
+# The formats each line read while streaming (--stream) can be in; either
+# plain text (the line is the body) or a JSON object
+STREAM_FORMATS = ('text', 'json')
+
+# The number of notifications we'll have in flight at the same time while
+# streaming; when they're all busy we stop reading from <stdin> until one of
+# them frees up.
+DEFAULT_STREAM_MAX_INFLIGHT = 4
+
+# The largest request (in bytes) our daemon (--daemon) will accept
+DAEMON_MAX_REQUEST_SIZE = 4194304
+
+# How long our client will wait on the daemon to respond (in seconds)
+DAEMON_CLIENT_TIMEOUT = 300
+
+# The number of requests our daemon (--daemon) handles at the same time; we
+# stop accepting new connections while they're all busy
+DAEMON_MAX_THREADS = 16
+
 # Defines our click context settings adding -h to the additional options that
 # can be specified to get the help menu to come up
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
@@ -121,6 +147,391 @@ def print_version_msg():
     click.echo('\n'.join(result))
 
 
+def print_startup_profile(plugin_path=None):
+    """
+    Prints the time and memory Apprise spends starting up when
+    --profile-startup is specified.
+    """
+    # The profiler is only imported when it's needed so that it doesn't add
+    # to the start up time of every other call
+    from .profiler import profile_startup as startup_profiler
+
+    try:
+        results = startup_profiler(
+            plugin_paths=plugin_path if plugin_path else None)
+
+    except (RuntimeError, OSError, subprocess.CalledProcessError) as e:
+        logger.error('Could not profile the Apprise start up: {}'.format(e))
+        sys.exit(1)
+
+    def memory(value):
+        return '{:>10}'.format(
+            '-' if value is None else '{:.1f} KB'.format(value / 1024.0))
+
+    click.echo('Apprise v{} (Python v{}) start up profile:'.format(
+        results['apprise'], results['python']))
+
+    for entry in results['phases']:
+        click.echo('  {:<30} {:>10.2f} ms {}'.format(
+            entry['name'], entry['time'] * 1000, memory(entry['memory'])))
+
+    click.echo('')
+    click.echo('Plugins (slowest first):')
+    for entry in results['plugins']:
+        click.echo(click.style(
+            '{} {:<28} {:>10.2f} ms {} {}'.format(
+                '+' if entry['enabled'] else '-', entry['name'],
+                entry['time'] * 1000, memory(entry['memory']),
+                ', '.join(entry['dependencies'])).rstrip(),
+            fg="green" if entry['enabled'] else "red"))
+
+    if results['dependencies']:
+        click.echo('')
+        click.echo('3rd party modules loaded: {}'.format(
+            ', '.join(results['dependencies'])))
+
+
+def parse_stream_record(line, stream_format, **defaults):
+    """
+    Takes a line read while streaming and returns the keyword arguments to
+    pass into Apprise.notify().  The defaults are those specified on the
+    command line; a JSON record can override any of them with its own body,
+    title, type, tag, attach, format and/or interpret_escapes keys.
+
+    None is returned if the line should be ignored; a ValueError is thrown if
+    it can't be used.
+    """
+
+    line = line.rstrip('\r\n')
+    if not line.strip():
+        # Nothing to notify
+        return None
+
+    kwargs = dict(defaults)
+    if stream_format == 'text':
+        # The line is our body
+        kwargs['body'] = line
+        return kwargs
+
+    try:
+        record = json.loads(line)
+
+    except ValueError:
+        raise ValueError('Invalid JSON record.')
+
+    if not isinstance(record, dict) or \
+            not isinstance(record.get('body'), six.string_types):
+        raise ValueError('The JSON record does not contain a body.')
+
+    kwargs['body'] = record['body']
+
+    if 'title' in record:
+        kwargs['title'] = record['title']
+
+    if 'type' in record:
+        notify_type = str(record['type']).strip().lower()
+        if notify_type not in NOTIFY_TYPES:
+            raise ValueError(
+                'The notification type {} is not supported.'.format(
+                    notify_type))
+
+        kwargs['notify_type'] = notify_type
+
+    if 'tag' in record:
+        # Just like --tag (-g); each entry comprises of a comma separated
+        # 'and' list and we 'or' each of them
+        tag = record['tag']
+        kwargs['tag'] = [parse_list(t) for t in (
+            (tag, ) if isinstance(tag, six.string_types) else tag)] \
+            if tag else None
+
+    if 'attach' in record:
+        kwargs['attach'] = record['attach'] if record['attach'] else None
+
+    if 'format' in record:
+        body_format = str(record['format']).strip().lower()
+        if body_format not in NOTIFY_FORMATS:
+            raise ValueError(
+                'The input format {} is not supported.'.format(body_format))
+
+        kwargs['body_format'] = body_format
+
+    if 'interpret_escapes' in record:
+        kwargs['interpret_escapes'] = \
+            parse_bool(record['interpret_escapes'])
+
+    return kwargs
+
+
+def stream_notify(a, stream, stream_format='text',
+                  max_inflight=DEFAULT_STREAM_MAX_INFLIGHT, **defaults):
+    """
+    Reads the stream one line at a time and sends a notification for each of
+    them as they arrive using the (already loaded) Apprise object.  Up to
+    max_inflight notifications are sent at the same time; we stop reading
+    from our stream while they're all busy.  Our workers share the services
+    of our Apprise object; each service is still only notified of one line
+    at a time (see NotifyBase.notify()).
+
+    Just like Apprise.notify(), True is returned if every notification was
+    sent, False if at least one of them failed and None if nothing was
+    notified at all.
+    """
+
+    # Our queue is never larger then the number of workers we have; this
+    # provides our backpressure
+    max_inflight = max(1, max_inflight)
+    queue = six.moves.queue.Queue(maxsize=max_inflight)
+
+    # Protects our results
+    lock = threading.Lock()
+    results = []
+
+    def worker():
+        while True:
+            kwargs = queue.get()
+            if kwargs is None:
+                # We're done
+                return
+
+            try:
+                status = a.notify(**kwargs)
+
+            except Exception as e:
+                # We're in our own thread so we need to handle this
+                logger.warning('An exception occurred sending notification.')
+                logger.debug('Exception: %s' % str(e))
+                status = False
+
+            with lock:
+                results.append(status)
+
+    threads = [
+        threading.Thread(target=worker) for _ in range(max_inflight)]
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    try:
+        # readline() is used over iterating the stream so that we don't wait
+        # on a read-ahead buffer to fill before handling what was written
+        for no, line in enumerate(iter(stream.readline, ''), start=1):
+            try:
+                kwargs = parse_stream_record(line, stream_format, **defaults)
+
+            except ValueError as e:
+                logger.error('Ignoring line {}: {}'.format(no, str(e)))
+                with lock:
+                    results.append(False)
+                continue
+
+            if kwargs is not None:
+                # Blocks while all of our workers are busy
+                queue.put(kwargs)
+
+    finally:
+        # Let our workers finish what they've been given
+        for _ in threads:
+            queue.put(None)
+
+        for thread in threads:
+            thread.join()
+
+    if any(status is False for status in results):
+        return False
+
+    return True if any(results) else None
+
+
+def default_socket_path():
+    """
+    Returns the UNIX socket our daemon (--daemon) listens on by default.
+
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and isdir(runtime_dir):
+        return os.path.join(runtime_dir, 'apprise.sock')
+
+    return expanduser('~/.apprise.sock')
+
+
+class DaemonRequestHandler(six.moves.socketserver.StreamRequestHandler):
+    """
+    Handles a single notification forwarded to our daemon.  The request is a
+    (JSON) record just like the ones accepted by --stream=json and we respond
+    with a JSON object containing our status.
+
+    """
+
+    def handle(self):
+        line = self.rfile.readline(DAEMON_MAX_REQUEST_SIZE)
+
+        try:
+            kwargs = parse_stream_record(line.decode('utf-8'), 'json')
+
+            # An empty request notifies nothing
+            status = None if kwargs is None \
+                else self.server.apprise.notify(**kwargs)
+
+        except (ValueError, UnicodeDecodeError) as e:
+            logger.error('Ignoring daemon request: {}'.format(str(e)))
+            status = False
+
+        except Exception as e:
+            # We're in our own thread so we need to handle this
+            logger.warning('An exception occurred sending notification.')
+            logger.debug('Exception: %s' % str(e))
+            status = False
+
+        self.wfile.write(
+            (json.dumps({'status': status}) + '\n').encode('utf-8'))
+
+
+class DaemonServer(six.moves.socketserver.ThreadingMixIn,
+                   six.moves.socketserver.TCPServer):
+    """
+    Our daemon (--daemon); it holds our loaded Apprise object and sends a
+    notification for each of the requests it receives on its UNIX socket.
+    Up to max_threads requests are handled at the same time.
+
+    """
+
+    # We listen on a UNIX socket (not available on all platforms)
+    address_family = getattr(socket, 'AF_UNIX', None)
+
+    # Don't wait on our in-flight requests when shutting down
+    daemon_threads = True
+
+    def __init__(self, a, path, max_threads=DAEMON_MAX_THREADS):
+        """
+        Takes our (loaded) Apprise object and the UNIX socket path we should
+        listen on.
+
+        """
+
+        self.apprise = a
+
+        # Our requests are each handled in a thread of their own; this
+        # limits how many of them we have
+        self.slots = threading.BoundedSemaphore(max(1, max_threads))
+
+        if exists(path):
+            sock = daemon_connect(path)
+            if sock is not None:
+                sock.close()
+                raise socket.error(
+                    'Another daemon is already listening on {}'.format(
+                        path))
+
+            # The previous daemon didn't get the chance to clean up after
+            # itself
+            os.unlink(path)
+
+        # Only we can talk to our daemon
+        umask = os.umask(0o177)
+        try:
+            six.moves.socketserver.TCPServer.__init__(
+                self, path, DaemonRequestHandler)
+
+        finally:
+            os.umask(umask)
+
+    def process_request(self, request, client_address):
+        """
+        Hands the request to a thread of its own; we block (and stop
+        accepting anything more) while all of our threads are busy.
+
+        """
+        self.slots.acquire()
+        try:
+            six.moves.socketserver.ThreadingMixIn.process_request(
+                self, request, client_address)
+
+        except Exception:
+            # Our thread never started
+            self.slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        """
+        Handles our request (from within its own thread)
+
+        """
+        try:
+            six.moves.socketserver.ThreadingMixIn.process_request_thread(
+                self, request, client_address)
+
+        finally:
+            self.slots.release()
+
+    def server_close(self):
+        """
+        Stops listening and removes our UNIX socket
+
+        """
+        six.moves.socketserver.TCPServer.server_close(self)
+
+        try:
+            os.unlink(self.server_address)
+
+        except OSError:
+            # Already gone
+            pass
+
+
+def daemon_connect(path):
+    """
+    Returns a socket connected to our daemon (--daemon) listening on the UNIX
+    socket path specified; None is returned if it isn't running.
+
+    """
+    if not hasattr(socket, 'AF_UNIX') or not exists(path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+
+    except socket.error:
+        sock.close()
+        return None
+
+    return sock
+
+
+def daemon_notify(sock, record, timeout=DAEMON_CLIENT_TIMEOUT):
+    """
+    Forwards a notification (a record just like the ones accepted by
+    --stream=json) to our daemon using the socket returned by
+    daemon_connect().  The status the daemon responds with is returned
+    (see Apprise.notify()).
+
+    A socket.error or ValueError is thrown if we don't get a response.
+
+    """
+    try:
+        sock.settimeout(timeout)
+        sock.sendall((json.dumps(record) + '\n').encode('utf-8'))
+
+        response = b''
+        while not response.endswith(b'\n'):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+
+            response += chunk
+
+    finally:
+        sock.close()
+
+    try:
+        return json.loads(response.decode('utf-8'))['status']
+
+    except (TypeError, KeyError, UnicodeDecodeError):
+        raise ValueError('Invalid response from the daemon.')
+
+
 @click.command(context_settings=CONTEXT_SETTINGS)
 @click.option('--body', '-b', default=None, type=str,
               help='Specify the message body. If no body is specified then '
@@ -158,6 +569,38 @@ def print_version_msg():
               'If no tags are specified then all services are notified.')
 @click.option('--disable-async', '-Da', is_flag=True,
               help='Send all notifications sequentially')
+@click.option('--stream', '-S', default=None,
+              type=click.Choice(STREAM_FORMATS), metavar='FORMAT',
+              help='Keep reading <stdin> and send a notification for each '
+              'line as it arrives. Possible values are "text" (each line is '
+              'a message body) and "json" (each line is a JSON object '
+              'with a body and optionally a title, type, tag and attach).')
+@click.option('--stream-max-inflight', default=DEFAULT_STREAM_MAX_INFLIGHT,
+              type=int, metavar='COUNT',
+              help='The number of notifications sent at the same time while '
+              'streaming (default={}).'.format(DEFAULT_STREAM_MAX_INFLIGHT))
+@click.option('--dedup-window', default=0.0, type=float, metavar='SECONDS',
+              help='Suppress a notification if the same one was already sent '
+              'to the same service within the last SECONDS (default=0; '
+              'disabled).')
+@click.option('--dedup-path', default=None, type=str,
+              envvar='APPRISE_DEDUP_PATH', metavar='PATH',
+              help='An (SQLite) database the notifications recently sent are '
+              'remembered in so that duplicates are also suppressed between '
+              'separate calls to apprise.')
+@click.option('--circuit-threshold', default=0, type=int, metavar='COUNT',
+              help='Skip the notifications of a service for a while '
+              '(see --circuit-timeout) once it failed COUNT times in a row '
+              '(default=0; disabled).')
+@click.option('--circuit-timeout', default=60.0, type=float,
+              metavar='SECONDS',
+              help='The number of seconds the notifications of a failing '
+              'service are skipped for before it is tried again '
+              '(default=60).')
+@click.option('--dns-cache-ttl', default=0.0, type=float, metavar='SECONDS',
+              envvar='APPRISE_DNS_CACHE_TTL',
+              help='Cache DNS lookups for SECONDS and connect over IPv6 and '
+              'IPv4 in parallel (default=0; disabled).')
 @click.option('--dry-run', '-d', is_flag=True,
               help='Perform a trial run but only prints the notification '
               'services to-be triggered to stdout. Notifications are never '
@@ -165,6 +608,21 @@ def print_version_msg():
 @click.option('--details', '-l', is_flag=True,
               help='Prints details about the current services supported by '
               'Apprise.')
+@click.option('--daemon', is_flag=True,
+              help='Load our configuration once and then listen on a UNIX '
+              'socket (see --socket) for notifications to send. Calls to '
+              'apprise that specify the --socket (and rely on the default '
+              'configuration) are forwarded to the daemon.')
+@click.option('--socket', 'socket_path', default=None, type=str,
+              envvar='APPRISE_SOCKET', metavar='PATH',
+              help='The UNIX socket the daemon listens on (default='
+              '$XDG_RUNTIME_DIR/apprise.sock if set, otherwise '
+              '~/.apprise.sock). Specify it to forward a notification to the '
+              'daemon.')
+@click.option('--profile-startup', is_flag=True,
+              help='Profiles the time and memory Apprise spends starting up '
+              '(per plugin) and exits. No notifications are sent using '
+              'this mode.')
 @click.option('--recursion-depth', '-R', default=DEFAULT_RECURSION_DEPTH,
               type=int,
               help='The number of recursive import entries that can be '
@@ -182,7 +640,10 @@ def print_version_msg():
                 metavar='SERVER_URL [SERVER_URL2 [SERVER_URL3]]',)
 def main(body, title, config, attach, urls, notification_type, theme, tag,
          input_format, dry_run, recursion_depth, verbose, disable_async,
-         details, interpret_escapes, plugin_path, debug, version):
+         details, interpret_escapes, plugin_path, debug, version,
+         profile_startup, stream, stream_max_inflight, daemon, socket_path,
+         dedup_window, dedup_path, circuit_threshold, circuit_timeout,
+         dns_cache_ttl):
     """
     Send a notification to all of the specified servers identified by their
     URLs the content provided within the title, body and notification-type.
@@ -256,12 +717,85 @@ def main(body, title, config, attach, urls, notification_type, theme, tag,
         # issue.  For consistency, we also return a 2
         sys.exit(2)
 
+    # A running daemon (--daemon) already has our default configuration
+    # loaded; we forward our notification to it if we were told where to find
+    # it (--socket) and the default configuration is all we'd use
+    sock = None if not socket_path or daemon or dry_run or details \
+        or stream or profile_startup or urls or config \
+        or os.environ.get('APPRISE_URLS', '').strip() \
+        or os.environ.get('APPRISE_CONFIG', '').strip() \
+        else daemon_connect(socket_path)
+
+    if sock is not None:
+        logger.debug('Forwarding notification to daemon: %s', socket_path)
+
+        # The daemon sends our notification using its own settings
+        ignored = [option for option, specified in (
+            ('--theme (-T)', theme != AppriseAsset.theme),
+            ('--disable-async (-Da)', disable_async),
+            ('--plugin-path (-P)', plugin_path),
+            ('--recursion-depth (-R)',
+             recursion_depth != DEFAULT_RECURSION_DEPTH),
+            ('--dedup-window', dedup_window),
+            ('--dedup-path', dedup_path),
+            ('--circuit-threshold', circuit_threshold),
+            ('--circuit-timeout',
+             circuit_timeout != AppriseAsset.circuit_timeout),
+            ('--dns-cache-ttl', dns_cache_ttl)) if specified]
+
+        if ignored:
+            logger.warning(
+                'The daemon uses its own settings; ignoring {}.'.format(
+                    ', '.join(ignored)))
+
+        if body is None:
+            logger.trace('No --body (-b) specified; reading from stdin')
+            # if no body was specified, then read from STDIN
+            body = click.get_text_stream('stdin').read()
+
+        record = {
+            'body': body,
+            'type': notification_type,
+            'format': input_format,
+            'interpret_escapes': interpret_escapes,
+        }
+
+        if title is not None:
+            record['title'] = title
+
+        if tag:
+            record['tag'] = list(tag)
+
+        if attach:
+            # The daemon doesn't share our working directory
+            record['attach'] = [
+                path if '://' in path else os.path.abspath(path)
+                for path in attach]
+
+        try:
+            result = daemon_notify(sock, record)
+
+        except (socket.error, ValueError) as e:
+            logger.error('The daemon failed to respond: {}'.format(str(e)))
+            sys.exit(1)
+
+        # Exit codes are the same as if we sent the notification ourselves
+        sys.exit(3 if result is None else (1 if result is False else 0))
+
     if not plugin_path:
         # Prepare a default set of plugin path
         plugin_path = \
             next((path for path in DEFAULT_PLUGIN_PATHS
                  if exists(expanduser(path))), None)
 
+    if profile_startup:
+        # Profile our start up and exit
+        print_startup_profile(plugin_path)
+        sys.exit(0)
+
+    if not socket_path:
+        socket_path = default_socket_path()
+
     # Prepare our asset
     asset = AppriseAsset(
         # Our body format
@@ -279,204 +813,279 @@ def main(body, title, config, attach, urls, notification_type, theme, tag,
         # everything run sequentially/syncronously instead.
         async_mode=disable_async is not True,
 
+        # Suppress duplicate notifications
+        dedup_window=dedup_window,
+        dedup_path=dedup_path,
+
+        # Fail fast when a service is down
+        circuit_threshold=circuit_threshold,
+        circuit_timeout=circuit_timeout,
+
+        # Cache our DNS lookups
+        dns_cache_ttl=dns_cache_ttl,
+
         # Load our plugins
         plugin_paths=plugin_path,
     )
 
-    # Create our Apprise object
-    a = Apprise(asset=asset, debug=debug, location=ContentLocation.LOCAL)
-
-    if details:
-        # Print details and exit
-        results = a.details(show_requirements=True, show_disabled=True)
-
-        # Sort our results:
-        plugins = sorted(
-            results['schemas'], key=lambda i: str(i['service_name']))
-        for entry in plugins:
-            protocols = [] if not entry['protocols'] else \
-                [p for p in entry['protocols']
-                 if isinstance(p, six.string_types)]
-            protocols.extend(
-                [] if not entry['secure_protocols'] else
-                [p for p in entry['secure_protocols']
-                 if isinstance(p, six.string_types)])
-
-            if len(protocols) == 1:
-                # Simplify view by swapping {schema} with the single
-                # protocol value
-
-                # Convert tuple to list
-                entry['details']['templates'] = \
-                    list(entry['details']['templates'])
-
-                for x in range(len(entry['details']['templates'])):
-                    entry['details']['templates'][x] = \
-                        re.sub(
-                            r'^[^}]+}://',
-                            '{}://'.format(protocols[0]),
-                            entry['details']['templates'][x])
-
-            fg = "green" if entry['enabled'] else "red"
-            if entry['category'] == 'custom':
-                # Identify these differently
-                fg = "cyan"
-                # Flip the enable switch so it forces the requirements
-                # to be displayed
-                entry['enabled'] = False
-
-            click.echo(click.style(
-                '{} {:<30} '.format(
-                    '+' if entry['enabled'] else '-',
-                    str(entry['service_name'])), fg=fg, bold=True),
-                nl=(not entry['enabled'] or len(protocols) == 1))
-
-            if not entry['enabled']:
-                if entry['requirements']['details']:
-                    click.echo(
-                        '   ' + str(entry['requirements']['details']))
-
-                if entry['requirements']['packages_required']:
-                    click.echo('   Python Packages Required:')
-                    for req in entry['requirements']['packages_required']:
-                        click.echo('     - ' + req)
-
-                if entry['requirements']['packages_recommended']:
-                    click.echo('   Python Packages Recommended:')
-                    for req in entry['requirements']['packages_recommended']:
-                        click.echo('     - ' + req)
+    # Create our Apprise object; our services are closed (releasing any
+    # sessions they hold) no matter how we exit
+    with Apprise(asset=asset, debug=debug,
+                 location=ContentLocation.LOCAL) as a:
+
+        if details:
+            # Print details and exit
+            results = a.details(show_requirements=True, show_disabled=True)
+
+            # Sort our results:
+            plugins = sorted(
+                results['schemas'], key=lambda i: str(i['service_name']))
+            for entry in plugins:
+                protocols = [] if not entry['protocols'] else \
+                    [p for p in entry['protocols']
+                     if isinstance(p, six.string_types)]
+                protocols.extend(
+                    [] if not entry['secure_protocols'] else
+                    [p for p in entry['secure_protocols']
+                     if isinstance(p, six.string_types)])
+
+                if len(protocols) == 1:
+                    # Simplify view by swapping {schema} with the single
+                    # protocol value
+
+                    # Convert tuple to list
+                    entry['details']['templates'] = \
+                        list(entry['details']['templates'])
+
+                    for x in range(len(entry['details']['templates'])):
+                        entry['details']['templates'][x] = \
+                            re.sub(
+                                r'^[^}]+}://',
+                                '{}://'.format(protocols[0]),
+                                entry['details']['templates'][x])
+
+                fg = "green" if entry['enabled'] else "red"
+                if entry['category'] == 'custom':
+                    # Identify these differently
+                    fg = "cyan"
+                    # Flip the enable switch so it forces the requirements
+                    # to be displayed
+                    entry['enabled'] = False
+
+                click.echo(click.style(
+                    '{} {:<30} '.format(
+                        '+' if entry['enabled'] else '-',
+                        str(entry['service_name'])), fg=fg, bold=True),
+                    nl=(not entry['enabled'] or len(protocols) == 1))
+
+                if not entry['enabled']:
+                    if entry['requirements']['details']:
+                        click.echo(
+                            '   ' + str(entry['requirements']['details']))
+
+                    if entry['requirements']['packages_required']:
+                        click.echo('   Python Packages Required:')
+                        for req in entry['requirements']['packages_required']:
+                            click.echo('     - ' + req)
+
+                    if entry['requirements']['packages_recommended']:
+                        click.echo('   Python Packages Recommended:')
+                        for req in \
+                                entry['requirements']['packages_recommended']:
+                            click.echo('     - ' + req)
+
+                    # new line padding between entries
+                    if entry['category'] == 'native':
+                        click.echo()
+                        continue
+
+                if len(protocols) > 1:
+                    click.echo('| Schema(s): {}'.format(
+                        ', '.join(protocols),
+                    ))
+
+                prefix = '   - '
+                click.echo('{}{}'.format(
+                    prefix,
+                    '\n{}'.format(prefix).join(entry['details']['templates'])))
 
                 # new line padding between entries
-                if entry['category'] == 'native':
-                    click.echo()
-                    continue
-
-            if len(protocols) > 1:
-                click.echo('| Schema(s): {}'.format(
-                    ', '.join(protocols),
-                ))
-
-            prefix = '   - '
-            click.echo('{}{}'.format(
-                prefix,
-                '\n{}'.format(prefix).join(entry['details']['templates'])))
-
-            # new line padding between entries
-            click.echo()
-
+                click.echo()
+
+            sys.exit(0)
+            # end if details()
+
+        # The priorities of what is accepted are parsed in order below:
+        #    1. URLs by command line
+        #    2. Configuration by command line
+        #    3. URLs by environment variable: APPRISE_URLS
+        #    4. Configuration by environment variable: APPRISE_CONFIG
+        #    5. Default Configuration File(s) (if found)
+        #
+        if urls:
+            if tag:
+                # Ignore any tags specified
+                logger.warning(
+                    '--tag (-g) entries are ignored when using specified URLs')
+                tag = None
+
+            # Load our URLs (if any defined)
+            for url in urls:
+                a.add(url)
+
+            if config:
+                # Provide a warning to the end user if they specified both
+                logger.warning(
+                    'You defined both URLs and a --config (-c) entry; '
+                    'Only the URLs will be referenced.')
+
+        elif config:
+            # We load our configuration file(s) now only if no URLs were
+            # specified. Specified config entries trump all
+            a.add(AppriseConfig(
+                paths=config, asset=asset, recursion=recursion_depth))
+
+        elif os.environ.get('APPRISE_URLS', '').strip():
+            logger.debug('Loading provided APPRISE_URLS environment variable')
+            if tag:
+                # Ignore any tags specified
+                logger.warning(
+                    '--tag (-g) entries are ignored when using specified URLs')
+                tag = None
+
+            # Attempt to use our APPRISE_URLS environment variable (if
+            # populated)
+            a.add(os.environ['APPRISE_URLS'].strip())
+
+        elif os.environ.get('APPRISE_CONFIG', '').strip():
+            logger.debug(
+                'Loading provided APPRISE_CONFIG environment variable')
+            # Fall back to config environment variable (if populated)
+            a.add(AppriseConfig(
+                paths=os.environ['APPRISE_CONFIG'].strip(),
+                asset=asset, recursion=recursion_depth))
+
+        else:
+            # Load default configuration
+            a.add(AppriseConfig(
+                paths=[f for f in DEFAULT_CONFIG_PATHS
+                       if isfile(expanduser(f))],
+                asset=asset, recursion=recursion_depth))
+
+        if not (a or urls):
+            logger.error(
+                'You must specify at least one server URL or populated '
+                'configuration file.')
+            print_help_msg(main)
+            sys.exit(1)
+
+        # each --tag entry comprises of a comma separated 'and' list
+        # we or each of of the --tag and sets specified.
+        tags = None if not tag else [parse_list(t) for t in tag]
+
+        if daemon:
+            if not hasattr(socket, 'AF_UNIX'):
+                logger.error('The --daemon mode requires UNIX socket support.')
+                sys.exit(2)
+
+            if title or tags or attach:
+                # Each request carries its own
+                logger.warning(
+                    'The --title (-t), --tag (-g) and --attach (-a) entries '
+                    'are ignored when using --daemon')
+
+            try:
+                server = DaemonServer(a, socket_path)
+
+            except (socket.error, OSError) as e:
+                logger.error(
+                    'Could not listen on {}: {}'.format(socket_path, str(e)))
+                sys.exit(1)
+
+            # Load (and instantiate) all of our services now so that we're
+            # ready when the first notification arrives
+            services = list(a.find())
+            logger.info(
+                'Listening on {} with {} service(s) loaded.'.format(
+                    socket_path, len(services)))
+
+            def terminate(*args):
+                # Allows our clean up below to take place
+                raise KeyboardInterrupt()
+
+            signal.signal(signal.SIGTERM, terminate)
+
+            try:
+                server.serve_forever()
+
+            except KeyboardInterrupt:
+                logger.info('Shutting down daemon.')
+
+            finally:
+                server.server_close()
+
+            sys.exit(0)
+
+        if not dry_run and stream:
+            if body is not None:
+                logger.warning(
+                    'The --body (-b) entry is ignored when using '
+                    '--stream (-S)')
+
+            logger.trace('Streaming notifications from stdin')
+            result = stream_notify(
+                a, click.get_text_stream('stdin'), stream_format=stream,
+                max_inflight=stream_max_inflight, title=title,
+                notify_type=notification_type, tag=tags, attach=attach)
+
+        elif not dry_run:
+            if body is None:
+                logger.trace('No --body (-b) specified; reading from stdin')
+                # if no body was specified, then read from STDIN
+                body = click.get_text_stream('stdin').read()
+
+            # now print it out
+            result = a.notify(
+                body=body, title=title, notify_type=notification_type,
+                tag=tags, attach=attach)
+        else:
+            # Number of rows to assume in the terminal.  In future, maybe this
+            # can be detected and made dynamic. The actual row count is 80,
+            # but 5 characters are already reserved for the counter on the
+            # left
+            rows = 75
+
+            # Initialize our URL response;  This is populated within the
+            # for/loop below; but plays a factor at the end when we need to
+            # determine if we iterated at least once in the loop.
+            url = None
+
+            for idx, server in enumerate(a.find(tag=tags)):
+                url = server.url(privacy=True)
+                click.echo("{: 3d}. {}".format(
+                    idx + 1,
+                    url if len(url) <= rows
+                    else '{}...'.format(url[:rows - 3])))
+                if server.tags:
+                    click.echo("{} - {}".format(
+                        ' ' * 5, ', '.join(server.tags)))
+
+            # Initialize a default response of nothing matched, otherwise
+            # if we matched at least one entry, we can return True
+            result = None if url is None else True
+
+        if result is None:
+            # There were no notifications set.  This is a result of just
+            # having empty configuration files and/or being to restrictive
+            # when filtering by specific tag(s)
+
+            # Exit code 3 is used since Click uses exit code 2 if there is an
+            # error with the parameters specified
+            sys.exit(3)
+
+        elif result is False:
+            # At least 1 notification service failed to send
+            sys.exit(1)
+
+        # else:  We're good!
         sys.exit(0)
-        # end if details()
-
-    # The priorities of what is accepted are parsed in order below:
-    #    1. URLs by command line
-    #    2. Configuration by command line
-    #    3. URLs by environment variable: APPRISE_URLS
-    #    4. Configuration by environment variable: APPRISE_CONFIG
-    #    5. Default Configuration File(s) (if found)
-    #
-    if urls:
-        if tag:
-            # Ignore any tags specified
-            logger.warning(
-                '--tag (-g) entries are ignored when using specified URLs')
-            tag = None
-
-        # Load our URLs (if any defined)
-        for url in urls:
-            a.add(url)
-
-        if config:
-            # Provide a warning to the end user if they specified both
-            logger.warning(
-                'You defined both URLs and a --config (-c) entry; '
-                'Only the URLs will be referenced.')
-
-    elif config:
-        # We load our configuration file(s) now only if no URLs were specified
-        # Specified config entries trump all
-        a.add(AppriseConfig(
-            paths=config, asset=asset, recursion=recursion_depth))
-
-    elif os.environ.get('APPRISE_URLS', '').strip():
-        logger.debug('Loading provided APPRISE_URLS environment variable')
-        if tag:
-            # Ignore any tags specified
-            logger.warning(
-                '--tag (-g) entries are ignored when using specified URLs')
-            tag = None
-
-        # Attempt to use our APPRISE_URLS environment variable (if populated)
-        a.add(os.environ['APPRISE_URLS'].strip())
-
-    elif os.environ.get('APPRISE_CONFIG', '').strip():
-        logger.debug('Loading provided APPRISE_CONFIG environment variable')
-        # Fall back to config environment variable (if populated)
-        a.add(AppriseConfig(
-            paths=os.environ['APPRISE_CONFIG'].strip(),
-            asset=asset, recursion=recursion_depth))
-
-    else:
-        # Load default configuration
-        a.add(AppriseConfig(
-            paths=[f for f in DEFAULT_CONFIG_PATHS if isfile(expanduser(f))],
-            asset=asset, recursion=recursion_depth))
-
-    if len(a) == 0 and not urls:
-        logger.error(
-            'You must specify at least one server URL or populated '
-            'configuration file.')
-        print_help_msg(main)
-        sys.exit(1)
-
-    # each --tag entry comprises of a comma separated 'and' list
-    # we or each of of the --tag and sets specified.
-    tags = None if not tag else [parse_list(t) for t in tag]
-
-    if not dry_run:
-        if body is None:
-            logger.trace('No --body (-b) specified; reading from stdin')
-            # if no body was specified, then read from STDIN
-            body = click.get_text_stream('stdin').read()
-
-        # now print it out
-        result = a.notify(
-            body=body, title=title, notify_type=notification_type, tag=tags,
-            attach=attach)
-    else:
-        # Number of rows to assume in the terminal.  In future, maybe this can
-        # be detected and made dynamic. The actual row count is 80, but 5
-        # characters are already reserved for the counter on the left
-        rows = 75
-
-        # Initialize our URL response;  This is populated within the for/loop
-        # below; but plays a factor at the end when we need to determine if
-        # we iterated at least once in the loop.
-        url = None
-
-        for idx, server in enumerate(a.find(tag=tags)):
-            url = server.url(privacy=True)
-            click.echo("{: 3d}. {}".format(
-                idx + 1,
-                url if len(url) <= rows else '{}...'.format(url[:rows - 3])))
-            if server.tags:
-                click.echo("{} - {}".format(' ' * 5, ', '.join(server.tags)))
-
-        # Initialize a default response of nothing matched, otherwise
-        # if we matched at least one entry, we can return True
-        result = None if url is None else True
-
-    if result is None:
-        # There were no notifications set.  This is a result of just having
-        # empty configuration files and/or being to restrictive when filtering
-        # by specific tag(s)
-
-        # Exit code 3 is used since Click uses exit code 2 if there is an
-        # error with the parameters specified
-        sys.exit(3)
-
-    elif result is False:
-        # At least 1 notification service failed to send
-        sys.exit(1)
-
-    # else:  We're good!
-    sys.exit(0)
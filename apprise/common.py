@@ -152,6 +152,33 @@ OVERFLOW_MODES = (
 )
 
 
+class OverflowUnit(object):
+    """
+    A list of pre-defined units a notification service may measure its
+    maximum message size in.
+    """
+
+    # The length is measured in characters; this is what most services
+    # use
+    CHARACTER = 'character'
+
+    # The length is measured in bytes once the content is UTF-8 encoded
+    BYTE = 'byte'
+
+    # The length is measured in UTF-16 code units (the way JavaScript and
+    # Java measure a string); characters outside of the basic multilingual
+    # plane (such as emojis) count as two units
+    UTF16 = 'utf16'
+
+
+# Define our overflow units so we can verify if we need to
+OVERFLOW_UNITS = (
+    OverflowUnit.CHARACTER,
+    OverflowUnit.BYTE,
+    OverflowUnit.UTF16,
+)
+
+
 class ConfigFormat(object):
     """
     A list of pre-defined config formats that can be passed via the
@@ -28,21 +28,144 @@ import re
 import six
 import yaml
 import time
+import logging
+import threading
 
 from .. import plugins
 from .. import common
 from ..AppriseAsset import AppriseAsset
 from ..URLBase import URLBase
 from ..utils import GET_SCHEMA_RE
-from ..utils import parse_list
+from ..utils import tag_logic
+from ..utils import tag_set
 from ..utils import parse_bool
 from ..utils import parse_urls
-from ..utils import cwe312_url
+from ..utils import CWE312URL
+from ..utils import is_exclusive_match
+
+try:
+    # Use the C (libyaml) accelerated loader if it's available to us; it's
+    # many times faster then the pure python implementation
+    from yaml import CSafeLoader as YAMLSafeLoader
+
+except ImportError:  # pragma: no cover
+    # Fall back to the pure python implementation
+    from yaml import SafeLoader as YAMLSafeLoader
 
 # Test whether token is valid or not
 VALID_TOKEN = re.compile(
     r'(?P<token>[a-z0-9][a-z0-9_]+)', re.I)
 
+# Define what a valid line of our TEXT based configuration looks like
+VALID_TEXT_LINE_RE = re.compile(
+    r'^\s*(?P<line>([;#]+(?P<comment>.*))|'
+    r'(\s*(?P<tags>[^=]+)=|=)?\s*'
+    r'(?P<url>[a-z0-9]{2,9}://.*)|'
+    r'include\s+(?P<config>.+))?\s*$', re.I)
+
+# Used to strip the cache argument from the configuration URLs we track in
+# our include graph; it has no bearing on the content that gets loaded
+CACHE_ARG_RE = re.compile(r'(?<=[?&])cache=[^&]*(&|$)', re.I)
+
+# The templates (see plugins.details()) of each notification service
+# referenced in our YAML configuration are cached here; they're consulted for
+# every entry and never change once they've been generated
+TEMPLATE_DETAILS_CACHE = {}
+
+
+class ConfigEntry(object):
+    """
+    A lightweight reference to a notification service defined in our
+    configuration.  The notification service itself is only instantiated the
+    first time it's needed (and is then re-used thereafter).
+    """
+
+    __slots__ = ('schema', 'tags', 'results', 'plugin', 'description')
+
+    # Ensures each of our services is only ever instantiated once (even when
+    # several threads ask for it at the same time).  It's shared by all of
+    # our entries since there can be a great deal of them (and they're only
+    # instantiated the once).
+    _instantiate_lock = threading.Lock()
+
+    def __init__(self, results, description):
+        """
+        Takes the (parsed) results that will be used to instantiate our
+        notification service and a tuple describing where we came from
+        (for logging purposes should we fail to load). The description is
+        a logging format string followed by it's arguments.
+        """
+
+        # Our schema and the tags we can be matched against
+        self.schema = results['schema']
+        self.tags = results['tag']
+
+        # What we need to instantiate our plugin
+        self.results = results
+        self.description = description
+
+        # Our instantiated plugin
+        self.plugin = None
+
+    def instantiate(self):
+        """
+        Returns our instantiated notification service or None if it could
+        not be loaded.  We only ever try to load our service once.
+        """
+
+        if self.results is None:
+            # We've already been here
+            return self.plugin
+
+        with ConfigEntry._instantiate_lock:
+            if self.results is None:
+                # Another thread beat us to it
+                return self.plugin
+
+            return self._instantiate()
+
+    def _instantiate(self):
+        """
+        Instantiates our notification service (see instantiate())
+        """
+
+        results = self.results
+        if 'tag' in results:
+            # Our (interned) tags are shared with every other entry tagged
+            # the same way; our service gets a set of its own
+            results['tag'] = set(results['tag'])
+
+        asset = results['asset']
+        try:
+            # Attempt to create an instance of our plugin using the
+            # parsed URL information
+            self.plugin = \
+                common.NOTIFY_SCHEMA_MAP[results['schema']](**results)
+
+            if URLBase.logger.isEnabledFor(logging.DEBUG):
+                # Create log entry of loaded URL
+                URLBase.logger.debug(
+                    'Loaded URL: %s',
+                    self.plugin.url(privacy=asset.secure_logging))
+
+        except Exception as e:
+            # the arguments are invalid or can not be used.
+            URLBase.logger.warning(
+                'Could not load ' + self.description[0] + '.',
+                *self.description[1:])
+            URLBase.logger.debug('Loading Exception: %s' % str(e))
+
+        # We no longer need our results
+        self.results = None
+        return self.plugin
+
+    def close(self):
+        """
+        Releases the resources held by our service (if it was loaded)
+        """
+        if self.plugin is not None:
+            self.plugin.close()
+
 
 class ConfigBase(URLBase):
     """
@@ -72,6 +195,10 @@ class ConfigBase(URLBase):
     # the config path manages the handling of relative include
     config_path = os.getcwd()
 
+    # The maximum number of configuration sources (and the configuration
+    # they include) we'll fetch at the same time
+    max_concurrent_loads = 8
+
     def __init__(self, cache=True, recursion=0, insecure_includes=False,
                  **kwargs):
         """
@@ -124,6 +251,9 @@ class ConfigBase(URLBase):
         # Tracks previously loaded content for speed
         self._cached_servers = None
 
+        # Protects our cached content; only one thread loads it at a time
+        self._cached_lock = threading.RLock()
+
         # Initialize our recursion value
         self.recursion = recursion
 
@@ -169,23 +299,99 @@ class ConfigBase(URLBase):
 
         """
 
-        if not self.expired():
-            # We already have cached results to return; use them
-            return self._cached_servers
+        # Load our entries (if we need to) and instantiate all of them
+        self.entries(asset=asset, **kwargs)
+        return self._instantiate()
+
+    def find(self, tag=common.MATCH_ALL_TAG, match_always=True, asset=None,
+             **kwargs):
+        """
+        Returns a generator of all of the services matching the tag specified.
+
+        Unlike servers(), only the services that match our tag are
+        instantiated (if they weren't already).  See Apprise.find() for
+        details on how the tag is applied.
+
+        """
+
+        # A match_always flag allows us to pick up on our 'any' keyword
+        # and notify these services under all circumstances
+        match_always = common.MATCH_ALWAYS_TAG if match_always else None
+
+        # Our tag is applied to every service we have; parse it only once
+        tag = tag_logic(tag)
+
+        servers = self.entries(asset=asset, **kwargs)
+        for index, server in enumerate(servers):
+            # Apply our tag matching based on our defined logic
+            if not is_exclusive_match(
+                    logic=tag, data=server.tags,
+                    match_all=common.MATCH_ALL_TAG,
+                    match_always=match_always):
+                continue
+
+            if isinstance(server, ConfigEntry):
+                plugin = server.instantiate()
+                if plugin is None:
+                    # We couldn't load this service
+                    continue
+
+                with self._cached_lock:
+                    if servers[index] is server:
+                        # Cache our instantiated plugin in place of our entry
+                        servers[index] = plugin
+
+                server = plugin
+
+            yield server
+
+    def entries(self, asset=None, include_graph=None, **kwargs):
+        """
+        Performs reads loaded configuration and returns all of the services
+        that could be parsed.  The services returned are either already
+        instantiated or a ConfigEntry() object that has yet to be; see
+        servers() if you need all of them instantiated.
+
+        The include_graph is a dictionary shared by all of the configuration
+        loaded from the same (top level) source; it tracks every URL that
+        was included so that each is only ever fetched once (no matter how
+        many times it is referenced or whether it includes itself).
+
+        """
+
+        with self._cached_lock:
+            if not self.expired():
+                # We already have cached results to return; use them
+                return self._cached_servers
+
+            # Our list is only made available once it's complete
+            servers = self._load(
+                asset=asset, include_graph=include_graph, **kwargs)
+
+            # Cache our results along with the time we did so
+            self._cached_servers = servers
+            self._cached_time = time.time()
+
+            return servers
+
+    def _load(self, asset=None, include_graph=None, **kwargs):
+        """
+        Reads and parses our configuration (and that which it includes);
+        this is the work behind entries().  A new list of the services found
+        is returned.
+
+        """
 
-        # Our cached response object
-        self._cached_servers = list()
+        # Our response object
+        cached = list()
 
         # read() causes the child class to do whatever it takes for the
         # config plugin to load the data source and return unparsed content
         # None is returned if there was an error or simply no data
         content = self.read(**kwargs)
         if not isinstance(content, six.string_types):
-            # Set the time our content was cached at
-            self._cached_time = time.time()
-
-            # Nothing more to do; return our empty cache list
-            return self._cached_servers
+            # Nothing more to do; return our empty list
+            return cached
 
         # Our Configuration format uses a default if one wasn't one detected
         # or enfored.
@@ -200,9 +406,17 @@ class ConfigBase(URLBase):
         asset = asset if isinstance(asset, AppriseAsset) else self.asset
 
         # Execute our config parse function which always returns a tuple
-        # of our servers and our configuration
-        servers, configs = fn(content=content, asset=asset)
-        self._cached_servers.extend(servers)
+        # of our servers and our configuration; we instantiate our services
+        # as they're needed
+        servers, configs = fn(content=content, asset=asset, lazy=True)
+        cached.extend(servers)
+
+        if include_graph is None:
+            # We're the top of our include tree
+            include_graph = {self._include_key(): self}
+
+        # The configuration we include
+        includes = []
 
         # Configuration files were detected; recursively populate them
         # If we have been configured to do so
@@ -234,7 +448,7 @@ class ConfigBase(URLBase):
 
                 # CWE-312 (Secure Logging) Handling
                 loggable_url = url if not asset.secure_logging \
-                    else cwe312_url(url)
+                    else CWE312URL(url)
 
                 # Parse our url details of the server object as dictionary
                 # containing all of the information parsed from our URL
@@ -242,7 +456,7 @@ class ConfigBase(URLBase):
                 if not results:
                     # Failed to parse the server URL
                     self.logger.warning(
-                        'Unparseable include URL {}'.format(loggable_url))
+                        'Unparseable include URL %s', loggable_url)
                     continue
 
                 # Handle cross inclusion based on allow_cross_includes rules
@@ -256,8 +470,8 @@ class ConfigBase(URLBase):
 
                     # Prevent the loading if insecure base protocols
                     ConfigBase.logger.warning(
-                        'Including {}:// based configuration is prohibited. '
-                        'Ignoring URL {}'.format(schema, loggable_url))
+                        'Including %s:// based configuration is prohibited. '
+                        'Ignoring URL %s', schema, loggable_url)
                     continue
 
                 # Prepare our Asset Object
@@ -284,39 +498,156 @@ class ConfigBase(URLBase):
                 except Exception as e:
                     # the arguments are invalid or can not be used.
                     self.logger.warning(
-                        'Could not load include URL: {}'.format(loggable_url))
+                        'Could not load include URL: %s', loggable_url)
                     self.logger.debug('Loading Exception: {}'.format(str(e)))
                     continue
 
-                # if we reach here, we can now add this servers found
-                # in this configuration file to our list
-                self._cached_servers.extend(
-                    cfg_plugin.servers(asset=asset))
+                # setdefault() is atomic; so even if the same URL is included
+                # by more than one of the configuration files we're loading
+                # concurrently, only one of them gets to fetch it
+                if include_graph.setdefault(
+                        cfg_plugin._include_key(), cfg_plugin) \
+                        is not cfg_plugin:
+                    self.logger.debug(
+                        'Ignoring previously included URL: %s', loggable_url)
+                    continue
 
-                # We no longer need our configuration object
-                del cfg_plugin
+                includes.append(cfg_plugin)
 
             else:
                 # CWE-312 (Secure Logging) Handling
                 loggable_url = url if not asset.secure_logging \
-                    else cwe312_url(url)
+                    else CWE312URL(url)
 
                 self.logger.debug(
                     'Recursion limit reached; ignoring Include URL: %s',
                     loggable_url)
 
-        if self._cached_servers:
+        # if we reach here, we can now add the servers found in the
+        # configuration we include to our list; they're all fetched at the
+        # same time (and added in the order they were referenced)
+        for servers in ConfigBase.load_all(
+                includes, asset=asset, include_graph=include_graph):
+            cached.extend(servers)
+
+        # We no longer need our included configuration objects
+        del includes
+
+        if cached:
             self.logger.info(
                 'Loaded {} entries from {}'.format(
-                    len(self._cached_servers),
-                    self.url(privacy=asset.secure_logging)))
+                    len(cached), self.url(privacy=asset.secure_logging)))
         else:
             self.logger.warning(
                 'Failed to load Apprise configuration from {}'.format(
                     self.url(privacy=asset.secure_logging)))
 
-        # Set the time our content was cached at
-        self._cached_time = time.time()
+        return cached
+
+    def _include_key(self):
+        """
+        Returns the key we're tracked by within an include graph; it's simply
+        our type paired with our URL (less the cache argument).
+        """
+        return (
+            type(self),
+            CACHE_ARG_RE.sub('', self.url(privacy=False)).rstrip('?&'))
+
+    @staticmethod
+    def load_all(configs, **kwargs):
+        """
+        Calls entries() on each of the configuration objects specified; up to
+        max_concurrent_loads of them are fetched at the same time.  Any
+        keyword arguments are passed along to entries().
+
+        A list of what each of them returned is returned (in the same order
+        the configuration was specified in).
+        """
+
+        configs = list(configs)
+        results = [[] for _ in configs]
+        if len(configs) <= 1:
+            # No need to spin up any threads
+            for index, config in enumerate(configs):
+                results[index] = config.entries(**kwargs)
+
+            return results
+
+        # Protects our source (which is a generator)
+        lock = threading.Lock()
+        source = enumerate(configs)
+
+        def worker():
+            while True:
+                with lock:
+                    try:
+                        index, config = next(source)
+
+                    except StopIteration:
+                        # We're done
+                        return
+
+                try:
+                    results[index] = config.entries(**kwargs)
+
+                except Exception as e:
+                    # We're in our own thread so we need to handle this
+                    ConfigBase.logger.warning(
+                        'An exception occurred loading configuration from '
+                        '{}.'.format(config.url(privacy=True)))
+                    ConfigBase.logger.debug('Exception: %s' % str(e))
+
+        threads = [
+            threading.Thread(target=worker) for _ in range(
+                min(len(configs), ConfigBase.max_concurrent_loads))]
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    @staticmethod
+    def prefetch(configs):
+        """
+        Fetches the configuration objects specified (that have yet to be
+        loaded or that have expired) at the same time so that their content is
+        cached and ready for when it's needed.
+
+        Configuration that is not cached is skipped; it is re-read every
+        time it is used anyway.
+        """
+
+        # The same configuration object could be referenced more than once
+        pending = []
+        for config in configs:
+            if config.cache and config.expired() and \
+                    not any(config is c for c in pending):
+                pending.append(config)
+
+        ConfigBase.load_all(pending)
+
+    def _instantiate(self):
+        """
+        Ensures every service we've loaded has been instantiated; entries that
+        fail to load are dropped.  Our (cached) list of servers is returned.
+
+        """
+
+        if not isinstance(self._cached_servers, list):
+            # Generate ourselves a list of content we can pull from
+            return self.servers()
+
+        with self._cached_lock:
+            if any(isinstance(s, ConfigEntry) for s in self._cached_servers):
+                # Update our list in place
+                self._cached_servers[:] = [
+                    p for p in (
+                        s.instantiate() if isinstance(s, ConfigEntry) else s
+                        for s in self._cached_servers) if p is not None]
 
         return self._cached_servers
 
@@ -476,11 +807,15 @@ class ConfigBase(URLBase):
         return config_format
 
     @staticmethod
-    def config_parse(content, asset=None, config_format=None, **kwargs):
+    def config_parse(content, asset=None, config_format=None, lazy=False,
+                     **kwargs):
         """
         Takes the specified config content and loads it based on the specified
         config_format. If a format isn't specified, then it is auto detected.
 
+        If lazy is set to True, then ConfigEntry() objects are returned in
+        place of the instantiated services.
+
         """
 
         if config_format is None:
@@ -503,10 +838,10 @@ class ConfigBase(URLBase):
         fn = getattr(ConfigBase, 'config_parse_{}'.format(config_format))
 
         # Execute our config parse function which always returns a list
-        return fn(content=content, asset=asset)
+        return fn(content=content, asset=asset, lazy=lazy)
 
     @staticmethod
-    def config_parse_text(content, asset=None):
+    def config_parse_text(content, asset=None, lazy=False):
         """
         Parse the specified content as though it were a simple text file only
         containing a list of URLs.
@@ -518,6 +853,9 @@ class ConfigBase(URLBase):
 
         You may also optionally associate an asset with the notification.
 
+        If lazy is set to True, then the servers returned are ConfigEntry()
+        objects which only instantiate the service when they're asked to.
+
         The file syntax is:
 
             #
@@ -546,13 +884,6 @@ class ConfigBase(URLBase):
         # Prepare our Asset Object
         asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
 
-        # Define what a valid line should look like
-        valid_line_re = re.compile(
-            r'^\s*(?P<line>([;#]+(?P<comment>.*))|'
-            r'(\s*(?P<tags>[^=]+)=|=)?\s*'
-            r'(?P<url>[a-z0-9]{2,9}://.*)|'
-            r'include\s+(?P<config>.+))?\s*$', re.I)
-
         try:
             # split our content up to read line by line
             content = re.split(r'\r*\n', content)
@@ -564,7 +895,7 @@ class ConfigBase(URLBase):
             return (list(), list())
 
         for line, entry in enumerate(content, start=1):
-            result = valid_line_re.match(entry)
+            result = VALID_TEXT_LINE_RE.match(entry)
             if not result:
                 # Invalid syntax
                 ConfigBase.logger.error(
@@ -584,10 +915,9 @@ class ConfigBase(URLBase):
             if config:
                 # CWE-312 (Secure Logging) Handling
                 loggable_url = config if not asset.secure_logging \
-                    else cwe312_url(config)
+                    else CWE312URL(config)
 
-                ConfigBase.logger.debug(
-                    'Include URL: {}'.format(loggable_url))
+                ConfigBase.logger.debug('Include URL: %s', loggable_url)
 
                 # Store our include line
                 configs.append(config.strip())
@@ -595,7 +925,7 @@ class ConfigBase(URLBase):
 
             # CWE-312 (Secure Logging) Handling
             loggable_url = url if not asset.secure_logging \
-                else cwe312_url(url)
+                else CWE312URL(url)
 
             # Acquire our url tokens
             results = plugins.url_to_dict(
@@ -603,32 +933,26 @@ class ConfigBase(URLBase):
             if results is None:
                 # Failed to parse the server URL
                 ConfigBase.logger.warning(
-                    'Unparseable URL {} on line {}.'.format(
-                        loggable_url, line))
+                    'Unparseable URL %s on line %s.', loggable_url, line)
                 continue
 
             # Build a list of tags to associate with the newly added
             # notifications if any were set
-            results['tag'] = set(parse_list(result.group('tags')))
+            results['tag'] = tag_set(result.group('tags'))
 
             # Set our Asset Object
             results['asset'] = asset
 
-            try:
-                # Attempt to create an instance of our plugin using the
-                # parsed URL information
-                plugin = common.NOTIFY_SCHEMA_MAP[results['schema']](**results)
-
-                # Create log entry of loaded URL
-                ConfigBase.logger.debug(
-                    'Loaded URL: %s', plugin.url(privacy=asset.secure_logging))
+            entry = ConfigEntry(
+                results, ('URL %s on line %s', loggable_url, line))
+            if lazy:
+                # We'll instantiate our plugin when it's needed
+                servers.append(entry)
+                continue
 
-            except Exception as e:
+            plugin = entry.instantiate()
+            if plugin is None:
                 # the arguments are invalid or can not be used.
-                ConfigBase.logger.warning(
-                    'Could not load URL {} on line {}.'.format(
-                        loggable_url, line))
-                ConfigBase.logger.debug('Loading Exception: %s' % str(e))
                 continue
 
             # if we reach here, we successfully loaded our data
@@ -638,7 +962,7 @@ class ConfigBase(URLBase):
         return (servers, configs)
 
     @staticmethod
-    def config_parse_yaml(content, asset=None):
+    def config_parse_yaml(content, asset=None, lazy=False):
         """
         Parse the specified content as though it were a yaml file
         specifically formatted for Apprise.
@@ -650,6 +974,9 @@ class ConfigBase(URLBase):
 
         You may optionally associate an asset with the notification.
 
+        If lazy is set to True, then the servers returned are ConfigEntry()
+        objects which only instantiate the service when they're asked to.
+
         """
 
         # A list of loaded Notification Services
@@ -661,9 +988,10 @@ class ConfigBase(URLBase):
 
         try:
             # Load our data (safely)
-            result = yaml.load(content, Loader=yaml.SafeLoader)
+            result = yaml.load(content, Loader=YAMLSafeLoader)
 
         except (AttributeError,
+                TypeError,
                 yaml.parser.ParserError,
                 yaml.error.MarkedYAMLError) as e:
             # Invalid content
@@ -735,12 +1063,12 @@ class ConfigBase(URLBase):
         #
         # global tag root directive
         #
-        global_tags = set()
+        global_tags = tag_set()
 
         tags = result.get('tag', None)
         if tags and isinstance(tags, (list, tuple, six.string_types)):
             # Store any preset tags
-            global_tags = set(parse_list(tags))
+            global_tags = tag_set(tags)
 
         #
         # include root directive
@@ -775,6 +1103,10 @@ class ConfigBase(URLBase):
             # Not a problem; we simply have no urls
             urls = list()
 
+        # Unpacking our entries for the logs is only worth doing if we're
+        # going to log it
+        trace = ConfigBase.logger.isEnabledFor(logging.TRACE)
+
         # Iterate over each URL
         for no, url in enumerate(urls):
 
@@ -784,7 +1116,7 @@ class ConfigBase(URLBase):
 
             # CWE-312 (Secure Logging) Handling
             loggable_url = url if not asset.secure_logging \
-                else cwe312_url(url)
+                else CWE312URL(url)
 
             if isinstance(url, six.string_types):
                 # We're just a simple URL string...
@@ -794,8 +1126,7 @@ class ConfigBase(URLBase):
                     # config file at least has something to take action
                     # with.
                     ConfigBase.logger.warning(
-                        'Invalid URL {}, entry #{}'.format(
-                            loggable_url, no + 1))
+                        'Invalid URL %s, entry #%d', loggable_url, no + 1)
                     continue
 
                 # We found a valid schema worthy of tracking; store it's
@@ -804,8 +1135,7 @@ class ConfigBase(URLBase):
                     url, secure_logging=asset.secure_logging)
                 if _results is None:
                     ConfigBase.logger.warning(
-                        'Unparseable URL {}, entry #{}'.format(
-                            loggable_url, no + 1))
+                        'Unparseable URL %s, entry #%d', loggable_url, no + 1)
                     continue
 
                 # add our results to our global set
@@ -938,8 +1268,7 @@ class ConfigBase(URLBase):
                 # The below ensures our tags are set correctly
                 if 'tag' in _results:
                     # Tidy our list up
-                    _results['tag'] = \
-                        set(parse_list(_results['tag'])) | global_tags
+                    _results['tag'] = tag_set(_results['tag'], global_tags)
 
                 else:
                     # Just use the global settings
@@ -956,34 +1285,28 @@ class ConfigBase(URLBase):
                             .format(key, no + 1, entry))
                         del _results[key]
 
-                ConfigBase.logger.trace(
-                    'URL #{}: {} unpacked as:{}{}'
-                    .format(no + 1, url, os.linesep, os.linesep.join(
-                        ['{}="{}"'.format(k, a)
-                         for k, a in _results.items()])))
+                if trace:
+                    ConfigBase.logger.trace(
+                        'URL #{}: {} unpacked as:{}{}'
+                        .format(no + 1, url, os.linesep, os.linesep.join(
+                            ['{}="{}"'.format(k, a)
+                             for k, a in _results.items()])))
 
                 # Prepare our Asset Object
                 _results['asset'] = asset
 
-                # Now we generate our plugin
-                try:
-                    # Attempt to create an instance of our plugin using the
-                    # parsed URL information
-                    plugin = common.\
-                        NOTIFY_SCHEMA_MAP[_results['schema']](**_results)
-
-                    # Create log entry of loaded URL
-                    ConfigBase.logger.debug(
-                        'Loaded URL: {}'.format(
-                            plugin.url(privacy=asset.secure_logging)))
+                config_entry = ConfigEntry(_results, (
+                    'Apprise YAML configuration entry #%d, item #%d',
+                    no + 1, entry))
+                if lazy:
+                    # We'll instantiate our plugin when it's needed
+                    servers.append(config_entry)
+                    continue
 
-                except Exception as e:
+                # Now we generate our plugin
+                plugin = config_entry.instantiate()
+                if plugin is None:
                     # the arguments are invalid or can not be used.
-                    ConfigBase.logger.warning(
-                        'Could not load Apprise YAML configuration '
-                        'entry #{}, item #{}'
-                        .format(no + 1, entry))
-                    ConfigBase.logger.debug('Loading Exception: %s' % str(e))
                     continue
 
                 # if we reach here, we successfully loaded our data
@@ -998,12 +1321,18 @@ class ConfigBase(URLBase):
         By default, the last element of the list is removed.
         """
 
-        if not isinstance(self._cached_servers, list):
-            # Generate ourselves a list of content we can pull from
-            self.servers()
-
         # Pop the element off of the stack
-        return self._cached_servers.pop(index)
+        return self._instantiate().pop(index)
+
+    def close(self):
+        """
+        Releases the resources held by any of the services we already loaded.
+        Configuration is not (re-)read to do this.
+
+        """
+        if isinstance(self._cached_servers, list):
+            for server in self._cached_servers:
+                server.close()
 
     @staticmethod
     def _special_token_handler(schema, tokens):
@@ -1067,8 +1396,13 @@ class ConfigBase(URLBase):
         #
         # This function here allows these mappings to take place within the
         # YAML file as independant arguments.
-        class_templates = \
-            plugins.details(common.NOTIFY_SCHEMA_MAP[schema])
+        plugin = common.NOTIFY_SCHEMA_MAP[schema]
+        try:
+            class_templates = TEMPLATE_DETAILS_CACHE[plugin]
+
+        except KeyError:
+            class_templates = plugins.details(plugin)
+            TEMPLATE_DETAILS_CACHE[plugin] = class_templates
 
         for key in list(tokens.keys()):
 
@@ -1139,50 +1473,40 @@ class ConfigBase(URLBase):
         Returns the indexed server entry associated with the loaded
         notification servers
         """
-        if not isinstance(self._cached_servers, list):
-            # Generate ourselves a list of content we can pull from
-            self.servers()
-
-        return self._cached_servers[index]
+        return self._instantiate()[index]
 
     def __iter__(self):
         """
         Returns an iterator to our server list
         """
-        if not isinstance(self._cached_servers, list):
-            # Generate ourselves a list of content we can pull from
-            self.servers()
-
-        return iter(self._cached_servers)
+        return iter(self._instantiate())
 
     def __len__(self):
         """
         Returns the total number of servers loaded
         """
-        if not isinstance(self._cached_servers, list):
-            # Generate ourselves a list of content we can pull from
-            self.servers()
-
-        return len(self._cached_servers)
+        return len(self._instantiate())
 
     def __bool__(self):
         """
         Allows the Apprise object to be wrapped in an Python 3.x based 'if
-        statement'.  True is returned if our content was downloaded correctly.
+        statement'.  True is returned if at least one of our services can be
+        loaded; they're only instantiated until the first one that does is
+        found.
         """
-        if not isinstance(self._cached_servers, list):
-            # Generate ourselves a list of content we can pull from
-            self.servers()
+        for _ in self.find():
+            return True
 
-        return True if self._cached_servers else False
+        return False
 
     def __nonzero__(self):
         """
         Allows the Apprise object to be wrapped in an Python 2.x based 'if
-        statement'.  True is returned if our content was downloaded correctly.
+        statement'.  True is returned if at least one of our services can be
+        loaded; they're only instantiated until the first one that does is
+        found.
         """
-        if not isinstance(self._cached_servers, list):
-            # Generate ourselves a list of content we can pull from
-            self.servers()
+        for _ in self.find():
+            return True
 
-        return True if self._cached_servers else False
+        return False
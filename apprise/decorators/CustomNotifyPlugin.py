@@ -23,6 +23,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import six
+import threading
+from functools import partial
+from itertools import islice
 from ..plugins.NotifyBase import NotifyBase
 from ..utils import URL_DETAILS_RE
 from ..utils import parse_url
@@ -32,6 +35,13 @@ from .. import common
 from ..logger import logger
 import inspect
 
+if six.PY3:
+    from ..py3compat import asyncio as py3aio
+
+# Python v2.7 has no notion of coroutines
+iscoroutinefunction = getattr(
+    inspect, 'iscoroutinefunction', lambda fn: False)
+
 
 class CustomNotifyPlugin(NotifyBase):
     """
@@ -56,6 +66,14 @@ class CustomNotifyPlugin(NotifyBase):
     # wrapper class
     _default_args = {}
 
+    # Set to True if our hook accepts many (body, title, notify_type) items
+    # at once instead of being called once per message
+    hook_batch = False
+
+    # Set to True if our hook is a coroutine (async def); it is awaited
+    # natively when we're notified asynchronously
+    hook_coroutine = False
+
     def __init__(self, **kwargs):
         """
         Our initialization
@@ -70,6 +88,218 @@ class CustomNotifyPlugin(NotifyBase):
         # initialized as
         self._default_args['url'] = url_assembly(**self._default_args)
 
+        if self.hook_batch:
+            # The notifications waiting to be handed to our hook
+            self._batch_lock = threading.Lock()
+            self._batch_pending = []
+            self._batch_active = False
+
+    def notify(self, *args, **kwargs):
+        """
+        Perform notification; batch hooks receive all of the messages (the
+        chunks of a message that was split) at once.  They also receive the
+        messages of any other notification sent to us while we're still busy
+        with the last one.
+
+        """
+        if not self.hook_batch:
+            return super(CustomNotifyPlugin, self).notify(*args, **kwargs)
+
+        prepared = self._prepare(*args, **kwargs)
+        if prepared is None:
+            return False
+
+        items, kwargs, resume = prepared
+        if not self._batch_send(items, kwargs):
+            # Our items are all delivered (or not) at once; so we resume
+            # from where we started if we're asked to send them again
+            self._overflow_resume = resume
+            return False
+
+        self._overflow_resume = None
+        return True
+
+    if six.PY3:
+        def async_notify(self, *args, **kwargs):
+            """
+            Async Notification Wrapper; coroutine hooks are awaited natively
+            (instead of occupying a thread of their own).
+
+            Batching is handled by our (thread based) notify(); so coroutine
+            batch hooks are still run from there to share our queue.
+
+            """
+            if not self.hook_coroutine or self.hook_batch:
+                return super(CustomNotifyPlugin, self).async_notify(
+                    *args, **kwargs)
+
+            return py3aio.hook_notify(self, *args, **kwargs)
+
+    def send(self, body, title='', notify_type=common.NotifyType.INFO,
+             *args, **kwargs):
+        """
+        Our send() call which triggers our hook
+        """
+        return self._hook_send([(body, title, notify_type)], **kwargs)
+
+    def _prepare(self, body, title=None, notify_type=common.NotifyType.INFO,
+                 overflow=None, attach=None, body_format=None, **kwargs):
+        """
+        Prepares a notification for our hook (just as NotifyBase.notify()
+        would have).  Returns a tuple of the (body, title, notify_type) items
+        to send, the keyword arguments our hook receives and the (key,
+        offset, delivered) to track in _overflow_resume should they fail;
+        None is returned if the notification can't be sent.
+
+        """
+
+        prepared = self._notify_prepare(
+            body=body, title=title, notify_type=notify_type,
+            overflow=overflow, attach=attach, body_format=body_format)
+
+        if prepared is None:
+            return None
+
+        title, overflow, attach, key, offset, delivered = prepared
+
+        # Apply our overflow (if defined); anything we already delivered is
+        # skipped over
+        items = [
+            (chunk['body'], chunk['title'], notify_type)
+            for index, chunk in islice(enumerate(self._iter_overflow(
+                body=body, title=title, overflow=overflow,
+                body_format=body_format)), offset, None)
+            if index not in delivered]
+
+        return items, {'attach': attach, 'body_format': body_format}, \
+            (key, offset, delivered)
+
+    def _hook_calls(self, items, **kwargs):
+        """
+        Returns a generator of the calls to make to our hook to deliver the
+        (body, title, notify_type) items specified.  A batch hook is called
+        once with all of them while any other is called once per item.
+
+        """
+        if self.hook_batch:
+            yield partial(
+                self._send_func, items, meta=self._default_args, **kwargs)
+            return
+
+        for body, title, notify_type in items:
+            yield partial(
+                self._send_func, body, title, notify_type,
+                meta=self._default_args, **kwargs)
+
+    def _hook_send(self, items, **kwargs):
+        """
+        Hands the items to our hook and returns True if they were all
+        delivered successfully.
+
+        """
+        for call in self._hook_calls(items, **kwargs):
+            try:
+                result = call()
+                if self.hook_coroutine:
+                    # Run our coroutine to completion
+                    result = py3aio.run(result)
+
+            except Exception as e:
+                self._hook_exception(e)
+                return False
+
+            if not self._hook_response(result):
+                return False
+
+        return True
+
+    def _batch_send(self, items, kwargs):
+        """
+        Sends our items to our (batch) hook.  If our hook is already busy, our
+        items are queued and sent along with any others that arrive in the
+        mean time as soon as it's free again.
+
+        """
+        entry = {
+            'items': items,
+            'kwargs': kwargs,
+            'lead': False,
+            'result': False,
+            'done': threading.Event(),
+        }
+
+        with self._batch_lock:
+            self._batch_pending.append(entry)
+            if not self._batch_active:
+                # Nobody is sending; we will
+                self._batch_active = entry['lead'] = True
+
+        if not entry['lead']:
+            entry['done'].wait()
+            if not entry['lead']:
+                # Our items were sent along with someone else's
+                return entry['result']
+
+        with self._batch_lock:
+            # Everything waiting that can be sent the same way we are goes
+            # out with us
+            batch = [
+                e for e in self._batch_pending if e['kwargs'] == kwargs]
+            self._batch_pending[:] = [
+                e for e in self._batch_pending
+                if not any(e is b for b in batch)]
+
+        result = self._hook_send(
+            [item for e in batch for item in e['items']], **kwargs)
+
+        with self._batch_lock:
+            if self._batch_pending:
+                # Hand off to the next in line
+                self._batch_pending[0]['lead'] = True
+                self._batch_pending[0]['done'].set()
+
+            else:
+                self._batch_active = False
+
+        for e in batch:
+            e['result'] = result
+            e['done'].set()
+
+        return result
+
+    def _hook_response(self, result):
+        """
+        Interprets (and logs) the result returned by our hook
+        """
+        if result is None:
+            # The wrapper did not define a return (or returned None)
+            # this is treated as a successful return as it is assumed the
+            # developer did not care about the result of the call.
+            response = True
+
+        else:
+            # Perform boolean check (allowing obects to also be returned and
+            # check against the __bool__ call
+            response = True if result else False
+
+        if response:
+            self.logger.info('Sent %s notification.', self.service_name)
+
+        else:
+            self.logger.warning(
+                'Failed to send %s notification.', self.service_name)
+
+        return response
+
+    def _hook_exception(self, e):
+        """
+        Logs an (unhandled) exception thrown by our hook
+        """
+        self.logger.warning(
+            'An exception occured sending a %s notification.',
+            self.service_name)
+        self.logger.debug('%s Exception: %s', type(self), str(e))
+
     @staticmethod
     def parse_url(url):
         """
@@ -85,10 +315,13 @@ class CustomNotifyPlugin(NotifyBase):
         return '{schema}://'.format(schema=self.secure_protocol)
 
     @staticmethod
-    def instantiate_plugin(url, send_func, name=None):
+    def instantiate_plugin(url, send_func, name=None, batch=False):
         """
         The function used to add a new notification plugin based on the schema
         parsed from the provided URL into our supported matrix structure.
+
+        Set batch to True if the send_func accepts a list of (body, title,
+        notify_type) items instead of a single message.
         """
 
         if not isinstance(url, six.string_types):
@@ -142,60 +375,15 @@ class CustomNotifyPlugin(NotifyBase):
             }
 
             # Assign our send() function
-            __send = staticmethod(send_func)
+            _send_func = staticmethod(send_func)
+
+            # How our send() function is called
+            hook_batch = True if batch else False
+            hook_coroutine = iscoroutinefunction(send_func)
 
             # Update our default arguments
             _default_args = default_args
 
-            def send(self, body, title='', notify_type=common.NotifyType.INFO,
-                     *args, **kwargs):
-                """
-                Our send() call which triggers our hook
-                """
-
-                response = False
-                try:
-                    # Enforce a boolean response
-                    result = self.__send(
-                        body, title, notify_type, *args,
-                        meta=self._default_args, **kwargs)
-
-                    if result is None:
-                        # The wrapper did not define a return (or returned
-                        # None)
-                        # this is treated as a successful return as it is
-                        # assumed the developer did not care about the result
-                        # of the call.
-                        response = True
-
-                    else:
-                        # Perform boolean check (allowing obects to also be
-                        # returned and check against the __bool__ call
-                        response = True if result else False
-
-                except Exception as e:
-                    # Unhandled Exception
-                    self.logger.warning(
-                        'An exception occured sending a %s notification.',
-                        common.
-                        NOTIFY_SCHEMA_MAP[self.secure_protocol].service_name)
-                    self.logger.debug(
-                        '%s Exception: %s',
-                        common.NOTIFY_SCHEMA_MAP[self.secure_protocol], str(e))
-                    return False
-
-                if response:
-                    self.logger.info(
-                        'Sent %s notification.',
-                        common.
-                        NOTIFY_SCHEMA_MAP[self.secure_protocol].service_name)
-                else:
-                    self.logger.warning(
-                        'Failed to send %s notification.',
-                        common.
-                        NOTIFY_SCHEMA_MAP[self.secure_protocol].service_name)
-                return response
-
         # Store our plugin into our core map file
         common.NOTIFY_SCHEMA_MAP[plugin_name] = CustomNotifyPluginWrapper
 
@@ -25,7 +25,7 @@
 from .CustomNotifyPlugin import CustomNotifyPlugin
 
 
-def notify(on, name=None):
+def notify(on, name=None, batch=False):
     """
     @notify decorator allows you to map functions you've defined to be loaded
     as a regular notify by Apprise.  You must identify a protocol that
@@ -108,6 +108,24 @@ def notify(on, name=None):
     expected and return False if not. If nothing is returned, then this is
     treated as as success (True).
 
+    Your wrapper can also be a coroutine (async def); it is awaited directly
+    when Apprise is notifying asynchronously:
+
+        @notify(on="foobar", name="My Foobar Process")
+        async def your_action(body, title, *args, **kwargs):
+            await ...
+
+    Set batch to True if your wrapper would rather receive many messages at
+    once. Instead of a body, title and notify_type, it is passed a list of
+    (body, title, notify_type) items; this includes each part of a message
+    that was split (see overflow) as well as the messages of any other
+    notification that arrived while it was still busy with the last:
+
+        @notify(on="foobar", name="My Foobar Process", batch=True)
+        def your_action(items, meta, *args, **kwargs):
+            for body, title, notify_type in items:
+                ...
+
     """
     def wrapper(func):
         """
@@ -116,7 +134,7 @@ def notify(on, name=None):
 
         # Generate
         CustomNotifyPlugin.instantiate_plugin(
-            url=on, send_func=func, name=name)
+            url=on, send_func=func, name=name, batch=batch)
 
         return func
 
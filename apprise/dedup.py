@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import six
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from .logger import logger
+
+try:
+    # The sqlite3 module is optional (some Python builds leave it out); it's
+    # only required if our fingerprints are shared on disk
+    import sqlite3
+
+    # We're good to go
+    DEDUP_SQLITE_SUPPORT = True
+
+except ImportError:
+    # No problem; we just can't share our fingerprints between processes
+    DEDUP_SQLITE_SUPPORT = False
+
+# Our fingerprint stores (keyed by the path of their database or None for
+# the one kept in memory); they're shared between all of the Apprise objects
+# (and assets) that reference them.
+DEDUP_STORES = {}
+
+# Held while a fingerprint store is looked up (or opened)
+DEDUP_STORES_LOCK = threading.Lock()
+
+# Our (on disk) stores tidy their expired fingerprints every so many checks
+DEDUP_SQLITE_PURGE_INTERVAL = 64
+
+
+class DedupStore(object):
+    """
+    A bounded (least recently used) store of the fingerprints of the
+    notifications sent recently along with when they expire.  It also counts
+    the notifications that were checked against it and suppressed by it.
+
+    """
+
+    def __init__(self, size=4096):
+        """
+        Initialize our (empty) store
+        """
+        # The maximum number of fingerprints we remember
+        self.size = size
+
+        # Our counters
+        self.checked = 0
+        self.suppressed = 0
+
+        # Our fingerprints mapped to when they expire
+        self._entries = OrderedDict()
+
+        # A fingerprint is checked and recorded (and our counters updated)
+        # in one go while this is held
+        self._lock = threading.Lock()
+
+    def seen(self, fingerprint, window):
+        """
+        Returns True if the fingerprint was recorded within the last window
+        seconds (and should be suppressed).  Otherwise the fingerprint is
+        recorded (for the next window seconds) and False is returned.
+
+        The window of a fingerprint is never extended by a duplicate so a
+        notification that keeps on firing still makes it through once every
+        window.
+        """
+        now = time.time()
+        with self._lock:
+            self.checked += 1
+            if self._seen(fingerprint, now, window):
+                self.suppressed += 1
+                return True
+
+        return False
+
+    def forget(self, fingerprint):
+        """
+        Removes the fingerprint specified (so that it's no longer suppressed)
+        """
+        with self._lock:
+            self._forget(fingerprint)
+
+    def clear(self):
+        """
+        Removes all of our fingerprints and resets our counters
+        """
+        with self._lock:
+            self._clear()
+            self.checked = 0
+            self.suppressed = 0
+
+    def _seen(self, fingerprint, now, window):
+        """
+        Checks and records the fingerprint (see seen())
+        """
+        expires = self._entries.pop(fingerprint, None)
+        if expires is not None and expires > now:
+            # Keep it (as our most recently used)
+            self._entries[fingerprint] = expires
+            return True
+
+        self._entries[fingerprint] = now + window
+        while len(self._entries) > self.size:
+            # Drop our least recently used fingerprint
+            self._entries.popitem(last=False)
+
+        return False
+
+    def _forget(self, fingerprint):
+        """
+        Removes the fingerprint specified
+        """
+        self._entries.pop(fingerprint, None)
+
+    def _clear(self):
+        """
+        Removes all of our fingerprints
+        """
+        self._entries.clear()
+
+    def __len__(self):
+        """
+        Returns the number of fingerprints we're tracking
+        """
+        return len(self._entries)
+
+
+class SQLiteDedupStore(DedupStore):
+    """
+    A DedupStore kept in an SQLite database so that it can be shared between
+    processes (such as multiple calls to the apprise tool).
+
+    Any trouble accessing the database is logged and treats the notification
+    as if it were never seen; deduplication never prevents a notification
+    from being sent.
+
+    """
+
+    def __init__(self, path, size=4096):
+        """
+        Initialize our store
+        """
+        super(SQLiteDedupStore, self).__init__(size=size)
+
+        # The path to our database
+        self.path = path
+
+        # Our (lazily established) connection
+        self._conn = None
+
+    def _connection(self):
+        """
+        Returns our connection to our database (creating it if required)
+        """
+        if self._conn is None:
+            # We manage our own transactions (isolation_level=None); our lock
+            # ensures only one thread at a time uses our connection
+            conn = sqlite3.connect(
+                self.path, timeout=5.0, isolation_level=None,
+                check_same_thread=False)
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS dedup ('
+                'fingerprint TEXT PRIMARY KEY, expires REAL NOT NULL)')
+            self._conn = conn
+
+        return self._conn
+
+    def _execute(self, fn):
+        """
+        Runs fn(connection) within a (write) transaction and returns its
+        result; None is returned if our database could not be accessed.
+        """
+        try:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = fn(conn)
+
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+            conn.execute('COMMIT')
+            return result
+
+        except sqlite3.Error as e:
+            logger.warning(
+                'Could not access the deduplication database %s.', self.path)
+            logger.debug('SQLite Exception: %s' % str(e))
+
+        return None
+
+    def _seen(self, fingerprint, now, window):
+        """
+        Checks and records the fingerprint (see seen())
+        """
+        def check(conn):
+            row = conn.execute(
+                'SELECT expires FROM dedup WHERE fingerprint = ?',
+                (fingerprint, )).fetchone()
+
+            if row is not None and row[0] > now:
+                return True
+
+            conn.execute(
+                'INSERT OR REPLACE INTO dedup (fingerprint, expires) '
+                'VALUES (?, ?)', (fingerprint, now + window))
+
+            if not self.checked % DEDUP_SQLITE_PURGE_INTERVAL:
+                # Tidy up what has expired and keep ourselves bounded
+                conn.execute('DELETE FROM dedup WHERE expires <= ?', (now, ))
+                conn.execute(
+                    'DELETE FROM dedup WHERE fingerprint IN ('
+                    'SELECT fingerprint FROM dedup ORDER BY expires DESC '
+                    'LIMIT -1 OFFSET ?)', (self.size, ))
+
+            return False
+
+        return True if self._execute(check) else False
+
+    def _forget(self, fingerprint):
+        """
+        Removes the fingerprint specified
+        """
+        self._execute(lambda conn: conn.execute(
+            'DELETE FROM dedup WHERE fingerprint = ?', (fingerprint, )))
+
+    def _clear(self):
+        """
+        Removes all of our fingerprints
+        """
+        self._execute(lambda conn: conn.execute('DELETE FROM dedup'))
+
+    def __len__(self):
+        """
+        Returns the number of fingerprints we're tracking
+        """
+        with self._lock:
+            count = self._execute(lambda conn: conn.execute(
+                'SELECT COUNT(*) FROM dedup').fetchone()[0])
+
+        return count if count else 0
+
+
+def dedup_store(path=None, size=4096):
+    """
+    Returns the (shared) fingerprint store associated with the path
+    specified; the fingerprints are kept in memory if no path is specified.
+    The size is only applied when the store is first created.
+
+    """
+    if path:
+        path = os.path.abspath(os.path.expanduser(path))
+
+        if not DEDUP_SQLITE_SUPPORT:
+            logger.warning(
+                'The sqlite3 module is not available; notification '
+                'fingerprints are kept in memory instead of %s.', path)
+            path = None
+
+    with DEDUP_STORES_LOCK:
+        store = DEDUP_STORES.get(path)
+        if store is None:
+            store = SQLiteDedupStore(path, size=size) if path \
+                else DedupStore(size=size)
+            DEDUP_STORES[path] = store
+
+    return store
+
+
+def dedup_reset():
+    """
+    Closes the database connections of all of our fingerprint stores and
+    forgets them; their databases (and the fingerprints within) are left on
+    disk while those held in memory are lost.
+    """
+    with DEDUP_STORES_LOCK:
+        stores = list(DEDUP_STORES.values())
+        DEDUP_STORES.clear()
+
+    for store in stores:
+        if isinstance(store, SQLiteDedupStore) and store._conn is not None:
+            store._conn.close()
+
+
+def fingerprint(server, body='', title='', notify_type='', attach=None):
+    """
+    Returns the fingerprint of a notification sent to the server (service)
+    specified.
+
+    """
+    digest = hashlib.sha256()
+    for entry in (server.url(privacy=False), notify_type, title, body):
+        if isinstance(entry, six.text_type):
+            entry = entry.encode('utf-8')
+
+        digest.update(entry if entry else b'')
+        digest.update(b'\0')
+
+    for attachment in (attach if attach else ()):
+        # Attachments are identified by their content; the same file (or
+        # URL) can hold something entirely different the next time around
+        content = attachment.digest()
+        digest.update(
+            content.encode('ascii') if content
+            else attachment.url(privacy=False).encode('utf-8'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def dedup_check(server, body='', title='', notify_type='', attach=None,
+                **kwargs):
+    """
+    Consults the fingerprint store of the server's asset (if it has
+    deduplication enabled) before a notification is sent to it.
+
+    Returns None if deduplication isn't enabled and True if the notification
+    should be suppressed.  Otherwise a function is returned that should be
+    called if the notification could not be sent (so that it isn't
+    suppressed when it's retried).
+
+    """
+    asset = server.asset
+    if not asset.dedup_window or asset.dedup_window <= 0:
+        return None
+
+    store = dedup_store(asset.dedup_path, size=asset.dedup_size)
+    key = fingerprint(
+        server, body=body, title=title, notify_type=notify_type,
+        attach=attach)
+
+    if store.seen(key, asset.dedup_window):
+        logger.info(
+            'Suppressed a duplicate %s notification (%d so far).',
+            server.service_name, store.suppressed)
+        return True
+
+    return lambda: store.forget(key)
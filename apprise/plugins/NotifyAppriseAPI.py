@@ -25,20 +25,67 @@
 
 import re
 import six
+import time
 import requests
+import threading
 from json import dumps
 
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
 from ..common import NotifyType
+from ..utils import compress
+from ..utils import parse_bool
 from ..utils import parse_list
 from ..utils import validate_regex
 from ..AppriseLocale import gettext_lazy as _
 
+# Keep-alive (HTTP) sessions shared between all of the NotifyAppriseAPI
+# objects that talk to the same Apprise API server so that we aren't
+# setting up a new (TLS) connection for every notification we relay.
+APPRISE_API_SESSION_POOL = {}
+
+# Held while a keep-alive session is looked up (or added to our pool)
+APPRISE_API_SESSION_POOL_LOCK = threading.Lock()
+
+# The notifications waiting to be relayed (in batch mode) grouped by the
+# request they will be posted with; notifications from different
+# NotifyAppriseAPI objects (e.g. ones with different tags) that are destined
+# for the same endpoint are posted together.
+APPRISE_API_BATCH_POOL = {}
+
+# Held while notifications join (or are taken off of) a batch
+APPRISE_API_BATCH_POOL_LOCK = threading.Lock()
+
+# Signalled whenever a notification joins a batch
+APPRISE_API_BATCH_CHANGED = threading.Condition(APPRISE_API_BATCH_POOL_LOCK)
+
+# The response codes an Apprise API server that doesn't support batch
+# (multi-message) requests is expected to respond with; when we receive one
+# of these, the notifications are re-sent one at a time
+APPRISE_API_BATCH_UNSUPPORTED = (400, 404, 405, 415, 422, 501)
+
 
 class NotifyAppriseAPI(NotifyBase):
     """
     A wrapper for Apprise (Persistent) API Notifications
+
+    In batch mode (batch=yes) everything that accumulated for the same
+    endpoint is relayed using a single request.  The first notification to
+    arrive is held for window= seconds (or until the batch is full) so that
+    others (sent from other threads or to our other services) can join it;
+    a notification sent on its own is therefore delayed by the window.
+    Anything that arrives while a request is underway is posted as soon as
+    it completes.  A batch request is posted to the same notify/{token}
+    endpoint, but its JSON body is a list of the
+    usual notification objects (title, body, type, format and tag) instead
+    of a single one; the server responds with a 200 if all of them were
+    sent.  Servers that don't support this are detected by their response
+    (see APPRISE_API_BATCH_UNSUPPORTED) in which case the notifications are
+    re-sent one at a time.  A lone notification is always posted the
+    regular way.
+
+    Request bodies can additionally be gzip compressed (gzip=yes) and the
+    connections to the server kept alive between requests (keepalive=yes).
     """
 
     # The default descriptive name associated with the Notification
@@ -64,6 +111,14 @@ class NotifyAppriseAPI(NotifyBase):
     # local anyway
     request_rate_per_sec = 0.0
 
+    # The maximum number of notifications relayed using a single (batch)
+    # request
+    default_batch_size = 100
+
+    # We're notified from several threads at the same time so that we can
+    # batch what we're sent (our batches are protected by a lock of their own)
+    notify_concurrent = True
+
     # Define object templates
     templates = (
         '{schema}://{host}/{token}',
@@ -116,6 +171,27 @@ class NotifyAppriseAPI(NotifyBase):
         'to': {
             'alias_of': 'token',
         },
+        'batch': {
+            'name': _('Batch Mode'),
+            'type': 'bool',
+            'default': False,
+        },
+        'window': {
+            'name': _('Batch Window'),
+            'type': 'float',
+            'min': 0,
+            'default': 0.25,
+        },
+        'gzip': {
+            'name': _('Compress Requests'),
+            'type': 'bool',
+            'default': False,
+        },
+        'keepalive': {
+            'name': _('Keep Alive'),
+            'type': 'bool',
+            'default': False,
+        },
     })
 
     # Define any kwargs we're using
@@ -126,13 +202,17 @@ class NotifyAppriseAPI(NotifyBase):
         },
     }
 
-    def __init__(self, token=None, tags=None, headers=None, **kwargs):
+    def __init__(self, token=None, tags=None, headers=None, batch=None,
+                 window=None, gzip=None, keepalive=None, **kwargs):
         """
         Initialize Apprise API Object
 
         headers can be a dictionary of key/value pairs that you want to
         additionally include as part of the server headers to post with
 
+        window is the number of seconds (batch mode) the first notification
+        of a batch is held for so that others can be relayed along with it
+
         """
         super(NotifyAppriseAPI, self).__init__(**kwargs)
 
@@ -156,6 +236,28 @@ class NotifyAppriseAPI(NotifyBase):
             # Store our extra headers
             self.headers.update(headers)
 
+        # Prepare Batch Mode Flag
+        self.batch = self.template_args['batch']['default'] \
+            if batch is None else bool(batch)
+
+        self.batch_window = self.template_args['window']['default']
+        if window is not None:
+            try:
+                self.batch_window = max(
+                    self.template_args['window']['min'], float(window))
+
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    'Invalid Apprise API batch window ({}) was specified; '
+                    'using default {}s'.format(window, self.batch_window))
+
+        # Prepare our Compression and Keep-Alive Flags
+        self.gzip = self.template_args['gzip']['default'] \
+            if gzip is None else bool(gzip)
+
+        self.keepalive = self.template_args['keepalive']['default'] \
+            if keepalive is None else bool(keepalive)
+
         return
 
     def url(self, privacy=False, *args, **kwargs):
@@ -172,6 +274,15 @@ class NotifyAppriseAPI(NotifyBase):
         if self.__tags:
             params['tags'] = ','.join([x for x in self.__tags])
 
+        # Batch Mode
+        params['batch'] = 'yes' if self.batch else 'no'
+        if self.batch:
+            params['window'] = str(self.batch_window)
+
+        # Compression and Keep-Alive
+        params['gzip'] = 'yes' if self.gzip else 'no'
+        params['keepalive'] = 'yes' if self.keepalive else 'no'
+
         # Determine Authentication
         auth = ''
         if self.user and self.password:
@@ -208,10 +319,6 @@ class NotifyAppriseAPI(NotifyBase):
         Perform Apprise API Notification
         """
 
-        headers = {}
-        # Apply any/all header over-rides defined
-        headers.update(self.headers)
-
         # prepare Apprise API Object
         payload = {
             # Apprise API Payload
@@ -224,6 +331,22 @@ class NotifyAppriseAPI(NotifyBase):
         if self.__tags:
             payload['tag'] = self.__tags
 
+        if self.batch:
+            # Relay our notification along with any others
+            return self._batch_send(payload)
+
+        return self._post([payload])[0]
+
+    def _request(self):
+        """
+        Returns a tuple of the (url, headers, auth) our notifications are
+        posted with.
+
+        """
+        headers = {}
+        # Apply any/all header over-rides defined
+        headers.update(self.headers)
+
         auth = None
         if self.user:
             auth = (self.user, self.password)
@@ -249,24 +372,69 @@ class NotifyAppriseAPI(NotifyBase):
             'X-Apprise-Recursion-Count': str(self.asset._recursion + 1),
         })
 
+        if self.gzip:
+            headers['Content-Encoding'] = 'gzip'
+
+        return url, headers, auth
+
+    def _batch_key(self):
+        """
+        Returns the key our notifications are batched by; everything posted
+        using the same request can be batched together.
+
+        """
+        url, headers, auth = self._request()
+        return (
+            url, frozenset(headers.items()), auth, self.verify_certificate,
+            self.request_timeout, self.keepalive)
+
+    def _post(self, payloads):
+        """
+        Posts the payloads (notifications) provided to our Apprise API server
+        using a single request; more than one is posted as a batch.  A list
+        identifying whether or not each of them was sent successfully is
+        returned.
+
+        """
+
+        url, headers, auth = self._request()
+
+        # A lone notification is always posted the regular way
+        data = dumps(payloads[0] if len(payloads) == 1 else payloads)
+
         self.logger.debug('Apprise API POST URL: %s (cert_verify=%r)' % (
             url, self.verify_certificate,
         ))
-        self.logger.debug('Apprise API Payload: %s' % str(payload))
+        self.logger.debug('Apprise API Payload: %s' % data)
+
+        if self.gzip:
+            data = compress(data, 'gzip')
 
         # Always call throttle before any remote server i/o is made
         self.throttle()
 
         try:
-            r = requests.post(
+            r = (self.session_lookup() if self.keepalive else requests).post(
                 url,
-                data=dumps(payload),
+                data=data,
                 headers=headers,
                 auth=auth,
                 verify=self.verify_certificate,
                 timeout=self.request_timeout,
             )
             if r.status_code != requests.codes.ok:
+                if len(payloads) > 1 \
+                        and r.status_code in APPRISE_API_BATCH_UNSUPPORTED:
+                    # Our server doesn't support batch requests
+                    self.logger.debug(
+                        'Apprise API batch request was rejected (error={}); '
+                        'sending {} notifications one at a time.'.format(
+                            r.status_code, len(payloads)))
+
+                    # Every notification is sent (even if an earlier one
+                    # failed)
+                    return [self._post([p])[0] for p in payloads]
+
                 # We had a problem
                 status_str = \
                     NotifyAppriseAPI.http_response_code_lookup(r.status_code)
@@ -281,21 +449,128 @@ class NotifyAppriseAPI(NotifyBase):
                 self.logger.debug('Response Details:\r\n{}'.format(r.content))
 
                 # Return; we're done
-                return False
+                return [False] * len(payloads)
 
             else:
-                self.logger.info('Sent Apprise API notification.')
+                self.logger.info(
+                    'Sent Apprise API notification.' if len(payloads) == 1
+                    else 'Sent {} Apprise API notifications.'.format(
+                        len(payloads)))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Apprise API '
                 'notification to %s.' % self.host)
             self.logger.debug('Socket Exception: %s' % str(e))
 
             # Return; we're done
-            return False
+            return [False] * len(payloads)
+
+        return [True] * len(payloads)
+
+    def _batch_send(self, payload):
+        """
+        Relays our payload along with any others destined for the same
+        endpoint.  The first to arrive holds the batch open for our window
+        (or until it is full) before posting everything that accumulated.
+        Anything that arrives while a request is already underway is posted
+        as soon as it completes.
+
+        """
+        key = self._batch_key()
+
+        entry = {
+            'payload': payload,
+            'lead': False,
+            'result': False,
+            'done': threading.Event(),
+        }
+
+        with APPRISE_API_BATCH_POOL_LOCK:
+            batch = APPRISE_API_BATCH_POOL.get(key)
+            if batch is None:
+                batch = {'pending': [], 'active': False}
+                APPRISE_API_BATCH_POOL[key] = batch
+
+            batch['pending'].append(entry)
+            if not batch['active']:
+                # Nobody is sending; we will
+                batch['active'] = entry['lead'] = True
+
+            # Let our leader know we've arrived
+            APPRISE_API_BATCH_CHANGED.notify_all()
+
+        if entry['lead']:
+            # Give everyone else a chance to join us
+            deadline = time.time() + self.batch_window
+            with APPRISE_API_BATCH_CHANGED:
+                while len(batch['pending']) < self.default_batch_size:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+
+                    APPRISE_API_BATCH_CHANGED.wait(remaining)
+
+        else:
+            entry['done'].wait()
+            if not entry['lead']:
+                # Our notification was sent along with someone else's
+                return entry['result']
 
-        return True
+        with APPRISE_API_BATCH_POOL_LOCK:
+            sending = batch['pending'][:self.default_batch_size]
+            del batch['pending'][:len(sending)]
+
+        results = [False] * len(sending)
+        try:
+            results = self._post([e['payload'] for e in sending])
+
+        finally:
+            with APPRISE_API_BATCH_POOL_LOCK:
+                if batch['pending']:
+                    # Hand off to the next in line
+                    batch['pending'][0]['lead'] = True
+                    batch['pending'][0]['done'].set()
+
+                else:
+                    batch['active'] = False
+                    APPRISE_API_BATCH_POOL.pop(key, None)
+
+            for e, result in zip(sending, results):
+                e['result'] = result
+                e['done'].set()
+
+        return entry['result']
+
+    def session_lookup(self):
+        """
+        Returns the (shared) keep-alive session associated with our server;
+        one is created if it doesn't already exist.
+
+        """
+        key = (self.secure, self.host, self.port)
+
+        with APPRISE_API_SESSION_POOL_LOCK:
+            session = APPRISE_API_SESSION_POOL.get(key)
+            if session is None:
+                session = requests.Session()
+                APPRISE_API_SESSION_POOL[key] = session
+
+        return session
+
+    @staticmethod
+    def session_pool_reset():
+        """
+        Closes the keep-alive connections of all of our shared sessions; a
+        new session is opened the next time a server is notified
+        """
+        with APPRISE_API_SESSION_POOL_LOCK:
+            sessions = list(APPRISE_API_SESSION_POOL.values())
+            APPRISE_API_SESSION_POOL.clear()
+
+        for session in sessions:
+            session.close()
 
     @staticmethod
     def parse_native_url(url):
@@ -371,4 +646,22 @@ class NotifyAppriseAPI(NotifyBase):
                 # re-assemble our full path
                 results['fullpath'] = '/'.join(entries)
 
+        # Get Batch Mode Flag (and Window)
+        results['batch'] = \
+            parse_bool(results['qsd'].get(
+                'batch', NotifyAppriseAPI.template_args['batch']['default']))
+
+        if 'window' in results['qsd'] and len(results['qsd']['window']):
+            results['window'] = results['qsd']['window']
+
+        # Get Compression and Keep-Alive Flags
+        results['gzip'] = \
+            parse_bool(results['qsd'].get(
+                'gzip', NotifyAppriseAPI.template_args['gzip']['default']))
+
+        results['keepalive'] = \
+            parse_bool(results['qsd'].get(
+                'keepalive',
+                NotifyAppriseAPI.template_args['keepalive']['default']))
+
         return results
@@ -381,6 +381,7 @@ class NotifyBark(NotifyBase):
                         'Sent Bark notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Bark '
                     'notification to {}.'.format(target))
@@ -25,6 +25,10 @@
 
 import re
 import six
+import sys
+import threading
+from itertools import chain
+from itertools import islice
 
 from ..URLBase import URLBase
 from ..common import NotifyType
@@ -33,8 +37,11 @@ from ..common import NotifyFormat
 from ..common import NOTIFY_FORMATS
 from ..common import OverflowMode
 from ..common import OVERFLOW_MODES
+from ..common import OverflowUnit
 from ..AppriseLocale import gettext_lazy as _
 from ..AppriseAttachment import AppriseAttachment
+from ..circuit import circuit_track
+from ..circuit import circuit_tracker
 
 
 if six.PY3:
@@ -46,6 +53,19 @@ else:
     # Python v2.7 (backwards compatibility)
     BASE_OBJECT = URLBase
 
+# Used to break apart the lines of our message body
+LINE_SPLIT_RE = re.compile(r'\r*\n')
+
+# The whitespace we're willing to split a message on (when splitting) ordered
+# by preference; we'd rather break between lines before breaking between
+# words
+SPLIT_BOUNDARIES = ('\n', ' ', '\t')
+
+# The tag placed in front of each chunk of a split message when they're
+# delivered at the same time to a service that may not preserve the order
+# they arrive in
+SEQUENCE_TAG = '[{index}/{total}] '
+
 
 class NotifyBase(BASE_OBJECT):
     """
@@ -130,6 +150,39 @@ class NotifyBase(BASE_OBJECT):
     # automatically placed into the body
     title_maxlen = 250
 
+    # The unit our body_maxlen is measured in; most services count characters
+    # but some count the bytes (or UTF-16 code units) that make up the message
+    body_maxlen_unit = OverflowUnit.CHARACTER
+
+    # The number of chunks (of a message being split) that can be in flight
+    # at the same time. The default (of 1) sends each chunk one after the
+    # other; anything larger allows us to deliver them concurrently while
+    # still respecting our throttle.
+    overflow_max_inflight = 1
+
+    # Set this to True if the upstream service is known to preserve the
+    # order of the messages it receives.
+    overflow_ordered = False
+
+    # Services that don't preserve the order of the messages they receive
+    # only have their chunks delivered at the same time if this is set to
+    # True; each chunk is then tagged with it's position in the sequence
+    # (e.g. [2/5]) so that it can be read in order.  This alters the message
+    # content so it's something the user must ask for.
+    overflow_sequence = False
+
+    # Tracks the message (and chunk) we failed to deliver last so that we can
+    # resume from where we left off if we're asked to send it again; this is
+    # a tuple of the (key, offset, delivered) where delivered is the set of
+    # chunks after our offset that made it through anyway (if they were sent
+    # at the same time)
+    _overflow_resume = None
+
+    # Set this to True if the service can safely be notified from more then
+    # one thread at the same time; otherwise these notifications are sent
+    # one after the other
+    notify_concurrent = False
+
     # Set the maximum line count; if this is set to anything larger then zero
     # the message (prior to it being sent) will be truncated to this number
     # of lines. Setting this to zero disables this feature.
@@ -188,6 +241,9 @@ class NotifyBase(BASE_OBJECT):
 
         super(NotifyBase, self).__init__(**kwargs)
 
+        # Serializes the notifications sent to us (see notify())
+        self._notify_lock = threading.RLock()
+
         if 'format' in kwargs:
             # Store the specified format if specified
             notify_format = kwargs.get('format', '')
@@ -274,18 +330,108 @@ class NotifyBase(BASE_OBJECT):
         )
 
     def notify(self, body, title=None, notify_type=NotifyType.INFO,
-               overflow=None, attach=None, body_format=None, **kwargs):
+               overflow=None, attach=None, body_format=None, tracker=None,
+               **kwargs):
+        """
+        Performs notification; notifications sent to us from several
+        threads at the same time are delivered one after the other (unless
+        notify_concurrent is set).
+
+        If a (circuit) tracker is specified, it tracks what becomes of the
+        requests made to our upstream server.
+
+        """
+
+        # Track what becomes of the requests made to our upstream server
+        # (see circuit_check())
+        previous = circuit_track(tracker)
+        try:
+            if self.notify_concurrent:
+                # We take care of this ourselves
+                result = self._notify(
+                    body=body, title=title, notify_type=notify_type,
+                    overflow=overflow, attach=attach, body_format=body_format)
+
+            else:
+                # Our services hold onto state between calls (sessions, the
+                # targets they detected, the chunk we left off on, etc) that
+                # isn't safe to change from more then one thread at a time
+                with self._notify_lock:
+                    result = self._notify(
+                        body=body, title=title, notify_type=notify_type,
+                        overflow=overflow, attach=attach,
+                        body_format=body_format)
+
+        finally:
+            circuit_track(previous)
+
+        return result
+
+    def _notify(self, body, title=None, notify_type=NotifyType.INFO,
+                overflow=None, attach=None, body_format=None):
         """
-        Performs notification
+        Sends our notification (see notify())
 
         """
 
+        prepared = self._notify_prepare(
+            body=body, title=title, notify_type=notify_type,
+            overflow=overflow, attach=attach, body_format=body_format)
+
+        if prepared is None:
+            return False
+
+        title, overflow, attach, key, offset, delivered = prepared
+
+        # Only split messages are pipelined; and only if the order of our
+        # chunks is preserved (or they're tagged with it)
+        pipeline = overflow == OverflowMode.SPLIT \
+            and self.overflow_max_inflight > 1 \
+            and (self.overflow_ordered or self.overflow_sequence)
+
+        # Apply our overflow (if defined)
+        chunks = self._iter_overflow(
+            body=body, title=title, overflow=overflow,
+            body_format=body_format,
+            sequence=pipeline and not self.overflow_ordered)
+
+        def send(chunk):
+            return self.send(
+                body=chunk['body'], title=chunk['title'],
+                notify_type=notify_type, attach=attach,
+                body_format=body_format)
+
+        try:
+            return self._send_chunks(
+                chunks, send, key, offset=offset, delivered=delivered,
+                inflight=self.overflow_max_inflight if pipeline else 1)
+
+        finally:
+            # Our attachments are only mapped into memory for as long as
+            # we're sending them (see AttachBase.view())
+            for attachment in (attach if attach else ()):
+                attachment.release()
+
+    def _notify_prepare(self, body, title=None, notify_type=NotifyType.INFO,
+                        overflow=None, attach=None, body_format=None):
+        """
+        Prepares a notification to be sent; this is shared by everything
+        that delivers a notification (see notify()).
+
+        None is returned if the notification can't be sent at all; otherwise
+        a tuple of the (title, overflow, attach, key, offset, delivered) to
+        use is returned.  The key identifies the message (see
+        _overflow_resume), the offset is the index of the chunk we should
+        resume sending from and delivered is the set of chunks after it that
+        don't need to be sent again.
+        """
+
         if not self.enabled:
             # Deny notifications issued to services that are disabled
             self.logger.warning(
                 "{} is currently disabled on this system.".format(
                     self.service_name))
-            return False
+            return None
 
         # Prepare attachments if required
         if attach is not None and not isinstance(attach, AppriseAttachment):
@@ -294,25 +440,119 @@ class NotifyBase(BASE_OBJECT):
 
             except TypeError:
                 # bad attachments
-                return False
+                return None
 
         # Handle situations where the title is None
         title = '' if not title else title
 
-        # Apply our overflow (if defined)
-        for chunk in self._apply_overflow(
-                body=body, title=title, overflow=overflow,
-                body_format=body_format):
+        if overflow is None:
+            # default
+            overflow = self.overflow_mode
 
-            # Send notification
-            if not self.send(body=chunk['body'], title=chunk['title'],
-                             notify_type=notify_type, attach=attach,
-                             body_format=body_format):
+        # If we failed to deliver this very message last time, then we
+        # resume from the chunk that failed
+        key = hash((body, title, notify_type, overflow, body_format))
+        offset = 0
+        delivered = frozenset()
+        if self._overflow_resume and self._overflow_resume[0] == key:
+            _, offset, delivered = self._overflow_resume
+            self.logger.debug(
+                'Resuming delivery from chunk {}.'.format(offset + 1))
+
+        return title, overflow, attach, key, offset, delivered
+
+    def _send_chunks(self, chunks, send, key, offset=0, delivered=(),
+                     inflight=1):
+        """
+        Delivers the chunks provided (skipping over the first few if an
+        offset is specified along with any others already delivered) using
+        the send() function provided.  Up to inflight chunks are delivered
+        at the same time.
+
+        Delivery stops at the first failure; the first chunk that could not
+        be delivered (and any after it that were) is tracked in
+        _overflow_resume under the key specified.  An exception raised by
+        send() is a failure too; it is re-raised (from the thread that
+        called us) once we're done.
+
+        True is returned if everything was delivered successfully.
+        """
+
+        # Our chunks (paired with their index)
+        source = (
+            (index, chunk) for index, chunk in islice(
+                enumerate(chunks), offset, None) if index not in delivered)
+
+        # Protects our source (which is a generator) and what became of the
+        # chunks we sent
+        lock = threading.Lock()
+        sent = []
+        failures = []
+        errors = []
+
+        def deliver(index, chunk):
+            try:
+                result = send(chunk)
 
-                # Toggle our return status flag
-                return False
+            except Exception:
+                # Raised again once we're done
+                errors.append(sys.exc_info())
+                result = False
 
-        return True
+            with lock:
+                (sent if result else failures).append(index)
+
+        if inflight <= 1:
+            for index, chunk in source:
+                deliver(index, chunk)
+                if failures:
+                    # Stop sending once something has failed
+                    break
+
+        else:
+            # The requests made from our workers are tracked as our own
+            tracker = circuit_tracker()
+
+            def worker():
+                circuit_track(tracker)
+                while True:
+                    with lock:
+                        if failures:
+                            # Stop sending once something has failed
+                            return
+
+                        try:
+                            index, chunk = next(source)
+
+                        except StopIteration:
+                            # We're done
+                            return
+
+                    deliver(index, chunk)
+
+            threads = [
+                threading.Thread(target=worker) for _ in range(inflight)]
+            for thread in threads:
+                thread.daemon = True
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        if failures:
+            # Resume from the earliest chunk that failed; skipping over
+            # those after it that made it through
+            offset = min(failures)
+            self._overflow_resume = (key, offset, frozenset(
+                index for index in chain(delivered, sent) if index > offset))
+
+        else:
+            self._overflow_resume = None
+
+        if errors:
+            six.reraise(*errors[0])
+
+        return not failures
 
     def _apply_overflow(self, body, title=None, overflow=None,
                         body_format=None):
@@ -335,8 +575,23 @@ class NotifyBase(BASE_OBJECT):
 
             ]
         """
+        return list(self._iter_overflow(
+            body=body, title=title, overflow=overflow,
+            body_format=body_format))
+
+    def _iter_overflow(self, body, title=None, overflow=None,
+                       body_format=None, sequence=False):
+        """
+        The generator behind _apply_overflow(); each chunk is only prepared
+        as it is requested so that very large messages being split can start
+        being sent right away.
+
+        If sequence is set to True, then each chunk of a message that had to
+        be split is prefixed with it's position (e.g. [2/5]).  Room is made
+        for this tag so our chunks still fit within our limits.
 
-        response = list()
+        Each chunk yielded is a dictionary containing a 'title' and 'body'.
+        """
 
         # tidy
         title = '' if not title else title.strip()
@@ -373,41 +628,150 @@ class NotifyBase(BASE_OBJECT):
 
         # Enforce the line count first always
         if self.body_max_line_count > 0:
-            # Limit results to just the first 2 line otherwise
-            # there is just to much content to display
-            body = re.split(r'\r*\n', body)
-            body = '\r\n'.join(body[0:self.body_max_line_count])
+            # Limit results to just the first few lines otherwise there is
+            # just to much content to display; we stop looking for new lines
+            # once we have what we need
+            lines = []
+            offset = 0
+            for match in LINE_SPLIT_RE.finditer(body):
+                lines.append(body[offset:match.start()])
+                offset = match.end()
+                if len(lines) >= self.body_max_line_count:
+                    break
+
+            else:
+                lines.append(body[offset:])
+
+            body = '\r\n'.join(lines)
 
         if overflow == OverflowMode.UPSTREAM:
             # Nothing more to do
-            response.append({'body': body, 'title': title})
-            return response
+            yield {'body': body, 'title': title}
+            return
 
         elif len(title) > self.title_maxlen:
             # Truncate our Title
             title = title[:self.title_maxlen]
 
-        if self.body_maxlen > 0 and len(body) <= self.body_maxlen:
-            response.append({'body': body, 'title': title})
-            return response
+        if self.body_maxlen <= 0:
+            # Nothing more to do
+            yield {'body': body[:self.body_maxlen], 'title': title}
+            return
 
         if overflow == OverflowMode.TRUNCATE:
-            # Truncate our body and return
-            response.append({
-                'body': body[:self.body_maxlen],
+            # Truncate our body and return; for truncate mode, we're done
+            # after our first chunk
+            yield {
+                'body': next(self._split_body(body, smart=False)),
                 'title': title,
-            })
-            # For truncate mode, we're done now
-            return response
+            }
+            return
 
         # If we reach here, then we are in SPLIT mode.
         # For here, we want to split the message as many times as we have to
         # in order to fit it within the designated limits.
-        response = [{
-            'body': body[i: i + self.body_maxlen],
-            'title': title} for i in range(0, len(body), self.body_maxlen)]
+        if sequence:
+            # Our sequence tag can never be longer then this since each
+            # chunk is at least one character long
+            reserve = len(SEQUENCE_TAG.format(
+                index=len(body), total=len(body)))
+
+            chunk = next(self._split_body(body))
+            if len(chunk) < len(body) and reserve < self.body_maxlen:
+                # We need to know how many chunks there are to tag them; we
+                # count them first (without holding onto them) and then
+                # split our body again as each chunk is requested
+                maxlen = self.body_maxlen - reserve
+                total = sum(1 for _ in self._split_body(body, maxlen=maxlen))
+
+                for no, chunk in enumerate(
+                        self._split_body(body, maxlen=maxlen), start=1):
+                    yield {
+                        'body': SEQUENCE_TAG.format(
+                            index=no, total=total) + chunk,
+                        'title': title,
+                    }
+
+                return
+
+        for chunk in self._split_body(body):
+            yield {'body': chunk, 'title': title}
+
+    def _split_body(self, body, smart=True, maxlen=None):
+        """
+        A generator that breaks apart the body provided into chunks that fit
+        within our body_maxlen (as measured by our body_maxlen_unit).
+
+        If smart is set to True, then chunks are broken on a line (or word)
+        boundary when one can be found in the later half of the chunk.  No
+        content is ever lost; the whitespace we split on remains at the end
+        of the chunk it was found in.
+
+        An empty body still produces a single (empty) chunk.
+
+        The maxlen can be specified to use something smaller then our
+        body_maxlen.
+        """
+
+        if maxlen is None:
+            maxlen = self.body_maxlen
+
+        body_len = len(body)
+        if not body_len:
+            yield body
+            return
+
+        offset = 0
+        while offset < body_len:
+            end = offset + self._overflow_fit(body, offset, maxlen)
+
+            if smart and end < body_len:
+                # We only accept a boundary found in the later half of our
+                # chunk; otherwise we'd be sending very small messages
+                minimum = offset + int((end - offset) / 2)
+                for boundary in SPLIT_BOUNDARIES:
+                    index = body.rfind(boundary, minimum, end)
+                    if index >= 0:
+                        # Split after our boundary
+                        end = index + 1
+                        break
+
+            yield body[offset:end]
+            offset = end
+
+    def _overflow_fit(self, body, offset, maxlen):
+        """
+        Returns the number of characters (starting from the offset specified)
+        that fit within the maxlen specified as measured by our
+        body_maxlen_unit. At least one character is always returned so that
+        we can always make progress.
+        """
+
+        # A character is always at least one unit long; so there is never any
+        # need to measure more then this
+        window = body[offset:offset + maxlen]
+
+        if self.body_maxlen_unit == OverflowUnit.CHARACTER \
+                or not isinstance(window, six.text_type):
+            # Nothing more to do
+            return len(window)
+
+        if self.body_maxlen_unit == OverflowUnit.UTF16:
+            # Each unit is 2 bytes
+            encoding = 'utf-16-le'
+            maxlen *= 2
+
+        else:  # OverflowUnit.BYTE
+            encoding = 'utf-8'
+
+        encoded = window.encode(encoding)
+        if len(encoded) <= maxlen:
+            # Everything fits
+            return len(window)
 
-        return response
+        # Anything left over that was cut in half by our truncation is
+        # dropped when we decode our content again
+        return max(1, len(encoded[:maxlen].decode(encoding, 'ignore')))
 
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
@@ -304,6 +304,7 @@ class NotifyBoxcar(NotifyBase):
                 self.logger.info('Sent Boxcar notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Boxcar '
                 'notification to %s.' % (host))
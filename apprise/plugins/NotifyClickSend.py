@@ -242,6 +242,7 @@ class NotifyClickSend(NotifyBase):
                         ))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending {} ClickSend '
                     'notification(s).'.format(len(payload['messages'])))
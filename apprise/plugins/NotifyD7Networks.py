@@ -371,6 +371,7 @@ class NotifyD7Networks(NotifyBase):
                         'Response Details:\r\n{}'.format(r.content))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending D7 Networks:%s ' % (
                         ', '.join(self.targets)) + 'notification.'
@@ -298,6 +298,7 @@ class NotifyDapnet(NotifyBase):
                     )
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending DAPNET '
                     'notification to {}'.format(self.targets)
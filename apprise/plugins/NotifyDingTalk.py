@@ -264,6 +264,7 @@ class NotifyDingTalk(NotifyBase):
                 self.logger.info('Sent DingTalk notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occured sending DingTalk '
                 'notification.'
@@ -382,7 +382,7 @@ class NotifyDiscord(NotifyBase):
 
             # Open our attachment path if required:
             if attach:
-                files = {'file': (attach.name, open(attach.path, 'rb'))}
+                files = {'file': (attach.name, attach.view())}
 
             else:
                 headers['Content-Type'] = 'application/json; charset=utf-8'
@@ -420,6 +420,7 @@ class NotifyDiscord(NotifyBase):
                     'attachment' if attach else 'notification'))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred posting {}to Discord.'.format(
                     attach.name if attach else ''))
@@ -433,12 +434,6 @@ class NotifyDiscord(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return False
 
-        finally:
-            # Close our file (if it's open) stored in the second element
-            # of our files tuple (index 1)
-            if files:
-                files['file'][1].close()
-
         return True
 
     def url(self, privacy=False, *args, **kwargs):
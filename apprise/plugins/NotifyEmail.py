@@ -28,6 +28,7 @@ import six
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
+from email.encoders import encode_noop
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr, make_msgid
 from email.header import Header
@@ -764,16 +765,19 @@ class NotifyEmail(NotifyBase):
                         'Preparing Email attachment {}'.format(
                             attachment.url(privacy=True)))
 
-                    with open(attachment.path, "rb") as abody:
-                        app = MIMEApplication(abody.read())
-                        app.set_type(attachment.mimetype)
-
-                        app.add_header(
-                            'Content-Disposition',
-                            'attachment; filename="{}"'.format(
-                                Header(attachment.name, 'utf-8')),
-                        )
-                        mixed.attach(app)
+                    # Our content is already base64 encoded
+                    app = MIMEApplication(
+                        attachment.base64(lines=True),
+                        _encoder=encode_noop)
+                    app['Content-Transfer-Encoding'] = 'base64'
+                    app.set_type(attachment.mimetype)
+
+                    app.add_header(
+                        'Content-Disposition',
+                        'attachment; filename="{}"'.format(
+                            Header(attachment.name, 'utf-8')),
+                    )
+                    mixed.attach(app)
                 base = mixed
 
             # Apply any provided custom headers
@@ -850,6 +854,7 @@ class NotifyEmail(NotifyBase):
                     'Sent Email notification to "{}".'.format(to_addr))
 
             except (SocketError, smtplib.SMTPException, RuntimeError) as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Email '
                     'notification to {}.'.format(self.smtp_host))
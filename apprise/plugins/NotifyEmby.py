@@ -31,8 +31,10 @@
 # Notifications: https://github.com/MediaBrowser/Emby/wiki/Remote-control
 import requests
 import hashlib
+import threading
 from json import dumps
 from json import loads
+from time import time
 
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
@@ -41,6 +43,16 @@ from ..common import NotifyType
 from .. import __version__ as VERSION
 from ..AppriseLocale import gettext_lazy as _
 
+# Authenticated Emby sessions are shared between all of the NotifyEmby objects
+# that use the same credentials (and server) so that we only ever log in once.
+# The discovered (user controllable) Emby sessions we notify are cached here
+# as well.
+EMBY_SESSION_POOL = {}
+
+# Held while a shared session is looked up (or created); logging in to one
+# is serialized by the lock the session holds itself
+EMBY_SESSION_POOL_LOCK = threading.Lock()
+
 
 class NotifyEmby(NotifyBase):
     """
@@ -112,6 +124,10 @@ class NotifyEmby(NotifyBase):
         },
     })
 
+    # The number of seconds our discovered list of Emby sessions is re-used
+    # for before we query the server for it again
+    emby_session_cache_sec = 300
+
     def __init__(self, modal=False, **kwargs):
         """
         Initialize Emby Object
@@ -125,12 +141,6 @@ class NotifyEmby(NotifyBase):
         else:
             self.schema = 'http'
 
-        # Our access token does not get created until we first
-        # authenticate with our Emby server. The same goes for the
-        # user id below.
-        self.access_token = None
-        self.user_id = None
-
         # Whether or not our popup dialog is a timed notification
         # or a modal type box (requires an Okay acknowledgement)
         self.modal = modal
@@ -145,12 +155,105 @@ class NotifyEmby(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
+        # Our access token does not get created until we first
+        # authenticate with our Emby server. The same goes for the
+        # user id.  Both are tracked in our (shared) session.
+        self._session = self.session_lookup()
+
         return
 
+    def session_lookup(self):
+        """
+        Returns the (shared) session associated with our credentials;
+        one is created if it doesn't already exist.
+
+        """
+        key = (
+            self.schema, self.host, self.port, self.user, self.password,
+            self.verify_certificate)
+
+        with EMBY_SESSION_POOL_LOCK:
+            session = EMBY_SESSION_POOL.get(key)
+            if session is None:
+                session = {
+                    # Our access token and user id
+                    'access_token': None,
+                    'user_id': None,
+                    # Our cached list of Emby session identifiers
+                    'sessions': None,
+                    'expiry': 0.0,
+                    # Held while we log in (or out) so that the objects
+                    # sharing this session don't log each other out
+                    'lock': threading.RLock(),
+                }
+                EMBY_SESSION_POOL[key] = session
+
+        return session
+
+    @staticmethod
+    def session_pool_reset():
+        """
+        Forgets all of our shared sessions (and the Emby sessions they
+        discovered) without logging them out; the next notification logs in
+        and looks up the Emby sessions to notify again
+        """
+        with EMBY_SESSION_POOL_LOCK:
+            EMBY_SESSION_POOL.clear()
+
+    @property
+    def access_token(self):
+        """
+        Our (shared) access token
+        """
+        return self._session['access_token']
+
+    @access_token.setter
+    def access_token(self, value):
+        self._session['access_token'] = value
+        # Any cached sessions are no longer valid
+        self._session['sessions'] = None
+
+    @property
+    def user_id(self):
+        """
+        Our (shared) user id
+        """
+        return self._session['user_id']
+
+    @user_id.setter
+    def user_id(self, value):
+        self._session['user_id'] = value
+
+    def authenticate(self, expired=None):
+        """
+        Logs in unless our (shared) session already is; only one of the
+        objects sharing it logs in at a time and the others use the access
+        token it acquired.
+
+        expired is an access token our server rejected; we only log back in
+        if nobody else sharing our session has done so already.
+
+        """
+        with self._session['lock']:
+            if self.is_authenticated and (
+                    expired is None or self.access_token != expired):
+                # We're already logged in
+                return True
+
+            if expired is not None:
+                # There is no point logging out of a rejected token
+                self.access_token = None
+                self.user_id = None
+
+            return self.login()
+
     def login(self, **kwargs):
         """
         Creates our authentication token and prepares our header
 
+        Use authenticate() when sharing our session with other threads;
+        this logs out of any access token we already have first.
+
         """
 
         if self.is_authenticated:
@@ -231,6 +334,7 @@ class NotifyEmby(NotifyBase):
                 return False
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred authenticating a user with Emby '
                 'at %s.' % self.host)
@@ -341,7 +445,7 @@ class NotifyEmby(NotifyBase):
         # are stored inside.
         sessions = dict()
 
-        if not self.is_authenticated and not self.login():
+        if not self.authenticate():
             # Authenticate if we aren't already
             return sessions
 
@@ -395,6 +499,7 @@ class NotifyEmby(NotifyBase):
                 return sessions
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred querying Emby '
                 'for session information at %s.' % self.host)
@@ -481,6 +586,7 @@ class NotifyEmby(NotifyBase):
                 return False
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred querying Emby '
                 'to logoff user %s at %s.' % (self.user, self.host))
@@ -500,12 +606,19 @@ class NotifyEmby(NotifyBase):
         """
         Perform Emby Notification
         """
-        if not self.is_authenticated and not self.login():
+        if not self.authenticate():
             # Authenticate if we aren't already
             return False
 
         # Acquire our list of sessions
-        sessions = self.sessions().keys()
+        sessions = self._session['sessions']
+        if sessions is None or self._session['expiry'] < time():
+            sessions = list(self.sessions().keys())
+            if sessions:
+                # Cache our results for next time
+                self._session['sessions'] = sessions
+                self._session['expiry'] = time() + self.emby_session_cache_sec
+
         if not sessions:
             self.logger.warning('There were no Emby sessions to notify.')
             # We don't need to fail; there really is no one to notify
@@ -537,7 +650,11 @@ class NotifyEmby(NotifyBase):
         # Track whether or not we had a failure or not.
         has_error = False
 
-        for session in sessions:
+        # We only log back in once if our (shared) access token expired
+        # while we were holding onto it
+        relogin = True
+
+        for session in list(sessions):
             # Update our session
             session_url = url % session
 
@@ -557,6 +674,30 @@ class NotifyEmby(NotifyBase):
                     verify=self.verify_certificate,
                     timeout=self.request_timeout,
                 )
+
+                if r.status_code == requests.codes.unauthorized and relogin:
+                    # Our access token expired; log back in (unless someone
+                    # else already has) and try again
+                    relogin = False
+                    if self.authenticate(
+                            expired=headers['X-MediaBrowser-Token']):
+                        headers['X-Emby-Authorization'] = \
+                            self.emby_auth_header
+                        headers['X-MediaBrowser-Token'] = self.access_token
+
+                        r = requests.post(
+                            session_url,
+                            data=dumps(payload),
+                            headers=headers,
+                            verify=self.verify_certificate,
+                            timeout=self.request_timeout,
+                        )
+
+                elif r.status_code == requests.codes.not_found:
+                    # The session went away; we'll look our sessions up
+                    # again next time
+                    self._session['sessions'] = None
+
                 if r.status_code not in (
                         requests.codes.ok,
                         requests.codes.no_content):
@@ -582,6 +723,7 @@ class NotifyEmby(NotifyBase):
                     self.logger.info('Sent Emby notification.')
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Emby '
                     'notification to %s.' % self.host)
@@ -675,50 +817,31 @@ class NotifyEmby(NotifyBase):
 
         return results
 
-    def __del__(self):
+    def close(self):
         """
-        Deconstructor
+        Logs out of our (shared) Emby session; any other NotifyEmby object
+        sharing it will log back in the next time it's used.
+
         """
-        try:
-            self.logout()
+        with self._session['lock']:
+            if not self.is_authenticated:
+                # Nothing to do
+                return
 
-        except LookupError:  # pragma: no cover
-            # Python v3.5 call to requests can sometimes throw the exception
-            #   "/usr/lib64/python3.7/socket.py", line 748, in getaddrinfo
-            #   LookupError: unknown encoding: idna
-            #
-            # This occurs every time when running unit-tests against Apprise:
-            # LANG=C.UTF-8 PYTHONPATH=$(pwd) py.test-3.7
-            #
-            # There has been an open issue on this since Jan 2017.
-            #   - https://bugs.python.org/issue29288
-            #
-            # A ~similar~ issue can be identified here in the requests
-            # ticket system as unresolved and has provided work-arounds
-            #   - https://github.com/kennethreitz/requests/issues/3578
-            pass
-
-        except ImportError:  # pragma: no cover
-            # The actual exception is `ModuleNotFoundError` however ImportError
-            # grants us backwards compatiblity with versions of Python older
-            # than v3.6
-
-            # Python code that makes early calls to sys.exit() can cause
-            # the __del__() code to run. However in some newer versions of
-            # Python, this causes the `sys` library to no longer be
-            # available. The stack overflow also goes on to suggest that
-            # it's not wise to use the __del__() as a deconstructor
-            # which is the case here.
-
-            # https://stackoverflow.com/questions/67218341/\
-            #       modulenotfounderror-import-of-time-halted-none-in-sys-\
-            #           modules-occured-when-obj?noredirect=1&lq=1
-            #
-            #
-            # Also see: https://stackoverflow.com/questions\
-            #       /1481488/what-is-the-del-method-and-how-do-i-call-it
-
-            # At this time it seems clean to try to log out (if we can)
-            # but not throw any unessisary exceptions (like this one) to
-            # the end user if we don't have to.
-            pass
+            try:
+                self.logout()
+
+            except LookupError:  # pragma: no cover
+                # Python v3.5 call to requests can sometimes throw the
+                # exception
+                #   "/usr/lib64/python3.7/socket.py", line 748, in getaddrinfo
+                #   LookupError: unknown encoding: idna
+                #
+                # There has been an open issue on this since Jan 2017.
+                #   - https://bugs.python.org/issue29288
+                pass
+
+            # Always drop our session regardless of whether or not our
+            # logout was successful
+            self.access_token = None
+            self.user_id = None
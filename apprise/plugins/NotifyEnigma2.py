@@ -314,6 +314,7 @@ class NotifyEnigma2(NotifyBase):
             self.logger.info('Sent Enigma2 notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Enigma2 '
                 'notification to %s.' % self.host)
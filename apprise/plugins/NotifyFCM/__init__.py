@@ -48,6 +48,7 @@
 import six
 import requests
 from json import dumps
+from json import loads
 from ..NotifyBase import NotifyBase
 from ...common import NotifyType
 from ...utils import validate_regex
@@ -128,6 +129,16 @@ class NotifyFCM(NotifyBase):
     # The maximum length of the body
     body_maxlen = 1024
 
+    # The maximum number of device tokens a single (legacy) multicast
+    # request can notify.  FCM's HTTP v1 API (OAuth2) has no multicast
+    # support so each device token is always notified separately in that
+    # mode.
+    default_batch_size = 1000
+
+    # The maximum number of topics that can be referenced by a single
+    # condition (in both modes)
+    default_topic_batch_size = 5
+
     # Define object templates
     templates = (
         # OAuth2
@@ -185,6 +196,11 @@ class NotifyFCM(NotifyBase):
             'type': 'choice:string',
             'values': FCM_PRIORITIES,
         },
+        'batch': {
+            'name': _('Batch Mode'),
+            'type': 'bool',
+            'default': True,
+        },
         'image_url': {
             'name': _('Custom Image URL'),
             'type': 'string',
@@ -214,7 +230,7 @@ class NotifyFCM(NotifyBase):
 
     def __init__(self, project, apikey, targets=None, mode=None, keyfile=None,
                  data_kwargs=None, image_url=None, include_image=False,
-                 color=None, priority=None, **kwargs):
+                 color=None, priority=None, batch=None, **kwargs):
         """
         Initialize Firebase Cloud Messaging
 
@@ -284,6 +300,10 @@ class NotifyFCM(NotifyBase):
         # Acquire Device IDs to notify
         self.targets = parse_list(targets)
 
+        # Prepare Batch Mode Flag
+        self.batch = self.template_args['batch']['default'] \
+            if batch is None else bool(batch)
+
         # Our data Keyword/Arguments to include in our outbound payload
         self.data_kwargs = {}
         if isinstance(data_kwargs, dict):
@@ -378,132 +398,211 @@ class NotifyFCM(NotifyBase):
         image = self.image_url(notify_type) \
             if not self.image_src else self.image_src
 
-        has_error = False
-        # Create a copy of the targets list
-        targets = list(self.targets)
-        while len(targets):
-            recipient = targets.pop(0)
-
-            if self.mode == FCMMode.OAuth2:
-                payload = {
-                    'message': {
-                        'token': None,
-                        'notification': {
-                            'title': title,
-                            'body': body,
-                        }
+        if self.mode == FCMMode.OAuth2:
+            payload = {
+                'message': {
+                    'notification': {
+                        'title': title,
+                        'body': body,
                     }
                 }
+            }
 
-                if self.color:
-                    # Acquire our color
-                    payload['message']['android'] = {
-                        'notification': {'color': self.color.get(notify_type)}}
-
-                if self.include_image and image:
-                    payload['message']['notification']['image'] = image
-
-                if self.data_kwargs:
-                    payload['message']['data'] = self.data_kwargs
+            if self.color:
+                # Acquire our color
+                payload['message']['android'] = {
+                    'notification': {'color': self.color.get(notify_type)}}
 
-                if recipient[0] == '#':
-                    payload['message']['topic'] = recipient[1:]
-                    self.logger.debug(
-                        "FCM recipient %s parsed as a topic",
-                        recipient[1:])
+            if self.include_image and image:
+                payload['message']['notification']['image'] = image
 
-                else:
-                    payload['message']['token'] = recipient
-                    self.logger.debug(
-                        "FCM recipient %s parsed as a device token",
-                        recipient)
+            if self.data_kwargs:
+                payload['message']['data'] = self.data_kwargs
 
-            else:  # FCMMode.Legacy
-                payload = {
+        else:  # FCMMode.Legacy
+            payload = {
+                'notification': {
                     'notification': {
-                        'notification': {
-                            'title': title,
-                            'body': body,
-                        }
+                        'title': title,
+                        'body': body,
                     }
                 }
+            }
 
-                if self.color:
-                    # Acquire our color
-                    payload['notification']['notification']['color'] = \
-                        self.color.get(notify_type)
+            if self.color:
+                # Acquire our color
+                payload['notification']['notification']['color'] = \
+                    self.color.get(notify_type)
 
-                if self.include_image and image:
-                    payload['notification']['notification']['image'] = image
+            if self.include_image and image:
+                payload['notification']['notification']['image'] = image
 
-                if self.data_kwargs:
-                    payload['data'] = self.data_kwargs
+            if self.data_kwargs:
+                payload['data'] = self.data_kwargs
 
-                if recipient[0] == '#':
-                    payload['to'] = '/topics/{}'.format(recipient)
-                    self.logger.debug(
-                        "FCM recipient %s parsed as a topic",
-                        recipient[1:])
+        # A more advanced dict.update() that recursively includes
+        # sub-dictionaries as well
+        dict_full_update(payload, self.priority.payload())
 
-                else:
-                    payload['to'] = recipient
-                    self.logger.debug(
-                        "FCM recipient %s parsed as a device token",
-                        recipient)
+        # Send in batches if identified to do so
+        batch_size = 1 if not (self.batch and self.mode == FCMMode.Legacy) \
+            else self.default_batch_size
+        topic_batch_size = \
+            1 if not self.batch else self.default_topic_batch_size
 
-            # A more advanced dict.update() that recursively includes
-            # sub-dictionaries as well
-            dict_full_update(payload, self.priority.payload())
+        # Separate our device tokens from our topics
+        tokens = [t for t in self.targets if t[0] != '#']
+        topics = [t[1:] for t in self.targets if t[0] == '#']
+
+        has_error = False
+        for index in range(0, len(tokens), batch_size):
+            if not self._send(
+                    notify_url, headers, payload,
+                    tokens=tokens[index:index + batch_size]):
+                has_error = True
+
+        for index in range(0, len(topics), topic_batch_size):
+            if not self._send(
+                    notify_url, headers, payload,
+                    topics=topics[index:index + topic_batch_size]):
+                has_error = True
+
+        return not has_error
+
+    def _send(self, notify_url, headers, payload, tokens=None, topics=None):
+        """
+        Sends our prepared payload to the device tokens or topics specified.
+        Multiple device tokens are notified using a single (legacy)
+        multicast request while multiple topics are notified using a
+        condition.
+
+        """
+
+        # Our recipient(s) differ between each request; create a (shallow)
+        # copy of what we need to alter
+        payload = dict(payload)
+        if self.mode == FCMMode.OAuth2:
+            message = payload['message'] = dict(payload['message'])
 
+        else:  # FCMMode.Legacy
+            message = payload
+
+        if tokens:
             self.logger.debug(
-                'FCM %s POST URL: %s (cert_verify=%r)',
-                self.mode, notify_url, self.verify_certificate,
-            )
-            self.logger.debug('FCM %s Payload: %s', self.mode, str(payload))
+                'FCM recipient(s) %s parsed as device token(s)',
+                ', '.join(tokens))
 
-            # Always call throttle before any remote server i/o is made
-            self.throttle()
-            try:
-                r = requests.post(
-                    notify_url.format(project=self.project),
-                    data=dumps(payload),
-                    headers=headers,
-                    verify=self.verify_certificate,
-                    timeout=self.request_timeout,
-                )
-                if r.status_code not in (
-                        requests.codes.ok, requests.codes.no_content):
-                    # We had a problem
-                    status_str = \
-                        NotifyBase.http_response_code_lookup(
-                            r.status_code, FCM_HTTP_ERROR_MAP)
+            if len(tokens) > 1:
+                # Multicast (legacy mode only)
+                message['registration_ids'] = tokens
 
-                    self.logger.warning(
-                        'Failed to send {} FCM notification: '
-                        '{}{}error={}.'.format(
-                            self.mode,
-                            status_str,
-                            ', ' if status_str else '',
-                            r.status_code))
+            else:
+                message['token' if self.mode == FCMMode.OAuth2 else 'to'] = \
+                    tokens[0]
 
-                    self.logger.debug(
-                        'Response Details:\r\n%s', r.content)
+        else:
+            self.logger.debug(
+                'FCM recipient(s) %s parsed as topic(s)', ', '.join(topics))
 
-                    has_error = True
+            if len(topics) > 1:
+                message['condition'] = ' || '.join(
+                    ["'{}' in topics".format(t) for t in topics])
 
-                else:
-                    self.logger.info('Sent %s FCM notification.', self.mode)
+            elif self.mode == FCMMode.OAuth2:
+                message['topic'] = topics[0]
+
+            else:  # FCMMode.Legacy
+                message['to'] = '/topics/{}'.format(topics[0])
+
+        self.logger.debug(
+            'FCM %s POST URL: %s (cert_verify=%r)',
+            self.mode, notify_url, self.verify_certificate,
+        )
+        self.logger.debug('FCM %s Payload: %s', self.mode, str(payload))
+
+        # Always call throttle before any remote server i/o is made
+        self.throttle()
+        try:
+            r = requests.post(
+                notify_url.format(project=self.project),
+                data=dumps(payload),
+                headers=headers,
+                verify=self.verify_certificate,
+                timeout=self.request_timeout,
+            )
+            if r.status_code not in (
+                    requests.codes.ok, requests.codes.no_content):
+                # We had a problem
+                status_str = \
+                    NotifyBase.http_response_code_lookup(
+                        r.status_code, FCM_HTTP_ERROR_MAP)
 
-            except requests.RequestException as e:
                 self.logger.warning(
-                    'A Connection error occurred sending FCM '
-                    'notification.'
-                )
-                self.logger.debug('Socket Exception: %s', str(e))
+                    'Failed to send {} FCM notification: '
+                    '{}{}error={}.'.format(
+                        self.mode,
+                        status_str,
+                        ', ' if status_str else '',
+                        r.status_code))
 
-                has_error = True
+                self.logger.debug(
+                    'Response Details:\r\n%s', r.content)
 
-        return not has_error
+                return False
+
+        except requests.RequestException as e:
+            self.upstream_failure(e)
+            self.logger.warning(
+                'A Connection error occurred sending FCM '
+                'notification.'
+            )
+            self.logger.debug('Socket Exception: %s', str(e))
+
+            return False
+
+        if self.mode == FCMMode.Legacy:
+            # The legacy API reports the result of each device token (and
+            # topic) in the body of a successful response, e.g.:
+            #  {
+            #    "multicast_id": 108,
+            #    "success": 1,
+            #    "failure": 1,
+            #    "results": [
+            #      { "message_id": "1:08" },
+            #      { "error": "NotRegistered"},
+            #    ]
+            #  }
+            try:
+                content = loads(r.content)
+                results = content['results'] \
+                    if 'results' in content else [content]
+
+                failures = [
+                    (recipient, result['error']) for recipient, result in zip(
+                        tokens if tokens else [', '.join(topics)], results)
+                    if isinstance(result, dict) and result.get('error')]
+
+            except (AttributeError, TypeError, ValueError, KeyError):
+                # ValueError = r.content is Unparsable
+                # TypeError = r.content is None
+                # AttributeError = r is None
+                # KeyError = an unexpected response was received
+                failures = []
+
+            if failures:
+                for recipient, error in failures:
+                    self.logger.warning(
+                        'Failed to send FCM notification to %s: %s',
+                        recipient, error)
+
+                self.logger.debug('Response Details:\r\n%s', r.content)
+                return False
+
+        self.logger.info(
+            'Sent %s FCM notification to %d %s.', self.mode,
+            len(tokens) if tokens else len(topics),
+            'device(s)' if tokens else 'topic(s)')
+        return True
 
     def url(self, privacy=False, *args, **kwargs):
         """
@@ -515,6 +614,7 @@ class NotifyFCM(NotifyBase):
             'mode': self.mode,
             'image': 'yes' if self.include_image else 'no',
             'color': str(self.color),
+            'batch': 'yes' if self.batch else 'no',
         }
 
         if self.priority:
@@ -614,6 +714,11 @@ class NotifyFCM(NotifyBase):
                 # but ONLY if the `image` boolean was not set
                 results['include_image'] = True
 
+        # Get Batch Mode Flag
+        results['batch'] = \
+            parse_bool(results['qsd'].get(
+                'batch', NotifyFCM.template_args['batch']['default']))
+
         # Store our data keyword/args if specified
         results['data_kwargs'] = results['qsd+']
 
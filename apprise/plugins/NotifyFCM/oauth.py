@@ -42,6 +42,7 @@ from cryptography.exceptions import UnsupportedAlgorithm
 from datetime import datetime
 from datetime import timedelta
 from ...logger import logger
+from ...circuit import circuit_failure
 
 try:
     # Python 2.7
@@ -291,6 +292,7 @@ class GoogleOAuth(object):
                 return None
 
         except requests.RequestException as e:
+            circuit_failure(e)
             logger.warning(
                 'A Connection error occurred refreshing FCM '
                 'Access Token.'
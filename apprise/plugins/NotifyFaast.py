@@ -160,6 +160,7 @@ class NotifyFaast(NotifyBase):
                 self.logger.info('Sent Faast notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Faast notification.',
             )
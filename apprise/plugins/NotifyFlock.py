@@ -294,6 +294,7 @@ class NotifyFlock(NotifyBase):
                 self.logger.info('Sent Flock notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Flock notification.'
             )
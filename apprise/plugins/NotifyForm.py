@@ -23,13 +23,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import re
 import six
 import requests
+from uuid import uuid4
 
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
 from ..common import NotifyImageSize
 from ..common import NotifyType
+from ..utils import compress
+from ..utils import StreamPayload
+from ..utils import CONTENT_ENCODINGS
 from ..AppriseLocale import gettext_lazy as _
 
 
@@ -42,6 +47,16 @@ METHODS = (
     'HEAD'
 )
 
+# The characters that are escaped in the (quoted) names of our multipart
+# form fields (and files) just as browsers (and requests) escape them
+MULTIPART_NAME_ESCAPES = {
+    '"': '%22',
+    '\\': '\\\\',
+    '\r': '%0D',
+    '\n': '%0A',
+}
+MULTIPART_NAME_ESCAPE_RE = re.compile(r'["\\\r\n]')
+
 
 class NotifyForm(NotifyBase):
     """
@@ -112,6 +127,11 @@ class NotifyForm(NotifyBase):
             'values': METHODS,
             'default': METHODS[0],
         },
+        'compress': {
+            'name': _('Compression'),
+            'type': 'choice:string',
+            'values': tuple(sorted(CONTENT_ENCODINGS.keys())),
+        },
     })
 
     # Define any kwargs we're using
@@ -126,13 +146,17 @@ class NotifyForm(NotifyBase):
         },
     }
 
-    def __init__(self, headers=None, method=None, payload=None, **kwargs):
+    def __init__(self, headers=None, method=None, payload=None,
+                 compress=None, **kwargs):
         """
         Initialize Form Object
 
         headers can be a dictionary of key/value pairs that you want to
         additionally include as part of the server headers to post with
 
+        compress can be set to gzip or deflate to compress the body of our
+        requests (they're sent uncompressed by default)
+
         """
         super(NotifyForm, self).__init__(**kwargs)
 
@@ -148,6 +172,13 @@ class NotifyForm(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
+        self.compress = None if not compress else compress.lower()
+        if self.compress and self.compress not in CONTENT_ENCODINGS:
+            msg = 'The compression specified ({}) is invalid.'.format(
+                compress)
+            self.logger.warning(msg)
+            raise TypeError(msg)
+
         self.headers = {}
         if headers:
             # Store our extra headers
@@ -170,6 +201,9 @@ class NotifyForm(NotifyBase):
             'method': self.method,
         }
 
+        if self.compress:
+            params['compress'] = self.compress
+
         # Extend our parameters
         params.update(self.url_parameters(privacy=privacy, *args, **kwargs))
 
@@ -220,39 +254,6 @@ class NotifyForm(NotifyBase):
         # Apply any/all header over-rides defined
         headers.update(self.headers)
 
-        # Track our potential attachments
-        files = []
-        if attach:
-            for no, attachment in enumerate(attach, start=1):
-                # Perform some simple error checking
-                if not attachment:
-                    # We could not access the attachment
-                    self.logger.error(
-                        'Could not access attachment {}.'.format(
-                            attachment.url(privacy=True)))
-                    return False
-
-                try:
-                    files.append((
-                        'file{:02d}'.format(no), (
-                            attachment.name,
-                            open(attachment.path, 'rb'),
-                            attachment.mimetype)
-                    ))
-
-                except (OSError, IOError) as e:
-                    self.logger.warning(
-                        'An I/O error occurred while opening {}.'.format(
-                            attachment.name if attachment else 'attachment'))
-                    self.logger.debug('I/O Exception: %s' % str(e))
-                    return False
-
-                finally:
-                    for file in files:
-                        # Ensure all files are closed
-                        if file[1][1]:
-                            file[1][1].close()
-
         # prepare Form Object
         payload = {
             # Version: Major.Minor,  Major is only updated if the entire
@@ -267,6 +268,34 @@ class NotifyForm(NotifyBase):
         # Apply any/all payload over-rides defined
         payload.update(self.payload_extras)
 
+        # Our request body; this is our payload unless we're performing a GET
+        # in which case it's passed along as our query parameters instead
+        data = payload if self.method != 'GET' else None
+
+        try:
+            if attach:
+                # Our attachments are sent as a multipart form whose content
+                # is only read as it's sent
+                data = self._multipart(data, attach, headers)
+                if data is None:
+                    return False
+
+            elif data and self.compress:
+                # Prepare our (url encoded) form ourselves
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+                data = NotifyForm.urlencode(data)
+
+            if data is not None and self.compress:
+                data = compress(data, self.compress)
+                headers['Content-Encoding'] = self.compress
+
+        except (OSError, IOError) as e:
+            self.logger.warning(
+                'An I/O error occurred while reading one of the '
+                'attached files.')
+            self.logger.debug('I/O Exception: %s' % str(e))
+            return False
+
         auth = None
         if self.user:
             auth = (self.user, self.password)
@@ -306,8 +335,7 @@ class NotifyForm(NotifyBase):
         try:
             r = method(
                 url,
-                files=None if not files else files,
-                data=payload if self.method != 'GET' else None,
+                data=data,
                 params=payload if self.method == 'GET' else None,
                 headers=headers,
                 auth=auth,
@@ -335,6 +363,7 @@ class NotifyForm(NotifyBase):
                 self.logger.info('Sent Form %s notification.', self.method)
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Form '
                 'notification to %s.' % self.host)
@@ -350,13 +379,69 @@ class NotifyForm(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return False
 
-        finally:
-            for file in files:
-                # Ensure all files are closed
-                file[1][1].close()
-
         return True
 
+    def _multipart(self, fields, attach, headers):
+        """
+        Returns a StreamPayload of the (multipart/form-data) form made up of
+        the fields and attachments provided; the headers are updated with
+        its Content-Type.  None is returned if an attachment could not be
+        accessed.
+
+        """
+
+        boundary = uuid4().hex
+        payload = StreamPayload()
+
+        def part(name, filename=None, mimetype=None):
+            # Writes the headers of the next part of our form
+            payload.write(
+                '--{}\r\nContent-Disposition: form-data; name="{}"'.format(
+                    boundary, NotifyForm._multipart_escape(name)))
+
+            if filename is not None:
+                payload.write('; filename="{}"\r\nContent-Type: {}'.format(
+                    NotifyForm._multipart_escape(filename), mimetype))
+
+            payload.write('\r\n\r\n')
+
+        for name, value in (fields or {}).items():
+            part(name)
+            payload.write(
+                value if isinstance(value, six.string_types)
+                else str(value))
+            payload.write('\r\n')
+
+        for no, attachment in enumerate(attach, start=1):
+            # Perform some simple error checking
+            if not attachment:
+                # We could not access the attachment
+                self.logger.error(
+                    'Could not access attachment {}.'.format(
+                        attachment.url(privacy=True)))
+                return None
+
+            part('file{:02d}'.format(no),
+                 filename=attachment.name, mimetype=attachment.mimetype)
+            payload.write_file(attachment.path)
+            payload.write('\r\n')
+
+        payload.write('--{}--\r\n'.format(boundary))
+
+        headers['Content-Type'] = \
+            'multipart/form-data; boundary={}'.format(boundary)
+
+        return payload
+
+    @staticmethod
+    def _multipart_escape(name):
+        """
+        Escapes the (field or file) name provided so that it can be quoted
+        in our multipart form
+        """
+        return MULTIPART_NAME_ESCAPE_RE.sub(
+            lambda m: MULTIPART_NAME_ESCAPES[m.group(0)], name)
+
     @staticmethod
     def parse_url(url):
         """
@@ -382,4 +467,9 @@ class NotifyForm(NotifyBase):
         if 'method' in results['qsd'] and len(results['qsd']['method']):
             results['method'] = NotifyForm.unquote(results['qsd']['method'])
 
+        # Set our compression if specified
+        if 'compress' in results['qsd'] and len(results['qsd']['compress']):
+            results['compress'] = \
+                NotifyForm.unquote(results['qsd']['compress'])
+
         return results
@@ -352,6 +352,7 @@ class NotifyGitter(NotifyBase):
                 pass
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'Exception received when sending Gitter {} to {}: '.
                 format(method, url))
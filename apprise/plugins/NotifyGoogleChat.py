@@ -227,6 +227,7 @@ class NotifyGoogleChat(NotifyBase):
                 self.logger.info('Sent Google Chat notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred postingto Google Chat.')
             self.logger.debug('Socket Exception: %s' % str(e))
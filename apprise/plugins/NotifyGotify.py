@@ -256,6 +256,7 @@ class NotifyGotify(NotifyBase):
                 self.logger.info('Sent Gotify notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Gotify '
                 'notification to %s.' % self.host)
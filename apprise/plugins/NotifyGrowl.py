@@ -22,6 +22,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import threading
 
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
@@ -45,6 +46,21 @@ except ImportError:
     pass
 
 
+# Our Growl registrations are shared between all of the NotifyGrowl objects
+# that notify the same server (using the same password and application name)
+# so that we only ever register once. Growl servers remember the applications
+# registered with them so this is only revisited if the server tells us it
+# no longer knows who we are.
+GROWL_REGISTRATIONS = {}
+
+# Held while a registration is looked up, recorded or forgotten
+GROWL_REGISTRATION_LOCK = threading.Lock()
+
+# The GNTP error codes returned if we notify a server that doesn't know about
+# our application (UNKNOWN_APPLICATION) or notification (UNKNOWN_NOTIFICATION)
+GROWL_UNREGISTERED_ERRORS = ('401', '402')
+
+
 # Priorities
 class GrowlPriority(object):
     LOW = -2
@@ -215,10 +231,23 @@ class NotifyGrowl(NotifyBase):
 
         return
 
-    def register(self):
+    def register(self, force=False):
         """
-        Registers with the Growl server
+        Registers with the Growl server; registrations are shared so we only
+        ever register once unless we're forced to.
         """
+        key = (self.host, self.port, self.password, self.app_id)
+        with GROWL_REGISTRATION_LOCK:
+            if force:
+                # Forget our previous registration
+                GROWL_REGISTRATIONS.pop(key, None)
+                self.growl = None
+
+            elif key in GROWL_REGISTRATIONS:
+                # We're already registered
+                self.growl = GROWL_REGISTRATIONS[key]
+                return True
+
         payload = {
             'applicationName': self.app_id,
             'notifications': [self.growl_notification_type, ],
@@ -231,12 +260,13 @@ class NotifyGrowl(NotifyBase):
             payload['password'] = self.password
 
         self.logger.debug('Growl Registration Payload: %s' % str(payload))
-        self.growl = gntp.notifier.GrowlNotifier(**payload)
+        growl = gntp.notifier.GrowlNotifier(**payload)
 
         try:
-            self.growl.register()
+            growl.register()
 
         except gntp.errors.NetworkError:
+            self.upstream_failure()
             msg = 'A network error error occurred registering ' \
                   'with Growl at {}.'.format(self.host)
             self.logger.warning(msg)
@@ -264,9 +294,24 @@ class NotifyGrowl(NotifyBase):
             'Growl server registration completed successfully.'
         )
 
+        # Share our registration
+        with GROWL_REGISTRATION_LOCK:
+            GROWL_REGISTRATIONS[key] = growl
+
+        self.growl = growl
+
         # Return our state
         return True
 
+    @staticmethod
+    def registration_reset():
+        """
+        Forgets every server we registered with; each of them is registered
+        with again the next time it's notified
+        """
+        with GROWL_REGISTRATION_LOCK:
+            GROWL_REGISTRATIONS.clear()
+
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
         Perform Growl Notification
@@ -308,6 +353,20 @@ class NotifyGrowl(NotifyBase):
         try:
             # Perform notification
             response = self.growl.notify(**payload)
+            if isinstance(response, tuple) and \
+                    str(response[0]) in GROWL_UNREGISTERED_ERRORS:
+                # The server no longer knows who we are (it may have been
+                # restarted or reset); register again and retry once
+                self.logger.debug(
+                    'Growl server does not recognize our registration; '
+                    're-registering.')
+
+                if not self.register(force=True):
+                    return False
+
+                self.throttle()
+                response = self.growl.notify(**payload)
+
             if not isinstance(response, bool):
                 self.logger.warning(
                     'Growl notification failed to send with response: %s' %
@@ -325,6 +384,9 @@ class NotifyGrowl(NotifyBase):
 
             # However, if the host/server is unavailable, you will get to this
             # point of the code.
+            if isinstance(e, gntp.errors.NetworkError):
+                self.upstream_failure()
+
             self.logger.warning(
                 'A Connection error occurred sending Growl '
                 'notification to %s.' % self.host)
@@ -218,6 +218,7 @@ class NotifyHomeAssistant(NotifyBase):
                 self.logger.info('Sent Home Assistant notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Home Assistant '
                 'notification to %s.' % self.host)
@@ -274,6 +274,7 @@ class NotifyIFTTT(NotifyBase):
                         'Sent IFTTT notification to %s.' % event)
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending IFTTT:%s ' % (
                         event) + 'notification.'
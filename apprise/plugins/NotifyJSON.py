@@ -23,15 +23,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import re
 import six
 import requests
-import base64
 from json import dumps
+from uuid import uuid4
 
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
 from ..common import NotifyImageSize
 from ..common import NotifyType
+from ..utils import compress
+from ..utils import StreamPayload
+from ..utils import CONTENT_ENCODINGS
 from ..AppriseLocale import gettext_lazy as _
 
 
@@ -114,6 +118,11 @@ class NotifyJSON(NotifyBase):
             'values': METHODS,
             'default': METHODS[0],
         },
+        'compress': {
+            'name': _('Compression'),
+            'type': 'choice:string',
+            'values': tuple(sorted(CONTENT_ENCODINGS.keys())),
+        },
     })
 
     # Define any kwargs we're using
@@ -128,13 +137,17 @@ class NotifyJSON(NotifyBase):
         },
     }
 
-    def __init__(self, headers=None, method=None, payload=None, **kwargs):
+    def __init__(self, headers=None, method=None, payload=None,
+                 compress=None, **kwargs):
         """
         Initialize JSON Object
 
         headers can be a dictionary of key/value pairs that you want to
         additionally include as part of the server headers to post with
 
+        compress can be set to gzip or deflate to compress the body of our
+        requests (they're sent uncompressed by default)
+
         """
         super(NotifyJSON, self).__init__(**kwargs)
 
@@ -150,6 +163,13 @@ class NotifyJSON(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
+        self.compress = None if not compress else compress.lower()
+        if self.compress and self.compress not in CONTENT_ENCODINGS:
+            msg = 'The compression specified ({}) is invalid.'.format(
+                compress)
+            self.logger.warning(msg)
+            raise TypeError(msg)
+
         self.headers = {}
         if headers:
             # Store our extra headers
@@ -172,6 +192,9 @@ class NotifyJSON(NotifyBase):
             'method': self.method,
         }
 
+        if self.compress:
+            params['compress'] = self.compress
+
         # Extend our parameters
         params.update(self.url_parameters(privacy=privacy, *args, **kwargs))
 
@@ -223,10 +246,15 @@ class NotifyJSON(NotifyBase):
         # Apply any/all header over-rides defined
         headers.update(self.headers)
 
-        # Track our potential attachments
+        # Track our potential attachments (and their paths); their (base64
+        # encoded) content is only read as our payload is sent
         attachments = []
+        paths = []
+
+        # A unique marker we hold the place of each attachment's content with
+        marker = uuid4().hex
         if attach:
-            for attachment in attach:
+            for no, attachment in enumerate(attach):
                 # Perform some simple error checking
                 if not attachment:
                     # We could not access the attachment
@@ -235,23 +263,12 @@ class NotifyJSON(NotifyBase):
                             attachment.url(privacy=True)))
                     return False
 
-                try:
-                    with open(attachment.path, 'rb') as f:
-                        # Output must be in a DataURL format (that's what
-                        # PushSafer calls it):
-                        attachments.append({
-                            'filename': attachment.name,
-                            'base64': base64.b64encode(f.read())
-                            .decode('utf-8'),
-                            'mimetype': attachment.mimetype,
-                        })
-
-                except (OSError, IOError) as e:
-                    self.logger.warning(
-                        'An I/O error occurred while reading {}.'.format(
-                            attachment.name if attachment else 'attachment'))
-                    self.logger.debug('I/O Exception: %s' % str(e))
-                    return False
+                attachments.append({
+                    'filename': attachment.name,
+                    'base64': '{}:{}'.format(marker, no),
+                    'mimetype': attachment.mimetype,
+                })
+                paths.append(attachment.path)
 
         # prepare JSON Object
         payload = {
@@ -286,6 +303,32 @@ class NotifyJSON(NotifyBase):
         ))
         self.logger.debug('JSON Payload: %s' % str(payload))
 
+        data = dumps(payload)
+        try:
+            if attachments:
+                # Swap our markers with the content of our attachments
+                stream = StreamPayload()
+                parts = re.split(r'{}:([0-9]+)'.format(marker), data)
+                for no, part in enumerate(parts):
+                    if no % 2:
+                        stream.write_file(paths[int(part)], base64=True)
+
+                    else:
+                        stream.write(part)
+
+                data = stream
+
+            if self.compress:
+                data = compress(data, self.compress)
+                headers['Content-Encoding'] = self.compress
+
+        except (OSError, IOError) as e:
+            self.logger.warning(
+                'An I/O error occurred while reading one of the '
+                'attached files.')
+            self.logger.debug('I/O Exception: %s' % str(e))
+            return False
+
         # Always call throttle before any remote server i/o is made
         self.throttle()
 
@@ -307,7 +350,7 @@ class NotifyJSON(NotifyBase):
         try:
             r = method(
                 url,
-                data=dumps(payload),
+                data=data,
                 headers=headers,
                 auth=auth,
                 verify=self.verify_certificate,
@@ -334,6 +377,7 @@ class NotifyJSON(NotifyBase):
                 self.logger.info('Sent JSON %s notification.', self.method)
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending JSON '
                 'notification to %s.' % self.host)
@@ -342,6 +386,13 @@ class NotifyJSON(NotifyBase):
             # Return; we're done
             return False
 
+        except (OSError, IOError) as e:
+            self.logger.warning(
+                'An I/O error occurred while reading one of the '
+                'attached files.')
+            self.logger.debug('I/O Exception: %s' % str(e))
+            return False
+
         return True
 
     @staticmethod
@@ -369,4 +420,9 @@ class NotifyJSON(NotifyBase):
         if 'method' in results['qsd'] and len(results['qsd']['method']):
             results['method'] = NotifyJSON.unquote(results['qsd']['method'])
 
+        # Set our compression if specified
+        if 'compress' in results['qsd'] and len(results['qsd']['compress']):
+            results['compress'] = \
+                NotifyJSON.unquote(results['qsd']['compress'])
+
         return results
@@ -331,6 +331,7 @@ class NotifyJoin(NotifyBase):
                     self.logger.info('Sent Join notification to %s.' % target)
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Join:%s '
                     'notification.' % target
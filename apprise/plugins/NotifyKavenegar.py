@@ -290,6 +290,7 @@ class NotifyKavenegar(NotifyBase):
                     'Response Details:\r\n{}'.format(r.content))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Kavenegar:%s ' % (
                         ', '.join(self.targets)) + 'notification.'
@@ -187,6 +187,7 @@ class NotifyKumulos(NotifyBase):
                 self.logger.info('Sent Kumulos notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Kumulos '
                 'notification.')
@@ -771,6 +771,7 @@ class NotifyLametric(NotifyBase):
                 self.logger.info('Sent LaMetric notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending LaMetric '
                 'notification to %s.' % self.host)
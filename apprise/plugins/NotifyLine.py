@@ -225,6 +225,7 @@ class NotifyLine(NotifyBase):
                         'Sent Line notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Line '
                     'notification to {}.'.format(target))
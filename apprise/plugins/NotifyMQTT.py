@@ -33,12 +33,13 @@
 import ssl
 import re
 import six
-from time import sleep
+import threading
 from datetime import datetime
 from os.path import isfile
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import parse_list
 from ..utils import parse_bool
 from ..AppriseLocale import gettext_lazy as _
@@ -82,6 +83,57 @@ HUMAN_MQTT_PROTOCOL_MAP = {
 }
 
 
+class MQTTConnection(object):
+    """
+    A broker connection that can be shared between all of the NotifyMQTT
+    instances that talk to the same server using the same credentials and
+    TLS settings.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize our connection wrapper around a paho client object
+        """
+
+        # Our MQTT Client Object
+        self.client = client
+
+        # Serializes our connection handshaking between the threads sharing
+        # this connection
+        self.lock = threading.Lock()
+
+        # Set once the broker has acknowledged our connection (CONNACK)
+        self.connected = threading.Event()
+
+        # Toggled to False once our connection has been established at least
+        # once
+        self.initial_connect = True
+
+        # Track our connection state through the paho callbacks
+        self.client.on_connect = self.on_connect
+        self.client.on_disconnect = self.on_disconnect
+
+    def on_connect(self, client, userdata, flags, rc, *args):
+        """
+        paho callback triggered when the broker responds to our connection
+        """
+        if rc == 0:
+            self.connected.set()
+
+    def on_disconnect(self, client, userdata, rc, *args):
+        """
+        paho callback triggered when we lose our connection to the broker
+        """
+        self.connected.clear()
+
+
+# Our shared MQTT connections keyed by broker, credentials and TLS settings
+MQTT_CONNECTION_POOL = {}
+
+# Guards access to our MQTT_CONNECTION_POOL
+MQTT_CONNECTION_POOL_LOCK = threading.Lock()
+
+
 class NotifyMQTT(NotifyBase):
     """
     A wrapper for MQTT Notifications
@@ -92,7 +144,7 @@ class NotifyMQTT(NotifyBase):
 
     requirements = {
         # Define our required packaging in order to work
-        'packages_required': 'paho-mqtt'
+        'packages_required': 'paho-mqtt >= 1.6'
     }
 
     # The default descriptive name associated with the Notification
@@ -113,6 +165,9 @@ class NotifyMQTT(NotifyBase):
     # The maximum length a body can be set to
     body_maxlen = 268435455
 
+    # MQTT payloads are limited by their size in bytes
+    body_maxlen_unit = OverflowUnit.BYTE
+
     # Use a throttle; but it doesn't need to be so strict since most
     # MQTT server hostings can handle the small bursts of packets and are
     # locally hosted anyway
@@ -130,10 +185,6 @@ class NotifyMQTT(NotifyBase):
     # The default mqtt transport
     mqtt_transport = "tcp"
 
-    # The number of seconds to wait for a publish to occur at before
-    # checking to see if it's been sent yet.
-    mqtt_block_time_sec = 0.2
-
     # Set the maximum number of messages with QoS>0 that can be part way
     # through their network flow at once.
     mqtt_inflight_messages = 200
@@ -286,19 +337,70 @@ class NotifyMQTT(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
-        # Our MQTT Client Object
-        self.client = mqtt.Client(
-            client_id=self.client_id,
-            clean_session=not self.session, userdata=None,
-            protocol=self.mqtt_protocol, transport=self.mqtt_transport,
+        # Acquire our (potentially shared) broker connection
+        self.connection = self.connection_lookup()
+
+    def connection_lookup(self):
+        """
+        Returns the MQTTConnection associated with our broker, credentials
+        and TLS settings; one is created (but not connected) if it does not
+        already exist.
+        """
+
+        key = (
+            self.host, self.port, self.user, self.password, self.secure,
+            self.verify_certificate, self.ca_certs, self.mqtt_protocol,
+            self.client_id, self.session,
         )
 
-        # Our maximum number of in-flight messages
-        self.client.max_inflight_messages_set(self.mqtt_inflight_messages)
+        with MQTT_CONNECTION_POOL_LOCK:
+            connection = MQTT_CONNECTION_POOL.get(key)
+            if connection is None:
+                # Our MQTT Client Object
+                client = mqtt.Client(
+                    client_id=self.client_id,
+                    clean_session=not self.session, userdata=None,
+                    protocol=self.mqtt_protocol,
+                    transport=self.mqtt_transport,
+                )
 
-        # Toggled to False once our connection has been established at least
-        # once
-        self.__initial_connect = True
+                # Our maximum number of in-flight messages
+                client.max_inflight_messages_set(self.mqtt_inflight_messages)
+
+                connection = MQTTConnection(client)
+                MQTT_CONNECTION_POOL[key] = connection
+
+        return connection
+
+    @property
+    def client(self):
+        """
+        Returns the paho client associated with our shared connection
+        """
+        return self.connection.client
+
+    @staticmethod
+    def connection_pool_reset():
+        """
+        Disconnects and releases all of our shared MQTT connections
+        """
+
+        with MQTT_CONNECTION_POOL_LOCK:
+            connections = list(MQTT_CONNECTION_POOL.values())
+            MQTT_CONNECTION_POOL.clear()
+
+        for connection in connections:
+            if connection.initial_connect:
+                # Never connected; nothing to tear down
+                continue
+
+            try:
+                connection.client.loop_stop()
+                connection.client.disconnect()
+
+            except Exception:
+                # We're tearing down; there is nothing more we can do
+                pass
 
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
@@ -314,66 +416,52 @@ class NotifyMQTT(NotifyBase):
         url = '{host}:{port}'.format(host=self.host, port=self.port)
 
         try:
-            if self.__initial_connect:
-                # Our initial connection
-                if self.user:
-                    self.client.username_pw_set(
-                        self.user, password=self.password)
-
-                if self.secure:
-                    if self.ca_certs is None:
+            with self.connection.lock:
+                if self.connection.initial_connect:
+                    # Our initial connection
+                    if self.user:
+                        self.client.username_pw_set(
+                            self.user, password=self.password)
+
+                    if self.secure:
+                        if self.ca_certs is None:
+                            self.logger.warning(
+                                'MQTT Secure comunication can not be '
+                                'verified; no local CA certificate file')
+                            return False
+
+                        self.client.tls_set(
+                            ca_certs=self.ca_certs, certfile=None,
+                            keyfile=None, cert_reqs=ssl.CERT_REQUIRED,
+                            tls_version=ssl.PROTOCOL_TLS,
+                            ciphers=None)
+
+                        # Set our TLS Verify Flag
+                        self.client.tls_insecure_set(self.verify_certificate)
+
+                    # Establish our connection
+                    if self.client.connect(
+                            self.host, port=self.port,
+                            keepalive=self.mqtt_keepalive) \
+                            != mqtt.MQTT_ERR_SUCCESS:
                         self.logger.warning(
-                            'MQTT Secure comunication can not be verified; '
-                            'no local CA certificate file')
+                            'An MQTT connection could not be established '
+                            'for {}'.format(url))
                         return False
 
-                    self.client.tls_set(
-                        ca_certs=self.ca_certs, certfile=None, keyfile=None,
-                        cert_reqs=ssl.CERT_REQUIRED,
-                        tls_version=ssl.PROTOCOL_TLS,
-                        ciphers=None)
-
-                    # Set our TLS Verify Flag
-                    self.client.tls_insecure_set(self.verify_certificate)
-
-                # Establish our connection
-                if self.client.connect(
-                        self.host, port=self.port,
-                        keepalive=self.mqtt_keepalive) \
-                        != mqtt.MQTT_ERR_SUCCESS:
-                    self.logger.warning(
-                        'An MQTT connection could not be established for {}'.
-                        format(url))
-                    return False
-
-                # Start our client loop
-                self.client.loop_start()
-
-                # Throttle our start otherwise the starting handshaking doesnt
-                # work. I'm not sure if this is a bug or not, but with qos=0,
-                # and without this sleep(), the messages randomly fails to be
-                # delivered.
-                sleep(0.01)
-
-                # Toggle our flag since we never need to enter this area again
-                self.__initial_connect = False
-
-            # Create a copy of the subreddits list
-            topics = list(self.topics)
+                    # Start our client loop
+                    self.client.loop_start()
 
-            has_error = False
-            while len(topics) > 0 and not has_error:
-                # Retrieve our subreddit
-                topic = topics.pop()
+                    # Block until the broker acknowledges our connection;
+                    # publishing before the handshake completes causes our
+                    # messages to randomly fail to be delivered.
+                    if not self.client.is_connected():
+                        self.connection.connected.wait(
+                            self.socket_connect_timeout)
 
-                # For logging:
-                url = '{host}:{port}/{topic}'.format(
-                    host=self.host,
-                    port=self.port,
-                    topic=topic)
-
-                # Always call throttle before any remote server i/o is made
-                self.throttle()
+                    # Toggle our flag since we never need to enter this area
+                    # again
+                    self.connection.initial_connect = False
 
                 # handle a re-connection
                 if not self.client.is_connected() and \
@@ -381,44 +469,58 @@ class NotifyMQTT(NotifyBase):
                     self.logger.warning(
                         'An MQTT connection could not be sustained for {}'.
                         format(url))
-                    has_error = True
-                    break
+                    return False
 
-                # Some Debug Logging
-                self.logger.debug('MQTT POST URL: {} (cert_verify={})'.format(
-                    url, self.verify_certificate))
-                self.logger.debug('MQTT Payload: %s' % str(body))
+            # Always call throttle before any remote server i/o is made
+            self.throttle()
 
+            # Some Debug Logging
+            self.logger.debug('MQTT POST URL: {} (cert_verify={})'.format(
+                url, self.verify_certificate))
+            self.logger.debug('MQTT Payload: %s' % str(body))
+
+            # Queue all of our topics in a single pass; the paho network loop
+            # delivers them while we're busy queuing the rest
+            results = []
+            for topic in self.topics:
                 result = self.client.publish(
                     topic, payload=body, qos=self.qos, retain=False)
 
                 if result.rc != mqtt.MQTT_ERR_SUCCESS:
                     # Toggle our status
                     self.logger.warning(
-                        'An error (rc={}) occured when sending MQTT to {}'.
-                        format(result.rc, url))
-                    has_error = True
-                    break
-
-                elif not result.is_published():
-                    self.logger.debug(
-                        'Blocking until MQTT payload is published...')
-                    reference = datetime.now()
-                    while not has_error and not result.is_published():
-                        # Throttle
-                        sleep(self.mqtt_block_time_sec)
-
-                        # Our own throttle so we can abort eventually....
-                        elapsed = (datetime.now() - reference).total_seconds()
-                        if elapsed >= self.socket_read_timeout:
-                            self.logger.warning(
-                                'The MQTT message could not be delivered')
-                            has_error = True
+                        'An error (rc={}) occured when sending MQTT to '
+                        '{}:{}/{}'.format(
+                            result.rc, self.host, self.port, topic))
+                    return False
+
+                results.append((topic, result))
+
+            # Our delivery deadline applies to the batch as a whole
+            reference = datetime.now()
+            for topic, result in results:
+                if result.is_published():
+                    continue
+
+                self.logger.debug(
+                    'Blocking until MQTT payload is published...')
 
-                # if we reach here; we're at the bottom of our loop
-                # we loop around and do the next topic now
+                remaining = self.socket_read_timeout - \
+                    (datetime.now() - reference).total_seconds()
+
+                if remaining > 0:
+                    # Woken up by the paho network loop as soon as the
+                    # publish has completed
+                    result.wait_for_publish(timeout=remaining)
+
+                if not result.is_published():
+                    self.logger.warning(
+                        'The MQTT message could not be delivered to '
+                        '{}:{}/{}'.format(self.host, self.port, topic))
+                    return False
 
         except ConnectionError as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'MQTT Connection Error received from {}'.format(url))
             self.logger.debug('Socket Exception: %s' % str(e))
@@ -430,14 +532,15 @@ class NotifyMQTT(NotifyBase):
             self.logger.debug('Socket Exception: %s' % str(e))
             return False
 
-        except ValueError as e:
+        except (ValueError, RuntimeError) as e:
             # ValueError's are thrown from publish() call if there is a problem
+            # while RuntimeError's are thrown from wait_for_publish()
             self.logger.warning(
                 'MQTT Publishing error received: from {}'.format(url))
             self.logger.debug('Socket Exception: %s' % str(e))
             return False
 
-        return not has_error
+        return True
 
     def url(self, privacy=False, *args, **kwargs):
         """
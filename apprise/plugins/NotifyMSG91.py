@@ -289,6 +289,7 @@ class NotifyMSG91(NotifyBase):
                     'Sent MSG91 notification to %s.' % ','.join(self.targets))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending MSG91:%s '
                 'notification.' % ','.join(self.targets)
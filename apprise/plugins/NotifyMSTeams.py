@@ -457,6 +457,7 @@ class NotifyMSTeams(NotifyBase):
                 self.logger.info('Sent MSTeams notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending MSTeams notification.')
             self.logger.debug('Socket Exception: %s' % str(e))
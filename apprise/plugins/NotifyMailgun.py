@@ -364,8 +364,10 @@ class NotifyMailgun(NotifyBase):
                     'Preparing Mailgun attachment {}'.format(
                         attachment.url(privacy=True)))
                 try:
+                    # Our (memory mapped) view of the attachment can be
+                    # re-used for each of our batches
                     files['attachment[{}]'.format(idx)] = \
-                        (attachment.name, open(attachment.path, 'rb'))
+                        (attachment.name, attachment.view())
 
                 except (OSError, IOError) as e:
                     self.logger.warning(
@@ -373,14 +375,6 @@ class NotifyMailgun(NotifyBase):
                             attachment.name if attachment
                             else 'attachment'))
                     self.logger.debug('I/O Exception: %s' % str(e))
-
-                    # tidy up any open files before we make our early
-                    # return
-                    for entry in files.values():
-                        self.logger.trace(
-                            'Closing attachment {}'.format(entry[0]))
-                        entry[1].close()
-
                     return False
 
         try:
@@ -428,32 +422,6 @@ class NotifyMailgun(NotifyBase):
             # Initialize our to list
             to = list()
 
-            # Ensure we're pointed to the head of the attachment; this doesn't
-            # do much for the first iteration through this loop as we're
-            # already pointing there..., but it allows us to re-use the
-            # attachment over and over again without closing and then
-            # re-opening the same file again and again
-            for entry in files.values():
-                try:
-                    self.logger.trace(
-                        'Seeking to head of attachment {}'.format(entry[0]))
-                    entry[1].seek(0)
-
-                except (OSError, IOError) as e:
-                    self.logger.warning(
-                        'An I/O error occurred seeking to head of attachment '
-                        '{}.'.format(entry[0]))
-                    self.logger.debug('I/O Exception: %s' % str(e))
-
-                    # tidy up any open files before we make our early
-                    # return
-                    for entry in files.values():
-                        self.logger.trace(
-                            'Closing attachment {}'.format(entry[0]))
-                        entry[1].close()
-
-                    return False
-
             for to_addr in self.targets[index:index + batch_size]:
                 # Strip target out of cc list if in To
                 cc = (cc - set([to_addr[1]]))
@@ -558,6 +526,7 @@ class NotifyMailgun(NotifyBase):
                             verbose_dest))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Mailgun:%s ' % (
                         verbose_dest) + 'notification.'
@@ -577,12 +546,6 @@ class NotifyMailgun(NotifyBase):
                 has_error = True
                 continue
 
-        # Close any potential attachments that are still open
-        for entry in files.values():
-            self.logger.trace(
-                'Closing attachment {}'.format(entry[0]))
-            entry[1].close()
-
         return not has_error
 
     def url(self, privacy=False, *args, **kwargs):
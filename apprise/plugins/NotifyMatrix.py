@@ -30,6 +30,7 @@
 import re
 import six
 import requests
+import threading
 from markdown import markdown
 from json import dumps
 from json import loads
@@ -56,6 +57,15 @@ MATRIX_HTTP_ERROR_MAP = {
     429: 'Rate limit imposed; wait 2s and try again',
 }
 
+# Authenticated Matrix sessions (and the rooms we've joined) are shared
+# between all of the NotifyMatrix objects that use the same credentials (and
+# server) so that we only ever log in once.
+MATRIX_SESSION_POOL = {}
+
+# Held while a shared session is looked up (or created); logging in to one
+# is serialized by the lock the session holds itself
+MATRIX_SESSION_POOL_LOCK = threading.Lock()
+
 # Matrix Room Syntax
 IS_ROOM_ALIAS = re.compile(
     r'^\s*(#|%23)?(?P<room>[a-z0-9-]+)((:|%3A)'
@@ -67,6 +77,37 @@ IS_ROOM_ID = re.compile(
     r'(?P<home_server>[a-z0-9.-]+))?\s*$', re.I)
 
 
+class MatrixSession(object):
+    """
+    Helper for the session details tracked by (and possibly shared between)
+    our Matrix objects
+    """
+
+    @staticmethod
+    def new():
+        """
+        Returns a new (unauthenticated) session
+        """
+        return MatrixSession.reset({
+            # Held while we log in (or out) so that the objects sharing
+            # this session don't log each other out
+            'lock': threading.RLock(),
+        })
+
+    @staticmethod
+    def reset(session):
+        """
+        Drops the details of an authenticated session (but keeps its lock)
+        """
+        session.update({
+            'access_token': None,
+            'home_server': None,
+            'user_id': None,
+            'room_cache': {},
+        })
+        return session
+
+
 class MatrixMessageType(object):
     """
     The Matrix Message types
@@ -245,22 +286,9 @@ class NotifyMatrix(NotifyBase):
         # Prepare a list of rooms to connect and notify
         self.rooms = parse_list(targets)
 
-        # our home server gets populated after a login/registration
-        self.home_server = None
-
-        # our user_id gets populated after a login/registration
-        self.user_id = None
-
-        # This gets initialized after a login/registration
-        self.access_token = None
-
         # Place an image inline with the message body
         self.include_image = include_image
 
-        # maintain a lookup of room alias's we already paired with their id
-        # to speed up future requests
-        self._room_cache = {}
-
         # Setup our mode
         self.mode = self.template_args['mode']['default'] \
             if not isinstance(mode, six.string_types) else mode.lower()
@@ -269,6 +297,15 @@ class NotifyMatrix(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
+        # Our home server, user_id and access_token get populated after a
+        # login/registration. We also maintain a lookup of room alias's we
+        # already paired with their id to speed up future requests.  All of
+        # this is tracked in our session which is shared with other Matrix
+        # objects using the same credentials (webhooks have nothing to share)
+        self._session = self.session_lookup() \
+            if self.mode == MatrixWebhookMode.DISABLED \
+            else MatrixSession.new()
+
         # Setup our message type
         self.msgtype = self.template_args['msgtype']['default'] \
             if not isinstance(msgtype, six.string_types) else msgtype.lower()
@@ -303,6 +340,78 @@ class NotifyMatrix(NotifyBase):
                 self.logger.warning(msg)
                 raise TypeError(msg)
 
+    def session_lookup(self):
+        """
+        Returns the (shared) session associated with our credentials;
+        one is created if it doesn't already exist.
+
+        """
+        key = (
+            self.secure, self.host, self.port, self.user, self.password,
+            self.verify_certificate)
+
+        with MATRIX_SESSION_POOL_LOCK:
+            session = MATRIX_SESSION_POOL.get(key)
+            if session is None:
+                session = MatrixSession.new()
+                MATRIX_SESSION_POOL[key] = session
+
+        return session
+
+    @staticmethod
+    def session_pool_reset():
+        """
+        Forgets all of our shared sessions (and the rooms they joined)
+        without logging them out; their access tokens remain valid on the
+        server and the next notification logs in with a new one
+        """
+        with MATRIX_SESSION_POOL_LOCK:
+            MATRIX_SESSION_POOL.clear()
+
+    @property
+    def access_token(self):
+        """
+        Our (shared) access token
+        """
+        return self._session['access_token']
+
+    @access_token.setter
+    def access_token(self, value):
+        self._session['access_token'] = value
+
+    @property
+    def home_server(self):
+        """
+        Our (shared) home server
+        """
+        return self._session['home_server']
+
+    @home_server.setter
+    def home_server(self, value):
+        self._session['home_server'] = value
+
+    @property
+    def user_id(self):
+        """
+        Our (shared) user id
+        """
+        return self._session['user_id']
+
+    @user_id.setter
+    def user_id(self, value):
+        self._session['user_id'] = value
+
+    @property
+    def _room_cache(self):
+        """
+        Our (shared) room alias to room id lookup
+        """
+        return self._session['room_cache']
+
+    @_room_cache.setter
+    def _room_cache(self, value):
+        self._session['room_cache'] = value
+
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
         Perform Matrix Notification
@@ -394,6 +503,7 @@ class NotifyMatrix(NotifyBase):
                 self.logger.info('Sent Matrix notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Matrix notification.'
             )
@@ -513,11 +623,12 @@ class NotifyMatrix(NotifyBase):
         Perform Direct Matrix Server Notification (no webhook)
         """
 
-        if self.access_token is None:
-            # We need to register
-            if not self._login():
-                if not self._register():
-                    return False
+        with self._session['lock']:
+            if self.access_token is None:
+                # We need to register
+                if not self._login():
+                    if not self._register():
+                        return False
 
         if len(self.rooms) == 0:
             # Attempt to retrieve a list of already joined channels
@@ -670,38 +781,40 @@ class NotifyMatrix(NotifyBase):
         fail we return False, otherwise we return True
         """
 
-        if self.access_token:
-            # Login not required; silently skip-over
-            return True
+        with self._session['lock']:
+            if self.access_token:
+                # Login not required (someone sharing our session may have
+                # just logged in); silently skip-over
+                return True
 
-        if not (self.user and self.password):
-            # It's not possible to register since we need these 2 values to
-            # make the action possible.
-            self.logger.warning(
-                'Failed to login to Matrix server: '
-                'user/pass combo is missing.')
-            return False
+            if not (self.user and self.password):
+                # It's not possible to register since we need these 2 values
+                # to make the action possible.
+                self.logger.warning(
+                    'Failed to login to Matrix server: '
+                    'user/pass combo is missing.')
+                return False
 
-        # Prepare our Registration Payload
-        payload = {
-            'type': 'm.login.password',
-            'user': self.user,
-            'password': self.password,
-        }
+            # Prepare our Registration Payload
+            payload = {
+                'type': 'm.login.password',
+                'user': self.user,
+                'password': self.password,
+            }
 
-        # Build our URL
-        postokay, response = self._fetch('/login', payload=payload)
-        if not (postokay and isinstance(response, dict)):
-            # Failed to login
-            return False
+            # Build our URL
+            postokay, response = self._fetch('/login', payload=payload)
+            if not (postokay and isinstance(response, dict)):
+                # Failed to login
+                return False
 
-        # Pull the response details
-        self.access_token = response.get('access_token')
-        self.home_server = response.get('home_server')
-        self.user_id = response.get('user_id')
+            # Pull the response details
+            self.access_token = response.get('access_token')
+            self.home_server = response.get('home_server')
+            self.user_id = response.get('user_id')
 
-        if not self.access_token:
-            return False
+            if not self.access_token:
+                return False
 
         self.logger.debug(
             'Authenticated successfully with Matrix server.')
@@ -992,6 +1105,11 @@ class NotifyMatrix(NotifyBase):
         # fetch function
         fn = requests.post if method == 'POST' else requests.get
 
+        # We can log back in (once) if the access token we're sharing expired
+        relogin = self.user and self.password \
+            and self.mode == MatrixWebhookMode.DISABLED \
+            and path not in ('/login', '/logout', '/register')
+
         # Define how many attempts we'll make if we get caught in a throttle
         # event
         retries = self.default_retries if self.default_retries > 0 else 1
@@ -1044,7 +1162,29 @@ class NotifyMatrix(NotifyBase):
                     # Try again
                     continue
 
-                elif r.status_code != requests.codes.ok:
+                elif r.status_code == requests.codes.unauthorized and \
+                        relogin and \
+                        response.get('errcode') == u'M_UNKNOWN_TOKEN':
+                    # Our access token expired; log back in (unless someone
+                    # else sharing our session already has) and try again
+                    relogin = False
+                    self.logger.debug(
+                        'Matrix access token expired; logging back in.')
+
+                    with self._session['lock']:
+                        if headers.get('Authorization') == \
+                                'Bearer %s' % self.access_token:
+                            MatrixSession.reset(self._session)
+
+                        relogged = self._login()
+
+                    if relogged:
+                        headers["Authorization"] = \
+                            'Bearer %s' % self.access_token
+                        retries += 1
+                        continue
+
+                if r.status_code != requests.codes.ok:
                     # We had a problem
                     status_str = \
                         NotifyMatrix.http_response_code_lookup(
@@ -1074,6 +1214,7 @@ class NotifyMatrix(NotifyBase):
                 return (False, {})
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred while registering with Matrix'
                     ' server.')
@@ -1086,57 +1227,32 @@ class NotifyMatrix(NotifyBase):
         # If we get here, we ran out of retries
         return (False, {})
 
-    def __del__(self):
+    def close(self):
         """
-        Ensure we relinquish our token
+        Relinquishes our (shared) token; any other NotifyMatrix object sharing
+        it will log back in the next time it's used.
         """
-        if self.mode == MatrixWebhookMode.T2BOT:
+        if self.mode != MatrixWebhookMode.DISABLED:
             # nothing to do
             return
 
-        try:
-            self._logout()
-
-        except LookupError:  # pragma: no cover
-            # Python v3.5 call to requests can sometimes throw the exception
-            #   "/usr/lib64/python3.7/socket.py", line 748, in getaddrinfo
-            #   LookupError: unknown encoding: idna
-            #
-            # This occurs every time when running unit-tests against Apprise:
-            # LANG=C.UTF-8 PYTHONPATH=$(pwd) py.test-3.7
-            #
-            # There has been an open issue on this since Jan 2017.
-            #   - https://bugs.python.org/issue29288
-            #
-            # A ~similar~ issue can be identified here in the requests
-            # ticket system as unresolved and has provided work-arounds
-            #   - https://github.com/kennethreitz/requests/issues/3578
-            pass
-
-        except ImportError:  # pragma: no cover
-            # The actual exception is `ModuleNotFoundError` however ImportError
-            # grants us backwards compatiblity with versions of Python older
-            # than v3.6
-
-            # Python code that makes early calls to sys.exit() can cause
-            # the __del__() code to run. However in some newer versions of
-            # Python, this causes the `sys` library to no longer be
-            # available. The stack overflow also goes on to suggest that
-            # it's not wise to use the __del__() as a deconstructor
-            # which is the case here.
-
-            # https://stackoverflow.com/questions/67218341/\
-            #       modulenotfounderror-import-of-time-halted-none-in-sys-\
-            #           modules-occured-when-obj?noredirect=1&lq=1
-            #
-            #
-            # Also see: https://stackoverflow.com/questions\
-            #       /1481488/what-is-the-del-method-and-how-do-i-call-it
-
-            # At this time it seems clean to try to log out (if we can)
-            # but not throw any unessisary exceptions (like this one) to
-            # the end user if we don't have to.
-            pass
+        with self._session['lock']:
+            try:
+                self._logout()
+
+            except LookupError:  # pragma: no cover
+                # Python v3.5 call to requests can sometimes throw the
+                # exception
+                #   "/usr/lib64/python3.7/socket.py", line 748, in getaddrinfo
+                #   LookupError: unknown encoding: idna
+                #
+                # There has been an open issue on this since Jan 2017.
+                #   - https://bugs.python.org/issue29288
+                pass
+
+            # Always drop our session regardless of whether or not our
+            # logout was successful
+            MatrixSession.reset(self._session)
 
     def url(self, privacy=False, *args, **kwargs):
         """
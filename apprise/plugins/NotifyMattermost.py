@@ -267,6 +267,7 @@ class NotifyMattermost(NotifyBase):
                             else ' to channel {}'.format(channel)))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Mattermost '
                     'notification{}.'.format(
@@ -276,6 +276,7 @@ class NotifyMessageBird(NotifyBase):
                         'Sent MessageBird notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending MessageBird:%s ' % (
                         target) + 'notification.'
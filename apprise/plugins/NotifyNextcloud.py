@@ -249,6 +249,7 @@ class NotifyNextcloud(NotifyBase):
                         'Sent Nextcloud %d notification.', self.version)
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Nextcloud v%d'
                     'notification.', self.version)
@@ -213,6 +213,7 @@ class NotifyNextcloudTalk(NotifyBase):
                         'Sent Nextcloud Talk notification.')
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Nextcloud Talk '
                     'notification.')
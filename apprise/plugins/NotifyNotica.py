@@ -265,6 +265,7 @@ class NotifyNotica(NotifyBase):
                 self.logger.info('Sent Notica notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Notica notification.',
             )
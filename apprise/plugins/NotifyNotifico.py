@@ -311,6 +311,7 @@ class NotifyNotifico(NotifyBase):
                 self.logger.info('Sent Notifico notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Notifico '
                 'notification.')
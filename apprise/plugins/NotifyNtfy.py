@@ -424,7 +424,7 @@ class NotifyNtfy(NotifyBase):
             params['filename'] = attach.name
 
             # prepare our files object
-            files = {'file': (attach.name, open(attach.path, 'rb'))}
+            files = {'file': (attach.name, attach.view())}
 
         elif self.attach is not None:
             data['attach'] = self.attach
@@ -499,6 +499,7 @@ class NotifyNtfy(NotifyBase):
             return True, response
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending ntfy:%s ' % (
                     notify_url) + 'notification.'
@@ -514,12 +515,6 @@ class NotifyNtfy(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return False, response
 
-        finally:
-            # Close our file (if it's open) stored in the second element
-            # of our files tuple (index 1)
-            if files:
-                files['file'][1].close()
-
     def url(self, privacy=False, *args, **kwargs):
         """
         Returns the URL built dynamically based on specified arguments.
@@ -540,6 +540,7 @@ class NotifyOffice365(NotifyBase):
                 content = {}
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'Exception received when sending Office 365 POST to {}: '.
                 format(url))
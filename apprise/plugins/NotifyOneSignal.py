@@ -372,6 +372,7 @@ class NotifyOneSignal(NotifyBase):
                         self.logger.info('Sent OneSignal notification.')
 
                 except requests.RequestException as e:
+                    self.upstream_failure(e)
                     self.logger.warning(
                         'A Connection error occurred sending OneSignal '
                         'notification.'
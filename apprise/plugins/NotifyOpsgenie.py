@@ -464,6 +464,7 @@ class NotifyOpsgenie(NotifyBase):
                     'Response Details:\r\n{}'.format(r.content))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Opsgenie '
                     'notification.')
@@ -371,6 +371,7 @@ class NotifyPagerDuty(NotifyBase):
                 self.logger.info('Sent Pager Duty notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Pager Duty '
                 'notification to %s.' % self.host)
@@ -247,6 +247,7 @@ class NotifyParsePlatform(NotifyBase):
                 self.logger.info('Sent Parse Platform notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occured sending Parse Platform '
                 'notification to %s.' % self.host)
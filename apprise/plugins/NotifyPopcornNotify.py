@@ -226,6 +226,7 @@ class NotifyPopcornNotify(NotifyBase):
                         ))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occured sending {} PopcornNotify '
                     'notification(s).'.format(
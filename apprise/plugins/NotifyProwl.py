@@ -238,6 +238,7 @@ class NotifyProwl(NotifyBase):
                 self.logger.info('Sent Prowl notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Prowl notification.')
             self.logger.debug('Socket Exception: %s' % str(e))
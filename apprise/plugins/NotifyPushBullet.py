@@ -313,7 +313,7 @@ class NotifyPushBullet(NotifyBase):
         try:
             # Open our attachment path if required:
             if isinstance(payload, AttachBase):
-                files = {'file': (payload.name, open(payload.path, 'rb'))}
+                files = {'file': (payload.name, payload.view())}
 
             r = requests.post(
                 url,
@@ -359,6 +359,7 @@ class NotifyPushBullet(NotifyBase):
             return True, response
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred communicating with PushBullet.')
             self.logger.debug('Socket Exception: %s' % str(e))
@@ -373,12 +374,6 @@ class NotifyPushBullet(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return False, response
 
-        finally:
-            # Close our file (if it's open) stored in the second element
-            # of our files tuple (index 1)
-            if files:
-                files['file'][1].close()
-
     def url(self, privacy=False, *args, **kwargs):
         """
         Returns the URL built dynamically based on specified arguments.
@@ -23,9 +23,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-# We use io because it allows us to test the open() call
-import io
-import base64
 import requests
 from json import loads
 
@@ -565,14 +562,12 @@ class NotifyPushSafer(NotifyBase):
                         attachment.url(privacy=True)))
 
                 try:
-                    with io.open(attachment.path, 'rb') as f:
-                        # Output must be in a DataURL format (that's what
-                        # PushSafer calls it):
-                        attachment = (
-                            attachment.name,
-                            'data:{};base64,{}'.format(
-                                attachment.mimetype,
-                                base64.b64encode(f.read())))
+                    # Output must be in a DataURL format (that's what
+                    # PushSafer calls it):
+                    attachment = (
+                        attachment.name,
+                        'data:{};base64,{}'.format(
+                            attachment.mimetype, attachment.base64()))
 
                 except (OSError, IOError) as e:
                     self.logger.warning(
@@ -746,6 +741,7 @@ class NotifyPushSafer(NotifyBase):
             return True, response
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred communicating with PushSafer.')
             self.logger.debug('Socket Exception: %s' % str(e))
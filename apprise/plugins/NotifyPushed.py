@@ -291,6 +291,7 @@ class NotifyPushed(NotifyBase):
                 self.logger.info('Sent Pushed notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Pushed notification.')
             self.logger.debug('Socket Exception: %s' % str(e))
@@ -215,6 +215,7 @@ class NotifyPushjet(NotifyBase):
                 self.logger.info('Sent Pushjet notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Pushjet '
                 'notification to %s.' % self.host)
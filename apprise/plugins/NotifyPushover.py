@@ -26,11 +26,13 @@
 import re
 import six
 import requests
+from json import loads
 
 from .NotifyBase import NotifyBase
 from ..common import NotifyType
 from ..common import NotifyFormat
 from ..conversion import convert_between
+from ..utils import parse_bool
 from ..utils import parse_list
 from ..utils import validate_regex
 from ..AppriseLocale import gettext_lazy as _
@@ -164,6 +166,10 @@ class NotifyPushover(NotifyBase):
     # Default Pushover sound
     default_pushover_sound = PushoverSound.PUSHOVER
 
+    # The maximum number of devices we'll notify in a single request; they're
+    # passed along to Pushover as a comma separated list
+    default_batch_size = 50
+
     # 2.5MB is the maximum supported image filesize as per documentation
     # here: https://pushover.net/api#attachments (Dec 26th, 2019)
     attach_max_size_bytes = 2621440
@@ -241,6 +247,11 @@ class NotifyPushover(NotifyBase):
             'max': 10800,
             'default': 3600,  # 1 hour
         },
+        'batch': {
+            'name': _('Batch Mode'),
+            'type': 'bool',
+            'default': True,
+        },
         'to': {
             'alias_of': 'targets',
         },
@@ -248,7 +259,7 @@ class NotifyPushover(NotifyBase):
 
     def __init__(self, user_key, token, targets=None, priority=None,
                  sound=None, retry=None, expire=None, supplemental_url=None,
-                 supplemental_url_title=None, **kwargs):
+                 supplemental_url_title=None, batch=None, **kwargs):
         """
         Initialize Pushover Object
         """
@@ -274,6 +285,10 @@ class NotifyPushover(NotifyBase):
         if len(self.targets) == 0:
             self.targets = (PUSHOVER_SEND_TO_ALL, )
 
+        # Prepare Batch Mode Flag
+        self.batch = self.template_args['batch']['default'] \
+            if batch is None else bool(batch)
+
         # Setup supplemental url
         self.supplemental_url = supplemental_url
         self.supplemental_url_title = supplemental_url_title
@@ -335,11 +350,9 @@ class NotifyPushover(NotifyBase):
         # error tracking (used for function return)
         has_error = False
 
-        # Create a copy of the devices list
-        devices = list(self.targets)
-        while len(devices):
-            device = devices.pop(0)
-
+        # Acquire our list of valid devices
+        devices = []
+        for device in self.targets:
             if VALIDATE_DEVICE.match(device) is None:
                 self.logger.warning(
                     'The device specified (%s) is invalid.' % device,
@@ -349,37 +362,44 @@ class NotifyPushover(NotifyBase):
                 has_error = True
                 continue
 
-            # prepare JSON Object
-            payload = {
-                'token': self.token,
-                'user': self.user_key,
-                'priority': str(self.priority),
-                'title': title if title else self.app_desc,
-                'message': body,
-                'device': device,
-                'sound': self.sound,
-            }
-
-            if self.supplemental_url:
-                payload['url'] = self.supplemental_url
-            if self.supplemental_url_title:
-                payload['url_title'] = self.supplemental_url_title
-
-            if self.notify_format == NotifyFormat.HTML:
-                # https://pushover.net/api#html
-                payload['html'] = 1
-            elif self.notify_format == NotifyFormat.MARKDOWN:
-                payload['message'] = convert_between(
-                    NotifyFormat.MARKDOWN, NotifyFormat.HTML, body)
-                payload['html'] = 1
-
-            if self.priority == PushoverPriority.EMERGENCY:
-                payload.update({'retry': self.retry, 'expire': self.expire})
+            devices.append(device)
 
-            if attach:
-                # Create a copy of our payload
-                _payload = payload.copy()
+        # prepare JSON Object
+        payload = {
+            'token': self.token,
+            'user': self.user_key,
+            'priority': str(self.priority),
+            'title': title if title else self.app_desc,
+            'message': body,
+            'sound': self.sound,
+        }
+
+        if self.supplemental_url:
+            payload['url'] = self.supplemental_url
+        if self.supplemental_url_title:
+            payload['url_title'] = self.supplemental_url_title
+
+        if self.notify_format == NotifyFormat.HTML:
+            # https://pushover.net/api#html
+            payload['html'] = 1
+        elif self.notify_format == NotifyFormat.MARKDOWN:
+            payload['message'] = convert_between(
+                NotifyFormat.MARKDOWN, NotifyFormat.HTML, body)
+            payload['html'] = 1
+
+        if self.priority == PushoverPriority.EMERGENCY:
+            payload.update({'retry': self.retry, 'expire': self.expire})
+
+        # Send in batches if identified to do so; Pushover accepts a comma
+        # separated list of devices
+        batch_size = 1 if not self.batch else self.default_batch_size
+
+        for index in range(0, len(devices), batch_size):
+            # Create a copy of our payload for our device(s)
+            _payload = payload.copy()
+            _payload['device'] = ','.join(devices[index:index + batch_size])
 
+            if attach:
                 # Send with attachments
                 for attachment in attach:
                     # Simple send
@@ -398,7 +418,7 @@ class NotifyPushover(NotifyBase):
 
             else:
                 # Simple send
-                if not self._send(payload):
+                if not self._send(_payload):
                     # Mark our failure
                     has_error = True
 
@@ -474,7 +494,7 @@ class NotifyPushover(NotifyBase):
         try:
             # Open our attachment path if required:
             if attach:
-                files = {'attachment': (attach.name, open(attach.path, 'rb'))}
+                files = {'attachment': (attach.name, attach.view())}
 
             r = requests.post(
                 self.notify_url,
@@ -500,9 +520,49 @@ class NotifyPushover(NotifyBase):
                         ', ' if status_str else '',
                         r.status_code))
 
+                # Set if Pushover rejected (one of) our devices
+                device_error = False
+
+                try:
+                    # Pushover identifies what went wrong, e.g.:
+                    #  {
+                    #    "device": "invalid for this user",
+                    #    "errors": ["device name is not valid for user"],
+                    #    "status": 0,
+                    #  }
+                    response = loads(r.content)
+                    errors = response.get('errors')
+                    if isinstance(errors, list) and errors:
+                        self.logger.warning(
+                            'Pushover reported: %s',
+                            ', '.join([str(e) for e in errors]))
+
+                    device_error = 'device' in response
+
+                except (AttributeError, TypeError, ValueError):
+                    # ValueError = r.content is Unparsable
+                    # TypeError = r.content is None
+                    # AttributeError = r is None or not a dict
+                    pass
+
                 self.logger.debug(
                     'Response Details:\r\n{}'.format(r.content))
 
+                devices = payload['device'].split(',')
+                if device_error and len(devices) > 1:
+                    # Pushover doesn't tell us which of the devices in our
+                    # batch it rejected (e.g. one that is no longer
+                    # registered); so we notify each of them on their own so
+                    # that the others still receive our notification
+                    self.logger.info(
+                        'Notifying the {} Pushover devices of our batch one '
+                        'at a time.'.format(len(devices)))
+
+                    results = [
+                        self._send(dict(payload, device=device), attach)
+                        for device in devices]
+                    return all(results)
+
                 return False
 
             else:
@@ -510,6 +570,7 @@ class NotifyPushover(NotifyBase):
                     'Sent Pushover notification to %s.' % payload['device'])
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Pushover:%s ' % (
                     payload['device']) + 'notification.'
@@ -525,12 +586,6 @@ class NotifyPushover(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return False
 
-        finally:
-            # Close our file (if it's open) stored in the second element
-            # of our files tuple (index 1)
-            if files:
-                files['attachment'][1].close()
-
         return True
 
     def url(self, privacy=False, *args, **kwargs):
@@ -546,6 +601,9 @@ class NotifyPushover(NotifyBase):
                 else PUSHOVER_PRIORITIES[self.priority],
         }
 
+        # Batch Mode
+        params['batch'] = 'yes' if self.batch else 'no'
+
         # Only add expire and retry for emergency messages,
         # pushover ignores for all other priorities
         if self.priority == PushoverPriority.EMERGENCY:
@@ -617,6 +675,11 @@ class NotifyPushover(NotifyBase):
             results['targets'] += \
                 NotifyPushover.parse_list(results['qsd']['to'])
 
+        # Get Batch Mode Flag
+        results['batch'] = \
+            parse_bool(results['qsd'].get(
+                'batch', NotifyPushover.template_args['batch']['default']))
+
         # Token
         results['token'] = NotifyPushover.unquote(results['host'])
 
@@ -667,6 +667,7 @@ class NotifyReddit(NotifyBase):
                 pass
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'Exception received when sending Reddit to {}'.
                 format(url))
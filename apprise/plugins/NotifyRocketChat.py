@@ -522,6 +522,7 @@ class NotifyRocketChat(NotifyBase):
                     'Sent Rocket.Chat {}:notification.'.format(self.mode))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Rocket.Chat '
                 '{}:notification.'.format(self.mode))
@@ -597,6 +598,7 @@ class NotifyRocketChat(NotifyBase):
             return False
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A connection error occurred authenticating {} on '
                 'Rocket.Chat.'.format(self.user))
@@ -644,6 +646,7 @@ class NotifyRocketChat(NotifyBase):
                         r.content))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred logging off the '
                 'Rocket.Chat server')
@@ -260,6 +260,7 @@ class NotifyRyver(NotifyBase):
                 self.logger.info('Sent Ryver notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Ryver:%s ' % (
                     self.organization) + 'notification.'
@@ -86,6 +86,7 @@ from collections import OrderedDict
 from xml.etree import ElementTree
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
+from email.encoders import encode_noop
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr
 from email.header import Header
@@ -479,17 +480,20 @@ class NotifySES(NotifyBase):
                         'Preparing Email attachment {}'.format(
                             attachment.url(privacy=True)))
 
-                    with open(attachment.path, "rb") as abody:
-                        app = MIMEApplication(abody.read())
-                        app.set_type(attachment.mimetype)
+                    # Our content is already base64 encoded
+                    app = MIMEApplication(
+                        attachment.base64(lines=True),
+                        _encoder=encode_noop)
+                    app['Content-Transfer-Encoding'] = 'base64'
+                    app.set_type(attachment.mimetype)
 
-                        app.add_header(
-                            'Content-Disposition',
-                            'attachment; filename="{}"'.format(
-                                Header(attachment.name, 'utf-8')),
-                        )
+                    app.add_header(
+                        'Content-Disposition',
+                        'attachment; filename="{}"'.format(
+                            Header(attachment.name, 'utf-8')),
+                    )
 
-                        base.attach(app)
+                    base.attach(app)
 
             # Prepare our payload object
             payload = {
@@ -575,6 +579,7 @@ class NotifySES(NotifyBase):
                     'Sent AWS SES notification to "%s".' % (to))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending AWS SES '
                 'notification to "%s".' % (to),
@@ -26,7 +26,6 @@
 import re
 import requests
 from json import dumps, loads
-import base64
 from itertools import chain
 
 from .NotifyBase import NotifyBase
@@ -333,13 +332,11 @@ class NotifySMSEagle(NotifyBase):
                     continue
 
                 try:
-                    with open(attachment.path, 'rb') as f:
-                        # Prepare our Attachment in Base64
-                        attachments.append({
-                            'content_type': attachment.mimetype,
-                            'content': base64.b64encode(
-                                f.read()).decode('utf-8'),
-                        })
+                    # Prepare our Attachment in Base64
+                    attachments.append({
+                        'content_type': attachment.mimetype,
+                        'content': attachment.base64(),
+                    })
 
                 except (OSError, IOError) as e:
                     self.logger.warning(
@@ -528,6 +525,7 @@ class NotifySMSEagle(NotifyBase):
                             ))
 
                 except requests.RequestException as e:
+                    self.upstream_failure(e)
                     self.logger.warning(
                         'A Connection error occured sending {} SMSEagle '
                         '{} notification(s).'.format(
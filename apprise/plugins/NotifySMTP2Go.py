@@ -42,7 +42,6 @@
 #  the email will be transmitted from.  If no email address is specified
 #  then it will also become the 'to' address as well.
 #
-import base64
 import requests
 from json import dumps
 from email.utils import formataddr
@@ -298,15 +297,12 @@ class NotifySMTP2Go(NotifyBase):
                     return False
 
                 try:
-                    with open(attachment.path, 'rb') as f:
-                        # Output must be in a DataURL format (that's what
-                        # PushSafer calls it):
-                        attachments.append({
-                            'filename': attachment.name,
-                            'fileblob': base64.b64encode(f.read())
-                            .decode('utf-8'),
-                            'mimetype': attachment.mimetype,
-                        })
+                    # Prepare our Attachment in Base64
+                    attachments.append({
+                        'filename': attachment.name,
+                        'fileblob': attachment.base64(),
+                        'mimetype': attachment.mimetype,
+                    })
 
                 except (OSError, IOError) as e:
                     self.logger.warning(
@@ -461,6 +457,7 @@ class NotifySMTP2Go(NotifyBase):
                             verbose_dest))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending SMTP2Go:%s ' % (
                         verbose_dest) + 'notification.'
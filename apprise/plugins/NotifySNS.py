@@ -360,6 +360,7 @@ class NotifySNS(NotifyBase):
                     'Sent AWS notification to "%s".' % (to))
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending AWS '
                 'notification to "%s".' % (to),
@@ -387,6 +387,7 @@ class NotifySendGrid(NotifyBase):
                         'Sent SendGrid notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending SendGrid '
                     'notification to {}.'.format(target))
@@ -137,6 +137,7 @@ class NotifyServerChan(NotifyBase):
                 self.logger.info('Sent ServerChan notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occured sending ServerChan '
                 'notification.'
@@ -26,7 +26,6 @@
 import re
 import requests
 from json import dumps
-import base64
 
 from .NotifyBase import NotifyBase
 from ..common import NotifyType
@@ -238,10 +237,8 @@ class NotifySignalAPI(NotifyBase):
                     return False
 
                 try:
-                    with open(attachment.path, 'rb') as f:
-                        # Prepare our Attachment in Base64
-                        attachments.append(
-                            base64.b64encode(f.read()).decode('utf-8'))
+                    # Prepare our Attachment in Base64
+                    attachments.append(attachment.base64())
 
                 except (OSError, IOError) as e:
                     self.logger.warning(
@@ -354,6 +351,7 @@ class NotifySignalAPI(NotifyBase):
                         ))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occured sending {} Signal API '
                     'notification(s).'.format(
@@ -270,6 +270,7 @@ class NotifySimplePush(NotifyBase):
                 self.logger.info('Sent SimplePush notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending SimplePush notification.')
             self.logger.debug('Socket Exception: %s' % str(e))
@@ -367,6 +367,7 @@ class NotifySinch(NotifyBase):
                         'Sent Sinch notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Sinch:%s ' % (
                         target) + 'notification.'
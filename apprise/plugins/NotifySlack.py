@@ -731,6 +731,7 @@ class NotifySlack(NotifyBase):
                 'Email %s resolves to the Slack User ID: %s.', email, user_id)
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred looking up Slack User.',
             )
@@ -773,7 +774,7 @@ class NotifySlack(NotifyBase):
         try:
             # Open our attachment path if required:
             if attach:
-                files = {'file': (attach.name, open(attach.path, 'rb'))}
+                files = {'file': (attach.name, attach.view())}
 
             r = requests.post(
                 url,
@@ -895,6 +896,7 @@ class NotifySlack(NotifyBase):
             #   "ok": true
             # }
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred posting {}to Slack.'.format(
                     attach.name if attach else ''))
@@ -908,12 +910,6 @@ class NotifySlack(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return False
 
-        finally:
-            # Close our file (if it's open) stored in the second element
-            # of our files tuple (index 1)
-            if files:
-                files['file'][1].close()
-
         # Return the response for processing
         return response
 
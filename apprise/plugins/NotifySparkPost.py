@@ -52,7 +52,6 @@
 # API Documentation: https://developers.sparkpost.com/api/
 # Specifically: https://developers.sparkpost.com/api/transmissions/
 import requests
-import base64
 from json import loads
 from json import dumps
 from .NotifyBase import NotifyBase
@@ -475,6 +474,7 @@ class NotifySparkPost(NotifyBase):
                         continue
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending SparkPost '
                     'notification')
@@ -559,13 +559,12 @@ class NotifySparkPost(NotifyBase):
                         attachment.url(privacy=True)))
 
                 try:
-                    with open(attachment.path, 'rb') as fp:
-                        # Prepare API Upload Payload
-                        payload['content']['attachments'].append({
-                            'name': attachment.name,
-                            'type': attachment.mimetype,
-                            'data': base64.b64encode(fp.read()).decode("ascii")
-                        })
+                    # Prepare API Upload Payload
+                    payload['content']['attachments'].append({
+                        'name': attachment.name,
+                        'type': attachment.mimetype,
+                        'data': attachment.base64(),
+                    })
 
                 except (OSError, IOError) as e:
                     self.logger.warning(
@@ -313,6 +313,7 @@ class NotifySpontit(NotifyBase):
                     'Response Details:\r\n{}'.format(r.content))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Spontit:%s ' % (
                         ', '.join(self.targets)) + 'notification.'
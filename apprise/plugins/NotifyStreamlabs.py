@@ -320,6 +320,7 @@ class NotifyStreamlabs(NotifyBase):
                     self.logger.info('Sent Streamlabs alert.')
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occured sending Streamlabs '
                     'alert.'
@@ -365,6 +366,7 @@ class NotifyStreamlabs(NotifyBase):
                     self.logger.info('Sent Streamlabs donation.')
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occured sending Streamlabs '
                     'donation.'
@@ -31,6 +31,7 @@ from .NotifyBase import NotifyBase
 from ..common import NotifyType
 from ..utils import parse_bool
 from ..utils import is_hostname
+from .. import resolver
 from ..AppriseLocale import gettext_lazy as _
 
 
@@ -299,12 +300,20 @@ class NotifySyslog(NotifyBase):
             sent = 0
 
             try:
+                address = (host, port)
+                if resolver.RESOLVER_TTL > 0:
+                    # Resolve our host ourselves so that the lookup is
+                    # cached (see AppriseAsset.dns_cache_ttl)
+                    address = resolver.getaddrinfo(
+                        host, port, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+
                 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 sock.settimeout(self.socket_connect_timeout)
-                sent = sock.sendto(payload.encode('utf-8'), (host, port))
+                sent = sock.sendto(payload.encode('utf-8'), address)
                 sock.close()
 
             except socket.gaierror as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A connection error occurred sending Syslog '
                     'notification to %s:%d/%s', host, port,
@@ -314,6 +323,7 @@ class NotifySyslog(NotifyBase):
                 return False
 
             except socket.timeout as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A connection timeout occurred sending Syslog '
                     'notification to %s:%d/%s', host, port,
@@ -171,6 +171,7 @@ class NotifyTechulusPush(NotifyBase):
                     'Sent Techulus Push notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Techulus Push '
                 'notification.'
@@ -52,6 +52,7 @@
 import requests
 import re
 import os
+import threading
 
 from json import loads
 from json import dumps
@@ -60,6 +61,7 @@ from .NotifyBase import NotifyBase
 from ..common import NotifyType
 from ..common import NotifyImageSize
 from ..common import NotifyFormat
+from ..common import OverflowUnit
 from ..utils import parse_bool
 from ..utils import parse_list
 from ..utils import validate_regex
@@ -105,6 +107,14 @@ class NotifyTelegram(NotifyBase):
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 4096
 
+    # Telegram measures the length of a message in UTF-16 code units
+    body_maxlen_unit = OverflowUnit.UTF16
+
+    # Deliver up to 4 chunks of a split message at the same time; Telegram
+    # doesn't guarantee the order they're displayed in so this only happens
+    # if the user asks for them to be tagged (sequence=yes)
+    overflow_max_inflight = 4
+
     # Title is to be part of body
     title_maxlen = 0
 
@@ -305,13 +315,19 @@ class NotifyTelegram(NotifyBase):
             'type': 'bool',
             'default': False,
         },
+        'sequence': {
+            'name': _('Tag Split Messages'),
+            'type': 'bool',
+            'default': False,
+        },
         'to': {
             'alias_of': 'targets',
         },
     })
 
     def __init__(self, bot_token, targets, detect_owner=True,
-                 include_image=False, silent=None, preview=None, **kwargs):
+                 include_image=False, silent=None, preview=None,
+                 sequence=None, **kwargs):
         """
         Initialize Telegram Object
         """
@@ -337,6 +353,16 @@ class NotifyTelegram(NotifyBase):
         self.preview = self.template_args['preview']['default'] \
             if preview is None else bool(preview)
 
+        # Define whether or not the chunks of a split message are tagged with
+        # their position (e.g. [2/5]) so that they can be delivered at the
+        # same time
+        self.overflow_sequence = self.template_args['sequence']['default'] \
+            if sequence is None else bool(sequence)
+
+        # Protects our bot owner detection since the chunks of a split
+        # message can be sent at the same time
+        self._detect_lock = threading.Lock()
+
         # if detect_owner is set to True, we will attempt to determine who
         # the bot owner is based on the first person who messaged it.  This
         # is not a fool proof way of doing things as over time Telegram removes
@@ -453,6 +479,7 @@ class NotifyTelegram(NotifyBase):
                 return True
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A connection error occurred posting Telegram '
                 'attachment.')
@@ -546,6 +573,7 @@ class NotifyTelegram(NotifyBase):
             return 0
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A connection error occurred detecting the Telegram User.')
             self.logger.debug('Socket Exception: %s' % str(e))
@@ -595,13 +623,18 @@ class NotifyTelegram(NotifyBase):
         """
 
         if len(self.targets) == 0 and self.detect_owner:
-            _id = self.detect_bot_owner()
-            if _id:
-                # Permanently store our id in our target list for next time
-                self.targets.append(str(_id))
-                self.logger.info(
-                    'Update your Telegram Apprise URL to read: '
-                    '{}'.format(self.url(privacy=True)))
+            with self._detect_lock:
+                # Another chunk may have already detected our owner while we
+                # waited on our lock
+                if len(self.targets) == 0:
+                    _id = self.detect_bot_owner()
+                    if _id:
+                        # Permanently store our id in our target list for
+                        # next time
+                        self.targets.append(str(_id))
+                        self.logger.info(
+                            'Update your Telegram Apprise URL to read: '
+                            '{}'.format(self.url(privacy=True)))
 
         if len(self.targets) == 0:
             self.logger.warning('There were not Telegram chat_ids to notify.')
@@ -734,6 +767,7 @@ class NotifyTelegram(NotifyBase):
                     continue
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A connection error occurred sending Telegram:%s ' % (
                         payload['chat_id']) + 'notification.'
@@ -773,6 +807,7 @@ class NotifyTelegram(NotifyBase):
             'detect': 'yes' if self.detect_owner else 'no',
             'silent': 'yes' if self.silent else 'no',
             'preview': 'yes' if self.preview else 'no',
+            'sequence': 'yes' if self.overflow_sequence else 'no',
         }
 
         # Extend our parameters
@@ -869,6 +904,10 @@ class NotifyTelegram(NotifyBase):
         results['include_image'] = \
             parse_bool(results['qsd'].get('image', False))
 
+        # Tag the chunks of a split message with their position
+        results['sequence'] = \
+            parse_bool(results['qsd'].get('sequence', False))
+
         # Include images with our message
         results['detect_owner'] = \
             parse_bool(results['qsd'].get('detect', True))
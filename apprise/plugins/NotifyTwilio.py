@@ -344,6 +344,7 @@ class NotifyTwilio(NotifyBase):
                         'Sent Twilio notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Twilio:%s ' % (
                         target) + 'notification.'
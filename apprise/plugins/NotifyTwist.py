@@ -712,6 +712,7 @@ class NotifyTwist(NotifyBase):
                 return (False, content)
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'Exception received when sending Twist {} to {}: '.
                 format(method, api_url))
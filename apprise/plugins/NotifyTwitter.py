@@ -659,7 +659,7 @@ class NotifyTwitter(NotifyBase):
         # Open our attachment path if required:
         if isinstance(payload, AttachBase):
             # prepare payload
-            files = {'media': (payload.name, open(payload.path, 'rb'))}
+            files = {'media': (payload.name, payload.view())}
 
         elif json:
             headers['Content-Type'] = 'application/json'
@@ -757,6 +757,7 @@ class NotifyTwitter(NotifyBase):
                 pass
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'Exception received when sending Twitter {} to {}: '.
                 format(method, url))
@@ -773,12 +774,6 @@ class NotifyTwitter(NotifyBase):
             self.logger.debug('I/O Exception: %s' % str(e))
             return (False, content)
 
-        finally:
-            # Close our file (if it's open) stored in the second element
-            # of our files tuple (index 1)
-            if files:
-                files['media'][1].close()
-
         return (True, content)
 
     @property
@@ -292,6 +292,7 @@ class NotifyVonage(NotifyBase):
                         'Sent Vonage notification to %s.' % target)
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Vonage:%s '
                     'notification.' % target
@@ -194,6 +194,7 @@ class NotifyWebexTeams(NotifyBase):
                     'Sent Webex Teams notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending Webex Teams '
                 'notification.'
@@ -285,6 +285,7 @@ class NotifyXBMC(NotifyBase):
                 self.logger.info('Sent XBMC/KODI notification.')
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending XBMC/KODI '
                 'notification.'
@@ -26,12 +26,14 @@
 import re
 import six
 import requests
-import base64
 
 from .NotifyBase import NotifyBase
 from ..URLBase import PrivacyMode
 from ..common import NotifyImageSize
 from ..common import NotifyType
+from ..utils import compress
+from ..utils import StreamPayload
+from ..utils import CONTENT_ENCODINGS
 from ..AppriseLocale import gettext_lazy as _
 
 
@@ -44,6 +46,23 @@ METHODS = (
     'HEAD'
 )
 
+# Our (SOAP) envelope; it's split up front around the {XSD_URL}, {CORE} and
+# {ATTACHMENTS} entries we place into it.  This leaves us with the literal
+# text (at the even indexes) and the names of the entries (at the odd ones).
+XML_ENVELOPE = re.split(r'\{(XSD_URL|CORE|ATTACHMENTS)\}', """\
+<?xml version='1.0' encoding='utf-8'?>
+<soapenv:Envelope
+    xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+    <soapenv:Body>
+        <Notification xmlns:xsi="{XSD_URL}">
+            {CORE}
+            {ATTACHMENTS}
+       </Notification>
+    </soapenv:Body>
+</soapenv:Envelope>""")
+
 
 class NotifyXML(NotifyBase):
     """
@@ -119,6 +138,11 @@ class NotifyXML(NotifyBase):
             'values': METHODS,
             'default': METHODS[0],
         },
+        'compress': {
+            'name': _('Compression'),
+            'type': 'choice:string',
+            'values': tuple(sorted(CONTENT_ENCODINGS.keys())),
+        },
     })
 
     # Define any kwargs we're using
@@ -133,29 +157,20 @@ class NotifyXML(NotifyBase):
         },
     }
 
-    def __init__(self, headers=None, method=None, payload=None, **kwargs):
+    def __init__(self, headers=None, method=None, payload=None,
+                 compress=None, **kwargs):
         """
         Initialize XML Object
 
         headers can be a dictionary of key/value pairs that you want to
         additionally include as part of the server headers to post with
 
+        compress can be set to gzip or deflate to compress the body of our
+        requests (they're sent uncompressed by default)
+
         """
         super(NotifyXML, self).__init__(**kwargs)
 
-        self.payload = """<?xml version='1.0' encoding='utf-8'?>
-<soapenv:Envelope
-    xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
-    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
-    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
-    <soapenv:Body>
-        <Notification xmlns:xsi="{{XSD_URL}}">
-            {{CORE}}
-            {{ATTACHMENTS}}
-       </Notification>
-    </soapenv:Body>
-</soapenv:Envelope>"""
-
         self.fullpath = kwargs.get('fullpath')
         if not isinstance(self.fullpath, six.string_types):
             self.fullpath = ''
@@ -168,6 +183,13 @@ class NotifyXML(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
+        self.compress = None if not compress else compress.lower()
+        if self.compress and self.compress not in CONTENT_ENCODINGS:
+            msg = 'The compression specified ({}) is invalid.'.format(
+                compress)
+            self.logger.warning(msg)
+            raise TypeError(msg)
+
         self.headers = {}
         if headers:
             # Store our extra headers
@@ -198,6 +220,9 @@ class NotifyXML(NotifyBase):
             'method': self.method,
         }
 
+        if self.compress:
+            params['compress'] = self.compress
+
         # Extend our parameters
         params.update(self.url_parameters(privacy=privacy, *args, **kwargs))
 
@@ -250,9 +275,6 @@ class NotifyXML(NotifyBase):
         # Apply any/all header over-rides defined
         headers.update(self.headers)
 
-        # Our XML Attachmement subsitution
-        xml_attachments = ''
-
         # Our Payload Base
         payload_base = {
             'Version': self.xsd_ver,
@@ -267,57 +289,64 @@ class NotifyXML(NotifyBase):
             {k: NotifyXML.escape_html(v, whitespace=False)
                 for k, v in self.payload_extras.items()})
 
-        # Base Entres
-        xml_base = ''.join(
-            ['<{}>{}</{}>'.format(k, v, k) for k, v in payload_base.items()])
-
-        attachments = []
-        if attach:
-            for attachment in attach:
-                # Perform some simple error checking
-                if not attachment:
-                    # We could not access the attachment
-                    self.logger.error(
-                        'Could not access attachment {}.'.format(
-                            attachment.url(privacy=True)))
-                    return False
-
-                try:
-                    with open(attachment.path, 'rb') as f:
-                        # Prepare our Attachment in Base64
-                        entry = \
+        # Our payload; the content of our attachments is only read (and
+        # base64 encoded) as it's sent
+        payload = StreamPayload()
+
+        try:
+            for no, part in enumerate(XML_ENVELOPE):
+                if not no % 2:
+                    # Literal text
+                    payload.write(part)
+
+                elif part == 'XSD_URL':
+                    payload.write(self.xsd_url.format(version=self.xsd_ver))
+
+                elif part == 'CORE':
+                    payload.write(''.join([
+                        '<{}>{}</{}>'.format(k, v, k)
+                        for k, v in payload_base.items()]))
+
+                elif attach:  # ATTACHMENTS
+                    payload.write('<Attachments format="base64">')
+                    for attachment in attach:
+                        # Perform some simple error checking
+                        if not attachment:
+                            # We could not access the attachment
+                            self.logger.error(
+                                'Could not access attachment {}.'.format(
+                                    attachment.url(privacy=True)))
+                            return False
+
+                        payload.write(
                             '<Attachment filename="{}" mimetype="{}">'.format(
                                 NotifyXML.escape_html(
                                     attachment.name, whitespace=False),
                                 NotifyXML.escape_html(
-                                    attachment.mimetype, whitespace=False))
-                        entry += base64.b64encode(f.read()).decode('utf-8')
-                        entry += '</Attachment>'
-                        attachments.append(entry)
+                                    attachment.mimetype, whitespace=False)))
+                        payload.write_file(attachment.path, base64=True)
+                        payload.write('</Attachment>')
 
-                except (OSError, IOError) as e:
-                    self.logger.warning(
-                        'An I/O error occurred while reading {}.'.format(
-                            attachment.name if attachment else 'attachment'))
-                    self.logger.debug('I/O Exception: %s' % str(e))
-                    return False
-
-            # Update our xml_attachments record:
-            xml_attachments = \
-                '<Attachments format="base64">' + \
-                ''.join(attachments) + '</Attachments>'
-
-        re_map = {
-            '{{XSD_URL}}': self.xsd_url.format(version=self.xsd_ver),
-            '{{ATTACHMENTS}}': xml_attachments,
-            '{{CORE}}': xml_base,
-        }
+                    payload.write('</Attachments>')
 
-        # Iterate over above list and store content accordingly
-        re_table = re.compile(
-            r'(' + '|'.join(re_map.keys()) + r')',
-            re.IGNORECASE,
-        )
+            if not attach:
+                # There is nothing for us to stream
+                payload = payload.getvalue().decode('utf-8')
+
+            self.logger.debug('XML Payload: %s' % (
+                payload if not attach else
+                '<{} byte payload with attachments>'.format(len(payload))))
+
+            if self.compress:
+                payload = compress(payload, self.compress)
+                headers['Content-Encoding'] = self.compress
+
+        except (OSError, IOError) as e:
+            self.logger.warning(
+                'An I/O error occurred while reading one of the '
+                'attached files.')
+            self.logger.debug('I/O Exception: %s' % str(e))
+            return False
 
         auth = None
         if self.user:
@@ -331,14 +360,11 @@ class NotifyXML(NotifyBase):
             url += ':%d' % self.port
 
         url += self.fullpath
-        payload = re_table.sub(lambda x: re_map[x.group()], self.payload)
 
         self.logger.debug('XML POST URL: %s (cert_verify=%r)' % (
             url, self.verify_certificate,
         ))
 
-        self.logger.debug('XML Payload: %s' % str(payload))
-
         # Always call throttle before any remote server i/o is made
         self.throttle()
 
@@ -387,6 +413,7 @@ class NotifyXML(NotifyBase):
                 self.logger.info('Sent XML %s notification.', self.method)
 
         except requests.RequestException as e:
+            self.upstream_failure(e)
             self.logger.warning(
                 'A Connection error occurred sending XML '
                 'notification to %s.' % self.host)
@@ -395,6 +422,13 @@ class NotifyXML(NotifyBase):
             # Return; we're done
             return False
 
+        except (OSError, IOError) as e:
+            self.logger.warning(
+                'An I/O error occurred while reading one of the '
+                'attached files.')
+            self.logger.debug('I/O Exception: %s' % str(e))
+            return False
+
         return True
 
     @staticmethod
@@ -422,4 +456,9 @@ class NotifyXML(NotifyBase):
         if 'method' in results['qsd'] and len(results['qsd']['method']):
             results['method'] = NotifyXML.unquote(results['qsd']['method'])
 
+        # Set our compression if specified
+        if 'compress' in results['qsd'] and len(results['qsd']['compress']):
+            results['compress'] = \
+                NotifyXML.unquote(results['qsd']['compress'])
+
         return results
@@ -316,6 +316,7 @@ class NotifyZulip(NotifyBase):
                         'Sent Zulip notification to {}.'.format(target))
 
             except requests.RequestException as e:
+                self.upstream_failure(e)
                 self.logger.warning(
                     'A Connection error occurred sending Zulip '
                     'notification to {}.'.format(target))
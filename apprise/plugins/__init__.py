@@ -43,7 +43,7 @@ from ..common import NotifyType
 from ..common import NOTIFY_TYPES
 from .. import common
 from ..utils import parse_list
-from ..utils import cwe312_url
+from ..utils import CWE312URL
 from ..utils import GET_SCHEMA_RE
 from ..logger import logger
 from ..AppriseLocale import gettext_lazy as _
@@ -531,7 +531,7 @@ def url_to_dict(url, secure_logging=True):
     _url = url.replace('/#', '/%23')
 
     # CWE-312 (Secure Logging) Handling
-    loggable_url = url if not secure_logging else cwe312_url(url)
+    loggable_url = url if not secure_logging else CWE312URL(url)
 
     # Attempt to acquire the schema at the very least to allow our plugins to
     # determine if they can make a better interpretation of a URL geared for
@@ -539,7 +539,7 @@ def url_to_dict(url, secure_logging=True):
     schema = GET_SCHEMA_RE.match(_url)
     if schema is None:
         # Not a valid URL; take an early exit
-        logger.error('Unsupported URL: {}'.format(loggable_url))
+        logger.error('Unsupported URL: %s', loggable_url)
         return None
 
     # Ensure our schema is always in lower case
@@ -556,7 +556,7 @@ def url_to_dict(url, secure_logging=True):
                  None)
 
         if not results:
-            logger.error('Unparseable URL {}'.format(loggable_url))
+            logger.error('Unparseable URL %s', loggable_url)
             return None
 
         logger.trace('URL {} unpacked as:{}{}'.format(
@@ -568,8 +568,9 @@ def url_to_dict(url, secure_logging=True):
         # containing all of the information parsed from our URL
         results = common.NOTIFY_SCHEMA_MAP[schema].parse_url(_url)
         if not results:
-            logger.error('Unparseable {} URL {}'.format(
-                common.NOTIFY_SCHEMA_MAP[schema].service_name, loggable_url))
+            logger.error(
+                'Unparseable %s URL %s',
+                common.NOTIFY_SCHEMA_MAP[schema].service_name, loggable_url)
             return None
 
         logger.trace('{} URL {} unpacked as:{}{}'.format(
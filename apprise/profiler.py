@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# This module is intentionally self contained (it only depends on the Python
+# standard library) so that it can be loaded on it's own, before Apprise has
+# been imported, when profiling the start up of a new interpreter.
+
+import re
+import os
+import sys
+import json
+import time
+import subprocess
+
+try:
+    # Python v3.4+
+    import tracemalloc
+    import importlib
+    import importlib.abc
+    import importlib.util
+
+except ImportError:
+    # Python v2.7
+    tracemalloc = None
+
+# The modules our plugins are loaded from
+PLUGIN_MODULE_RE = re.compile(r'^apprise\.plugins\.(?P<name>Notify[a-z0-9]+)$',
+                              re.I)
+
+# The code run by our profiling interpreter; it loads this file (without
+# importing Apprise) and prints the results of run() as JSON
+BOOTSTRAP = \
+    'import sys, json, importlib.util\n' \
+    'sys.path.insert(0, {root!r})\n' \
+    'spec = importlib.util.spec_from_file_location(' \
+    '"apprise_profiler", {path!r})\n' \
+    'module = importlib.util.module_from_spec(spec)\n' \
+    'spec.loader.exec_module(module)\n' \
+    'print(json.dumps(module.run(' \
+    'plugin_paths={plugin_paths!r}, memory={memory!r})))\n'
+
+
+class PluginImportProfiler(object):
+    """
+    Tracks the time (and optionally the memory) spent importing each of our
+    plugin modules along with the 3rd party modules they brought in.
+
+    Only plugins imported while the profiler is active are tracked, so it
+    must be started before Apprise is imported.
+    """
+
+    def __init__(self, memory=False):
+        """
+        Initialize our profiler
+        """
+
+        # Track our memory usage (this slows our imports down)
+        self.memory = memory and tracemalloc is not None
+
+        # Our plugin statistics keyed by plugin name
+        self.plugins = {}
+
+        # The plugin imports in progress; plugins can import one another
+        self._stack = []
+
+    def find_spec(self, fullname, path, target=None):
+        """
+        Our sys.meta_path hook; wraps the loader of all plugin modules
+        """
+        match = PLUGIN_MODULE_RE.match(fullname)
+        if not match:
+            return None
+
+        spec = None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+
+        if spec is None or spec.loader is None:
+            return spec
+
+        exec_module = spec.loader.exec_module
+        name = match.group('name')
+
+        def profiled_exec_module(module):
+            self.enter(name)
+            try:
+                exec_module(module)
+
+            finally:
+                self.leave(name)
+
+        spec.loader.exec_module = profiled_exec_module
+        return spec
+
+    def enter(self, name):
+        """
+        Called as we start importing a plugin
+        """
+        self._stack.append({
+            'name': name,
+            'modules': set(sys.modules),
+            'time': time.time(),
+            'memory': tracemalloc.get_traced_memory()[0]
+            if self.memory else 0,
+            # Time and memory consumed by plugins imported by this one
+            'nested_time': 0.0,
+            'nested_memory': 0,
+            'nested_modules': set(),
+        })
+
+    def leave(self, name):
+        """
+        Called once we're done importing a plugin
+        """
+        entry = self._stack.pop()
+        elapsed = time.time() - entry['time']
+        memory = (tracemalloc.get_traced_memory()[0] - entry['memory']) \
+            if self.memory else 0
+
+        # The top level modules this plugin imported
+        imported = set(sys.modules) - entry['modules']
+
+        if self._stack:
+            # Don't charge our parent for the work we did
+            self._stack[-1]['nested_time'] += elapsed
+            self._stack[-1]['nested_memory'] += memory
+            self._stack[-1]['nested_modules'] |= imported
+
+        self.plugins[name] = {
+            'name': name,
+            'time': elapsed - entry['nested_time'],
+            'memory': memory - entry['nested_memory']
+            if self.memory else None,
+            'dependencies': sorted(set(
+                m.split('.')[0]
+                for m in imported - entry['nested_modules']
+                if not m.startswith('apprise.') and m != 'apprise'
+                and not is_stdlib(m))),
+        }
+
+    def start(self):
+        """
+        Starts tracking our plugin imports
+        """
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        sys.meta_path.insert(0, self)
+
+    def stop(self):
+        """
+        Stops tracking our plugin imports
+        """
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def is_stdlib(name):
+    """
+    Returns True if the (top level) module name is part of the Python
+    standard library.  Without a way to tell (Python < 3.10), only builtin
+    modules are considered part of the standard library.
+
+    Private and runtime modules (such as those created by Cython) are
+    treated as part of the standard library too since they're never
+    something a user would install.
+    """
+    name = name.split('.')[0]
+    if name.startswith('_') or name == 'cython_runtime':
+        return True
+
+    stdlib = getattr(sys, 'stdlib_module_names', None)
+    if stdlib is not None:
+        return name in stdlib
+
+    return name in sys.builtin_module_names
+
+
+def run(plugin_paths=None, memory=False):
+    """
+    Profiles the importing of Apprise and the creation of our first Apprise
+    object in the current interpreter.  Apprise must not have already been
+    imported.
+
+    A dictionary of our results is returned.
+    """
+
+    if 'apprise' in sys.modules:
+        raise RuntimeError(
+            'Apprise was already imported; start up can not be profiled.')
+
+    phases = []
+
+    def phase(name, fn):
+        reference = time.time()
+        mem_reference = \
+            tracemalloc.get_traced_memory()[0] if profiler.memory else 0
+
+        result = fn()
+
+        phases.append({
+            'name': name,
+            'time': time.time() - reference,
+            'memory': (tracemalloc.get_traced_memory()[0] - mem_reference)
+            if profiler.memory else None,
+        })
+        return result
+
+    modules = set(sys.modules)
+    with PluginImportProfiler(memory=memory) as profiler:
+        apprise = phase(
+            'import apprise', lambda: importlib.import_module('apprise'))
+
+        asset = phase(
+            'AppriseAsset()',
+            lambda: apprise.AppriseAsset(plugin_paths=plugin_paths))
+
+        phase('AppriseLocale()', lambda: apprise.AppriseLocale.AppriseLocale())
+
+        phase('Apprise()', lambda: apprise.Apprise(asset=asset))
+
+    # Acquire our plugin states
+    for name, entry in profiler.plugins.items():
+        plugin = apprise.common.NOTIFY_MODULE_MAP.get(name)
+        entry['enabled'] = \
+            bool(plugin and getattr(plugin['plugin'], 'enabled', True))
+
+    return {
+        'python': sys.version.split()[0],
+        'apprise': apprise.__version__,
+        'phases': phases,
+        'plugins': sorted(
+            profiler.plugins.values(), key=lambda x: x['time'], reverse=True),
+        'dependencies': sorted(set(
+            m.split('.')[0] for m in set(sys.modules) - modules
+            if not m.startswith('apprise.') and m != 'apprise'
+            and not is_stdlib(m))),
+    }
+
+
+def profile_startup(plugin_paths=None, memory=True, python=None):
+    """
+    Profiles the start up of Apprise in a brand new interpreter and returns
+    a dictionary of the results:
+
+        {
+            'python': '3.10.4',
+            'apprise': '1.0.0',
+            'phases': [
+                {'name': 'import apprise', 'time': 0.2132, 'memory': 61235},
+                ...
+            ],
+            'plugins': [
+                {
+                    'name': 'NotifyFCM', 'time': 0.0213, 'memory': 12512,
+                    'enabled': True, 'dependencies': ['cryptography'],
+                },
+                ...
+            ],
+            'dependencies': ['click', 'cryptography', 'markdown', ...],
+        }
+
+    Times are in seconds and memory in bytes (None if memory is not being
+    tracked).  Since tracking memory slows everything down, two interpreters
+    are used when memory is set; one for our timings and one for our memory.
+    """
+
+    if tracemalloc is None:
+        raise RuntimeError('Start up profiling requires Python 3.4+')
+
+    if isinstance(plugin_paths, str):
+        plugin_paths = [plugin_paths]
+
+    def spawn(memory):
+        path = os.path.abspath(__file__)
+        if path.endswith(('.pyc', '.pyo')):
+            path = path[:-1]
+
+        output = subprocess.check_output([
+            python if python else sys.executable, '-c', BOOTSTRAP.format(
+                root=os.path.dirname(os.path.dirname(path)), path=path,
+                plugin_paths=list(plugin_paths) if plugin_paths else None,
+                memory=memory)])
+
+        # Our JSON response is always the last line printed
+        return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+    results = spawn(memory=False)
+    if memory:
+        usage = spawn(memory=True)
+        mem_lookup = dict((p['name'], p['memory']) for p in usage['plugins'])
+        for entry in results['plugins']:
+            entry['memory'] = mem_lookup.get(entry['name'])
+
+        for entry, mem_entry in zip(results['phases'], usage['phases']):
+            entry['memory'] = mem_entry['memory']
+
+    return results
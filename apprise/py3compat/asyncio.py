@@ -25,9 +25,13 @@
 
 import sys
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from itertools import count
 from ..URLBase import URLBase
+from ..common import NotifyType
 from ..logger import logger
+from ..scheduler import delivery_scheduler
 
 
 # A global flag that tracks if we are Python v3.7 or higher
@@ -98,6 +102,94 @@ def tosync(cor, debug=False):
         return loop.run_until_complete(cor)
 
 
+def run(cor):
+    """
+    Runs a coroutine to completion from non-async code and returns its
+    result.  Unlike tosync(), we always wait for the result; if an event loop
+    is already running in this thread, the coroutine is run in a thread (and
+    event loop) of its own.
+    """
+
+    if ASYNCIO_RUN_SUPPORT:
+        try:
+            asyncio.get_running_loop()
+
+        except RuntimeError:
+            # There is no existing event loop, so we can start our own.
+            return asyncio.run(cor)
+
+        # We can't block the event loop that's already running
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, cor).result()
+
+    # The Deprecated Way (<= Python v3.6)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(cor)
+
+    finally:
+        loop.close()
+
+
+async def hook_notify(plugin, *args, **kwargs):  # noqa: E999
+    """
+    Notifies a custom (@notify) plugin whose hook is a coroutine; the hook is
+    awaited directly (instead of being handed off to a thread).
+    """
+
+    prepared = plugin._prepare(*args, **kwargs)
+    if prepared is None:
+        return False
+
+    items, kwargs, (key, offset, delivered) = prepared
+
+    # The index of each of our items (some may have been delivered already)
+    indices = (index for index in count(offset) if index not in delivered)
+    for index, call in zip(indices, plugin._hook_calls(items, **kwargs)):
+        try:
+            result = await call()
+
+        except Exception as e:
+            plugin._hook_exception(e)
+            result = False
+
+        else:
+            result = plugin._hook_response(result)
+
+        if not result:
+            # Track where we left off
+            plugin._overflow_resume = (key, index, frozenset(
+                i for i in delivered if i > index))
+            return False
+
+    plugin._overflow_resume = None
+    return True
+
+
+async def onfailure(cor, fn):  # noqa: E999
+    """
+    Create a coroutine that, when run, awaits the (notification) coroutine
+    provided and calls fn() if it failed.
+    """
+
+    result = await cor
+    if not result:
+        fn()
+
+    return result
+
+
+async def onresult(cor, fn):  # noqa: E999
+    """
+    Create a coroutine that, when run, awaits the (notification) coroutine
+    provided and passes its result to fn().
+    """
+
+    result = await cor
+    fn(result)
+    return result
+
+
 async def toasyncwrapvalue(v):  # noqa: E999
     """
     Create a coroutine that, when run, returns the provided value.
@@ -125,10 +217,39 @@ class AsyncNotifyBase(URLBase):
         """
 
         loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def resolve(result, exception):
+            if future.done():
+                # We were cancelled
+                return
+
+            if exception is not None:
+                future.set_exception(exception)
+
+            else:
+                future.set_result(result)
+
+        def done(result, exception):
+            # We're called from one of the scheduler's threads
+            try:
+                loop.call_soon_threadsafe(resolve, result, exception)
+
+            except RuntimeError:
+                # Our event loop was closed while we were being sent
+                pass
+
+        notify_type = kwargs.get(
+            'notify_type', args[2] if len(args) > 2 else NotifyType.INFO)
+
+        # Our notification is queued (by its priority) with the workers
+        # shared by all of our notifications
+        delivery_scheduler().submit(
+            partial(self.notify, *args, **kwargs), done,
+            priority=self.asset.notify_priority_map.get(notify_type, 0))
 
         try:
-            return await loop.run_in_executor(
-                None, partial(self.notify, *args, **kwargs))
+            return await future
 
         except TypeError:
             # These our our internally thrown notifications
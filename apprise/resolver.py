@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import time
+import socket
+import threading
+from collections import OrderedDict
+from six.moves import queue
+
+from .logger import logger
+
+try:
+    # urllib3 is what requests uses to establish its connections
+    from urllib3.util import connection as urllib3_connection
+
+except ImportError:  # pragma: no cover
+    # Our connections are still cached, they just aren't established in
+    # parallel
+    urllib3_connection = None
+
+# The number of seconds our DNS lookups are cached for; they aren't cached
+# at all if this is set to zero (the default)
+RESOLVER_TTL = 0
+
+# The maximum number of DNS lookups we cache
+RESOLVER_CACHE_SIZE = 1024
+
+# The seconds to wait for a connection attempt to complete before we start
+# one to the next address in parallel (RFC 8305 recommends 250ms)
+RESOLVER_CONNECT_DELAY = 0.25
+
+# Our cached DNS lookups; keyed by the arguments passed to getaddrinfo()
+# and mapped to when they expire along with the addresses returned.
+RESOLVER_CACHE = OrderedDict()
+
+# Held while an address is looked up in (or added to) our cache
+RESOLVER_LOCK = threading.Lock()
+
+# The original getaddrinfo() and (urllib3) create_connection() functions
+# we replace while we're installed
+_getaddrinfo = socket.getaddrinfo
+_create_connection = None if urllib3_connection is None \
+    else urllib3_connection.create_connection
+
+# The value urllib3 passes to create_connection() if no timeout is set
+URLLIB3_DEFAULT_TIMEOUT = getattr(
+    urllib3_connection, '_DEFAULT_TIMEOUT', socket._GLOBAL_DEFAULT_TIMEOUT)
+
+
+def getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """
+    A drop-in replacement of socket.getaddrinfo() whose results are cached
+    for RESOLVER_TTL seconds (if set).
+
+    Unsuccessful lookups are never cached.
+
+    """
+    if RESOLVER_TTL <= 0 or not host:
+        return _getaddrinfo(host, port, family, type, proto, flags)
+
+    key = (host, port, family, type, proto, flags)
+    now = time.time()
+
+    with RESOLVER_LOCK:
+        entry = RESOLVER_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return list(entry[1])
+
+    addresses = _getaddrinfo(host, port, family, type, proto, flags)
+
+    with RESOLVER_LOCK:
+        RESOLVER_CACHE.pop(key, None)
+        RESOLVER_CACHE[key] = (now + RESOLVER_TTL, addresses)
+        while len(RESOLVER_CACHE) > RESOLVER_CACHE_SIZE:
+            # Drop our oldest entry
+            RESOLVER_CACHE.popitem(last=False)
+
+    return list(addresses)
+
+
+def interleave(addresses):
+    """
+    Re-orders the addresses (returned by getaddrinfo()) so that their
+    address families alternate; the first family returned is preferred.
+
+    """
+    families = OrderedDict()
+    for address in addresses:
+        families.setdefault(address[0], []).append(address)
+
+    ordered = []
+    groups = list(families.values())
+    while groups:
+        for group in groups:
+            ordered.append(group.pop(0))
+
+        groups = [group for group in groups if group]
+
+    return ordered
+
+
+def _connect(address, timeout, source_address, socket_options):
+    """
+    Establishes a connection to a single address (as returned by
+    getaddrinfo())
+    """
+    af, socktype, proto, _, sa = address
+    sock = socket.socket(af, socktype, proto)
+    try:
+        for option in (socket_options or ()):
+            sock.setsockopt(*option)
+
+        if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            sock.settimeout(timeout)
+
+        if source_address:
+            sock.bind(source_address)
+
+        sock.connect(sa)
+
+    except Exception:
+        sock.close()
+        raise
+
+    return sock
+
+
+def create_connection(address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                      source_address=None, socket_options=None, family=0):
+    """
+    A drop-in replacement of socket.create_connection() that (unlike the
+    original) doesn't wait for an address to time out before trying the
+    next one.
+
+    Using the Happy Eyeballs (RFC 8305) approach, if a connection attempt
+    hasn't completed within RESOLVER_CONNECT_DELAY seconds one is started
+    to the next address (alternating between IPv6 and IPv4) in parallel.
+    The first connection established is returned (and the others closed).
+    This prevents broken IPv6 (or IPv4) networks from delaying us.
+
+    """
+    host, port = address
+    if host.startswith('['):
+        host = host.strip('[]')
+
+    addresses = interleave(
+        getaddrinfo(host, port, family, socket.SOCK_STREAM))
+    if not addresses:
+        raise socket.error('getaddrinfo returns an empty list')
+
+    if len(addresses) == 1:
+        # Nothing to race
+        return _connect(addresses[0], timeout, source_address, socket_options)
+
+    results = queue.Queue()
+    lock = threading.Lock()
+    state = {'done': False}
+
+    def attempt(address):
+        try:
+            sock = _connect(address, timeout, source_address, socket_options)
+
+        except Exception as e:
+            results.put(e)
+            return
+
+        with lock:
+            if not state['done']:
+                # We won
+                state['done'] = True
+                results.put(sock)
+                return
+
+        # Another attempt was faster
+        sock.close()
+
+    pending = 0
+    error = None
+    for address in addresses:
+        thread = threading.Thread(target=attempt, args=(address,))
+        thread.daemon = True
+        thread.start()
+        pending += 1
+
+        try:
+            # Give our attempt a head start (but move on to the next address
+            # right away if it fails)
+            result = results.get(timeout=RESOLVER_CONNECT_DELAY)
+
+        except queue.Empty:
+            continue
+
+        pending -= 1
+        if not isinstance(result, Exception):
+            return result
+
+        error = result
+
+    while pending:
+        result = results.get()
+        pending -= 1
+        if not isinstance(result, Exception):
+            return result
+
+        error = result
+
+    raise error
+
+
+def urllib3_create_connection(
+        address, timeout=URLLIB3_DEFAULT_TIMEOUT, source_address=None,
+        socket_options=None):
+    """
+    Our create_connection() as used by urllib3 (and therefore requests)
+    """
+    if timeout is URLLIB3_DEFAULT_TIMEOUT:
+        timeout = socket._GLOBAL_DEFAULT_TIMEOUT
+
+    # Respect urllib3's detection of IPv6 support
+    family = urllib3_connection.allowed_gai_family() \
+        if hasattr(urllib3_connection, 'allowed_gai_family') else 0
+
+    return create_connection(
+        address, timeout=timeout, source_address=source_address,
+        socket_options=socket_options, family=family)
+
+
+def install(ttl=60):
+    """
+    Caches the DNS lookups of this process for ttl seconds and has requests
+    establish its connections using our create_connection().
+
+    This affects everything running in this process (not just Apprise).
+
+    """
+    global RESOLVER_TTL
+
+    RESOLVER_TTL = ttl
+    if socket.getaddrinfo is not getaddrinfo:
+        logger.debug(
+            'Caching DNS lookups for {} second(s).'.format(ttl))
+        socket.getaddrinfo = getaddrinfo
+
+    if urllib3_connection is not None \
+            and urllib3_connection.create_connection \
+            is not urllib3_create_connection:
+        urllib3_connection.create_connection = urllib3_create_connection
+
+
+def uninstall():
+    """
+    Restores the original getaddrinfo() and (urllib3) create_connection()
+    functions and clears our cache.
+
+    """
+    global RESOLVER_TTL
+
+    RESOLVER_TTL = 0
+    socket.getaddrinfo = _getaddrinfo
+    if urllib3_connection is not None:
+        urllib3_connection.create_connection = _create_connection
+
+    with RESOLVER_LOCK:
+        RESOLVER_CACHE.clear()
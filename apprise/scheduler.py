@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import time
+import threading
+from collections import deque
+
+from .logger import logger
+
+# The maximum number of notifications delivered at the same time (by all of
+# the Apprise objects in this process); None sizes it based on the number of
+# CPUs available (just like Python's own thread pools)
+SCHEDULER_WORKERS = None
+
+# The maximum number of seconds a notification can be held back by the ones
+# of a higher priority before it's delivered anyway (starvation protection);
+# set this to None to always deliver the higher priorities first
+SCHEDULER_MAX_WAIT = 10.0
+
+# Our (shared) delivery scheduler; created the first time it's needed
+DELIVERY_SCHEDULER = None
+
+# Held while our delivery scheduler is created (or replaced)
+DELIVERY_SCHEDULER_LOCK = threading.Lock()
+
+# Tracks whether or not the current thread is one of our workers
+SCHEDULER_LOCAL = threading.local()
+
+
+class DeliveryScheduler(object):
+    """
+    Hands the notifications queued with it to a (bounded) set of worker
+    threads; the ones queued with the highest priority are delivered first.
+
+    A notification held back (by the ones of a higher priority) for more
+    then max_wait seconds is delivered next regardless of its priority so
+    that the lower priorities are never starved out entirely.
+
+    """
+
+    def __init__(self, workers=None, max_wait=SCHEDULER_MAX_WAIT):
+        """
+        Initialize our scheduler; no worker threads are started until there
+        is something to deliver.
+        """
+        if not workers:
+            workers = min(32, (os.cpu_count() or 1) + 4) \
+                if hasattr(os, 'cpu_count') else 5
+
+        # The maximum number of worker threads we start
+        self.workers = workers
+
+        # Starvation protection
+        self.max_wait = max_wait
+
+        # Our counters
+        self.submitted = 0
+        self.completed = 0
+
+        # The number of notifications delivered ahead of a higher priority
+        # because they waited for too long
+        self.promoted = 0
+
+        # The longest (in seconds) a notification waited to be delivered
+        self.max_delay = 0.0
+
+        # Our queues keyed by their priority (and the number of notifications
+        # waiting in them)
+        self._queues = {}
+        self._queued = 0
+
+        # Our worker threads (and how many of them are waiting for work)
+        self._threads = 0
+        self._idle = 0
+
+        # Set once we've been shut down
+        self._shutdown = False
+
+        self._cond = threading.Condition(threading.Lock())
+
+    def submit(self, fn, callback=None, priority=0):
+        """
+        Queues fn() to be called by one of our workers.  If specified, the
+        callback is passed its result and the exception it raised (if any)
+        once it's done.
+
+        """
+        if getattr(SCHEDULER_LOCAL, 'worker', False) or self._shutdown:
+            # We're already running in one of our workers (a notification
+            # that sends notifications of its own); waiting for another one
+            # could dead-lock us if they're all busy, so we just deliver it
+            # ourselves.
+            self._call(fn, callback)
+            return
+
+        with self._cond:
+            queue = self._queues.get(priority)
+            if queue is None:
+                queue = self._queues[priority] = deque()
+
+            queue.append((time.time(), fn, callback))
+            self._queued += 1
+            self.submitted += 1
+
+            if self._idle:
+                # Wake one of our waiting workers
+                self._cond.notify()
+
+            if self._queued > self._idle:
+                # Our idle workers (that may not have woken up yet) can't
+                # deliver everything queued on their own
+                if self._threads < self.workers:
+                    self._threads += 1
+                    thread = threading.Thread(target=self._worker)
+                    thread.daemon = True
+                    thread.start()
+
+                else:
+                    logger.trace(
+                        'Notification queued (priority={}, depth={}); all {} '
+                        'delivery worker(s) are busy.'.format(
+                            priority, len(queue), self.workers))
+
+    def depth(self, priority=None):
+        """
+        Returns the number of notifications waiting to be delivered (with
+        the priority specified).
+        """
+        with self._cond:
+            if priority is not None:
+                return len(self._queues.get(priority, ()))
+
+            return self._queued
+
+    def stats(self):
+        """
+        Returns a dictionary containing our (queue depth) metrics.
+        """
+        with self._cond:
+            return {
+                'workers': self._threads,
+                'busy': self._threads - self._idle,
+                'queued': dict(
+                    (priority, len(queue))
+                    for priority, queue in self._queues.items()),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'promoted': self.promoted,
+                'max_delay': self.max_delay,
+            }
+
+    def shutdown(self):
+        """
+        Stops our workers once everything queued has been delivered;
+        anything submitted afterwards is delivered by the caller.
+        """
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+
+    def _next(self):
+        """
+        Returns the next notification to deliver (or None if there isn't one)
+        This must be called while holding our lock.
+        """
+        queues = [(p, q) for p, q in self._queues.items() if q]
+        if not queues:
+            return None
+
+        now = time.time()
+
+        # Deliver whatever has the highest priority
+        priority, queue = max(queues, key=lambda entry: entry[0])
+
+        if self.max_wait is not None:
+            # Unless something (of a lower priority) waited for too long
+            oldest, _queue = min(queues, key=lambda entry: entry[1][0][0])
+            if oldest != priority \
+                    and now - _queue[0][0] >= self.max_wait:
+                priority, queue = oldest, _queue
+                self.promoted += 1
+
+        queued, fn, callback = queue.popleft()
+        self._queued -= 1
+        self.max_delay = max(self.max_delay, now - queued)
+        return fn, callback
+
+    def _call(self, fn, callback):
+        """
+        Calls fn() and passes the result on to the callback
+        """
+        result = None
+        exception = None
+        try:
+            result = fn()
+
+        except Exception as e:
+            exception = e
+
+        if callback is not None:
+            try:
+                callback(result, exception)
+
+            except Exception:
+                logger.exception("Delivery Callback Exception")
+
+    def _worker(self):
+        """
+        Our worker thread; it delivers our notifications until we're shut
+        down.
+        """
+        SCHEDULER_LOCAL.worker = True
+
+        while True:
+            with self._cond:
+                entry = self._next()
+                while entry is None:
+                    if self._shutdown:
+                        self._threads -= 1
+                        return
+
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    entry = self._next()
+
+            self._call(*entry)
+
+            with self._cond:
+                self.completed += 1
+
+
+def delivery_scheduler():
+    """
+    Returns our (shared) delivery scheduler
+    """
+    global DELIVERY_SCHEDULER
+
+    with DELIVERY_SCHEDULER_LOCK:
+        if DELIVERY_SCHEDULER is None:
+            DELIVERY_SCHEDULER = DeliveryScheduler(
+                workers=SCHEDULER_WORKERS, max_wait=SCHEDULER_MAX_WAIT)
+
+        return DELIVERY_SCHEDULER
+
+
+def delivery_scheduler_reset():
+    """
+    Shuts down our (shared) delivery scheduler; a new one (using the current
+    SCHEDULER_WORKERS and SCHEDULER_MAX_WAIT values) is created the next time
+    it's needed.
+    """
+    global DELIVERY_SCHEDULER
+
+    with DELIVERY_SCHEDULER_LOCK:
+        scheduler = DELIVERY_SCHEDULER
+        DELIVERY_SCHEDULER = None
+
+    if scheduler is not None:
+        scheduler.shutdown()
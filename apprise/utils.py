@@ -29,7 +29,10 @@ import sys
 import json
 import contextlib
 import os
+import zlib
+import base64
 import hashlib
+from collections import OrderedDict
 from itertools import chain
 from os.path import expanduser
 from functools import reduce
@@ -221,10 +224,95 @@ UUID4_RE = re.compile(
     r'[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}',
     re.IGNORECASE)
 
+# Used to detect IPv4 Addresses
+# Based on https://stackoverflow.com/questions/5284147/\
+#       validating-ipv4-addresses-with-regexp
+IS_IPV4_RE = re.compile(
+    r'^(?P<ip>((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
+    r'(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))$'
+)
+
+# Used to detect IPv6 Addresses
+# Based on https://stackoverflow.com/questions/53497/\
+#              regular-expression-that-matches-valid-ipv6-addresses
+#
+# IPV6 URLs should be enclosed in square brackets when placed on a URL
+#   Source: https://tools.ietf.org/html/rfc2732
+#   - For this reason, they are additionally checked for existance
+IS_IPV6_RE = re.compile(
+    r'\[?(?P<ip>(([0-9a-f]{1,4}:){7,7}[0-9a-f]{1,4}|([0-9a-f]{1,4}:)'
+    r'{1,7}:|([0-9a-f]{1,4}:){1,6}:[0-9a-f]{1,4}|([0-9a-f]{1,4}:){1,5}'
+    r'(:[0-9a-f]{1,4}){1,2}|([0-9a-f]{1,4}:){1,4}'
+    r'(:[0-9a-f]{1,4}){1,3}|([0-9a-f]{1,4}:){1,3}'
+    r'(:[0-9a-f]{1,4}){1,4}|([0-9a-f]{1,4}:){1,2}'
+    r'(:[0-9a-f]{1,4}){1,5}|[0-9a-f]{1,4}:'
+    r'((:[0-9a-f]{1,4}){1,6})|:((:[0-9a-f]{1,4}){1,7}|:)|'
+    r'fe80:(:[0-9a-f]{0,4}){0,4}%[0-9a-z]{1,}|::'
+    r'(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]'
+    r'|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|'
+    r'1{0,1}[0-9]){0,1}[0-9])|([0-9a-f]{1,4}:){1,4}:((25[0-5]|'
+    r'(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|'
+    r'1{0,1}[0-9]){0,1}[0-9])))\]?', re.I,
+)
+
+# A quick check to see if our hostname could be an IPv4 Address
+IS_IPV4_HINT_RE = re.compile(r'[0-9.]+')
+
+# Used to validate each label of a hostname
+IS_HOSTNAME_LABEL_RE = re.compile(
+    r'^([a-z0-9][a-z0-9_-]{1,62}|[a-z_-])(?<![_-])$', re.IGNORECASE)
+
+# Used to validate each label of a hostname (where underscores are not
+# permitted)
+IS_HOSTNAME_STRICT_LABEL_RE = re.compile(
+    r'^([a-z0-9][a-z0-9-]{1,62}|[a-z-])(?<!-)$', re.IGNORECASE)
+
+# Used to separate the port from the hostname
+URL_PORT_RE = re.compile(
+    r'^(?P<host>(\[[0-9a-f:]+\]|[^:]+)):(?P<port>[^:]*)$')
+
+# Used to separate the user from the host and the password from the user
+URL_USER_DELIM_RE = re.compile(r'[@]+')
+URL_PASSWORD_DELIM_RE = re.compile(r'[:]+')
+
+# Used to detect if a port contains a digit
+HAS_DIGIT_RE = re.compile(r'[0-9]')
+
+# Used to strip non-digits from a phone number
+NON_DIGIT_RE = re.compile(r'[^\d]+')
+
 # validate_regex() utilizes this mapping to track and re-use pre-complied
 # regular expressions
 REGEX_VALIDATE_LOOKUP = {}
 
+# parse_url() tracks the results of the URLs it most recently parsed so that
+# the same URL (which is usually parsed several times over as it travels
+# through the config, plugin and attachment layers) is only ever tokenized
+# once.  Set the size to zero to disable caching.
+PARSE_URL_CACHE_SIZE = 4096
+PARSE_URL_CACHE = OrderedDict()
+
+# cwe312_url() tracks the URLs it most recently masked so that the same URL
+# logged several times over is only ever masked once.  Set the size to zero
+# to disable caching.
+CWE312_URL_CACHE_SIZE = 1024
+CWE312_URL_CACHE = OrderedDict()
+
+# tag_set() hands out immutable sets of tags; the tags we match against (and
+# the configuration entries sharing the same tags) share the same set.  The
+# least recently used sets are dropped once we hold onto this many of them.
+# Set the size to zero to disable caching.
+TAG_SET_CACHE_SIZE = 1024
+TAG_SET_CACHE = OrderedDict()
+
+# The (HTTP) Content-Encoding types compress() supports mapped to the zlib
+# window bits that produce them.  HTTP's deflate is zlib wrapped (and not a
+# raw deflate stream).
+CONTENT_ENCODINGS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
 
 class TemplateType(object):
     """
@@ -245,41 +333,13 @@ def is_ipaddr(addr, ipv4=True, ipv6=True):
     """
 
     if ipv4:
-        # Based on https://stackoverflow.com/questions/5284147/\
-        #       validating-ipv4-addresses-with-regexp
-        re_ipv4 = re.compile(
-            r'^(?P<ip>((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-            r'(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))$'
-        )
-        match = re_ipv4.match(addr)
+        match = IS_IPV4_RE.match(addr)
         if match is not None:
             # Return our matched IP
             return match.group('ip')
 
     if ipv6:
-        # Based on https://stackoverflow.com/questions/53497/\
-        #              regular-expression-that-matches-valid-ipv6-addresses
-        #
-        # IPV6 URLs should be enclosed in square brackets when placed on a URL
-        #   Source: https://tools.ietf.org/html/rfc2732
-        #   - For this reason, they are additionally checked for existance
-        re_ipv6 = re.compile(
-            r'\[?(?P<ip>(([0-9a-f]{1,4}:){7,7}[0-9a-f]{1,4}|([0-9a-f]{1,4}:)'
-            r'{1,7}:|([0-9a-f]{1,4}:){1,6}:[0-9a-f]{1,4}|([0-9a-f]{1,4}:){1,5}'
-            r'(:[0-9a-f]{1,4}){1,2}|([0-9a-f]{1,4}:){1,4}'
-            r'(:[0-9a-f]{1,4}){1,3}|([0-9a-f]{1,4}:){1,3}'
-            r'(:[0-9a-f]{1,4}){1,4}|([0-9a-f]{1,4}:){1,2}'
-            r'(:[0-9a-f]{1,4}){1,5}|[0-9a-f]{1,4}:'
-            r'((:[0-9a-f]{1,4}){1,6})|:((:[0-9a-f]{1,4}){1,7}|:)|'
-            r'fe80:(:[0-9a-f]{0,4}){0,4}%[0-9a-z]{1,}|::'
-            r'(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]'
-            r'|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|'
-            r'1{0,1}[0-9]){0,1}[0-9])|([0-9a-f]{1,4}:){1,4}:((25[0-5]|'
-            r'(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|'
-            r'1{0,1}[0-9]){0,1}[0-9])))\]?', re.I,
-        )
-
-        match = re_ipv6.match(addr)
+        match = IS_IPV6_RE.match(addr)
         if match is not None:
             # Return our matched IP between square brackets since that is
             # required for URL formatting as per RFC 2732.
@@ -306,7 +366,7 @@ def is_hostname(hostname, ipv4=True, ipv6=True, underscore=True):
     labels = hostname.split(".")
 
     # ipv4 check
-    if len(labels) == 4 and re.match(r'[0-9.]+', hostname):
+    if len(labels) == 4 and IS_IPV4_HINT_RE.match(hostname):
         return is_ipaddr(hostname, ipv4=ipv4, ipv6=False)
 
     # - RFC 1123 permits hostname labels to start with digits
@@ -320,11 +380,8 @@ def is_hostname(hostname, ipv4=True, ipv6=True, underscore=True):
     #   underscores in hostnames (if flag is set accordingly)
     # - labels can not exceed 63 characters
     # - allow single character alpha characters
-    allowed = re.compile(
-        r'^([a-z0-9][a-z0-9_-]{1,62}|[a-z_-])(?<![_-])$' if underscore else
-        r'^([a-z0-9][a-z0-9-]{1,62}|[a-z-])(?<!-)$',
-        re.IGNORECASE,
-    )
+    allowed = IS_HOSTNAME_LABEL_RE if underscore \
+        else IS_HOSTNAME_STRICT_LABEL_RE
 
     if not all(allowed.match(x) for x in labels):
         return is_ipaddr(hostname, ipv4=ipv4, ipv6=ipv6)
@@ -395,7 +452,7 @@ def is_phone_no(phone, min_len=10):
         return False
 
     # Tidy phone number up first
-    phone = re.sub(r'[^\d]+', '', phone)
+    phone = NON_DIGIT_RE.sub('', phone)
     if len(phone) > 14 or len(phone) < min_len:
         # Invalid phone number
         return False
@@ -591,17 +648,14 @@ def parse_qsd(qs, simple=False):
 
         # Apprise keys can start with a + symbol; so we need to skip over
         # the very first entry
-        key = '{}{}'.format(
-            '' if len(nv[0]) == 0 else nv[0][0],
-            '' if len(nv[0]) <= 1 else nv[0][1:].replace('+', ' '),
-        )
-
-        key = unquote(key)
-        key = '' if not key else key
+        key = nv[0][:1] + nv[0][1:].replace('+', ' ')
+        if '%' in key:
+            key = unquote(key)
 
         val = nv[1].replace('+', ' ')
-        val = unquote(val)
-        val = '' if not val else val.strip()
+        if '%' in val:
+            val = unquote(val)
+        val = val.strip()
 
         # Always Query String Dictionary (qsd) for every entry we have
         # content is always made lowercase for easy indexing
@@ -611,23 +665,29 @@ def parse_qsd(qs, simple=False):
             # move along
             continue
 
-        # Check for tokens that start with a addition/plus symbol (+)
-        k = NOTIFY_CUSTOM_ADD_TOKENS.match(key)
-        if k is not None:
-            # Store content 'as-is'
-            result['qsd+'][k.group('key')] = val
-
-        # Check for tokens that start with a subtraction/hyphen symbol (-)
-        k = NOTIFY_CUSTOM_DEL_TOKENS.match(key)
-        if k is not None:
-            # Store content 'as-is'
-            result['qsd-'][k.group('key')] = val
-
-        # Check for tokens that start with a colon symbol (:)
-        k = NOTIFY_CUSTOM_COLON_TOKENS.match(key)
-        if k is not None:
-            # Store content 'as-is'
-            result['qsd:'][k.group('key')] = val
+        # Only keys starting with a +, -, : (or space) can be custom tokens;
+        # this spares us from running our expressions against every key
+        prefix = key[:1]
+        if prefix in ('+', ' '):
+            # Check for tokens that start with a addition/plus symbol (+)
+            k = NOTIFY_CUSTOM_ADD_TOKENS.match(key)
+            if k is not None:
+                # Store content 'as-is'
+                result['qsd+'][k.group('key')] = val
+
+        elif prefix == '-':
+            # Check for tokens that start with a subtraction/hyphen symbol (-)
+            k = NOTIFY_CUSTOM_DEL_TOKENS.match(key)
+            if k is not None:
+                # Store content 'as-is'
+                result['qsd-'][k.group('key')] = val
+
+        elif prefix == ':':
+            # Check for tokens that start with a colon symbol (:)
+            k = NOTIFY_CUSTOM_COLON_TOKENS.match(key)
+            if k is not None:
+                # Store content 'as-is'
+                result['qsd:'][k.group('key')] = val
 
     return result
 
@@ -694,6 +754,48 @@ def parse_url(url, default_schema='http', verify_host=True, strict_port=False,
         # Simple error checking
         return None
 
+    key = (url, default_schema, verify_host, strict_port, simple)
+    try:
+        result = PARSE_URL_CACHE[key]
+
+    except KeyError:
+        result = _parse_url(
+            url, default_schema=default_schema, verify_host=verify_host,
+            strict_port=strict_port, simple=simple)
+
+        # Paths starting with a tilde (~) are expanded against the current
+        # environment and therefore can not be cached
+        if PARSE_URL_CACHE_SIZE > 0 and '~' not in url:
+            while len(PARSE_URL_CACHE) >= PARSE_URL_CACHE_SIZE:
+                try:
+                    # Drop our oldest entry
+                    PARSE_URL_CACHE.popitem(last=False)
+
+                except KeyError:
+                    # Another thread emptied our cache already
+                    break
+
+            PARSE_URL_CACHE[key] = result
+
+    if result is None:
+        return None
+
+    # Our callers are free to manipulate what we return, so always hand back
+    # a copy of our cached result
+    result = result.copy()
+    for qsd in ('qsd', 'qsd+', 'qsd-', 'qsd:'):
+        if qsd in result:
+            result[qsd] = result[qsd].copy()
+
+    return result
+
+
+def _parse_url(url, default_schema='http', verify_host=True,
+               strict_port=False, simple=False):
+    """
+    The uncached implementation of parse_url(); see parse_url() for details.
+    """
+
     # Default Results
     result = {
         # The username (if specified)
@@ -789,7 +891,7 @@ def parse_url(url, default_schema='http', verify_host=True, strict_port=False,
 
     try:
         (result['user'], result['host']) = \
-            re.split(r'[@]+', result['host'])[:2]
+            URL_USER_DELIM_RE.split(result['host'])[:2]
 
     except ValueError:
         # no problem then, host only exists
@@ -799,7 +901,7 @@ def parse_url(url, default_schema='http', verify_host=True, strict_port=False,
     if result.get('user') is not None:
         try:
             (result['user'], result['password']) = \
-                re.split(r'[:]+', result['user'])[:2]
+                URL_PASSWORD_DELIM_RE.split(result['user'])[:2]
 
         except ValueError:
             # no problem then, user only exists
@@ -807,9 +909,7 @@ def parse_url(url, default_schema='http', verify_host=True, strict_port=False,
             pass
 
     # Port Parsing
-    pmatch = re.search(
-        r'^(?P<host>(\[[0-9a-f:]+\]|[^:]+)):(?P<port>[^:]*)$',
-        result['host'])
+    pmatch = URL_PORT_RE.search(result['host'])
 
     if pmatch:
         # Separate our port from our hostname (if port is detected)
@@ -823,7 +923,7 @@ def parse_url(url, default_schema='http', verify_host=True, strict_port=False,
             # (and the .2 lost)
             result['port'] = int(
                 pmatch.group('port')
-                if re.search(r'[0-9]', pmatch.group('port')) else 'x')
+                if HAS_DIGIT_RE.search(pmatch.group('port')) else 'x')
 
         except ValueError:
             if verify_host:
@@ -1177,7 +1277,7 @@ def parse_list(*args):
         if isinstance(arg, six.string_types):
             result += re.split(STRING_DELIMITERS, arg)
 
-        elif isinstance(arg, (set, list, tuple)):
+        elif isinstance(arg, (set, frozenset, list, tuple)):
             result += parse_list(*arg)
 
     #
@@ -1189,6 +1289,59 @@ def parse_list(*args):
     return sorted([x for x in filter(bool, list(set(result)))])
 
 
+def tag_set(*args):
+    """
+    Takes the same arguments as parse_list() and returns the tags parsed as
+    an immutable (frozen) set.
+
+    The same set object is returned for the same tags (for as long as they
+    remain cached); there is no reason for thousands of configuration entries
+    all tagged the same way to each hold their own copy.
+    """
+    tags = frozenset(parse_list(*args))
+    try:
+        # Re-inserting our tags marks them as the most recently used
+        tags = TAG_SET_CACHE.pop(tags)
+
+    except KeyError:
+        while len(TAG_SET_CACHE) >= TAG_SET_CACHE_SIZE > 0:
+            try:
+                # Drop our least recently used entry
+                TAG_SET_CACHE.popitem(last=False)
+
+            except KeyError:
+                # Another thread emptied our cache already
+                break
+
+    if TAG_SET_CACHE_SIZE > 0:
+        TAG_SET_CACHE[tags] = tags
+
+    return tags
+
+
+def tag_logic(logic):
+    """
+    Parses the logic is_exclusive_match() takes up front; each of its (or'ed)
+    entries is turned into a (frozen) set of the tags it requires.  The
+    result can be handed to is_exclusive_match() for every service it's
+    compared against without having to be parsed over and over again.
+
+    Anything that can't be parsed is returned (or kept) as is so that
+    is_exclusive_match() still treats it like it otherwise would.
+    """
+
+    if isinstance(logic, six.string_types):
+        return [frozenset(parse_list(entry)) for entry in parse_list(logic)]
+
+    if not logic or not isinstance(logic, (list, tuple, set, frozenset)):
+        return logic
+
+    return [
+        frozenset(parse_list(entry)) if isinstance(
+            entry, (six.string_types, list, tuple, set)) else entry
+        for entry in logic]
+
+
 def is_exclusive_match(logic, data, match_all=common.MATCH_ALL_TAG,
                        match_always=common.MATCH_ALWAYS_TAG):
     """
@@ -1209,18 +1362,21 @@ def is_exclusive_match(logic, data, match_all=common.MATCH_ALL_TAG,
 
     If `match_always` is not set to None, then its value is added as an 'or'
     to all specified logic searches.
+
+    The logic can also be parsed ahead of time using tag_logic(); its
+    (frozen) sets of tags are used as they are.
     """
 
     if isinstance(logic, six.string_types):
         # Update our logic to support our delimiters
-        logic = set(parse_list(logic))
+        logic = tag_logic(logic)
 
     if not logic:
         # If there is no logic to apply then we're done early; we only match
         # if there is also no data to match against
         return not data
 
-    if not isinstance(logic, (list, tuple, set)):
+    if not isinstance(logic, (list, tuple, set, frozenset)):
         # garbage input
         return False
 
@@ -1234,13 +1390,15 @@ def is_exclusive_match(logic, data, match_all=common.MATCH_ALL_TAG,
 
     # Every entry here will be or'ed with the next
     for entry in logic:
-        if not isinstance(entry, (six.string_types, list, tuple, set)):
+        if not isinstance(
+                entry, (six.string_types, list, tuple, set, frozenset)):
             # Garbage entry in our logic found
             return False
 
         # treat these entries as though all elements found
         # must exist in the notification service
-        entries = set(parse_list(entry))
+        entries = entry if isinstance(entry, frozenset) \
+            else frozenset(parse_list(entry))
         if not entries:
             # We got a bogus set of tags to parse
             # If there is no logic to apply then we're done early; we only
@@ -1444,6 +1602,34 @@ def cwe312_url(url):
     The idea is that the URL can still be interpreted by the person who
     constructed them, but not to an intruder.
     """
+    try:
+        return CWE312_URL_CACHE[url]
+
+    except (KeyError, TypeError):
+        # KeyError: the URL has not been masked yet
+        # TypeError: the URL is not hashable (and therefore not a string)
+        pass
+
+    masked = _cwe312_url(url)
+    if CWE312_URL_CACHE_SIZE > 0 and isinstance(url, six.string_types):
+        while len(CWE312_URL_CACHE) >= CWE312_URL_CACHE_SIZE:
+            try:
+                # Drop our oldest entry
+                CWE312_URL_CACHE.popitem(last=False)
+
+            except KeyError:
+                # Another thread emptied our cache already
+                break
+
+        CWE312_URL_CACHE[url] = masked
+
+    return masked
+
+
+def _cwe312_url(url):
+    """
+    The uncached implementation of cwe312_url(); see cwe312_url() for details.
+    """
     # Parse our URL
     results = parse_url(url)
     if not results:
@@ -1504,6 +1690,227 @@ def cwe312_url(url):
     )
 
 
+class CWE312URL(object):
+    """
+    A deferred cwe312_url() intended to be passed as a logging argument:
+
+        logger.debug('Loaded URL: %s', CWE312URL(url))
+
+    The URL is only masked if (and when) the log record is actually emitted.
+    """
+
+    __slots__ = ('url', )
+
+    def __init__(self, url):
+        """
+        Store the URL we will mask on demand
+        """
+        self.url = url
+
+    def __str__(self):
+        """
+        Returns the masked URL
+        """
+        return cwe312_url(self.url)
+
+    def __repr__(self):
+        """
+        Returns the masked URL
+        """
+        return repr(cwe312_url(self.url))
+
+
+class StreamPayload(object):
+    """
+    A (request) body assembled from strings and the contents of files.  The
+    files are only read (a chunk at a time) as the body is sent rather than
+    all being loaded into memory up front:
+
+        payload = StreamPayload()
+        payload.write('<Attachment>')
+        payload.write_file('/path/to/file', base64=True)
+        payload.write('</Attachment>')
+
+        requests.post(url, data=payload)
+
+    Its length is known ahead of time so that it's still posted with a
+    Content-Length (instead of being chunked).  It can also be rewound (see
+    seek()) so that it can be sent again when requests follows a 307/308
+    redirect; our files are simply read over again.
+    """
+
+    # The number of bytes we read from our files at a time; this must be a
+    # multiple of 3 so that each chunk can be base64 encoded on its own
+    chunk_size = 65535
+
+    def __init__(self):
+        """
+        Initialize our (empty) payload
+        """
+        # Our bytes and (path, base64) file references
+        self._parts = []
+        self._length = 0
+
+        # Tracks our progress through read(); our buffer holds the chunk we
+        # are part way through (from offset on)
+        self._reader = None
+        self._buffer = b''
+        self._offset = 0
+        self._position = 0
+
+    def write(self, data):
+        """
+        Appends the (text or bytes) data provided to our payload
+        """
+        if isinstance(data, six.text_type):
+            data = data.encode('utf-8')
+
+        self._parts.append(data)
+        self._length += len(data)
+
+    def write_file(self, path, base64=False):
+        """
+        Appends the contents of the file (optionally base64 encoded) found at
+        the path specified to our payload.  An OSError is raised if it can't
+        be accessed.
+        """
+        with open(path, 'rb') as f:
+            # We're only ever reading our file later on, but this ensures
+            # we can
+            size = os.fstat(f.fileno()).st_size
+
+        self._parts.append((path, base64))
+        self._length += 4 * ((size + 2) // 3) if base64 else size
+
+    def getvalue(self):
+        """
+        Returns our entire payload (as bytes)
+        """
+        return b''.join(self)
+
+    def __iter__(self):
+        """
+        Generates the (byte) chunks that make up our payload
+        """
+        for part in self._parts:
+            if isinstance(part, six.binary_type):
+                yield part
+                continue
+
+            path, encode = part
+            with open(path, 'rb') as f:
+                while True:
+                    chunk = f.read(self.chunk_size)
+                    if not chunk:
+                        break
+
+                    yield base64.b64encode(chunk) if encode else chunk
+
+    def read(self, size=-1):
+        """
+        Allows our payload to be read like a file
+        """
+        if self._reader is None:
+            self._reader = iter(self)
+
+        available = len(self._buffer) - self._offset
+        if 0 <= size <= available:
+            # We can take what we need from the chunk we're already in
+            data = self._buffer[self._offset:self._offset + size]
+            self._offset += size
+            self._position += size
+            return data
+
+        parts = [self._buffer[self._offset:]] if available else []
+        remaining = size - available
+        self._buffer = b''
+        self._offset = 0
+
+        while size < 0 or remaining > 0:
+            try:
+                chunk = next(self._reader)
+
+            except StopIteration:
+                break
+
+            if 0 <= remaining < len(chunk):
+                # Hold onto what is left of our chunk for next time
+                parts.append(chunk[:remaining])
+                self._buffer = chunk
+                self._offset = remaining
+                break
+
+            parts.append(chunk)
+            remaining -= len(chunk)
+
+        data = b''.join(parts)
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """
+        Returns our current position (see read())
+        """
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """
+        Moves our read() position; moving back rewinds our payload (and
+        reads it over again up until the position requested).
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+
+        elif whence == os.SEEK_END:
+            offset += self._length
+
+        offset = max(0, offset)
+        if offset < self._position:
+            # Start over
+            self._reader = None
+            self._buffer = b''
+            self._offset = 0
+            self._position = 0
+
+        while self._position < offset:
+            if not self.read(min(offset - self._position, self.chunk_size)):
+                # We've reached the end of our payload
+                break
+
+        return self._position
+
+    def __len__(self):
+        """
+        Returns the length of our payload (in bytes)
+        """
+        return self._length
+
+
+def compress(data, encoding='gzip', level=6):
+    """
+    Returns the data provided compressed (as bytes) using the Content-Encoding
+    (see CONTENT_ENCODINGS) specified.
+
+    The data can be text, bytes or an iterable of (byte) chunks such as a
+    StreamPayload; the latter is compressed a chunk at a time as it's read.
+    """
+    if isinstance(data, (six.text_type, six.binary_type)):
+        data = (data, )
+
+    compressor = zlib.compressobj(
+        level, zlib.DEFLATED, CONTENT_ENCODINGS[encoding])
+
+    chunks = []
+    for chunk in data:
+        if isinstance(chunk, six.text_type):
+            chunk = chunk.encode('utf-8')
+
+        chunks.append(compressor.compress(chunk))
+
+    chunks.append(compressor.flush())
+    return b''.join(chunks)
+
+
 @contextlib.contextmanager
 def environ(*remove, **update):
     """
@@ -39,6 +39,7 @@ except ImportError:
 
 from os.path import dirname
 from os.path import join
+from os.path import isfile
 
 from apprise import Apprise
 from apprise import AppriseAsset
@@ -917,7 +918,9 @@ def test_apprise_asset(tmpdir):
         NotifyImageSize.XY_256,
         must_exist=True) is not None
 
-    # Test case where we can't access the image file
+    # Test case where we can't access the image file (which requires that
+    # it isn't already cached)
+    AppriseAsset.image_cache_reset()
     if sys.version_info.major <= 2:
         # Python v2.x
         with mock.patch('__builtin__.open', side_effect=OSError()):
@@ -974,6 +977,92 @@ def test_apprise_asset(tmpdir):
         'http://localhost/default/info-256x256.test'
 
 
+def test_apprise_asset_image_cache(tmpdir):
+    """
+    API: AppriseAsset() image caching
+
+    """
+    # Start with a fresh cache
+    AppriseAsset.image_cache_reset()
+
+    # Create a temporary theme
+    sub = tmpdir.mkdir("cache.theme")
+    image = sub.join("{0}-{1}.png".format(
+        NotifyType.INFO, NotifyImageSize.XY_256))
+    image.write("original")
+
+    a = AppriseAsset(
+        theme='cache.theme',
+        image_path_mask='%s/{THEME}/{TYPE}-{XY}.png' % dirname(sub.strpath),
+    )
+
+    with mock.patch('apprise.AppriseAsset.isfile', wraps=isfile) as \
+            mock_isfile:
+        assert a.image_path(
+            NotifyType.INFO, NotifyImageSize.XY_256) == image.strpath
+        assert a.image_path(
+            NotifyType.INFO, NotifyImageSize.XY_256) == image.strpath
+        # Our file was only checked for once
+        assert mock_isfile.call_count == 1
+
+        # Files that don't exist are cached too
+        assert a.image_path(NotifyType.INFO, NotifyImageSize.XY_72) is None
+        assert a.image_path(NotifyType.INFO, NotifyImageSize.XY_72) is None
+        assert mock_isfile.call_count == 2
+
+    # Our content is read once
+    assert a.image_raw(NotifyType.INFO, NotifyImageSize.XY_256) == \
+        b'original'
+    image.write("changed")
+    assert a.image_raw(NotifyType.INFO, NotifyImageSize.XY_256) == \
+        b'original'
+
+    # Our cache is shared with other assets configured the same way
+    b = AppriseAsset(
+        theme='cache.theme',
+        image_path_mask='%s/{THEME}/{TYPE}-{XY}.png' % dirname(sub.strpath),
+    )
+    assert b.image_raw(NotifyType.INFO, NotifyImageSize.XY_256) == \
+        b'original'
+
+    # But not with those that have disabled caching
+    c = AppriseAsset(
+        theme='cache.theme',
+        image_path_mask='%s/{THEME}/{TYPE}-{XY}.png' % dirname(sub.strpath),
+        image_cache=False,
+    )
+    assert c.image_raw(NotifyType.INFO, NotifyImageSize.XY_256) == \
+        b'changed'
+    # Nothing is preloaded without a cache
+    assert c.preload_images() == 0
+
+    # Resetting our cache causes our content to be read again
+    AppriseAsset.image_cache_reset()
+    assert a.image_raw(NotifyType.INFO, NotifyImageSize.XY_256) == \
+        b'changed'
+
+    # Preload our theme; only 1 of our images exists
+    AppriseAsset.image_cache_reset()
+    assert a.preload_images() == 1
+
+    # Our default theme has all of its images
+    AppriseAsset.image_cache_reset()
+    assert AppriseAsset().preload_images() == \
+        len(common.NOTIFY_TYPES) * len(common.NOTIFY_IMAGE_SIZES)
+
+    with mock.patch.object(
+            six.moves.builtins, 'open', side_effect=OSError()):
+        # Our content is already loaded
+        assert AppriseAsset().image_raw(
+            NotifyType.INFO, NotifyImageSize.XY_256) is not None
+
+    # Our template tokens are not case sensitive
+    a = AppriseAsset(
+        image_url_mask='http://localhost/{theme}/{Type}-{XY}{extension}')
+    assert a.image_url(NotifyType.INFO, NotifyImageSize.XY_256) == \
+        'http://localhost/default/info-256x256.png'
+
+
 def test_apprise_disabled_plugins():
     """
     API: Apprise() Disabled Plugin States
@@ -1880,6 +1969,44 @@ def test_apprise_async_mode(mock_async_notify, mock_post, tmpdir):
     mock_async_notify.reset_mock()
 
 
+def test_apprise_close():
+    """
+    API: Apprise() close()
+
+    """
+    from apprise import AppriseConfig
+
+    a = Apprise()
+    assert a.add('json://localhost') is True
+
+    # Configuration not yet loaded is not loaded just to close it
+    config = AppriseConfig()
+    assert config.add('file:///path/does/not/exist') is True
+    assert a.add(config) is True
+
+    loaded = AppriseConfig()
+    assert loaded.add_config('xml://localhost') is True
+    assert a.add(loaded) is True
+    # Force our configuration to load
+    assert len(loaded.servers()) == 1
+
+    # Closing a service without any resources does nothing
+    assert a[0].close() is None
+
+    with mock.patch.object(URLBase, 'close') as mock_close:
+        a.close()
+        # Our directly added server and the one loaded from our
+        # configuration were closed
+        assert mock_close.call_count == 2
+
+    # Our Apprise object can be used in a with block; our services are
+    # closed when it's exited
+    with mock.patch.object(Apprise, 'close') as mock_close:
+        with Apprise() as a:
+            assert isinstance(a, Apprise)
+        assert mock_close.call_count == 1
+
+
 def test_notify_matrix_dynamic_importing(tmpdir):
     """
     API: Apprise() Notify Matrix Importing
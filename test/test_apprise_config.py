@@ -26,6 +26,8 @@
 import sys
 import six
 import io
+import time
+import threading
 try:
     # Python 3.x
     from unittest import mock
@@ -42,6 +44,7 @@ from apprise import Apprise
 from apprise import AppriseConfig
 from apprise import AppriseAsset
 from apprise.config.ConfigBase import ConfigBase
+from apprise.config.ConfigBase import ConfigEntry
 from apprise.plugins.NotifyBase import NotifyBase
 
 from apprise.common import CONFIG_SCHEMA_MAP
@@ -451,6 +454,127 @@ def test_apprise_config_tagging(tmpdir):
     assert len(ac.servers(tag='d', match_always=False)) == 1
 
 
+@mock.patch('requests.post')
+def test_apprise_config_lazy_instantiation(mock_post):
+    """
+    API: AppriseConfig lazy service instantiation
+
+    """
+    # Prepare our response
+    response = mock.Mock()
+    response.status_code = 200
+    mock_post.return_value = response
+
+    # Create ourselves a config object
+    ac = AppriseConfig()
+    assert ac.add_config("""
+    a=json://localhost/a
+    b=json://localhost/b
+    c, always=xml://localhost/c
+
+    # This is missing its token; but we won't know that until we load it
+    d=pbul://
+    """) is True
+
+    a = Apprise()
+    assert a.add(ac) is True
+
+    entries = ac[0].entries()
+    assert len(entries) == 4
+    assert all(isinstance(e, ConfigEntry) for e in entries)
+
+    # Only what we match is instantiated
+    servers = list(a.find('b'))
+    assert len(servers) == 2
+    assert isinstance(entries[0], ConfigEntry)
+    assert isinstance(entries[1], NotifyBase)
+    assert isinstance(entries[2], NotifyBase)
+    assert isinstance(entries[3], ConfigEntry)
+    assert entries[1] in servers
+
+    # Our services are only ever instantiated once
+    assert servers[0] is next(a.find('b', match_always=False))
+
+    # We notify what matched our tag (and our 'always' entry)
+    assert a.notify('body', tag='b') is True
+    assert mock_post.call_count == 2
+    assert isinstance(entries[3], ConfigEntry)
+
+    # Our invalid entry is never returned
+    assert list(a.find('d', match_always=False)) == []
+    assert isinstance(entries[3], ConfigEntry)
+    assert entries[3].instantiate() is None
+
+    # We can tell that we have services by only instantiating them until
+    # one of them loads (as notify() did above)
+    assert a
+    assert isinstance(entries[0], NotifyBase)
+    assert isinstance(entries[3], ConfigEntry)
+
+    # Anything that needs all of our services instantiates everything;
+    # entries that can't be loaded are dropped
+    assert len(a) == 3
+    assert len(entries) == 3
+    assert all(isinstance(e, NotifyBase) for e in entries)
+
+    # Eager parsing returns instantiated objects
+    servers, configs = ConfigBase.config_parse(
+        "json://localhost", config_format=ConfigFormat.TEXT)
+    assert len(servers) == 1
+    assert isinstance(servers[0], NotifyBase)
+
+    # Lazy parsing doesn't
+    for content in ("json://localhost", "urls:\n  - json://localhost"):
+        servers, configs = ConfigBase.config_parse(content, lazy=True)
+        assert len(servers) == 1
+        assert isinstance(servers[0], ConfigEntry)
+        assert servers[0].schema == 'json'
+        assert isinstance(servers[0].instantiate(), NotifyBase)
+
+    # Closing a entry that was never instantiated is harmless
+    servers, configs = ConfigBase.config_parse("json://localhost", lazy=True)
+    servers[0].close()
+
+    # An empty configuration has no services
+    ac = AppriseConfig()
+    assert ac.add_config("# nothing here", format=ConfigFormat.TEXT) is True
+    a = Apprise()
+    assert a.add(ac) is True
+    assert not a
+    assert a.notify('body') is False
+
+    # Nor does one whose services can't be loaded
+    ac = AppriseConfig()
+    assert ac.add_config("pover://abc", format=ConfigFormat.TEXT) is True
+    assert not ac[0]
+    a = Apprise()
+    assert a.add(ac) is True
+    assert not a
+    assert len(a) == 0
+
+    # Services requested by several threads at the same time are only ever
+    # instantiated once
+    servers, configs = ConfigBase.config_parse("json://localhost", lazy=True)
+    entry = servers[0]
+    results = []
+    with mock.patch.dict(NOTIFY_SCHEMA_MAP, {
+            'json': mock.Mock(side_effect=lambda **kwargs: (
+                time.sleep(0.1), object())[1])}):
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(entry.instantiate()))
+            for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert NOTIFY_SCHEMA_MAP['json'].call_count == 1
+
+    assert len(results) == 4
+    assert all(r is results[0] for r in results)
+
+
 def test_apprise_config_instantiate():
     """
     API: AppriseConfig.instantiate()
@@ -849,12 +973,12 @@ include strict://{}""".format(str(cfg04), str(cfg04), str(cfg04)))
     # load our configuration
     assert ac.add(configs=str(cfg01)) is True
 
-    # verify one configuration file loaded however since it recursively
-    # loaded itself 1 more time, it still doesn't impact the load count:
+    # verify one configuration file loaded
     assert len(ac) == 1
 
-    # 2 services loaded now that we loaded the same file twice
-    assert len(ac.servers()) == 2
+    # Still just 1 service; a configuration file is never included more than
+    # once (this includes itself)
+    assert len(ac.servers()) == 1
 
     #
     # Now we test relative file inclusion
@@ -872,9 +996,8 @@ include strict://{}""".format(str(cfg04), str(cfg04), str(cfg04)))
     # verify it loaded
     assert len(ac) == 1
 
-    # 11 services loaded because we reloaded ourselves 10 times
-    # after loading the first entry
-    assert len(ac.servers()) == 11
+    # Our recursion doesn't get the better of us; we never reload ourselves
+    assert len(ac.servers()) == 1
 
     # Test our include modes (strict, always, and never)
 
@@ -919,6 +1042,111 @@ include strict://{}""".format(str(cfg04), str(cfg04), str(cfg04)))
     assert len(ac.servers()) == 3
 
 
+def test_apprise_config_concurrent_loading():
+    """
+    API: AppriseConfig() concurrent loading of configuration and includes
+
+    """
+
+    # Our configuration keyed by host; note that d:// is included by both
+    # b:// and c:// and that it includes a:// (which includes it)
+    content = {
+        'a': 'json://localhost/a\ninclude slow://b\ninclude slow://c',
+        'b': 'json://localhost/b\ninclude slow://d',
+        'c': 'json://localhost/c\ninclude slow://d',
+        'd': 'json://localhost/d\ninclude slow://a',
+    }
+
+    lock = threading.Lock()
+    stats = {'active': 0, 'max_active': 0, 'reads': []}
+
+    class ConfigSlow(ConfigBase):
+        """
+        A configuration source that takes its time to read
+        """
+
+        service_name = 'slow'
+
+        protocol = 'slow'
+
+        allow_cross_includes = ContentIncludeMode.ALWAYS
+
+        def url(self, privacy=False, *args, **kwargs):
+            return 'slow://{}'.format(self.host)
+
+        def read(self, **kwargs):
+            with lock:
+                stats['reads'].append(self.host)
+                stats['active'] += 1
+                stats['max_active'] = max(
+                    stats['max_active'], stats['active'])
+
+            time.sleep(0.2)
+
+            with lock:
+                stats['active'] -= 1
+
+            return content.get(self.host, 'json://localhost/' + self.host)
+
+        @staticmethod
+        def parse_url(url):
+            return ConfigBase.parse_url(url, verify_host=False)
+
+    CONFIG_SCHEMA_MAP['slow'] = ConfigSlow
+
+    try:
+        ac = AppriseConfig(recursion=5)
+        assert ac.add('slow://a') is True
+
+        # Every service is loaded once; even though d:// is included twice
+        # and a:// includes itself (by way of d://)
+        assert sorted(s.url().split('/')[-1].split('?')[0]
+                      for s in ac.servers()) == ['a', 'b', 'c', 'd']
+        assert sorted(stats['reads']) == ['a', 'b', 'c', 'd']
+
+        # b:// and c:// were fetched at the same time
+        assert stats['max_active'] == 2
+
+        # Our top level configuration sources are fetched at the same time
+        # too
+        stats['max_active'] = 0
+        del stats['reads'][:]
+
+        a = Apprise()
+        for host in ('e', 'f', 'g', 'h'):
+            assert a.add(AppriseConfig('slow://' + host)) is True
+
+        assert len(a) == 4
+        assert sorted(stats['reads']) == ['e', 'f', 'g', 'h']
+        assert stats['max_active'] == 4
+
+        # Our results were cached
+        assert len(a) == 4
+        assert len(stats['reads']) == 4
+
+        # The same configuration loaded from several threads at once is only
+        # read once; nobody sees it until it's complete
+        del stats['reads'][:]
+        cfg = ConfigSlow(host='a', recursion=5)
+        results = []
+
+        def load():
+            results.append(len(cfg.entries()))
+
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert results == [4] * 4
+        assert sorted(stats['reads']) == ['a', 'b', 'c', 'd']
+
+    finally:
+        del CONFIG_SCHEMA_MAP['slow']
+
+
 def test_apprise_config_matrix_load():
     """
     API: AppriseConfig() matrix initialization
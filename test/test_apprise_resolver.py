@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import time
+import socket
+import threading
+import pytest
+import requests
+
+from apprise import Apprise
+from apprise import AppriseAsset
+from apprise import resolver
+
+try:
+    # Python 3.x
+    from unittest import mock
+
+except ImportError:
+    # Python 2.7
+    import mock
+
+# Disable logging for a cleaner testing output
+import logging
+logging.disable(logging.CRITICAL)
+
+IPV4 = (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', 80))
+IPV6 = (socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('::1', 80, 0, 0))
+
+
+@pytest.fixture
+def listener():
+    """
+    A (local) server we can connect to
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(8)
+    yield sock
+    sock.close()
+
+
+def test_resolver_getaddrinfo():
+    """
+    resolver.getaddrinfo() Testing
+
+    """
+    resolver.uninstall()
+
+    with mock.patch.object(resolver, '_getaddrinfo') as mock_getaddrinfo:
+        mock_getaddrinfo.return_value = [IPV4]
+
+        # Nothing is cached by default
+        assert resolver.getaddrinfo('localhost', 80) == [IPV4]
+        assert resolver.getaddrinfo('localhost', 80) == [IPV4]
+        assert mock_getaddrinfo.call_count == 2
+        assert not resolver.RESOLVER_CACHE
+
+        resolver.install(ttl=60)
+        mock_getaddrinfo.reset_mock()
+        assert socket.getaddrinfo('localhost', 80) == [IPV4]
+        assert socket.getaddrinfo('localhost', 80) == [IPV4]
+        assert resolver.getaddrinfo('localhost', 80) == [IPV4]
+        assert mock_getaddrinfo.call_count == 1
+
+        # The arguments are all part of our key
+        assert resolver.getaddrinfo(
+            'localhost', 80, socket.AF_INET, socket.SOCK_STREAM) == [IPV4]
+        assert resolver.getaddrinfo('localhost', 443) == [IPV4]
+        assert mock_getaddrinfo.call_count == 3
+
+        # Our cached results can't be altered by the caller
+        resolver.getaddrinfo('localhost', 80).append(IPV6)
+        assert resolver.getaddrinfo('localhost', 80) == [IPV4]
+
+        # Our entries expire
+        with mock.patch('time.time', return_value=time.time() + 61):
+            assert resolver.getaddrinfo('localhost', 80) == [IPV4]
+        assert mock_getaddrinfo.call_count == 4
+
+        # Failures aren't cached
+        mock_getaddrinfo.side_effect = socket.gaierror()
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                resolver.getaddrinfo('invalid', 80)
+        assert mock_getaddrinfo.call_count == 6
+        mock_getaddrinfo.side_effect = None
+
+        # Our cache is bounded
+        with mock.patch.object(resolver, 'RESOLVER_CACHE_SIZE', 2):
+            resolver.getaddrinfo('a', 80)
+            resolver.getaddrinfo('b', 80)
+            resolver.getaddrinfo('c', 80)
+            assert len(resolver.RESOLVER_CACHE) == 2
+            assert ('a', 80, 0, 0, 0, 0) not in resolver.RESOLVER_CACHE
+
+    resolver.uninstall()
+    assert socket.getaddrinfo is resolver._getaddrinfo
+    assert not resolver.RESOLVER_CACHE
+
+
+def test_resolver_interleave():
+    """
+    resolver.interleave() Testing
+
+    """
+    a = (socket.AF_INET6, 1)
+    b = (socket.AF_INET6, 2)
+    c = (socket.AF_INET, 3)
+    d = (socket.AF_INET, 4)
+    e = (socket.AF_INET, 5)
+
+    assert resolver.interleave([]) == []
+    assert resolver.interleave([a, b, c, d, e]) == [a, c, b, d, e]
+    assert resolver.interleave([c, d, e, a, b]) == [c, a, d, b, e]
+    assert resolver.interleave([c, d]) == [c, d]
+
+
+@mock.patch.object(resolver, 'getaddrinfo')
+@mock.patch.object(resolver, '_connect')
+def test_resolver_create_connection(mock_connect, mock_getaddrinfo):
+    """
+    resolver.create_connection() Testing
+
+    """
+    v4 = mock.Mock()
+    v6 = mock.Mock()
+    release = threading.Event()
+
+    def connect(address, *args):
+        if address[0] == socket.AF_INET6:
+            # Our IPv6 network is broken
+            release.wait(10)
+            return v6
+
+        return v4
+
+    mock_connect.side_effect = connect
+    mock_getaddrinfo.return_value = [IPV6, IPV4]
+
+    # We don't have to wait for IPv6 to time out
+    start = time.time()
+    assert resolver.create_connection(('localhost', 80), timeout=30) is v4
+    assert time.time() - start < 5
+    assert mock_getaddrinfo.call_args[0][:2] == ('localhost', 80)
+
+    # Once our IPv6 connection completes it's closed (as we no longer need
+    # it)
+    release.set()
+    for _ in range(100):
+        if v6.close.called:
+            break
+        time.sleep(0.05)
+    assert v6.close.called is True
+    assert v4.close.called is False
+
+    # The first address to fail doesn't hold us up either
+    def connect(address, *args):
+        if address[0] == socket.AF_INET6:
+            raise socket.error('unreachable')
+        return v4
+
+    mock_connect.side_effect = connect
+    with mock.patch.object(resolver, 'RESOLVER_CONNECT_DELAY', 30):
+        start = time.time()
+        assert resolver.create_connection(('[::1]', 80)) is v4
+        assert time.time() - start < 5
+    assert mock_getaddrinfo.call_args[0][:2] == ('::1', 80)
+
+    # The connection completes after every address was tried
+    def connect(address, *args):
+        time.sleep(0.1)
+        return v4 if address[0] == socket.AF_INET else v6
+
+    mock_connect.side_effect = connect
+    with mock.patch.object(resolver, 'RESOLVER_CONNECT_DELAY', 0.01):
+        assert resolver.create_connection(('localhost', 80)) in (v4, v6)
+
+    # All of our addresses fail
+    mock_connect.side_effect = socket.error('unreachable')
+    with pytest.raises(socket.error):
+        resolver.create_connection(('localhost', 80))
+
+    # A single address is simply connected to
+    mock_connect.reset_mock()
+    mock_connect.side_effect = None
+    mock_connect.return_value = v4
+    mock_getaddrinfo.return_value = [IPV4]
+    assert resolver.create_connection(('localhost', 80)) is v4
+    assert mock_connect.call_count == 1
+
+    # No addresses at all
+    mock_getaddrinfo.return_value = []
+    with pytest.raises(socket.error):
+        resolver.create_connection(('localhost', 80))
+
+
+def test_resolver_connect(listener):
+    """
+    resolver.create_connection() Socket Testing
+
+    """
+    port = listener.getsockname()[1]
+
+    # Our socket options, timeout and source address are applied
+    sock = resolver.create_connection(
+        ('127.0.0.1', port), timeout=5, source_address=('127.0.0.1', 0),
+        socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+    assert sock.gettimeout() == 5
+    assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+    sock.close()
+
+    # Our failures are passed along
+    with pytest.raises(socket.error):
+        resolver.create_connection(
+            ('127.0.0.1', port),
+            socket_options=[(socket.SOL_SOCKET, -1, 1)])
+
+    # urllib3 connects to us (possibly trying IPv6 first)
+    with mock.patch.object(
+            resolver, 'getaddrinfo',
+            return_value=[
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, '',
+                 ('::1', port, 0, 0)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, '',
+                 ('127.0.0.1', port))]):
+        sock = resolver.urllib3_create_connection(('localhost', port))
+        assert sock.getpeername()[:2] == ('127.0.0.1', port)
+        sock.close()
+
+        sock = resolver.urllib3_create_connection(
+            ('localhost', port), timeout=5)
+        assert sock.gettimeout() == 5
+        sock.close()
+
+
+@mock.patch('requests.post')
+def test_apprise_resolver(mock_post):
+    """
+    Apprise() DNS Cache Testing
+
+    """
+    resolver.uninstall()
+
+    response = mock.Mock()
+    response.content = ''
+    response.status_code = requests.codes.ok
+    mock_post.return_value = response
+
+    # Disabled by default
+    asset = AppriseAsset()
+    a = Apprise(asset=asset)
+    assert a.add('json://localhost')
+    assert a.notify('body') is True
+    assert socket.getaddrinfo is resolver._getaddrinfo
+    assert resolver.RESOLVER_TTL == 0
+
+    try:
+        asset.dns_cache_ttl = 30
+        assert a.notify('body') is True
+        assert socket.getaddrinfo is resolver.getaddrinfo
+        assert resolver.RESOLVER_TTL == 30
+        if resolver.urllib3_connection is not None:
+            assert resolver.urllib3_connection.create_connection \
+                is resolver.urllib3_create_connection
+
+        # Installing ourselves again is harmless
+        resolver.install(ttl=30)
+        assert socket.getaddrinfo is resolver.getaddrinfo
+
+    finally:
+        resolver.uninstall()
+
+    if resolver.urllib3_connection is not None:
+        assert resolver.urllib3_connection.create_connection \
+            is resolver._create_connection
+
+
+@mock.patch('socket.socket')
+def test_apprise_resolver_syslog(mock_socket):
+    """
+    NotifySyslog() DNS Cache Testing
+
+    """
+    mock_connection = mock.Mock()
+    mock_connection.sendto.return_value = 1024
+    mock_socket.return_value = mock_connection
+
+    obj = Apprise.instantiate('syslog://example.com/')
+
+    # Without our cache the host is passed along as is
+    resolver.uninstall()
+    assert obj.notify('body') is True
+    assert mock_connection.sendto.call_args[0][1] == ('example.com', 514)
+
+    try:
+        resolver.install(ttl=30)
+        with mock.patch.object(
+                resolver, '_getaddrinfo', return_value=[
+                    (socket.AF_INET, socket.SOCK_DGRAM, 17, '',
+                     ('192.0.2.1', 514))]) as mock_getaddrinfo:
+            assert obj.notify('body') is True
+            assert obj.notify('body') is True
+            assert mock_getaddrinfo.call_count == 1
+
+        assert mock_connection.sendto.call_args[0][1] == ('192.0.2.1', 514)
+
+    finally:
+        resolver.uninstall()
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import sys
+import threading
+import pytest
+import requests
+
+from apprise import Apprise
+from apprise import AppriseAsset
+from apprise import NotifyType
+from apprise import scheduler
+
+try:
+    # Python 3.x
+    from unittest import mock
+
+except ImportError:
+    # Python 2.7
+    import mock
+
+# Disable logging for a cleaner testing output
+import logging
+logging.disable(logging.CRITICAL)
+
+
+def blocked_scheduler(**kwargs):
+    """
+    Returns a scheduler (with a single worker) along with the event that
+    allows it to start delivering what was queued with it.
+    """
+    s = scheduler.DeliveryScheduler(workers=1, **kwargs)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(10)
+
+    s.submit(block)
+    assert started.wait(10)
+    return s, release
+
+
+def test_scheduler_priority():
+    """
+    DeliveryScheduler() Priority Testing
+
+    """
+    s, release = blocked_scheduler(max_wait=None)
+
+    delivered = []
+    done = threading.Event()
+
+    def deliver(name):
+        def fn():
+            delivered.append(name)
+            return name
+        return fn
+
+    for priority, name in ((0, 'info1'), (0, 'info2'), (3, 'failure'),
+                           (1, 'success'), (2, 'warning')):
+        s.submit(deliver(name), priority=priority)
+
+    results = []
+    s.submit(
+        deliver('last'),
+        callback=lambda r, e: (results.append((r, e)), done.set()),
+        priority=-1)
+
+    # Nothing is delivered until our worker is free
+    assert s.depth() == 6
+    assert s.depth(0) == 2
+    assert s.depth(3) == 1
+    assert s.depth(4) == 0
+    stats = s.stats()
+    assert stats['workers'] == 1
+    assert stats['busy'] == 1
+    assert stats['queued'] == {-1: 1, 0: 2, 1: 1, 2: 1, 3: 1}
+    assert stats['submitted'] == 7
+
+    release.set()
+    assert done.wait(10)
+
+    # The highest priorities are delivered first (in the order they were
+    # queued otherwise)
+    assert delivered == [
+        'failure', 'warning', 'success', 'info1', 'info2', 'last']
+    assert results == [('last', None)]
+
+    s.shutdown()
+
+    stats = s.stats()
+    assert stats['submitted'] == 7
+    assert stats['promoted'] == 0
+    assert stats['max_delay'] > 0
+    assert s.depth() == 0
+
+
+def test_scheduler_starvation():
+    """
+    DeliveryScheduler() Starvation Testing
+
+    """
+    # Everything waits for too long with a max_wait of zero so our
+    # notifications are delivered in the order they were queued
+    s, release = blocked_scheduler(max_wait=0)
+
+    delivered = []
+    done = threading.Event()
+    s.submit(lambda: delivered.append('info'), priority=0)
+    s.submit(lambda: delivered.append('failure'), priority=3)
+    s.submit(
+        lambda: delivered.append('success'),
+        callback=lambda r, e: done.set(), priority=1)
+
+    release.set()
+    assert done.wait(10)
+    assert delivered == ['info', 'failure', 'success']
+
+    # Only info skipped ahead (of failure); failure had the highest priority
+    # by the time it was delivered anyway
+    assert s.stats()['promoted'] == 1
+    s.shutdown()
+
+
+def test_scheduler_exceptions():
+    """
+    DeliveryScheduler() Exception Testing
+
+    """
+    s = scheduler.DeliveryScheduler(workers=2)
+    results = []
+    done = threading.Event()
+
+    def fn():
+        raise ValueError()
+
+    def callback(result, exception):
+        results.append((result, exception))
+        done.set()
+        # Exceptions thrown by our callback are ignored
+        raise TypeError()
+
+    s.submit(fn, callback=callback)
+    assert done.wait(10)
+    assert results[0][0] is None
+    assert isinstance(results[0][1], ValueError)
+
+    # Our worker is still alive
+    done.clear()
+    s.submit(lambda: True, callback=lambda r, e: done.set())
+    assert done.wait(10)
+
+    s.shutdown()
+
+    # Anything submitted after we're shut down is delivered by the caller
+    results = []
+    s.submit(lambda: 'inline', callback=lambda r, e: results.append(r))
+    assert results == ['inline']
+
+
+def test_scheduler_concurrency():
+    """
+    DeliveryScheduler() Concurrency Testing
+
+    """
+    s = scheduler.DeliveryScheduler(workers=8)
+
+    # Warm up; this leaves us with a single idle worker
+    done = threading.Event()
+    s.submit(lambda: True, callback=lambda r, e: done.set())
+    assert done.wait(10)
+
+    lock = threading.Lock()
+    stats = {'active': 0, 'max_active': 0}
+    release = threading.Event()
+    finished = []
+
+    def job():
+        with lock:
+            stats['active'] += 1
+            stats['max_active'] = max(stats['max_active'], stats['active'])
+            if stats['active'] == 8:
+                release.set()
+
+        # Wait for all of our jobs to be running at the same time
+        release.wait(10)
+        with lock:
+            stats['active'] -= 1
+
+    all_done = threading.Event()
+
+    def callback(result, exception):
+        with lock:
+            finished.append(result)
+            if len(finished) == 8:
+                all_done.set()
+
+    for _ in range(8):
+        s.submit(job, callback=callback)
+
+    assert all_done.wait(20)
+
+    # Our jobs overlapped (instead of queuing behind our idle worker)
+    assert stats['max_active'] == 8
+    assert s.stats()['workers'] == 8
+    assert s.depth() == 0
+    s.shutdown()
+
+
+def test_scheduler_nested():
+    """
+    DeliveryScheduler() Nested Testing
+
+    """
+    # Our only worker sends a notification of its own; it's delivered
+    # right away instead of waiting for a worker (our own) to free up
+    s = scheduler.DeliveryScheduler(workers=1)
+    results = []
+    done = threading.Event()
+
+    def nested():
+        s.submit(lambda: 'nested', callback=lambda r, e: results.append(r))
+        return 'outer'
+
+    s.submit(nested, callback=lambda r, e: (results.append(r), done.set()))
+    assert done.wait(10)
+    assert results == ['nested', 'outer']
+    s.shutdown()
+
+
+def test_delivery_scheduler():
+    """
+    delivery_scheduler() Testing
+
+    """
+    scheduler.delivery_scheduler_reset()
+
+    with mock.patch.object(scheduler, 'SCHEDULER_WORKERS', 3), \
+            mock.patch.object(scheduler, 'SCHEDULER_MAX_WAIT', None):
+        s = scheduler.delivery_scheduler()
+        assert s.workers == 3
+        assert s.max_wait is None
+
+    # We're shared
+    assert scheduler.delivery_scheduler() is s
+
+    scheduler.delivery_scheduler_reset()
+    assert scheduler.delivery_scheduler() is not s
+    assert scheduler.delivery_scheduler().workers > 0
+
+    # Resetting twice is harmless
+    scheduler.delivery_scheduler_reset()
+    scheduler.delivery_scheduler_reset()
+
+
+@pytest.mark.skipif(sys.version_info.major <= 2, reason="Requires Python 3.x+")
+@mock.patch('requests.post')
+def test_apprise_scheduler(mock_post):
+    """
+    Apprise() Delivery Scheduler Testing
+
+    """
+    response = mock.Mock()
+    response.content = ''
+    response.status_code = requests.codes.ok
+    mock_post.return_value = response
+
+    # Our failures are delivered ahead of everything else
+    asset = AppriseAsset()
+    assert asset.notify_priority_map[NotifyType.FAILURE] > \
+        asset.notify_priority_map[NotifyType.INFO]
+
+    submit = mock.Mock(wraps=scheduler.DeliveryScheduler.submit)
+    with mock.patch.object(
+            scheduler.DeliveryScheduler, 'submit', autospec=True,
+            side_effect=lambda *args, **kwargs: submit(*args, **kwargs)):
+
+        a = Apprise(asset=asset)
+        a.add('json://localhost')
+        a.add('json://localhost/path')
+        assert a.notify('body', notify_type=NotifyType.FAILURE) is True
+        assert submit.call_count == 2
+        assert all(
+            call[1]['priority'] == 3 for call in submit.call_args_list)
+
+        # Custom weights; unknown types have a priority of zero
+        submit.reset_mock()
+        asset.notify_priority_map = {NotifyType.INFO: 10}
+        assert a.notify('body', notify_type=NotifyType.INFO) is True
+        assert a.notify('body', notify_type=NotifyType.WARNING) is True
+        assert [call[1]['priority'] for call in submit.call_args_list] \
+            == [10, 10, 0, 0]
+
+    # Exceptions are still handled
+    mock_post.side_effect = TypeError()
+    assert a.notify('body') is False
+    mock_post.side_effect = OSError()
+    assert a.notify('body') is False
+
+    # Our notifications are still sent if we're run synchronously
+    mock_post.side_effect = None
+    asset.async_mode = False
+    mock_post.reset_mock()
+    assert a.notify('body') is True
+    assert mock_post.call_count == 2
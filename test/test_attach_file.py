@@ -24,7 +24,11 @@
 # THE SOFTWARE.
 
 import re
+import os
 import time
+import base64
+import hashlib
+import pytest
 try:
     # Python 3.x
     from unittest import mock
@@ -34,9 +38,11 @@ except ImportError:
     import mock
 
 from os.path import dirname
+from os.path import getsize
 from os.path import join
 from apprise.attachment.AttachBase import AttachBase
 from apprise.attachment.AttachFile import AttachFile
+from apprise import Apprise
 from apprise import AppriseAttachment
 from apprise.common import ContentLocation
 
@@ -130,23 +136,22 @@ def test_attach_file():
     # File handling (even if image is set to maxium allowable)
     response = AppriseAttachment.instantiate(path)
     assert isinstance(response, AttachFile)
-    with mock.patch('os.path.getsize', return_value=AttachBase.max_file_size):
+    with mock.patch.object(AttachBase, 'max_file_size', getsize(path)):
         # It will still work
         assert response.path == path
 
     # File handling when size is to large
     response = AppriseAttachment.instantiate(path)
     assert isinstance(response, AttachFile)
-    with mock.patch(
-            'os.path.getsize', return_value=AttachBase.max_file_size + 1):
+    with mock.patch.object(AttachBase, 'max_file_size', getsize(path) - 1):
         # We can't work in this case
         assert response.path is None
 
     # File handling when image is not available
     response = AppriseAttachment.instantiate(path)
     assert isinstance(response, AttachFile)
-    with mock.patch('os.path.isfile', return_value=False):
-        # This triggers a full check and will fail the isfile() check
+    with mock.patch('os.stat', side_effect=OSError()):
+        # This triggers a full check and will fail the stat() check
         assert response.path is None
 
     # The call to AttachBase.path automatically triggers a call to download()
@@ -166,8 +171,8 @@ def test_attach_file():
     # to download() fails
     response = AppriseAttachment.instantiate(path)
     assert isinstance(response, AttachFile)
-    with mock.patch('os.path.isfile', return_value=False):
-        # This triggers a full check and will fail the isfile() check
+    with mock.patch('os.stat', side_effect=OSError()):
+        # This triggers a full check and will fail the stat() check
         assert response.name is None
 
     # The call to AttachBase.path automatically triggers a call to download()
@@ -187,12 +192,12 @@ def test_attach_file():
     # to download() fails
     response = AppriseAttachment.instantiate(path)
     assert isinstance(response, AttachFile)
-    with mock.patch('os.path.isfile', return_value=False):
+    with mock.patch('os.stat', side_effect=OSError()):
         # download() fails so we don't have a mimetpe
         assert response.mimetype is None
         assert response.name is None
         assert response.path is None
-        # This triggers a full check and will fail the isfile() check
+        # This triggers a full check and will fail the stat() check
 
     # Force a mime-type and new name
     response = AppriseAttachment.instantiate(
@@ -208,3 +213,132 @@ def test_attach_file():
     # Test hosted configuration and that we can't add a valid file
     aa = AppriseAttachment(location=ContentLocation.HOSTED)
     assert aa.add(path) is False
+
+
+def test_attach_file_view(tmpdir):
+    """
+    API: AttachFile().view(), base64() and digest()
+
+    """
+    path = join(TEST_VAR_DIR, 'apprise-test.gif')
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    image = tmpdir.join('test.gif')
+    image.write(content, mode='wb')
+
+    response = AppriseAttachment.instantiate(str(image))
+    assert isinstance(response, AttachFile)
+    assert len(response) == len(content)
+
+    view = response.view()
+    assert bytes(view) == content
+
+    # Our memory map is shared between our views
+    assert response._mmap is not None
+    mapped = response._mmap
+    assert bytes(response.view()) == content
+    assert response._mmap is mapped
+
+    # Our (single) stat() of our content was cached
+    with mock.patch('os.stat', wraps=os.stat) as mock_stat:
+        assert response.exists()
+        assert response.name == 'test.gif'
+        assert len(response) == len(content)
+        assert mock_stat.call_count == 3
+
+    assert response.base64() == base64.b64encode(content).decode('ascii')
+    assert response.base64(encoding=None) == base64.b64encode(content)
+
+    lines = response.base64(lines=True)
+    assert max(len(line) for line in lines.splitlines()) == 76
+    assert base64.b64decode(lines) == content
+
+    assert response.digest() == hashlib.sha256(content).hexdigest()
+    assert response.digest('md5') == hashlib.md5(content).hexdigest()
+
+    # Our digests are cached
+    with mock.patch('hashlib.new') as mock_new:
+        assert response.digest() == hashlib.sha256(content).hexdigest()
+        assert mock_new.call_count == 0
+
+    # Our map is released (even while a view of it is still in use); our
+    # digests remain
+    response.release()
+    assert response._mmap is None
+    assert bytes(view) == content
+    with mock.patch('hashlib.new') as mock_new:
+        assert response.digest() == hashlib.sha256(content).hexdigest()
+        assert mock_new.call_count == 0
+
+    # Calculating a digest doesn't leave our content mapped
+    assert response.digest('sha1') == hashlib.sha1(content).hexdigest()
+    assert response._mmap is None
+
+    # Our content changes; what we cached about it is dropped
+    del view
+    image.write(content + b'more', mode='wb')
+    os.utime(str(image), (time.time() + 10, time.time() + 10))
+    assert response.digest() == hashlib.sha256(content + b'more').hexdigest()
+    assert bytes(response.view()) == content + b'more'
+    assert len(response) == len(content) + 4
+
+    # Content that changes on us is read (and no longer mapped) from here on
+    assert response._mmap is None
+    image.write(content[:10], mode='wb')
+    os.utime(str(image), (time.time() + 20, time.time() + 20))
+    assert bytes(response.view()) == content[:10]
+    assert response._mmap is None
+
+    # Until we're invalidated
+    image.write(content + b'more', mode='wb')
+    response.invalidate()
+    assert bytes(response.view()) == content + b'more'
+    assert response._mmap is not None
+
+    # A view that is still in use doesn't prevent us from releasing our
+    # memory map
+    view = response.view()
+    response.invalidate()
+    assert response._mmap is None
+    assert response._stat is None
+    assert bytes(view) == content + b'more'
+    del view
+
+    # The attachments we send are only mapped for as long as we send them
+    obj = Apprise.instantiate('json://localhost/')
+    attach = AppriseAttachment(str(image))
+
+    def send(attach, **kwargs):
+        assert bytes(attach[0].view()) == content + b'more'
+        assert attach[0]._mmap is not None
+        return True
+
+    with mock.patch.object(obj, 'send', side_effect=send) as mock_send:
+        assert obj.notify('body', attach=attach) is True
+        assert mock_send.call_count == 1
+        assert attach[0]._mmap is None
+
+    # Empty files can't be memory mapped
+    image.write(b'', mode='wb')
+    response = AppriseAttachment.instantiate(str(image))
+    assert bytes(response.view()) == b''
+    assert response.base64() == ''
+    assert response.digest() == hashlib.sha256(b'').hexdigest()
+    assert len(response) == 0
+
+    # Our content isn't available
+    response = AppriseAttachment.instantiate(str(tmpdir.join('missing')))
+    assert response.view() is None
+    assert response.base64() is None
+    assert response.digest() is None
+    assert len(response) == 0
+
+    # Our content can't be read
+    response = AppriseAttachment.instantiate(path)
+    with mock.patch('mmap.mmap', side_effect=OSError()):
+        with pytest.raises(OSError):
+            response.view()
+
+    # Directories aren't files
+    assert response.refresh(str(tmpdir)) is None
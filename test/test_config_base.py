@@ -29,8 +29,18 @@ from apprise.AppriseAsset import AppriseAsset
 from apprise.config.ConfigBase import ConfigBase
 from apprise import ConfigFormat
 from apprise import plugins
+from apprise.config.ConfigBase import YAMLSafeLoader
+from apprise.config.ConfigBase import TEMPLATE_DETAILS_CACHE
 import yaml
 
+try:
+    # Python v3.4+
+    from unittest import mock
+
+except ImportError:
+    # Python v2.7
+    import mock
+
 # Disable logging for a cleaner testing output
 import logging
 logging.disable(logging.CRITICAL)
@@ -989,3 +999,65 @@ include: [file:///absolute/path/, relative/path, http://test.com]
     assert 'file:///absolute/path/' in config
     assert 'relative/path' in config
     assert 'http://test.com' in config
+
+
+def test_config_base_config_parse_yaml_fast_path():
+    """
+    API: ConfigBase.config_parse_yaml fast path
+
+    """
+
+    if yaml.__with_libyaml__:
+        # We use the C (libyaml) loader if we can
+        assert YAMLSafeLoader is yaml.CSafeLoader
+
+    # Our template cache is populated as it's needed
+    TEMPLATE_DETAILS_CACHE.clear()
+
+    with mock.patch('apprise.plugins.details', wraps=plugins.details) \
+            as mock_details:
+
+        result, config = ConfigBase.config_parse_yaml("""
+urls:
+  - json://localhost:
+    - tag: a
+    - tag: b
+  - json://localhost:
+      tag: c
+  - xml://localhost:
+      tag: d
+""")
+
+        assert len(result) == 4
+        assert len(config) == 0
+
+        # We only looked up the templates of each service once
+        assert mock_details.call_count == 2
+        assert len(TEMPLATE_DETAILS_CACHE) == 2
+
+        # Parsing our configuration again uses what we cached
+        result, config = ConfigBase.config_parse_yaml("""
+urls:
+  - json://localhost:
+      tag: e
+""")
+        assert len(result) == 1
+        assert mock_details.call_count == 2
+
+    # We never generate the URLs of what we load unless we're going to log
+    # them
+    with mock.patch.object(plugins.NotifyJSON, 'url') as mock_url:
+        result, config = ConfigBase.config_parse_yaml("""
+urls:
+  - json://localhost
+""")
+        assert len(result) == 1
+        assert mock_url.call_count == 0
+
+        result, config = ConfigBase.config_parse_text("json://localhost")
+        assert len(result) == 1
+        assert mock_url.call_count == 0
+
+    # Non-string content is handled gracefully
+    result, config = ConfigBase.config_parse_yaml(None)
+    assert len(result) == 0
@@ -22,8 +22,20 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import sys
+import threading
+import pytest
+try:
+    # Python 3.x
+    from unittest import mock
+
+except ImportError:
+    # Python 2.7
+    import mock
+
 from os.path import dirname
 from os.path import join
+from inspect import cleandoc
 from apprise.decorators import notify
 from apprise import Apprise
 from apprise import AppriseAsset
@@ -308,3 +320,242 @@ def test_notify_complex_decoration():
 
     # Tidy
     del common.NOTIFY_SCHEMA_MAP['utiltest']
+
+
+def test_notify_batch_decoration():
+    """decorators: Test batch @notify
+    """
+
+    assert 'batchtest' not in common.NOTIFY_SCHEMA_MAP
+
+    batches = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @notify(on="batchtest", name="Apprise @notify Batch Testing", batch=True)
+    def my_batch_wrapper(items, meta, *args, **kwargs):
+        batches.append(list(items))
+        if len(batches) == 1:
+            # Hold up our first batch so that others queue up behind it
+            started.set()
+            release.wait(5)
+
+        return all(item[0] != 'fail' for item in items)
+
+    obj = Apprise.instantiate('batchtest://')
+    assert obj.hook_batch is True
+    assert obj.hook_coroutine is False
+
+    # Each part of a split message is handed to us at once
+    obj.body_maxlen = 10
+    started.set()
+    release.set()
+    assert obj.notify('a' * 25, overflow='split') is True
+    assert batches == [[
+        ('a' * 10, '', common.NotifyType.INFO),
+        ('a' * 10, '', common.NotifyType.INFO),
+        ('a' * 5, '', common.NotifyType.INFO)]]
+
+    # Bad attachments
+    assert obj.notify('body', attach=object()) is False
+    assert len(batches) == 1
+
+    # Disabled services are never notified
+    obj.enabled = False
+    assert obj.notify('body') is False
+    assert len(batches) == 1
+    obj.enabled = True
+
+    # A failed message is tracked so that we can resume where we left off
+    del batches[:]
+    assert obj.notify('fail', overflow='split') is False
+    assert obj._overflow_resume is not None
+    assert obj._overflow_resume[1] == 0
+    assert obj.notify('fail', overflow='split') is False
+    assert len(batches) == 2
+    assert obj.notify('body') is True
+    assert obj._overflow_resume is None
+
+    # Notifications that arrive while we're busy are sent together
+    del batches[:]
+    started.clear()
+    release.clear()
+    obj = Apprise.instantiate('batchtest://')
+    results = {}
+
+    def send(body, **kwargs):
+        results[body] = obj.notify(body, **kwargs)
+
+    threads = [threading.Thread(target=send, args=('first', ))]
+    threads[0].start()
+    assert started.wait(5)
+
+    threads.extend([
+        threading.Thread(target=send, args=('second', ), kwargs={
+            'title': 'title', 'notify_type': common.NotifyType.WARNING}),
+        threading.Thread(target=send, args=('fail', )),
+        # Our attachments can't be shared with anyone else's
+        threading.Thread(target=send, args=('attach', ), kwargs={
+            'attach': join(TEST_VAR_DIR, 'apprise-test.gif')}),
+    ])
+    for thread in threads[1:]:
+        thread.start()
+
+    # Wait for everyone to queue up
+    for _ in range(500):
+        if len(obj._batch_pending) == 3:
+            break
+        threading.Event().wait(0.01)
+
+    assert len(obj._batch_pending) == 3
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(batches) == 3
+    assert batches[0] == [('first', '', common.NotifyType.INFO)]
+
+    # Whoever queued up first is sent next
+    assert sorted(sorted(batch) for batch in batches[1:]) == [
+        [('attach', '', common.NotifyType.INFO)],
+        [('fail', '', common.NotifyType.INFO),
+         ('second', 'title', common.NotifyType.WARNING)]]
+
+    # Everyone in the same batch shares the same result
+    assert results == {
+        'first': True, 'second': False, 'fail': False, 'attach': True}
+    assert obj._batch_active is False
+    assert obj._batch_pending == []
+
+    # Tidy
+    del common.NOTIFY_SCHEMA_MAP['batchtest']
+
+
+@pytest.mark.skipif(sys.version_info.major <= 2, reason="Requires Python 3.x+")
+def test_notify_coroutine_decoration(tmpdir):
+    """decorators: Test coroutine (async def) @notify
+    """
+    import asyncio
+    import apprise.py3compat.asyncio as py3aio
+
+    # Our hooks are loaded from a file (so that this test can be parsed
+    # by Python v2.7)
+    tmpdir.join('async_hooks.py').write(cleandoc("""
+    import asyncio
+    import threading
+    from apprise.decorators import notify
+
+    CALLS = []
+
+    @notify(on="asynctest")
+    async def my_async_hook(body, title, notify_type, *args, **kwargs):
+        await asyncio.sleep(0)
+        CALLS.append((body, threading.current_thread().name))
+        if body == 'exception':
+            raise ValueError()
+        return body != 'fail'
+
+    @notify(on="abatch", batch=True)
+    async def my_async_batch(items, meta, *args, **kwargs):
+        await asyncio.sleep(0)
+        CALLS.append(list(items))
+    """))
+
+    asset = AppriseAsset(plugin_paths=[str(tmpdir)])
+    assert 'asynctest' in common.NOTIFY_SCHEMA_MAP
+    assert 'abatch' in common.NOTIFY_SCHEMA_MAP
+
+    hook = common.NOTIFY_SCHEMA_MAP['asynctest']
+    assert hook.hook_coroutine is True
+    assert hook.hook_batch is False
+    calls = hook._send_func.__globals__['CALLS']
+
+    # Our coroutine is awaited directly by our event loop (and not handed off
+    # to a thread of its own)
+    a = Apprise(asset=asset)
+    assert a.add('asynctest://') is True
+    assert a.notify('hello') is True
+    assert calls == [('hello', threading.current_thread().name)]
+
+    assert a.notify('fail') is False
+    assert a.notify('exception') is False
+
+    # It can be called synchronously too
+    del calls[:]
+    obj = Apprise.instantiate('asynctest://', asset=asset)
+    assert obj.notify('sync') is True
+    assert obj.notify('fail') is False
+    assert obj.notify('exception') is False
+    assert [c[0] for c in calls] == ['sync', 'fail', 'exception']
+
+    # Even from within a running event loop
+    async def nested():
+        return obj.notify('nested')
+
+    assert asyncio.run(nested()) is True
+
+    # Bad attachments
+    assert py3aio.tosync(obj.async_notify('body', attach=object())) is False
+
+    # Disabled services are never notified
+    del calls[:]
+    obj.enabled = False
+    assert py3aio.tosync(obj.async_notify('body')) is False
+    assert calls == []
+    obj.enabled = True
+
+    # We resume from the chunk that failed
+    obj.body_maxlen = 4
+    assert py3aio.tosync(
+        obj.async_notify('goodfailgood', overflow='split')) is False
+    assert [c[0] for c in calls] == ['good', 'fail']
+    assert obj._overflow_resume[1] == 1
+    del calls[:]
+    assert py3aio.tosync(
+        obj.async_notify('goodfailgood', overflow='split')) is False
+    assert [c[0] for c in calls] == ['fail']
+
+    # Chunks already delivered (along with others at the same time) aren't
+    # sent again
+    del calls[:]
+    key, offset, _ = obj._overflow_resume
+    obj._overflow_resume = (key, 0, frozenset([2]))
+    assert py3aio.tosync(
+        obj.async_notify('goodfailgood', overflow='split')) is False
+    assert [c[0] for c in calls] == ['good', 'fail']
+    assert obj._overflow_resume[1:] == (1, frozenset([2]))
+
+    # A coroutine that is also a batch hook; it's still sent through our
+    # batch queue
+    del calls[:]
+    obj = Apprise.instantiate('abatch://', asset=asset)
+    obj.body_maxlen = 10
+    with mock.patch.object(
+            obj, '_batch_send', wraps=obj._batch_send) as mock_batch:
+        assert py3aio.tosync(
+            obj.async_notify('b' * 15, title='', overflow='split')) is True
+        assert mock_batch.call_count == 1
+
+    obj.enabled = False
+    assert py3aio.tosync(obj.async_notify('disabled')) is False
+    obj.enabled = True
+    assert obj.notify('sync batch') is True
+    assert calls == [
+        [('b' * 10, '', common.NotifyType.INFO),
+         ('b' * 5, '', common.NotifyType.INFO)],
+        [('sync batch', '', common.NotifyType.INFO)]]
+
+    # Hooks that aren't coroutines still use our regular async path
+    @notify(on="notasync")
+    def my_hook(body, title, notify_type, *args, **kwargs):
+        return True
+
+    obj = Apprise.instantiate('notasync://')
+    assert obj.hook_coroutine is False
+    assert py3aio.tosync(obj.async_notify('body')) is True
+
+    # Tidy
+    del common.NOTIFY_SCHEMA_MAP['asynctest']
+    del common.NOTIFY_SCHEMA_MAP['abatch']
+    del common.NOTIFY_SCHEMA_MAP['notasync']
@@ -22,14 +22,32 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import sys
+import gzip
+from io import BytesIO
+import json
+import time
+import threading
+import requests
 from helpers import AppriseURLTester
+from apprise import Apprise
 from apprise import plugins
-import requests
+
+try:
+    # Python 3.x
+    from unittest import mock
+
+except ImportError:
+    # Python 2.7
+    import mock
 
 # Disable logging for a cleaner testing output
 import logging
 logging.disable(logging.CRITICAL)
 
+# Our NotifyAppriseAPI module (and not the class of the same name)
+api_module = sys.modules['apprise.plugins.NotifyAppriseAPI']
+
 # Our Testing URLs
 apprise_url_tests = (
     ('apprise://', {
@@ -135,6 +153,18 @@ apprise_url_tests = (
     ('apprises://localhost:8080/path?+HeaderKey=HeaderValue', {
         'instance': plugins.NotifyAppriseAPI,
     }),
+    # Batch mode (with a window)
+    ('apprise://localhost/%s?batch=yes&window=0' % ('a' * 32), {
+        'instance': plugins.NotifyAppriseAPI,
+    }),
+    # An invalid (batch) window; the default is used
+    ('apprise://localhost/%s?window=bad' % ('a' * 32), {
+        'instance': plugins.NotifyAppriseAPI,
+    }),
+    # Compressed requests
+    ('apprise://localhost/%s?gzip=yes' % ('a' * 32), {
+        'instance': plugins.NotifyAppriseAPI,
+    }),
     ('apprise://localhost/%s' % ('a' * 32), {
         'instance': plugins.NotifyAppriseAPI,
         # force a failure
@@ -164,3 +194,228 @@ def test_plugin_apprise_urls():
 
     # Run our general tests
     AppriseURLTester(tests=apprise_url_tests).run_all()
+
+
+@mock.patch('requests.post')
+def test_plugin_apprise_api_batch(mock_post):
+    """
+    NotifyAppriseAPI() Batch Mode
+
+    """
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    mock_post.return_value = response
+
+    # Notifications for the same endpoint (even if they come from different
+    # services) are relayed together
+    a = Apprise()
+    assert a.add(
+        'apprise://localhost/token/?batch=yes&window=0.5&tags=a', tag='a')
+    assert a.add(
+        'apprise://localhost/token/?batch=yes&window=0.5&tags=b', tag='b')
+    assert a.notify('body', title='title') is True
+
+    assert mock_post.call_count == 1
+    assert mock_post.call_args[0][0] == 'http://localhost/notify/token'
+    payload = json.loads(mock_post.call_args[1]['data'])
+    assert isinstance(payload, list)
+    assert len(payload) == 2
+    assert sorted([p['tag'] for p in payload]) == [['a'], ['b']]
+    assert all([p['body'] == 'body' for p in payload])
+
+    # Notifications sent (from different threads) within our window are
+    # relayed together
+    mock_post.reset_mock()
+    obj = Apprise.instantiate(
+        'apprise://localhost/token/?batch=yes&window=0.5')
+    assert obj.url().find('batch=yes') > 0
+    assert obj.url().find('window=0.5') > 0
+
+    results = []
+    threads = []
+    for n in range(3):
+        threads.append(threading.Thread(
+            target=lambda n=n: results.append(obj.notify('body %d' % n))))
+        threads[-1].start()
+        time.sleep(0.1)
+    for t in threads:
+        t.join()
+
+    assert results == [True] * 3
+    assert mock_post.call_count == 1
+    payload = json.loads(mock_post.call_args[1]['data'])
+    assert sorted([p['body'] for p in payload]) == \
+        ['body %d' % n for n in range(3)]
+
+    # Notifications that arrive (from different threads) while a request is
+    # underway are batched and posted as soon as it completes
+    mock_post.reset_mock()
+    obj = Apprise.instantiate(
+        'apprise://localhost/token/?batch=yes&window=0')
+
+    def post(*args, **kwargs):
+        if mock_post.call_count == 1:
+            # Hold our first request until everyone else is waiting
+            for _ in range(500):
+                if sum(len(b['pending']) for b in
+                       api_module.APPRISE_API_BATCH_POOL.values()) == 4:
+                    break
+                time.sleep(0.01)
+
+        return response
+
+    mock_post.side_effect = post
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda n=n: results.append(obj.notify('body %d' % n)))
+        for n in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    mock_post.side_effect = None
+    assert results == [True] * 5
+    assert mock_post.call_count == 2
+    first = json.loads(mock_post.call_args_list[0][1]['data'])
+    payload = json.loads(mock_post.call_args_list[1][1]['data'])
+    assert sorted([first['body']] + [p['body'] for p in payload]) == \
+        ['body %d' % n for n in range(5)]
+
+    # A lone notification is held for our window and then posted the
+    # regular way
+    mock_post.reset_mock()
+    obj = Apprise.instantiate(
+        'apprise://localhost/token/?batch=yes&window=0.2')
+    start = time.time()
+    assert obj.notify('body') is True
+    assert time.time() - start >= 0.2
+    assert mock_post.call_count == 1
+    assert json.loads(mock_post.call_args[1]['data'])['body'] == 'body'
+
+    # Our batch size is respected
+    mock_post.reset_mock()
+    with mock.patch.object(
+            plugins.NotifyAppriseAPI, 'default_batch_size', 2):
+        a = Apprise()
+        for tag in ('a', 'b', 'c'):
+            assert a.add(
+                'apprise://localhost/token/?batch=yes&window=0.5&tags=' + tag)
+        assert a.notify('body') is True
+
+    assert mock_post.call_count == 2
+    assert sorted([
+        len(json.loads(c[1]['data'])) if isinstance(
+            json.loads(c[1]['data']), list) else 1
+        for c in mock_post.call_args_list]) == [1, 2]
+
+    # A server that doesn't support batch requests gets them one at a time
+    mock_post.reset_mock()
+    bad_response = mock.Mock()
+    bad_response.status_code = 405
+    mock_post.side_effect = (bad_response, response, response)
+    a = Apprise()
+    assert a.add('apprise://localhost/token/?batch=yes&window=0.5&tags=a')
+    assert a.add('apprise://localhost/token/?batch=yes&window=0.5&tags=b')
+    assert a.notify('body') is True
+    assert mock_post.call_count == 3
+    assert isinstance(
+        json.loads(mock_post.call_args_list[0][1]['data']), list)
+    assert isinstance(
+        json.loads(mock_post.call_args_list[1][1]['data']), dict)
+
+    # Each of them gets the result of its own request
+    mock_post.reset_mock()
+    failed_response = mock.Mock()
+    failed_response.status_code = requests.codes.internal_server_error
+    mock_post.side_effect = (bad_response, response, failed_response)
+    assert a[0]._post([{'body': 'a'}, {'body': 'b'}]) == [True, False]
+    assert mock_post.call_count == 3
+
+    mock_post.reset_mock()
+    mock_post.side_effect = (bad_response, response, failed_response)
+    assert a.notify('body') is False
+    assert mock_post.call_count == 3
+
+    # Any other failure fails the entire batch
+    mock_post.reset_mock()
+    mock_post.side_effect = None
+    bad_response.status_code = requests.codes.internal_server_error
+    mock_post.return_value = bad_response
+    a = Apprise()
+    assert a.add('apprise://localhost/token/?batch=yes&window=0.5&tags=a')
+    assert a.add('apprise://localhost/token/?batch=yes&window=0.5&tags=b')
+    assert a.notify('body') is False
+    assert mock_post.call_count == 1
+
+    # Nothing is left behind in our pool
+    assert api_module.APPRISE_API_BATCH_POOL == {}
+
+
+@mock.patch('requests.post')
+def test_plugin_apprise_api_gzip(mock_post):
+    """
+    NotifyAppriseAPI() Compressed Requests
+
+    """
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    mock_post.return_value = response
+
+    obj = Apprise.instantiate('apprise://localhost/token/?gzip=yes')
+    assert obj.url().find('gzip=yes') > 0
+    assert obj.notify('body', title='title') is True
+
+    assert mock_post.call_count == 1
+    headers = mock_post.call_args[1]['headers']
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['Content-Type'] == 'application/json'
+
+    data = mock_post.call_args[1]['data']
+    payload = json.loads(
+        gzip.GzipFile(fileobj=BytesIO(data)).read()
+        .decode('utf-8'))
+    assert payload['body'] == 'body'
+    assert payload['title'] == 'title'
+
+
+@mock.patch('requests.Session.post')
+@mock.patch('requests.post')
+def test_plugin_apprise_api_keepalive(mock_post, mock_session_post):
+    """
+    NotifyAppriseAPI() Keep-Alive Sessions
+
+    """
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    mock_session_post.return_value = response
+
+    plugins.NotifyAppriseAPI.session_pool_reset()
+
+    obj1 = Apprise.instantiate(
+        'apprises://localhost/token1/?keepalive=yes')
+    obj2 = Apprise.instantiate(
+        'apprises://localhost/token2/?keepalive=yes&tags=a')
+    obj3 = Apprise.instantiate(
+        'apprises://example.com/token1/?keepalive=yes')
+    assert obj1.url().find('keepalive=yes') > 0
+
+    # Our sessions are shared between objects talking to the same server
+    assert obj1.session_lookup() is obj2.session_lookup()
+    assert obj1.session_lookup() is not obj3.session_lookup()
+
+    assert obj1.notify('body') is True
+    assert obj2.notify('body') is True
+    assert obj3.notify('body') is True
+    assert mock_post.call_count == 0
+    assert mock_session_post.call_count == 3
+    assert len(api_module.APPRISE_API_SESSION_POOL) == 2
+
+    # Connection errors are handled
+    mock_session_post.side_effect = requests.RequestException('error')
+    assert obj1.notify('body') is False
+
+    plugins.NotifyAppriseAPI.session_pool_reset()
+    assert len(api_module.APPRISE_API_SESSION_POOL) == 0
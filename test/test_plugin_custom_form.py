@@ -24,6 +24,8 @@
 # THE SOFTWARE.
 import os
 import sys
+import zlib
+import email
 try:
     # Python 3.x
     from unittest import mock
@@ -218,12 +220,14 @@ def test_plugin_custom_form_attachments(mock_post):
             attach=attach) is False
 
     # Fail on the 2nd attempt (but not the first)
-    with mock.patch(builtin_open_function,
-                    side_effect=[None, OSError(), None]):
-        # We can't send the message we can't open the attachment for reading
-        assert obj.notify(
-            body='body', title='title', notify_type=NotifyType.INFO,
-            attach=attach) is False
+    with open(path[0], 'rb') as f:
+        with mock.patch(builtin_open_function,
+                        side_effect=[f, OSError(), f]):
+            # We can't send the message we can't open the attachment for
+            # reading
+            assert obj.notify(
+                body='body', title='title', notify_type=NotifyType.INFO,
+                attach=attach) is False
 
     # Test file exception handling when performing post
     mock_post.return_value = None
@@ -383,3 +387,82 @@ def test_plugin_custom_form_edge_cases(mock_get, mock_post):
     for k in ('user', 'password', 'port', 'host', 'fullpath', 'path', 'query',
               'schema', 'url', 'payload', 'method'):
         assert new_results[k] == results[k]
+
+
+@mock.patch('requests.post')
+def test_plugin_custom_form_multipart(mock_post):
+    """
+    NotifyForm() Multipart Forms and Compression
+
+    """
+    okay_response = requests.Request()
+    okay_response.status_code = requests.codes.ok
+    mock_post.return_value = okay_response
+
+    path = os.path.join(TEST_VAR_DIR, 'apprise-test.gif')
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    def parse(data, content_type):
+        # Returns the parts of the multipart form provided
+        if not isinstance(data, bytes):
+            data = data.getvalue()
+
+        message = email.message_from_string(
+            'Content-Type: {}\r\n\r\n'.format(content_type)
+            + data.decode('latin-1'))
+        return {
+            part.get_param('name', header='content-disposition'):
+            part for part in message.get_payload()}
+
+    obj = Apprise.instantiate('form://localhost/?:key=value')
+    assert isinstance(obj, plugins.NotifyForm)
+    assert obj.notify(body='body', title='title', attach=(path, path)) is True
+
+    # Our attachments are streamed (only read as they're sent)
+    details = mock_post.call_args[1]
+    assert len(details['data']) == len(details['data'].getvalue())
+    content_type = details['headers']['Content-Type']
+    assert content_type.startswith('multipart/form-data; boundary=')
+
+    parts = parse(details['data'], content_type)
+    assert sorted(parts.keys()) == [
+        'file01', 'file02', 'key', 'message', 'title', 'type', 'version']
+    assert parts['message'].get_payload() == 'body'
+    assert parts['key'].get_payload() == 'value'
+    assert parts['file01'].get_filename() == 'apprise-test.gif'
+    assert parts['file01'].get_content_type() == 'image/gif'
+    assert parts['file02'].get_payload().encode('latin-1') == content
+
+    # Compression
+    mock_post.reset_mock()
+    obj = Apprise.instantiate('form://localhost/?compress=gzip')
+    assert obj.url().find('compress=gzip') > 0
+    assert obj.notify(body='body', title='title', attach=path) is True
+
+    details = mock_post.call_args[1]
+    assert details['headers']['Content-Encoding'] == 'gzip'
+    parts = parse(
+        zlib.decompress(details['data'], 16 + zlib.MAX_WBITS),
+        details['headers']['Content-Type'])
+    assert parts['file01'].get_payload().encode('latin-1') == content
+
+    # Compressed forms (without attachments) are url encoded
+    mock_post.reset_mock()
+    obj = Apprise.instantiate('form://localhost/?compress=deflate')
+    assert obj.notify(body='body', title='title') is True
+
+    details = mock_post.call_args[1]
+    assert details['headers']['Content-Encoding'] == 'deflate'
+    assert details['headers']['Content-Type'] == \
+        'application/x-www-form-urlencoded'
+    data = zlib.decompress(details['data']).decode('utf-8')
+    assert 'title=title' in data.split('&')
+    assert 'message=body' in data.split('&')
+
+    # Field names are escaped
+    assert plugins.NotifyForm._multipart_escape('a"b\\c\r\n') == \
+        'a%22b\\\\c%0D%0A'
+
+    # An invalid compression
+    assert Apprise.instantiate('form://localhost/?compress=invalid') is None
@@ -25,6 +25,7 @@
 import os
 import sys
 import re
+import zlib
 try:
     # Python 3.x
     from unittest import mock
@@ -298,3 +299,43 @@ def test_plugin_custom_xml_edge_cases(mock_get, mock_post):
     assert re.search('<Message>test</Message>', details[1]['data'])
     # Custom entry
     assert re.search('<Key>value</Key>', details[1]['data'])
+
+
+@mock.patch('requests.post')
+def test_plugin_custom_xml_compression(mock_post):
+    """
+    NotifyXML() Compression
+
+    """
+    okay_response = requests.Request()
+    okay_response.status_code = requests.codes.ok
+    mock_post.return_value = okay_response
+
+    path = os.path.join(TEST_VAR_DIR, 'apprise-test.gif')
+
+    # An invalid compression
+    assert Apprise.instantiate('xml://localhost/?compress=invalid') is None
+
+    obj = Apprise.instantiate('xml://localhost/?compress=gzip')
+    assert isinstance(obj, plugins.NotifyXML)
+    assert obj.url().find('compress=gzip') > 0
+    assert obj.notify(body='body', title='title', attach=path) is True
+
+    assert mock_post.call_args[1]['headers']['Content-Encoding'] == 'gzip'
+    data = zlib.decompress(
+        mock_post.call_args[1]['data'], 16 + zlib.MAX_WBITS).decode('utf-8')
+    assert re.search(r'<Subject>title</Subject>', data)
+    assert re.search(r'<Message>body</Message>', data)
+    assert re.search(
+        r'<Attachments format="base64"><Attachment '
+        r'filename="apprise-test.gif" mimetype="image/gif">[^<]+'
+        r'</Attachment></Attachments>', data)
+    assert data.endswith('</soapenv:Envelope>')
+
+    # Without compression our attachments are streamed
+    mock_post.reset_mock()
+    obj = Apprise.instantiate('xml://localhost/')
+    assert obj.notify(body='body', title='title', attach=path) is True
+    data = mock_post.call_args[1]['data']
+    assert len(data) == len(data.getvalue())
+    assert 'Content-Encoding' not in mock_post.call_args[1]['headers']
@@ -545,6 +545,124 @@ def test_plugin_fcm_general_oauth(mock_post):
     assert data['message']['android']['notification']['color'] == '#12aabb'
 
 
+@pytest.mark.skipif(
+    'cryptography' not in sys.modules, reason="Requires cryptography")
+@mock.patch('requests.post')
+def test_plugin_fcm_batch(mock_post):
+    """
+    NotifyFCM() Batch Notifications
+
+    """
+    # Disable Throttling to speed testing
+    plugins.NotifyBase.request_rate_per_sec = 0
+
+    # Prepare a good response
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    response.content = json.dumps({
+        'multicast_id': 108,
+        'success': 1,
+        'failure': 0,
+        'results': [{'message_id': '1:08'}],
+    })
+    mock_post.return_value = response
+
+    # 1502 device tokens and 7 topics (sorted as our targets are)
+    devices = sorted(['device{}'.format(no) for no in range(1502)])
+    topics = ['#topic{}'.format(no) for no in range(7)]
+
+    obj = Apprise.instantiate(
+        'fcm://abc123/?to={}'.format(','.join(devices + topics)))
+    assert obj.batch is True
+    assert 'batch=yes' in obj.url()
+
+    # Send our notification
+    assert obj.notify("test") is True
+
+    # Our device tokens are notified in 2 batches (of up to 1000) and our
+    # topics in 2 conditions (of up to 5)
+    assert mock_post.call_count == 4
+
+    data = json.loads(mock_post.call_args_list[0][1]['data'])
+    assert data['registration_ids'] == devices[:1000]
+    assert 'to' not in data
+
+    data = json.loads(mock_post.call_args_list[1][1]['data'])
+    assert data['registration_ids'] == devices[1000:]
+
+    data = json.loads(mock_post.call_args_list[2][1]['data'])
+    assert data['condition'] == \
+        "'topic0' in topics || 'topic1' in topics || 'topic2' in topics" \
+        " || 'topic3' in topics || 'topic4' in topics"
+    assert 'registration_ids' not in data
+
+    data = json.loads(mock_post.call_args_list[3][1]['data'])
+    assert data['condition'] == "'topic5' in topics || 'topic6' in topics"
+
+    # Our per-token results are checked; if one of them failed, so does our
+    # notification
+    response.content = json.dumps({
+        'multicast_id': 108,
+        'success': 1,
+        'failure': 1,
+        'results': [{'message_id': '1:08'}, {'error': 'NotRegistered'}],
+    })
+    mock_post.reset_mock()
+    obj = Apprise.instantiate('fcm://abc123/device1/device2/')
+    assert obj.notify("test") is False
+    assert mock_post.call_count == 1
+
+    # Topics report their errors too
+    response.content = json.dumps({'error': 'TopicsMessageRateExceeded'})
+    mock_post.reset_mock()
+    obj = Apprise.instantiate('fcm://abc123/#topic1/')
+    assert obj.notify("test") is False
+    assert mock_post.call_count == 1
+    data = json.loads(mock_post.call_args_list[0][1]['data'])
+    assert data['to'] == '/topics/topic1'
+
+    # An unexpected response is treated as a success
+    response.content = json.dumps([])
+    assert obj.notify("test") is True
+
+    # Batch mode can be disabled
+    response.content = '{}'
+    mock_post.reset_mock()
+    obj = Apprise.instantiate(
+        'fcm://abc123/device1/device2/#topic1/#topic2?batch=no')
+    assert obj.batch is False
+    assert 'batch=no' in obj.url()
+    assert obj.notify("test") is True
+    assert mock_post.call_count == 4
+
+    data = json.loads(mock_post.call_args_list[0][1]['data'])
+    assert data['to'] == 'device1'
+    data = json.loads(mock_post.call_args_list[3][1]['data'])
+    assert data['to'] == '/topics/topic2'
+
+    # OAuth2 mode does not support multicast; only our topics are combined
+    path = os.path.join(PRIVATE_KEYFILE_DIR, 'service_account.json')
+    response.content = json.dumps({
+        "access_token": "ya29.c.abcd",
+        "expires_in": 3599,
+        "token_type": "Bearer",
+    })
+    mock_post.reset_mock()
+    obj = Apprise.instantiate(
+        'fcm://mock-project-id/device1/device2/#topic1/#topic2'
+        '?keyfile={}'.format(str(path)))
+    assert obj.notify("test") is True
+
+    # Our access token, 2 device tokens and 1 topic condition
+    assert mock_post.call_count == 4
+    data = json.loads(mock_post.call_args_list[1][1]['data'])
+    assert data['message']['token'] == 'device1'
+    data = json.loads(mock_post.call_args_list[3][1]['data'])
+    assert data['message']['condition'] == \
+        "'topic1' in topics || 'topic2' in topics"
+    assert 'token' not in data['message']
+
+
 @pytest.mark.skipif(
     'cryptography' not in sys.modules, reason="Requires cryptography")
 @mock.patch('requests.post')
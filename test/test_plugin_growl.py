@@ -98,6 +98,7 @@ def test_plugin_growl_exception_handling(mock_gntp):
     # First we test the growl.register() function
     for exception in TEST_GROWL_EXCEPTIONS:
         mock_notifier.register.side_effect = exception
+        apprise.plugins.NotifyGrowl.registration_reset()
 
         # instantiate our object
         obj = apprise.Apprise.instantiate(
@@ -258,6 +259,9 @@ def test_plugin_growl_general(mock_gntp):
         mock_gntp.return_value = mock_notifier
         mock_notifier.notify.side_effect = None
 
+        # Don't re-use the registrations of our previous tests
+        apprise.plugins.NotifyGrowl.registration_reset()
+
         # Store our response
         mock_notifier.notify.return_value = growl_response
 
@@ -394,3 +398,71 @@ def test_plugin_growl_config_files(mock_gntp):
     assert len([x for x in aobj.find(tag='growl_invalid')]) == 1
     assert next(aobj.find(tag='growl_invalid')).priority == \
         GrowlPriority.NORMAL
+
+
+@pytest.mark.skipif(
+    'gntp' not in sys.modules, reason="Requires gntp")
+@mock.patch('gntp.notifier.GrowlNotifier')
+def test_plugin_growl_registration(mock_gntp):
+    """
+    NotifyGrowl() Shared Registrations
+    """
+    # Disable Throttling to speed testing
+    apprise.plugins.NotifyBase.request_rate_per_sec = 0
+
+    # Start with no registrations
+    apprise.plugins.NotifyGrowl.registration_reset()
+
+    mock_notifier = mock.Mock()
+    mock_notifier.notify.return_value = True
+    mock_gntp.return_value = mock_notifier
+
+    obj = apprise.Apprise.instantiate('growl://pass@growl.server')
+    assert obj.notify(title='title', body='body') is True
+    assert obj.notify(title='title', body='body') is True
+    assert mock_notifier.register.call_count == 1
+    assert mock_notifier.notify.call_count == 2
+
+    # Another object pointing to the same server re-uses our registration
+    obj2 = apprise.Apprise.instantiate('growl://pass@growl.server')
+    assert obj2.notify(title='title', body='body') is True
+    assert mock_notifier.register.call_count == 1
+    assert mock_notifier.notify.call_count == 3
+
+    # A different password requires its own registration
+    obj3 = apprise.Apprise.instantiate('growl://other@growl.server')
+    assert obj3.notify(title='title', body='body') is True
+    assert mock_notifier.register.call_count == 2
+
+    # Our server forgot about us; we register again and retry
+    mock_notifier.reset_mock()
+    mock_notifier.notify.side_effect = \
+        [('402', 'Unknown Notification'), True]
+    assert obj.notify(title='title', body='body') is True
+    assert mock_notifier.register.call_count == 1
+    assert mock_notifier.notify.call_count == 2
+
+    # Our new registration is shared
+    mock_notifier.reset_mock()
+    mock_notifier.notify.side_effect = None
+    assert obj2.notify(title='title', body='body') is True
+    assert mock_notifier.register.call_count == 0
+
+    # Our re-registration fails
+    mock_notifier.reset_mock()
+    mock_notifier.notify.side_effect = \
+        [('401', 'Unknown Application'), True]
+    mock_notifier.register.side_effect = errors.NetworkError(
+        0, 'gntp.NetworkError() not handled')
+    assert obj.notify(title='title', body='body') is False
+    assert mock_notifier.notify.call_count == 1
+
+    # Other errors are not retried (but are not treated as failures as
+    # Growl servers don't always acknowledge what was sent to them)
+    mock_notifier.reset_mock()
+    mock_notifier.register.side_effect = None
+    mock_notifier.notify.side_effect = None
+    mock_notifier.notify.return_value = ('400', 'Invalid Request')
+    assert obj.notify(title='title', body='body') is True
+    assert mock_notifier.register.call_count == 1
+    assert mock_notifier.notify.call_count == 1
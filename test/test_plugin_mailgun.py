@@ -250,33 +250,13 @@ def test_plugin_mailgun_attachments(mock_post):
             attach=attach) is False
 
     # Do it again, but fail on the third file
-    with mock.patch(
-            builtin_open_function,
-            side_effect=(mock.Mock(), mock.Mock(), OSError())):
+    with open(path[0], 'rb') as f0, open(path[1], 'rb') as f1:
+        with mock.patch(
+                builtin_open_function, side_effect=(f0, f1, OSError())):
 
-        assert obj.notify(
-            body='body', title='title', notify_type=NotifyType.INFO,
-            attach=attach) is False
-
-    with mock.patch(builtin_open_function) as mock_open:
-        mock_fp = mock.Mock()
-        mock_fp.seek.side_effect = OSError()
-        mock_open.return_value = mock_fp
-
-        # We can't send the message we can't seek through it
-        assert obj.notify(
-            body='body', title='title', notify_type=NotifyType.INFO,
-            attach=attach) is False
-
-        mock_post.reset_mock()
-        # Fail on the third file; this tests the for-loop inside the seek()
-        # section of the code that calls close() on previously opened files
-        mock_fp.seek.side_effect = (None, None, OSError())
-        mock_open.return_value = mock_fp
-        # We can't send the message we can't seek through it
-        assert obj.notify(
-            body='body', title='title', notify_type=NotifyType.INFO,
-            attach=attach) is False
+            assert obj.notify(
+                body='body', title='title', notify_type=NotifyType.INFO,
+                attach=attach) is False
 
     # test the handling of our batch modes
     obj = Apprise.instantiate(
@@ -294,6 +274,14 @@ def test_plugin_mailgun_attachments(mock_post):
         attach=attach) is True
     assert mock_post.call_count == 2
 
+    # Each of our messages carry the same (complete) attachments
+    for call in mock_post.call_args_list:
+        files = call[1]['files']
+        assert len(files) == 3
+        for _, (name, content) in files.items():
+            assert name == 'apprise-test.gif'
+            assert bytes(content) == bytes(attach[0].view())
+
     # single batch
     mock_post.reset_mock()
     # We'll send 1 message
@@ -386,6 +386,109 @@ def test_plugin_pushover_edge_cases(mock_post):
         plugins.NotifyPushover(user_key="abcd", token="  ")
 
 
+@mock.patch('requests.post')
+def test_plugin_pushover_batch(mock_post):
+    """
+    NotifyPushover() Batch Notifications
+
+    """
+    # Disable Throttling to speed testing
+    plugins.NotifyPushover.request_rate_per_sec = 0
+
+    # Initialize some generic (but valid) tokens
+    token = 'a' * 30
+    user_key = 'u' * 30
+
+    # Prepare Mock
+    mock_post.return_value = requests.Request()
+    mock_post.return_value.status_code = requests.codes.ok
+
+    # 120 devices (sorted as our targets are)
+    devices = sorted(['device{}'.format(no) for no in range(120)])
+
+    obj = apprise.Apprise.instantiate('pover://{}@{}/{}'.format(
+        user_key, token, '/'.join(devices)))
+    assert isinstance(obj, plugins.NotifyPushover)
+    assert obj.batch is True
+    assert 'batch=yes' in obj.url()
+
+    assert obj.notify(body='body', title='title') is True
+
+    # Our devices are notified in batches of 50
+    assert mock_post.call_count == 3
+    assert mock_post.call_args_list[0][1]['data']['device'] == \
+        ','.join(devices[:50])
+    assert mock_post.call_args_list[1][1]['data']['device'] == \
+        ','.join(devices[50:100])
+    assert mock_post.call_args_list[2][1]['data']['device'] == \
+        ','.join(devices[100:])
+
+    # Invalid devices are skipped over (but still cause us to fail)
+    mock_post.reset_mock()
+    obj = apprise.Apprise.instantiate('pover://{}@{}/{}/{}'.format(
+        user_key, token, 'device1/device2', 'd' * 35))
+    assert obj.notify(body='body', title='title') is False
+    assert mock_post.call_count == 1
+    assert mock_post.call_args_list[0][1]['data']['device'] == \
+        'device1,device2'
+
+    # Pushover identifies the problem with our devices
+    mock_post.reset_mock()
+    mock_post.return_value.status_code = requests.codes.bad_request
+    mock_post.return_value.content = dumps({
+        'device': 'invalid for this user',
+        'errors': ['device name is not valid for user'],
+        'status': 0,
+    })
+    obj = apprise.Apprise.instantiate('pover://{}@{}/{}'.format(
+        user_key, token, 'device1/device2'))
+    assert obj.notify(body='body', title='title') is False
+    # We fall back to notifying each device of our batch on its own
+    assert mock_post.call_count == 3
+    assert [c[1]['data']['device'] for c in mock_post.call_args_list] == \
+        ['device1,device2', 'device1', 'device2']
+
+    # So a single stale device doesn't stop the others from being notified
+    mock_post.reset_mock()
+    okay = requests.Request()
+    okay.status_code = requests.codes.ok
+    mock_post.side_effect = (
+        mock_post.return_value, okay, mock_post.return_value, okay)
+    obj = apprise.Apprise.instantiate('pover://{}@{}/{}'.format(
+        user_key, token, 'device1/device2/device3'))
+    assert obj.notify(body='body', title='title') is False
+    assert [c[1]['data']['device'] for c in mock_post.call_args_list] == \
+        ['device1,device2,device3', 'device1', 'device2', 'device3']
+    mock_post.side_effect = None
+
+    # Anything else that goes wrong fails the batch as a whole
+    mock_post.reset_mock()
+    mock_post.return_value.content = dumps({
+        'errors': ['message cannot be blank'],
+        'status': 0,
+    })
+    assert obj.notify(body='body', title='title') is False
+    assert mock_post.call_count == 1
+
+    # An unparseable response is handled as well
+    mock_post.reset_mock()
+    mock_post.return_value.content = '{'
+    assert obj.notify(body='body', title='title') is False
+    assert mock_post.call_count == 1
+
+    # Batch mode can be disabled
+    mock_post.reset_mock()
+    mock_post.return_value.status_code = requests.codes.ok
+    obj = apprise.Apprise.instantiate('pover://{}@{}/{}?batch=no'.format(
+        user_key, token, 'device1/device2'))
+    assert obj.batch is False
+    assert 'batch=no' in obj.url()
+    assert obj.notify(body='body', title='title') is True
+    assert mock_post.call_count == 2
+    assert mock_post.call_args_list[0][1]['data']['device'] == 'device1'
+    assert mock_post.call_args_list[1][1]['data']['device'] == 'device2'
+
+
 @mock.patch('requests.post')
 def test_plugin_pushover_config_files(mock_post):
     """
@@ -211,6 +211,10 @@ apprise_url_tests = (
         'include_image': True,
         'test_requests_exceptions': True,
     }),
+    # Tag the chunks of split messages
+    ('tgram://123456789:abcdefg_hijklmnop/lead2gold/?sequence=Yes', {
+        'instance': plugins.NotifyTelegram,
+    }),
 )
 
 
@@ -1383,3 +1387,77 @@ def test_plugin_telegram_html_formatting(mock_post):
         '<b>Heading 3</b>\r\n<b>Heading 4</b>\r\n<b>Heading 5</b>\r\n' \
         '<b>Heading 6</b>\r\nA set of text\r\n' \
         'Another line after the set of text\r\nMore text\r\nlabel'
+
+
+@mock.patch('requests.post')
+def test_plugin_telegram_sequence(mock_post):
+    """
+    NotifyTelegram() Split Message Sequencing
+
+    """
+    # Disable Throttling to speed testing
+    plugins.NotifyTelegram.request_rate_per_sec = 0
+
+    # Our response identifies our bot owner too
+    mock_post.return_value = requests.Request()
+    mock_post.return_value.status_code = requests.codes.ok
+    mock_post.return_value.content = dumps({
+        "ok": True,
+        "result": [{
+            "update_id": 645421321,
+            "message": {
+                "message_id": 2,
+                "from": {
+                    "id": 532389719,
+                    "is_bot": False,
+                    "first_name": "Chris",
+                    "language_code": "en-US"
+                },
+                "chat": {
+                    "id": 532389719,
+                    "first_name": "Chris",
+                    "type": "private"
+                },
+                "date": 1519694394,
+                "text": "/start",
+            }},
+        ],
+    })
+
+    # A message that has to be split into several chunks
+    body = '\n'.join('line {} '.format(no) * 50 for no in range(100))
+
+    # By default our chunks are sent in order and are left untouched
+    obj = Apprise.instantiate(
+        'tgram://123456789:abcdefg_hijklmnop/?overflow=split')
+    assert obj.overflow_sequence is False
+    assert 'sequence=no' in obj.url()
+    assert obj.notify(body=body) is True
+
+    # 1 call to look up our bot owner and then the rest are our chunks
+    texts = [loads(c[1]['data'])['text']
+             for c in mock_post.call_args_list[1:]]
+    assert len(texts) > 4
+    assert texts[0].startswith('line 0 ')
+    assert not any(t.startswith('[') for t in texts)
+
+    # Now ask for our chunks to be tagged (and sent at the same time)
+    mock_post.reset_mock()
+    obj = Apprise.instantiate(
+        'tgram://123456789:abcdefg_hijklmnop/?overflow=split&sequence=yes')
+    assert obj.overflow_sequence is True
+    assert 'sequence=yes' in obj.url()
+    assert obj.notify(body=body) is True
+
+    # Our bot owner is only ever looked up (and added) once even though our
+    # chunks were sent at the same time
+    assert obj.targets == ['532389719']
+    urls = [c[0][0] for c in mock_post.call_args_list]
+    assert len([u for u in urls if u.endswith('/getUpdates')]) == 1
+
+    # Every chunk is tagged with it's position
+    texts = [loads(c[1]['data'])['text']
+             for c in mock_post.call_args_list
+             if not c[0][0].endswith('/getUpdates')]
+    assert sorted(t[:t.index(' ')] for t in texts) == sorted(
+        '[{}/{}]'.format(no, len(texts)) for no in range(1, len(texts) + 1))
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Chris Caron <lead2gold@gmail.com>
+# All rights reserved.
+#
+# This code is licensed under the MIT License.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files(the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and / or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions :
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import sys
+import types
+import pytest
+import subprocess
+
+try:
+    # Python 3.x
+    from unittest import mock
+
+except ImportError:
+    # Python 2.7
+    import mock
+
+from apprise import profiler
+
+# Disable logging for a cleaner testing output
+import logging
+logging.disable(logging.CRITICAL)
+
+
+@pytest.mark.skipif(sys.version_info.major <= 2, reason="Requires Python 3.x+")
+def test_profiler_startup():
+    """
+    Profiler: profile_startup()
+
+    """
+
+    results = profiler.profile_startup()
+    assert isinstance(results, dict)
+
+    assert results['python'] == sys.version.split()[0]
+    assert [p['name'] for p in results['phases']] == [
+        'import apprise', 'AppriseAsset()', 'AppriseLocale()', 'Apprise()']
+
+    # We track the memory consumed by each phase
+    for entry in results['phases']:
+        assert entry['time'] >= 0
+        assert isinstance(entry['memory'], int)
+
+    # Each of our plugins was tracked
+    plugins = dict((p['name'], p) for p in results['plugins'])
+    assert 'NotifyJSON' in plugins
+    assert 'NotifyEmail' in plugins
+    for entry in plugins.values():
+        assert entry['time'] >= 0
+        assert isinstance(entry['enabled'], bool)
+        assert isinstance(entry['dependencies'], list)
+        # Nothing internal to Apprise is ever reported as a dependency
+        assert not [d for d in entry['dependencies'] if d == 'apprise']
+
+    # Our plugins are sorted slowest first
+    times = [p['time'] for p in results['plugins']]
+    assert times == sorted(times, reverse=True)
+
+    # Without memory tracking, our profile is generated with only one
+    # interpreter
+    with mock.patch(
+            'subprocess.check_output',
+            wraps=subprocess.check_output) as mock_check_output:
+        results = profiler.profile_startup(
+            plugin_paths='/path/does/not/exist', memory=False)
+        assert mock_check_output.call_count == 1
+
+    assert results['phases'][0]['memory'] is None
+    assert results['plugins'][0]['memory'] is None
+
+    # A bad interpreter
+    with pytest.raises(subprocess.CalledProcessError):
+        profiler.profile_startup(python='false', memory=False)
+
+    # We can't profile an interpreter that already loaded Apprise
+    with pytest.raises(RuntimeError):
+        profiler.run()
+
+
+@pytest.mark.skipif(sys.version_info.major <= 2, reason="Requires Python 3.x+")
+def test_profiler_plugin_import_profiler():
+    """
+    Profiler: PluginImportProfiler()
+
+    """
+
+    # Non plugin modules are ignored
+    obj = profiler.PluginImportProfiler()
+    assert obj.find_spec('apprise.utils', None) is None
+    assert obj.find_spec('apprise.plugins.NotifyBase.x', None) is None
+
+    # A plugin that can't be found
+    assert obj.find_spec('apprise.plugins.NotifyInvalid999', None) is None
+
+    # Track nested plugin imports
+    with profiler.PluginImportProfiler(memory=True) as obj:
+        assert obj in sys.meta_path
+
+        obj.enter('NotifyA')
+        obj.enter('NotifyB')
+        sys.modules['apprise_profiler_test_dep'] = \
+            types.ModuleType('apprise_profiler_test_dep')
+        obj.leave('NotifyB')
+        obj.leave('NotifyA')
+
+    del sys.modules['apprise_profiler_test_dep']
+    assert obj not in sys.meta_path
+
+    # The module is charged to the plugin that imported it
+    assert obj.plugins['NotifyB']['dependencies'] == \
+        ['apprise_profiler_test_dep']
+    assert obj.plugins['NotifyA']['dependencies'] == []
+    assert isinstance(obj.plugins['NotifyA']['memory'], int)
+
+    # Our standard library detection
+    assert profiler.is_stdlib('os.path') is True
+    assert profiler.is_stdlib('_private') is True
+    assert profiler.is_stdlib('apprise_profiler_test_dep') is False
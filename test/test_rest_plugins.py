@@ -24,6 +24,8 @@
 # THE SOFTWARE.
 
 import pytest
+import threading
+import time
 from random import choice
 from string import ascii_uppercase as str_alpha
 from string import digits as str_num
@@ -32,6 +34,7 @@ from apprise import plugins
 from apprise import NotifyBase
 from apprise.common import NotifyFormat
 from apprise.common import OverflowMode
+from apprise.common import OverflowUnit
 
 # Disable logging for a cleaner testing output
 import logging
@@ -326,16 +329,33 @@ def test_notify_overflow_split():
     # and that the body remains untouched
     chunks = obj._apply_overflow(body=body, title=title)
     offset = 0
-    assert len(chunks) == 4
-    for chunk in chunks:
+
+    # We prefer to split our content on a line boundary (when one is
+    # available) so we end up with an extra chunk
+    assert len(chunks) == 5
+    for no, chunk in enumerate(chunks):
         # Our title never changes
         assert title == chunk.get('title')
 
         # Our body is only broken up; not lost
         _body = chunk.get('body')
-        assert body[offset: len(_body) + offset].rstrip() == _body
+        assert len(_body) <= TestNotification.body_maxlen
+        assert body[offset: len(_body) + offset] == _body
         offset += len(_body)
 
+        if no < len(chunks) - 1:
+            # All but our last chunk end on a new line
+            assert _body.endswith('\r\n')
+
+    # Nothing was lost
+    assert offset == len(body)
+
+    # Truncating never looks for a line boundary
+    chunks = obj._apply_overflow(
+        body=body, title=title, overflow=OverflowMode.TRUNCATE)
+    assert len(chunks) == 1
+    assert body[:TestNotification.body_maxlen] == chunks[0].get('body')
+
     #
     # Next Test: Append title to body + split body
     #
@@ -440,3 +460,279 @@ def test_notify_overflow_general():
     # Our title get's stripped off since it's not of valid markdown
     assert body == chunks[0].get('body')
     assert chunks[0].get('title') == ""
+
+
+def test_notify_overflow_units():
+    """
+    API: Overflow Unit and Boundary Testing
+
+    """
+
+    # Disable Throttling to speed testing
+    plugins.NotifyBase.request_rate_per_sec = 0
+
+    class TestNotification(NotifyBase):
+
+        # Test title max length
+        title_maxlen = 10
+
+        # Enforce a body length of just 10
+        body_maxlen = 10
+
+        def __init__(self, *args, **kwargs):
+            super(TestNotification, self).__init__(**kwargs)
+
+        def notify(self, *args, **kwargs):
+            # Pretend everything is okay
+            return True
+
+    obj = TestNotification(overflow=OverflowMode.SPLIT)
+
+    # We prefer to split on a word boundary
+    body = u'the quick brown fox jumps'
+    chunks = obj._apply_overflow(body=body)
+    assert [c['body'] for c in chunks] == \
+        [u'the quick ', u'brown fox ', u'jumps']
+
+    # Boundaries found to early in our chunk are ignored
+    body = u'a bcdefghijklmnop'
+    chunks = obj._apply_overflow(body=body)
+    assert [c['body'] for c in chunks] == [u'a bcdefghi', u'jklmnop']
+
+    # Our chunks are generated as they're needed
+    chunks = obj._iter_overflow(body=u'x' * 1000000)
+    assert next(chunks) == {'body': u'x' * 10, 'title': ''}
+
+    # Line counting without reading every line
+    obj.body_max_line_count = 2
+    chunks = obj._apply_overflow(body=u'a\r\nb\nc\nd')
+    assert [c['body'] for c in chunks] == [u'a\r\nb']
+    chunks = obj._apply_overflow(body=u'abc')
+    assert [c['body'] for c in chunks] == [u'abc']
+    obj.body_max_line_count = 0
+
+    # Bytes; our accented characters are 2 bytes each when UTF-8 encoded
+    obj.body_maxlen_unit = OverflowUnit.BYTE
+    body = u'\u00e9' * 12
+    chunks = obj._apply_overflow(body=body)
+    assert [c['body'] for c in chunks] == \
+        [u'\u00e9' * 5, u'\u00e9' * 5, u'\u00e9' * 2]
+
+    # We never cut a character in half
+    body = u'a' + u'\u00e9' * 5
+    chunks = obj._apply_overflow(body=body)
+    assert [c['body'] for c in chunks] == [u'a' + u'\u00e9' * 4, u'\u00e9']
+
+    # Content that fits is untouched
+    chunks = obj._apply_overflow(body=u'\u00e9' * 5)
+    assert [c['body'] for c in chunks] == [u'\u00e9' * 5]
+
+    # A character larger then our limit is still sent on it's own
+    obj.body_maxlen = 1
+    chunks = obj._apply_overflow(body=u'\u00e9\u00e9')
+    assert [c['body'] for c in chunks] == [u'\u00e9', u'\u00e9']
+    obj.body_maxlen = 10
+
+    # Truncation respects our units too
+    chunks = obj._apply_overflow(
+        body=u'\u00e9' * 12, overflow=OverflowMode.TRUNCATE)
+    assert [c['body'] for c in chunks] == [u'\u00e9' * 5]
+
+    # UTF-16; characters outside of the basic multilingual plane take up 2
+    # units each
+    obj.body_maxlen_unit = OverflowUnit.UTF16
+    body = u'\U0001F600' * 6
+    chunks = obj._apply_overflow(body=body)
+    assert [c['body'] for c in chunks] == \
+        [u'\U0001F600' * 5, u'\U0001F600']
+
+    body = u'a' + u'\U0001F600' * 5
+    chunks = obj._apply_overflow(body=body)
+    assert [c['body'] for c in chunks] == \
+        [u'a' + u'\U0001F600' * 4, u'\U0001F600']
+
+    # Everything else counts as a single unit
+    chunks = obj._apply_overflow(body=u'\u00e9' * 10)
+    assert [c['body'] for c in chunks] == [u'\u00e9' * 10]
+
+    # An empty body
+    for overflow in (OverflowMode.SPLIT, OverflowMode.TRUNCATE):
+        chunks = obj._apply_overflow(body='', overflow=overflow)
+        assert chunks == [{'body': '', 'title': ''}]
+
+
+def test_notify_overflow_pipeline():
+    """
+    API: Overflow Pipelined Delivery and Resume Testing
+
+    """
+
+    # Disable Throttling to speed testing
+    plugins.NotifyBase.request_rate_per_sec = 0
+
+    # Our message (100 characters long) split into 20 character chunks
+    body = ''.join(choice(str_alpha + str_num) for _ in range(100))
+
+    class TestNotification(NotifyBase):
+
+        # Leave room for our sequence tag; [100/100] is the largest one we
+        # could ever need for our message
+        body_maxlen = 30
+
+        # Deliver 4 chunks at a time
+        overflow_max_inflight = 4
+
+        def __init__(self, *args, **kwargs):
+            super(TestNotification, self).__init__(**kwargs)
+            self.sent = []
+            self.fail = set()
+
+        def send(self, body, title='', **kwargs):
+            self.sent.append(body)
+            return body not in self.fail
+
+    # Our chunks are only tagged (and delivered at the same time) if we ask
+    # for it; otherwise they're sent in order as they always were
+    obj = TestNotification(overflow=OverflowMode.SPLIT)
+    assert obj.notify(body=body) is True
+    assert obj.sent == [body[i:i + 30] for i in (0, 30, 60, 90)]
+
+    obj.overflow_sequence = True
+    obj.sent = []
+    assert obj.notify(body=body) is True
+
+    # Our chunks may arrive in any order but they're tagged
+    assert sorted(obj.sent) == sorted(
+        '[{}/5] {}'.format(no + 1, body[no * 20:(no + 1) * 20])
+        for no in range(5))
+    assert all(len(b) <= TestNotification.body_maxlen for b in obj.sent)
+
+    # Messages that don't need splitting are never tagged
+    obj.sent = []
+    assert obj.notify(body='short') is True
+    assert obj.sent == ['short']
+
+    # Nothing is tagged if we're not splitting
+    obj.sent = []
+    assert obj.notify(body=body, overflow=OverflowMode.TRUNCATE) is True
+    assert obj.sent == [body[:30]]
+
+    # Services that preserve order don't need tagging
+    obj.overflow_ordered = True
+    obj.sent = []
+    assert obj.notify(body=body) is True
+    assert sorted(obj.sent) == sorted(body[i:i + 30] for i in (0, 30, 60, 90))
+    obj.overflow_ordered = False
+
+    # Our chunks are delivered at the same time; the first chunk can't
+    # complete until the second one has started
+    started = threading.Event()
+
+    class BlockingNotification(TestNotification):
+        overflow_sequence = True
+
+        def send(self, body, title='', **kwargs):
+            if body.startswith('[2/'):
+                started.set()
+
+            elif body.startswith('[1/'):
+                assert started.wait(10)
+
+            return True
+
+    assert BlockingNotification(overflow=OverflowMode.SPLIT)\
+        .notify(body=body) is True
+
+    # A failure stops us from sending anything more
+    obj.sent = []
+    obj.fail = set(['[1/5] ' + body[:20]])
+    assert obj.notify(body=body) is False
+    assert obj._overflow_resume[1] == 0
+
+    # Retrying only sends the chunks that didn't make it through; the
+    # first chunk fails once the others were delivered
+    class SlowNotification(TestNotification):
+        overflow_sequence = True
+
+        def send(self, body, title='', **kwargs):
+            if body.startswith('[1/') and self.fail:
+                for _ in range(1000):
+                    if len(self.sent) >= 4:
+                        break
+                    time.sleep(0.01)
+
+            return super(SlowNotification, self).send(body, title, **kwargs)
+
+    obj_slow = SlowNotification(overflow=OverflowMode.SPLIT)
+    obj_slow.fail = set(['[1/5] ' + body[:20]])
+    assert obj_slow.notify(body=body) is False
+    key, offset, delivered = obj_slow._overflow_resume
+    assert offset == 0
+    assert set([1, 2, 3]).issubset(delivered)
+
+    sent = obj_slow.sent
+    obj_slow.fail = set()
+    obj_slow.sent = []
+    assert obj_slow.notify(body=body) is True
+    assert obj_slow._overflow_resume is None
+    assert '[1/5] ' + body[:20] in obj_slow.sent
+    assert not set(obj_slow.sent) & set(
+        b for b in sent if not b.startswith('[1/'))
+    assert sorted(set(sent + obj_slow.sent)) == sorted(
+        '[{}/5] {}'.format(no + 1, body[no * 20:(no + 1) * 20])
+        for no in range(5))
+
+    # An exception is a failure too; it's raised just like it is when we
+    # deliver one chunk at a time
+    message = body
+
+    class ExceptionNotification(TestNotification):
+        overflow_sequence = True
+
+        def send(self, body, title='', **kwargs):
+            if message[50:55] in body:
+                raise TypeError()
+
+            return super(ExceptionNotification, self).send(
+                body, title, **kwargs)
+
+    obj_exc = ExceptionNotification(overflow=OverflowMode.SPLIT)
+    with pytest.raises(TypeError):
+        obj_exc.notify(body=body)
+    assert obj_exc._overflow_resume[1] == 2
+
+    obj_exc = ExceptionNotification(overflow=OverflowMode.SPLIT)
+    obj_exc.overflow_max_inflight = 1
+    with pytest.raises(TypeError):
+        obj_exc.notify(body=body)
+    assert obj_exc._overflow_resume[1] == 1
+
+    #
+    # Resuming one chunk at a time
+    #
+    obj.overflow_max_inflight = 1
+    obj.fail = set([body[60:90]])
+    obj.sent = []
+    assert obj.notify(body=body) is False
+    assert obj.sent == [body[0:30], body[30:60], body[60:90]]
+    assert obj._overflow_resume[1] == 2
+
+    # Retrying resumes from the chunk that failed
+    obj.fail = set()
+    obj.sent = []
+    assert obj.notify(body=body) is True
+    assert obj.sent == [body[60:90], body[90:]]
+    assert obj._overflow_resume is None
+
+    # Sending it again sends everything
+    obj.sent = []
+    assert obj.notify(body=body) is True
+    assert len(obj.sent) == 4
+
+    # A different message is never resumed
+    obj.fail = set([body[30:60]])
+    assert obj.notify(body=body) is False
+    obj.fail = set()
+    obj.sent = []
+    assert obj.notify(body=body, title='different') is True
+    assert len(obj.sent) == 4